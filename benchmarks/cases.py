@@ -0,0 +1,85 @@
+"""The operations timed by the benchmark suite."""
+
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from systems import BenchmarkSystem
+
+from openff.interchange import Interchange
+
+
+def create_interchange(system: BenchmarkSystem) -> Interchange:
+    """Parametrize a system with its force field."""
+    return Interchange.from_smirnoff(
+        system.force_field,
+        system.topology,
+        charge_from_molecules=system.charge_from_molecules or None,
+    )
+
+
+class Benchmark:
+    """
+    An operation timed on each system.
+
+    ``run`` is called with the ``Interchange`` of the system, which is created once, outside of the
+    timed region, and shared between benchmarks. If ``takes_system`` is true, ``run`` is instead
+    called with the system itself.
+    """
+
+    def __init__(self, name: str, run: Callable, takes_system: bool = False):
+        self.name = name
+        self.run = run
+        self.takes_system = takes_system
+
+    def __repr__(self) -> str:
+        return f"Benchmark({self.name})"
+
+
+def _in_directory(function: Callable[[Interchange, Path], object]) -> Callable[[Interchange], object]:
+    def wrapped(interchange: Interchange):
+        with tempfile.TemporaryDirectory() as directory:
+            return function(interchange, Path(directory))
+
+    return wrapped
+
+
+def _get_openmm_energies(interchange: Interchange):
+    from openff.interchange.drivers import get_openmm_energies
+
+    return get_openmm_energies(interchange, combine_nonbonded_forces=True, platform="CPU")
+
+
+BENCHMARKS: list[Benchmark] = [
+    Benchmark("from_smirnoff", run=create_interchange, takes_system=True),
+    Benchmark("to_openmm_system", run=lambda interchange: interchange.to_openmm_system()),
+    Benchmark(
+        "to_gromacs",
+        run=_in_directory(lambda interchange, path: interchange.to_gromacs(str(path / "out"))),
+    ),
+    Benchmark(
+        "to_prmtop",
+        run=_in_directory(lambda interchange, path: interchange.to_prmtop(path / "out.prmtop")),
+    ),
+    Benchmark(
+        "to_lammps",
+        run=_in_directory(lambda interchange, path: interchange.to_lammps(path / "out.lmp")),
+    ),
+    Benchmark("combine", run=lambda interchange: interchange.combine(interchange)),
+    Benchmark("concatenate", run=lambda interchange: Interchange.concatenate([interchange] * 10)),
+    Benchmark("to_json", run=lambda interchange: interchange.json()),
+    Benchmark(
+        "json_roundtrip",
+        run=lambda interchange: Interchange.parse_raw(interchange.json()),
+    ),
+    Benchmark(
+        "npz_roundtrip",
+        run=_in_directory(
+            lambda interchange, path: (
+                interchange.to_npz(path / "out.npz"),
+                Interchange.from_npz(path / "out.npz"),
+            ),
+        ),
+    ),
+    Benchmark("get_openmm_energies", run=_get_openmm_energies),
+]
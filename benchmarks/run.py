@@ -0,0 +1,243 @@
+"""
+Time, and record the peak memory of, operations on generated systems, and compare to a baseline.
+
+Run from the root of the repository, i.e.
+
+    python benchmarks/run.py --output results.json --compare benchmarks/baselines/github-actions.json
+
+See benchmarks/README.md for details.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# The experimental Interchange.combine is one of the benchmarked operations
+os.environ.setdefault("INTERCHANGE_EXPERIMENTAL", "1")
+
+from cases import BENCHMARKS, Benchmark, create_interchange  # noqa: E402
+from systems import BenchmarkSystem, get_systems  # noqa: E402
+
+
+def _get_metadata() -> dict[str, str]:
+    import numpy
+    import openff.toolkit
+
+    import openff.interchange
+
+    metadata = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": numpy.__version__,
+        "openff.toolkit": openff.toolkit.__version__,
+        "openff.interchange": openff.interchange.__version__,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+    try:
+        import openmm
+
+        metadata["openmm"] = openmm.__version__
+    except ImportError:
+        pass
+
+    return metadata
+
+
+def measure(function, argument, repeats: int) -> dict[str, float]:
+    """
+    Time ``function(argument)`` and record its peak memory usage.
+
+    The time is the best of ``repeats`` runs, with the median also recorded. Memory is measured in a
+    separate run, since tracing allocations slows down the function.
+    """
+    times = list()
+
+    for _ in range(repeats):
+        gc.collect()
+
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+
+    function(argument)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "time": min(times),
+        "median_time": statistics.median(times),
+        "peak_memory": peak,
+    }
+
+
+def run_benchmarks(
+    systems: list[BenchmarkSystem],
+    benchmarks: list[Benchmark],
+    repeats: int,
+    select: str = "",
+) -> dict[str, dict]:
+    """
+    Run each benchmark on each system, returning results keyed by "benchmark[system]".
+
+    Only benchmarks whose key contains ``select`` are run.
+    """
+    results: dict[str, dict] = dict()
+
+    for system in systems:
+        keys = {benchmark.name: f"{benchmark.name}[{system.name}]" for benchmark in benchmarks}
+
+        if not any(select in key for key in keys.values()):
+            continue
+
+        try:
+            interchange = create_interchange(system)
+        except Exception as error:
+            interchange = None
+            setup_error = f"{type(error).__name__}: {error}"
+
+        for benchmark in benchmarks:
+            key = keys[benchmark.name]
+
+            if select not in key:
+                continue
+
+            if benchmark.takes_system:
+                argument = system
+            elif interchange is None:
+                results[key] = {"error": setup_error}
+                continue
+            else:
+                argument = interchange
+
+            try:
+                results[key] = measure(benchmark.run, argument, repeats)
+            except Exception as error:
+                results[key] = {"error": f"{type(error).__name__}: {error}"}
+
+            _report(key, results[key])
+
+    return results
+
+
+def _report(key: str, result: dict):
+    if "error" in result:
+        print(f"{key:<50} failed ({result['error'][:60]})", flush=True)
+    else:
+        print(
+            f"{key:<50} {result['time']:10.4f} s {result['peak_memory'] / 2**20:10.1f} MiB",
+            flush=True,
+        )
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Return descriptions of results which are slower, or use more memory, than the baseline allows."""
+    regressions = list()
+
+    for key, result in results.items():
+        reference = baseline.get(key)
+
+        if reference is None or "error" in reference:
+            continue
+
+        if "error" in result:
+            regressions.append(f"{key} failed, but passed in the baseline: {result['error']}")
+            continue
+
+        for quantity, tolerance in (("time", time_tolerance), ("peak_memory", memory_tolerance)):
+            ratio = result[quantity] / max(reference[quantity], 1e-12)
+
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{key} {quantity} increased by a factor of {ratio:.2f} "
+                    f"({reference[quantity]:.4g} -> {result[quantity]:.4g})",
+                )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--water-sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Approximate numbers of atoms in the water boxes; add 1000000 for the largest box",
+    )
+    parser.add_argument(
+        "-k",
+        "--select",
+        default="",
+        help="Only run benchmarks whose name, e.g. to_prmtop[water-999], contains this string",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs of each benchmark")
+    parser.add_argument("--output", type=Path, help="Write results, with metadata, to this JSON file")
+    parser.add_argument("--compare", type=Path, help="A previous output file to compare against")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.25,
+        help="Relative increase in time, compared to the baseline, which is reported as a regression",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.10,
+        help="Relative increase in peak memory, compared to the baseline, which is reported as a regression",
+    )
+
+    args = parser.parse_args(argv)
+
+    systems = get_systems(args.water_sizes)
+
+    results = run_benchmarks(systems, BENCHMARKS, args.repeats, args.select)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps({"metadata": _get_metadata(), "results": results}, indent=2) + "\n",
+        )
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+
+        regressions = compare(
+            results,
+            baseline["results"],
+            args.time_tolerance,
+            args.memory_tolerance,
+        )
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) compared to {args.compare}:")
+
+            for regression in regressions:
+                print(f"\t{regression}")
+
+            return 1
+
+        print(f"\nNo regressions compared to {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
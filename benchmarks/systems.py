@@ -0,0 +1,118 @@
+"""Systems used in benchmarks, generated without network access or external programs."""
+
+import math
+from dataclasses import dataclass, field
+
+import numpy
+from openff.toolkit import ForceField, Molecule, Quantity, Topology
+
+from openff.interchange._tests import get_test_file_path
+
+# Geometry of TIP3P water, in nanometers, in the order of the atoms of Molecule.from_smiles("O")
+_WATER_POSITIONS = numpy.array(
+    [
+        [0.0, 0.0, 0.0],
+        [0.09572, 0.0, 0.0],
+        [-0.02399, 0.09266, 0.0],
+    ],
+)
+
+# Spacing of water molecules on a cubic lattice, giving roughly the density of liquid water
+_WATER_SPACING = 0.31
+
+
+@dataclass
+class BenchmarkSystem:
+    """A topology, with positions, and the arguments needed to parametrize it."""
+
+    name: str
+    topology: Topology
+    force_field: ForceField
+    charge_from_molecules: list[Molecule] = field(default_factory=list)
+
+    @property
+    def n_atoms(self) -> int:
+        return self.topology.n_atoms
+
+
+def water_box(n_atoms: int, force_field: ForceField) -> BenchmarkSystem:
+    """Build a periodic box of water with about ``n_atoms`` atoms, placed on a cubic lattice."""
+    water = Molecule.from_smiles("O")
+
+    n_molecules = max(1, n_atoms // 3)
+    n_per_side = math.ceil(n_molecules ** (1 / 3))
+
+    lattice = numpy.stack(
+        numpy.meshgrid(*3 * [numpy.arange(n_per_side)], indexing="ij"),
+        axis=-1,
+    ).reshape(-1, 3)[:n_molecules]
+
+    positions = (lattice[:, None, :] * _WATER_SPACING + _WATER_POSITIONS[None, :, :]).reshape(-1, 3)
+
+    topology = Topology.from_molecules(n_molecules * [water])
+    topology.set_positions(Quantity(positions, "nanometer"))
+    topology.box_vectors = Quantity(numpy.eye(3) * n_per_side * _WATER_SPACING, "nanometer")
+
+    return BenchmarkSystem(
+        name=f"water-{topology.n_atoms}",
+        topology=topology,
+        force_field=force_field,
+    )
+
+
+def polymer(n_repeats: int, force_field: ForceField) -> BenchmarkSystem:
+    """Build a single, non-periodic, chain of polyethylene glycol with ``n_repeats`` repeat units."""
+    molecule = Molecule.from_smiles("C" + n_repeats * "COC" + "C")
+    molecule.generate_conformers(n_conformers=1)
+
+    # Charges are assigned ahead of time, since semi-empirical charges of a large molecule are slow
+    # to compute and not the subject of these benchmarks
+    molecule.assign_partial_charges("gasteiger")
+
+    return BenchmarkSystem(
+        name=f"peg-{n_repeats}",
+        topology=molecule.to_topology(),
+        force_field=force_field,
+        charge_from_molecules=[molecule],
+    )
+
+
+def ligand_set(n_ligands: int, force_field: ForceField) -> BenchmarkSystem:
+    """Build a non-periodic topology of drug-like molecules, spread out on a grid."""
+    molecules = Molecule.from_file(
+        get_test_file_path("MiniDrugBankTrimmed.sdf"),
+        allow_undefined_stereo=True,
+    )[:n_ligands]
+
+    n_per_side = math.ceil(len(molecules) ** (1 / 3))
+
+    positions = list()
+
+    for index, molecule in enumerate(molecules):
+        molecule.assign_partial_charges("gasteiger")
+
+        conformer = molecule.conformers[0].m_as("nanometer")
+        offset = numpy.array(numpy.unravel_index(index, 3 * (n_per_side,))) * 2.0
+
+        positions.append(conformer - conformer.mean(axis=0) + offset)
+
+    topology = Topology.from_molecules(molecules)
+    topology.set_positions(Quantity(numpy.concatenate(positions), "nanometer"))
+
+    return BenchmarkSystem(
+        name=f"ligands-{len(molecules)}",
+        topology=topology,
+        force_field=force_field,
+        charge_from_molecules=molecules,
+    )
+
+
+def get_systems(water_sizes: list[int]) -> list[BenchmarkSystem]:
+    """Build water boxes of each size, a polymer, and a set of ligands, parametrized with Sage."""
+    sage = ForceField("openff-2.0.0.offxml")
+
+    return [
+        *[water_box(n_atoms, sage) for n_atoms in water_sizes],
+        polymer(100, sage),
+        ligand_set(20, sage),
+    ]
@@ -0,0 +1,118 @@
+import numpy
+import pytest
+from openff.toolkit import Molecule, Quantity, unit
+
+from openff.interchange import Interchange
+from openff.interchange.components._arrays import CollectionArrays
+from openff.interchange.exceptions import UnsupportedArrayStorageError
+from openff.interchange.models import BondKey, PotentialKey, ProperTorsionKey
+
+
+class TestCollectionArrays:
+    @pytest.fixture
+    def ethanol_interchange(self, sage):
+        return Interchange.from_smirnoff(sage, [Molecule.from_smiles("CCO")])
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Bonds",
+            "Angles",
+            "ProperTorsions",
+            "ImproperTorsions",
+            "vdW",
+            "Electrostatics",
+        ],
+    )
+    def test_roundtrip(self, ethanol_interchange, name):
+        collection = ethanol_interchange[name]
+        arrays = collection.to_arrays()
+
+        assert arrays.n_terms == len(collection.key_map)
+        assert arrays.n_potentials == len(collection.potentials)
+
+        key_map, potentials = arrays.to_dicts()
+
+        assert key_map == collection.key_map
+        assert [*key_map] == [*collection.key_map]
+
+        for potential_key, potential in potentials.items():
+            expected = collection.potentials[potential_key].parameters
+
+            for parameter_name, value in potential.parameters.items():
+                assert value.m_as(expected[parameter_name].units) == pytest.approx(
+                    expected[parameter_name].m,
+                )
+
+    def test_shapes_and_dtypes(self, ethanol_interchange):
+        arrays = ethanol_interchange["ProperTorsions"].to_arrays()
+
+        assert arrays.atom_indices.shape == (arrays.n_terms, 4)
+        assert arrays.potential_indices.dtype == numpy.int32
+        assert arrays.parameters.shape == (arrays.n_potentials, 4)
+        assert arrays.parameter_names == ("k", "periodicity", "phase", "idivf")
+
+    def test_lazy_lookup(self, ethanol_interchange):
+        collection = ethanol_interchange["Bonds"]
+        arrays = collection.to_arrays()
+
+        key = BondKey(atom_indices=(0, 1))
+
+        assert key in arrays.key_map
+        assert arrays.key_map[key] == collection.key_map[key]
+        k = arrays.potentials[arrays.key_map[key]].parameters["k"]
+        expected = collection.potentials[collection.key_map[key]].parameters["k"]
+
+        assert k.m_as(expected.units) == pytest.approx(expected.m)
+
+        assert BondKey(atom_indices=(1, 0)) not in arrays.key_map
+        assert BondKey(atom_indices=(0, 100)) not in arrays.key_map
+        assert ProperTorsionKey(atom_indices=(0, 1, 2, 3)) not in arrays.key_map
+
+        with pytest.raises(KeyError):
+            arrays.potentials[PotentialKey(id="foo")]
+
+    def test_system_parameters(self, ethanol_interchange):
+        collection = ethanol_interchange["vdW"]
+        arrays = collection.to_arrays()
+
+        sigma_column = arrays.parameter_names.index("sigma")
+        sigmas = Quantity(
+            arrays.get_system_parameters()[:, sigma_column],
+            arrays.parameter_units[sigma_column],
+        )
+
+        for index, potential_key in enumerate(collection.key_map.values()):
+            sigma = collection.potentials[potential_key].parameters["sigma"]
+
+            assert sigmas[index].m_as(unit.nanometer) == pytest.approx(
+                sigma.m_as(unit.nanometer),
+            )
+
+    def test_empty_collection(self):
+        arrays = CollectionArrays.from_dicts(key_map=dict(), potentials=dict())
+
+        assert arrays.n_terms == 0
+        assert arrays.n_potentials == 0
+        assert arrays.to_dicts() == (dict(), dict())
+
+    def test_wrapped_potentials_not_supported(self, sage):
+        from openff.interchange.components.potentials import WrappedPotential
+
+        interchange = Interchange.from_smirnoff(sage, [Molecule.from_smiles("C")])
+        collection = interchange["Bonds"]
+        potential_key = next(iter(collection.potentials))
+        collection.potentials[potential_key] = WrappedPotential(
+            collection.potentials[potential_key],
+        )
+
+        with pytest.raises(UnsupportedArrayStorageError, match="wrapping"):
+            collection.to_arrays()
+
+    def test_virtual_sites_not_supported(self, sage_with_bond_charge):
+        interchange = sage_with_bond_charge.create_interchange(
+            Molecule.from_mapped_smiles("[H:3][C:2]([H:4])([H:5])[Cl:1]").to_topology(),
+        )
+
+        with pytest.raises(UnsupportedArrayStorageError, match="non-quantity"):
+            interchange["VirtualSites"].to_arrays()
@@ -0,0 +1,91 @@
+import numpy
+import pytest
+from openff.toolkit import Molecule, Topology
+
+from openff.interchange.components._graph import BondGraph
+from openff.interchange.components.toolkit import _get_14_pairs
+
+
+class TestBondGraph:
+    def test_csr_adjacency(self):
+        graph = BondGraph.from_topology(
+            Molecule.from_mapped_smiles("[H:3][C:1]#[C:2][H:4]"),
+        )
+
+        assert graph.indptr.tolist() == [0, 2, 4, 5, 6]
+        assert graph.neighbors(0).tolist() == [1, 2]
+        assert graph.neighbors(1).tolist() == [0, 3]
+        assert graph.degrees.tolist() == [2, 2, 1, 1]
+
+    def test_pairs_and_distances(self):
+        graph = BondGraph.from_topology(
+            Molecule.from_mapped_smiles("[H:3][C:1]#[C:2][H:4]"),
+        )
+
+        pairs, distances = graph.get_pairs()
+
+        assert pairs.tolist() == [[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]]
+        assert distances.tolist() == [1, 1, 2, 2, 1, 3]
+
+    def test_shortest_distance_in_rings(self):
+        # In cyclobutane, atoms across the ring are two bonds apart along either path
+        graph = BondGraph(
+            n_atoms=4,
+            bonds=numpy.array([[0, 1], [1, 2], [2, 3], [3, 0]]),
+        )
+
+        pairs, distances = graph.get_pairs()
+
+        assert dict(zip(map(tuple, pairs.tolist()), distances.tolist())) == {
+            (0, 1): 1,
+            (0, 2): 2,
+            (0, 3): 1,
+            (1, 2): 1,
+            (1, 3): 2,
+            (2, 3): 1,
+        }
+        assert len(graph.get_pairs_at_distance(3)) == 0
+
+    @pytest.mark.parametrize(
+        "smiles",
+        [
+            "C#C",
+            "CCO",
+            "C1=CC=CC=C1",
+            "C=1=C=C1",
+            "C=1=C=C=C1",
+            "C=1(Cl)-C(Cl)=C1",
+            "C=1=C(Cl)C(=C=1)Cl",
+            "CC(=O)Nc1ccc(O)cc1",
+        ],
+    )
+    def test_14_pairs_match_toolkit_utils(self, smiles):
+        molecule = Molecule.from_smiles(smiles)
+
+        expected = {
+            tuple(sorted(molecule.atom_index(atom) for atom in pair))
+            for pair in _get_14_pairs(molecule)
+        }
+
+        found = BondGraph.from_topology(molecule).get_pairs_at_distance(3).tolist()
+
+        assert [*map(tuple, found)] == sorted(expected)
+
+    def test_topology_offsets(self):
+        topology = Topology.from_molecules(
+            [Molecule.from_smiles("O"), Molecule.from_smiles("CCO")],
+        )
+
+        pairs, _ = BondGraph.from_topology(topology).get_pairs()
+
+        assert pairs.min() == 0
+        assert pairs.max() == topology.n_atoms - 1
+
+        # No pairs between molecules
+        assert not numpy.any((pairs[:, 0] < 3) & (pairs[:, 1] >= 3))
+
+    def test_no_bonds(self):
+        pairs, distances = BondGraph(n_atoms=3, bonds=numpy.empty((0, 2))).get_pairs()
+
+        assert pairs.shape == (0, 2)
+        assert distances.shape == (0,)
@@ -1,3 +1,5 @@
+import json
+
 import numpy
 import pytest
 from openff.toolkit import Molecule, Quantity, Topology, unit
@@ -381,6 +383,17 @@ class TestInterchangeSerialization:
             get_openmm_energies(roundtripped, combine_nonbonded_forces=False),
         )
 
+    def test_json_does_not_modify_conformers(self, sage, ethanol):
+        ethanol.generate_conformers(n_conformers=1)
+
+        interchange = Interchange.from_smirnoff(sage, [ethanol])
+        molecule = interchange.topology.molecule(0)
+
+        serialized_topology = json.loads(json.loads(interchange.json())["topology"])
+
+        assert serialized_topology["molecules"][0]["conformers"] is None
+        assert molecule.n_conformers == 1
+
 
 class TestWrappedCalls:
     """Test that methods which delegate out to other submodules call them."""
@@ -0,0 +1,87 @@
+import numpy
+import pytest
+from openff.toolkit import Quantity, Topology, unit
+
+from openff.interchange import Interchange
+from openff.interchange._tests import MoleculeWithConformer
+
+
+@pytest.fixture
+def interchange(sage):
+    topology = Topology.from_molecules(
+        [
+            MoleculeWithConformer.from_smiles("CCO"),
+            MoleculeWithConformer.from_smiles("O"),
+        ],
+    )
+    topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+    return sage.create_interchange(topology)
+
+
+@pytest.fixture(params=["npz", "json"])
+def saved(interchange, tmp_path, request):
+    if request.param == "npz":
+        interchange.to_npz(tmp_path / "out.npz")
+        return tmp_path / "out.npz"
+
+    (tmp_path / "out.json").write_text(interchange.json())
+    return tmp_path / "out.json"
+
+
+class TestLoadLazy:
+    def test_nothing_loaded_until_accessed(self, saved):
+        handle = Interchange.load_lazy(saved)
+
+        assert handle._loaded == dict()
+        assert handle.collections._loaded == dict()
+
+        handle["Electrostatics"]
+
+        assert [*handle.collections._loaded] == ["Electrostatics"]
+        assert "topology" not in handle._loaded
+
+    def test_fields_match(self, interchange, saved):
+        with Interchange.load_lazy(saved) as handle:
+            assert numpy.allclose(handle.positions, interchange.positions)
+            assert numpy.allclose(handle["box"], interchange.box)
+            assert handle.topology.n_atoms == interchange.topology.n_atoms
+
+            assert [*handle.collections] == [*interchange.collections]
+
+            for name, collection in interchange.collections.items():
+                assert handle[name].key_map == collection.key_map
+                assert handle[name].potentials == collection.potentials
+
+    def test_select_fields(self, saved):
+        handle = Interchange.load_lazy(saved, fields=["positions", "box"])
+
+        assert handle.positions is not None
+
+        with pytest.raises(LookupError, match="topology was not loaded"):
+            handle.topology
+
+        with pytest.raises(LookupError, match="collections was not loaded"):
+            handle.collections
+
+    def test_select_collections(self, interchange, saved):
+        handle = Interchange.load_lazy(saved, collections=["Electrostatics"])
+
+        assert [*handle.collections] == ["Electrostatics"]
+
+        assert handle["Electrostatics"].charges == interchange["Electrostatics"].charges
+
+        with pytest.raises(LookupError, match="Could not find component Bonds"):
+            handle["Bonds"]
+
+    def test_to_interchange(self, interchange, saved):
+        handle = Interchange.load_lazy(saved, fields=["positions", "collections"])
+        loaded = handle.to_interchange()
+
+        assert loaded.topology is None
+        assert numpy.allclose(loaded.positions, interchange.positions)
+        assert [*loaded.collections] == [*interchange.collections]
+
+    def test_unknown_field(self, saved):
+        with pytest.raises(ValueError, match="Unknown field charges"):
+            Interchange.load_lazy(saved, fields=["charges"])
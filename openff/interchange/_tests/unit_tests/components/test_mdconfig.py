@@ -202,6 +202,17 @@ class TestWriteSanderInput:
         assert options["cntrl"]["ntf"] == "1"
         assert options["cntrl"]["ntc"] == "1"
 
+    def test_rerun(self, system_no_constraints):
+        MDConfig.from_interchange(system_no_constraints).write_sander_input_file(
+            "1.in",
+            rerun=True,
+        )
+
+        options = parse_sander("1.in")
+
+        assert options["cntrl"]["imin"] == "5"
+        assert options["cntrl"]["maxcyc"] == "0"
+
     def test_rigid_water_box(self, rigid_water_box):
         MDConfig.from_interchange(rigid_water_box).write_sander_input_file("2.in")
 
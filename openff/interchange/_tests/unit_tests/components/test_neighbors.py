@@ -0,0 +1,125 @@
+import itertools
+
+import numpy
+import pytest
+
+from openff.interchange._tests import _rng
+from openff.interchange.components._neighbors import (
+    _is_reduced_form,
+    _iterate_all_pairs,
+    _iterate_neighbor_pairs,
+    _minimum_image,
+)
+from openff.interchange.exceptions import (
+    UnsupportedBoxError,
+    UnsupportedCutoffMethodError,
+)
+
+_BOXES = [
+    None,
+    numpy.diag([3.0, 3.0, 3.0]),
+    numpy.diag([2.0, 2.1, 5.0]),
+    numpy.array([[3.0, 0.0, 0.0], [1.0, 3.0, 0.0], [-1.2, 1.4, 3.0]]),
+]
+
+
+def _brute_force_pairs(positions, cutoff, box):
+    first, second = numpy.triu_indices(len(positions), k=1)
+
+    vectors = positions[second] - positions[first]
+
+    if box is None:
+        distances = numpy.linalg.norm(vectors, axis=1)
+
+    else:
+        fractional = vectors @ numpy.linalg.inv(box)
+        vectors = (fractional - numpy.round(fractional)) @ box
+
+        images = numpy.array(
+            [
+                i * box[0] + j * box[1] + k * box[2]
+                for i, j, k in itertools.product(range(-2, 3), repeat=3)
+            ],
+        )
+
+        image_distances = numpy.linalg.norm(vectors[:, None] + images[None], axis=2)
+        distances = image_distances.min(axis=1)
+
+    mask = distances < cutoff
+
+    pairs = zip(first[mask].tolist(), second[mask].tolist(), distances[mask])
+
+    return {(i, j): distance for i, j, distance in pairs}
+
+
+def _collect(chunks):
+    found = dict()
+
+    for first, second, distances in chunks:
+        assert len(first) > 0
+        assert numpy.all(first < second)
+
+        for i, j, distance in zip(first.tolist(), second.tolist(), distances):
+            assert (i, j) not in found
+
+            found[(i, j)] = distance
+
+    return found
+
+
+class TestNeighborPairs:
+    @pytest.mark.parametrize("box", _BOXES)
+    @pytest.mark.parametrize(
+        ("n_particles", "cutoff", "chunk_size"),
+        [(200, 0.9, 2**18), (200, 0.5, 50), (30, 0.99, 7)],
+    )
+    def test_same_as_brute_force(self, box, n_particles, cutoff, chunk_size):
+        # Positions are spread over several periodic images
+        positions = _rng.uniform(-4.0, 7.0, size=(n_particles, 3))
+
+        pairs = _iterate_neighbor_pairs(positions, cutoff, box, chunk_size=chunk_size)
+
+        found = _collect(pairs)
+        expected = _brute_force_pairs(positions, cutoff, box)
+
+        assert found.keys() == expected.keys()
+
+        for pair, distance in expected.items():
+            assert found[pair] == pytest.approx(distance)
+
+    def test_too_few_particles(self):
+        assert [*_iterate_neighbor_pairs(numpy.zeros((1, 3)), 1.0)] == []
+
+    def test_cutoff_too_long(self):
+        box = numpy.diag([3.0, 3.0, 3.0])
+
+        with pytest.raises(UnsupportedCutoffMethodError, match="half the width"):
+            list(_iterate_neighbor_pairs(numpy.zeros((2, 3)), 1.6, box))
+
+    def test_box_not_reduced(self):
+        box = numpy.array([[3.0, 0.0, 0.0], [2.0, 3.0, 0.0], [0.0, 0.0, 3.0]])
+
+        assert not _is_reduced_form(box)
+
+        with pytest.raises(UnsupportedBoxError, match="reduced form"):
+            list(_iterate_neighbor_pairs(numpy.zeros((2, 3)), 1.0, box))
+
+
+class TestAllPairs:
+    @pytest.mark.parametrize("chunk_size", [1, 13, 2**18])
+    def test_all_pairs(self, chunk_size):
+        positions = _rng.uniform(0.0, 3.0, size=(20, 3))
+
+        found = _collect(_iterate_all_pairs(positions, chunk_size=chunk_size))
+
+        assert found.keys() == _brute_force_pairs(positions, numpy.inf, None).keys()
+
+    def test_minimum_image(self):
+        box = numpy.array([[3.0, 0.0, 0.0], [1.0, 3.0, 0.0], [-1.2, 1.4, 3.0]])
+
+        vectors = numpy.array([[0.5, 0.2, 0.1], [2.9, 0.0, 0.0]]) + 2 * box[1] - box[2]
+
+        expected = numpy.array([[0.5, 0.2, 0.1], [-0.1, 0.0, 0.0]])
+
+        assert _minimum_image(vectors, box) == pytest.approx(expected)
+        assert _minimum_image(vectors, None) is vectors
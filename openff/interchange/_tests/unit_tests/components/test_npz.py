@@ -0,0 +1,121 @@
+import numpy
+import pytest
+from openff.toolkit import Molecule, Quantity, Topology, unit
+from openff.utilities import skip_if_missing
+
+from openff.interchange import Interchange
+from openff.interchange._tests import MoleculeWithConformer
+from openff.interchange.drivers import get_openmm_energies
+
+
+class TestNPZ:
+    @pytest.fixture
+    def interchange(self, sage):
+        topology = Topology.from_molecules(
+            [
+                MoleculeWithConformer.from_smiles("CCO"),
+                MoleculeWithConformer.from_smiles("O"),
+                MoleculeWithConformer.from_smiles("O"),
+            ],
+        )
+        topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+        return sage.create_interchange(topology)
+
+    def assert_same(self, original: Interchange, loaded: Interchange):
+        assert numpy.allclose(loaded.positions, original.positions)
+        assert numpy.allclose(loaded.box, original.box)
+
+        assert [*loaded.collections] == [*original.collections]
+
+        for name, collection in original.collections.items():
+            assert type(loaded[name]) is type(collection)
+            assert loaded[name].key_map == collection.key_map
+            assert loaded[name].potentials == collection.potentials
+
+        assert loaded.topology.n_molecules == original.topology.n_molecules
+
+        for loaded_molecule, original_molecule in zip(
+            loaded.topology.molecules,
+            original.topology.molecules,
+        ):
+            expected = original_molecule.to_smiles(mapped=True)
+
+            assert loaded_molecule.to_smiles(mapped=True) == expected
+
+    def test_roundtrip(self, interchange, tmp_path):
+        interchange.to_npz(tmp_path / "out.npz")
+
+        self.assert_same(interchange, Interchange.from_npz(tmp_path / "out.npz"))
+
+    def test_roundtrip_memory_mapped(self, interchange, tmp_path):
+        interchange.to_npz(tmp_path / "out.npz")
+
+        loaded = Interchange.from_npz(tmp_path / "out.npz", mmap=True)
+
+        assert isinstance(loaded.positions.m, numpy.memmap)
+
+        self.assert_same(interchange, loaded)
+
+    def test_unique_molecules_stored_once(self, interchange, tmp_path):
+        from openff.interchange.components._npz import _decode_json
+
+        interchange.to_npz(tmp_path / "out.npz")
+
+        with numpy.load(tmp_path / "out.npz") as data:
+            metadata = _decode_json(data["metadata"])
+
+            assert len(metadata["topology"]["unique_molecules"]) == 2
+            assert data["topology/molecule_indices"].tolist() == [0, 1, 1]
+
+    def test_virtual_sites_stored_as_json(self, sage_with_bond_charge, tmp_path):
+        interchange = sage_with_bond_charge.create_interchange(
+            MoleculeWithConformer.from_smiles("CCl").to_topology(),
+        )
+
+        interchange.to_npz(tmp_path / "out.npz")
+
+        loaded = Interchange.from_npz(tmp_path / "out.npz")
+
+        assert loaded["VirtualSites"].key_map == interchange["VirtualSites"].key_map
+        assert loaded["Electrostatics"].key_map == interchange["Electrostatics"].key_map
+
+    def test_not_interchange_file(self, tmp_path):
+        numpy.savez(
+            tmp_path / "other.npz",
+            metadata=numpy.frombuffer(b"{}", dtype=numpy.uint8),
+        )
+
+        with pytest.raises(ValueError, match="not an Interchange"):
+            Interchange.from_npz(tmp_path / "other.npz")
+
+    @skip_if_missing("openmm")
+    def test_same_energies(self, interchange, tmp_path):
+        interchange.to_npz(tmp_path / "out.npz")
+
+        get_openmm_energies(interchange, combine_nonbonded_forces=False).compare(
+            get_openmm_energies(
+                Interchange.from_npz(tmp_path / "out.npz"),
+                combine_nonbonded_forces=False,
+            ),
+        )
+
+    def test_no_topology(self, tmp_path):
+        interchange = Interchange()
+        interchange.positions = Quantity(numpy.zeros((3, 3)), unit.nanometer)
+
+        interchange.to_npz(tmp_path / "out.npz")
+
+        loaded = Interchange.from_npz(tmp_path / "out.npz")
+
+        assert loaded.topology is None
+        assert loaded.collections == dict()
+        assert numpy.allclose(loaded.positions, interchange.positions)
+
+    def test_molecule_conformers_not_modified(self, interchange, tmp_path):
+        molecule: Molecule = interchange.topology.molecule(0)
+        n_conformers = molecule.n_conformers
+
+        interchange.to_npz(tmp_path / "out.npz")
+
+        assert molecule.n_conformers == n_conformers
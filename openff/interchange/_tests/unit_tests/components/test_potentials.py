@@ -87,3 +87,77 @@ class TestPotentialSerialization:
         potential = Potential.parse_raw(dummy_potential.json())
 
         assert potential.parameters == dummy_potential.parameters
+
+
+class TestKeyMapIndex:
+    @pytest.fixture
+    def collection(self, sage):
+        interchange = sage.create_interchange(Molecule.from_smiles("CCO").to_topology())
+
+        return interchange["Bonds"]
+
+    def test_lookup_by_atom_indices(self, collection):
+        for topology_key in collection.key_map:
+            expected = [topology_key]
+            atom_indices = topology_key.atom_indices
+
+            assert collection.get_keys_by_atom_indices(atom_indices) == expected
+            assert collection.get_keys_by_atom_indices(atom_indices[::-1]) == expected
+
+        assert collection.get_keys_by_atom_indices((0, 8)) == []
+
+    def test_lookup_by_potential_key(self, collection):
+        for potential_key in collection.potentials:
+            assert collection.get_keys_by_potential_key(potential_key) == [
+                topology_key
+                for topology_key, associated_potential_key in collection.key_map.items()
+                if associated_potential_key == potential_key
+            ]
+
+    def test_index_invalidated(self, collection):
+        topology_key, potential_key = next(iter(collection.key_map.items()))
+        atom_indices = topology_key.atom_indices
+
+        assert collection.get_keys_by_atom_indices(atom_indices) == [topology_key]
+
+        collection.key_map.pop(topology_key)
+
+        assert collection.get_keys_by_atom_indices(atom_indices) == []
+
+        collection.key_map.update({topology_key: potential_key})
+
+        assert collection.get_keys_by_atom_indices(atom_indices) == [topology_key]
+
+        collection.key_map = dict()
+
+        assert collection.get_keys_by_potential_key(potential_key) == []
+
+    def test_key_map_not_replaced(self, collection):
+        key_map = collection.key_map
+        topology_key, potential_key = next(iter(key_map.items()))
+
+        collection.get_keys_by_atom_indices(topology_key.atom_indices)
+
+        assert collection.key_map is key_map
+
+        key_map.pop(topology_key)
+
+        assert topology_key not in collection.key_map
+        assert collection.get_keys_by_atom_indices(topology_key.atom_indices) == []
+
+    def test_unvalidated_key_map(self, collection):
+        topology_key, potential_key = next(iter(collection.key_map.items()))
+
+        copied = collection.copy(update={"key_map": {topology_key: potential_key}})
+
+        assert copied.get_keys_by_potential_key(potential_key) == [topology_key]
+
+        copied.key_map.clear()
+
+        assert copied.get_keys_by_potential_key(potential_key) == []
+
+    def test_get_parameters(self, collection):
+        topology_key, potential_key = next(iter(collection.key_map.items()))
+        parameters = collection._get_parameters(atom_indices=topology_key.atom_indices)
+
+        assert parameters == collection.potentials[potential_key].parameters
@@ -21,7 +21,11 @@ from openff.interchange._tests import (
     needs_not_sander,
     needs_sander,
 )
-from openff.interchange.drivers.all import get_all_energies, get_summary_data
+from openff.interchange.drivers.all import (
+    get_all_energies,
+    get_all_energies_concurrently,
+    get_summary_data,
+)
 
 
 @skip_if_missing("openmm")
@@ -81,3 +85,43 @@ class TestDriversAll:
         # Check that (some of) the data did not NaN out
         for val in summary["Torsion"].to_dict().values():
             assert not math.isnan(val)
+
+    def test_concurrent_same_as_serial(self, basic_interchange):
+        serial = get_all_energies(basic_interchange)
+        concurrent = get_all_energies(basic_interchange, concurrent=True)
+
+        assert sorted(concurrent) == sorted(serial)
+
+        for engine in serial:
+            serial[engine].compare(concurrent[engine])
+
+    def test_concurrent_results(self, basic_interchange):
+        results = get_all_energies_concurrently(basic_interchange, _engines=["OpenMM"])
+
+        assert [*results] == ["OpenMM"]
+        assert results["OpenMM"].error is None
+        assert results["OpenMM"].wall_time > 0.0
+
+        get_all_energies(basic_interchange, _engines=[])["OpenMM"].compare(
+            results["OpenMM"].energies,
+        )
+
+    def test_concurrent_timeout(self, basic_interchange):
+        results = get_all_energies_concurrently(
+            basic_interchange,
+            timeout={"OpenMM": 0.0},
+            _engines=["OpenMM"],
+        )
+
+        assert results["OpenMM"].energies is None
+        assert isinstance(results["OpenMM"].error, TimeoutError)
+
+        with pytest.warns(UserWarning, match="Skipping OpenMM"):
+            energies = get_all_energies(
+                basic_interchange,
+                _engines=[],
+                concurrent=True,
+                timeout=0.0,
+            )
+
+        assert energies == dict()
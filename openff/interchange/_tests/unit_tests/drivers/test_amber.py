@@ -0,0 +1,74 @@
+import numpy
+import pytest
+from openff.toolkit import Quantity, unit
+
+from openff.interchange._tests import get_test_file_path
+from openff.interchange.drivers.amber import _parse_amber_energies, _write_mdcrd
+from openff.interchange.exceptions import AmberError
+
+
+class TestParseAmberEnergies:
+    def test_frames(self):
+        frames = _parse_amber_energies(get_test_file_path("rerun.mdout"))
+
+        assert len(frames) == 2
+
+        assert frames[0]["BOND"].m_as(unit.kilocalorie_per_mole) == pytest.approx(
+            0.6217,
+        )
+        assert frames[1]["1-4 EEL"].m_as(unit.kilocalorie_per_mole) == pytest.approx(
+            2.4011,
+        )
+
+        for frame, total in zip(frames, [1.5468, 1.8692]):
+            assert frame["ENERGY"].m_as(unit.kilocalorie_per_mole) == pytest.approx(
+                total,
+            )
+
+    def test_no_frames(self, tmp_path):
+        (tmp_path / "out.mdout").write_text("   4.  RESULTS\n")
+
+        with pytest.raises(AmberError, match="Unable to find any frames"):
+            _parse_amber_energies(tmp_path / "out.mdout")
+
+
+class TestWriteMdcrd:
+    @pytest.fixture
+    def positions(self):
+        return Quantity(numpy.linspace(-1.0, 1.0, 24).reshape(2, 4, 3), unit.nanometer)
+
+    def test_frames(self, positions, tmp_path):
+        box = Quantity(numpy.diag([3.0, 4.0, 5.0]), unit.nanometer)
+
+        _write_mdcrd(tmp_path / "out.mdcrd", positions, box)
+
+        lines = (tmp_path / "out.mdcrd").read_text().splitlines()
+
+        assert lines[0] == "Generated by Interchange"
+
+        # Each frame of 4 atoms has a line of 10 coordinates, a line of 2, and a line of box lengths
+        assert len(lines) == 1 + 2 * 3
+
+        for index, frame in enumerate(positions):
+            coordinates, box_lengths = (
+                lines[1 + 3 * index : 3 + 3 * index],
+                lines[3 + 3 * index],
+            )
+
+            values = [
+                float(line[start : start + 8])
+                for line in coordinates
+                for start in range(0, len(line), 8)
+            ]
+
+            assert numpy.allclose(
+                values,
+                frame.m_as(unit.angstrom).flatten(),
+                atol=1e-3,
+            )
+            assert box_lengths == "  30.000  40.000  50.000"
+
+    def test_no_box(self, positions, tmp_path):
+        _write_mdcrd(tmp_path / "out.mdcrd", positions, None)
+
+        assert len((tmp_path / "out.mdcrd").read_text().splitlines()) == 1 + 2 * 2
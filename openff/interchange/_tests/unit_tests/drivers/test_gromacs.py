@@ -1,10 +1,16 @@
+import asyncio
+
+import numpy
 import pytest
-from openff.toolkit import unit
+from openff.toolkit import Molecule, unit
 from openff.utilities.testing import skip_if_missing
 
 from openff.interchange import Interchange
 from openff.interchange._tests import needs_gmx
-from openff.interchange.drivers.gromacs import get_gromacs_energies
+from openff.interchange.drivers.gromacs import (
+    get_gromacs_energies,
+    get_gromacs_energies_async,
+)
 from openff.interchange.drivers.openmm import get_openmm_energies
 
 
@@ -18,3 +24,46 @@ def test_group_impropers(cb8_host, no_charges):
     gromacs_torsions = get_gromacs_energies(out)["Torsion"]
 
     assert abs(openmm_torsions - gromacs_torsions).m_as(unit.kilojoule_per_mole) < 1e-3
+
+
+@pytest.mark.slow
+@needs_gmx
+def test_async_same_as_sync(cb8_host, no_charges):
+    out = Interchange.from_smirnoff(no_charges, [cb8_host], box=[4, 4, 4])
+
+    async def run_twice():
+        return await asyncio.gather(
+            get_gromacs_energies_async(out),
+            get_gromacs_energies_async(out),
+        )
+
+    for report in asyncio.run(run_twice()):
+        get_gromacs_energies(out).compare(report)
+
+
+@pytest.mark.slow
+@needs_gmx
+def test_multiple_frames(sage_unconstrained):
+    molecule = Molecule.from_smiles("CCO")
+    molecule.generate_conformers(n_conformers=3)
+
+    topology = molecule.to_topology()
+    topology.box_vectors = unit.Quantity([4, 4, 4], unit.nanometer)
+
+    interchange = sage_unconstrained.create_interchange(topology)
+
+    frames = unit.Quantity(
+        numpy.stack(
+            [conformer.m_as(unit.nanometer) for conformer in molecule.conformers],
+        ),
+        unit.nanometer,
+    )
+
+    report = get_gromacs_energies(interchange, positions=frames)
+
+    assert report.n_frames == len(molecule.conformers)
+
+    for index, conformer in enumerate(molecule.conformers):
+        interchange.positions = conformer
+
+        get_gromacs_energies(interchange).compare(report.frame(index))
@@ -1,9 +1,15 @@
+import asyncio
+
 import pytest
 from openff.toolkit import Quantity, unit
 
 from openff.interchange._tests import MoleculeWithConformer, needs_lmp
 from openff.interchange.constants import kj_mol
-from openff.interchange.drivers.lammps import _process, get_lammps_energies
+from openff.interchange.drivers.lammps import (
+    _process,
+    get_lammps_energies,
+    get_lammps_energies_async,
+)
 
 
 class TestProcess:
@@ -55,3 +61,14 @@ class TestLAMMPSDriver:
         topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
 
         assert get_lammps_energies(sage.create_interchange(topology))["Bond"].m == 0.0
+
+    @needs_lmp
+    def test_async_same_as_sync(self, sage):
+        topology = MoleculeWithConformer.from_smiles("CCO").to_topology()
+        topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+        interchange = sage.create_interchange(topology)
+
+        get_lammps_energies(interchange).compare(
+            asyncio.run(get_lammps_energies_async(interchange)),
+        )
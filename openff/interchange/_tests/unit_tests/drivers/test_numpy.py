@@ -0,0 +1,99 @@
+import numpy
+import pytest
+from openff.toolkit import Quantity, Topology
+
+from openff.interchange._tests import MoleculeWithConformer, _rng
+from openff.interchange.constants import kj_mol
+from openff.interchange.drivers.numpy import get_numpy_energies
+from openff.interchange.drivers.openmm import get_openmm_energies
+from openff.interchange.drivers.report import EnergyReport, MultiFrameEnergyReport
+from openff.interchange.exceptions import (
+    MissingPositionsError,
+    UnsupportedBoxError,
+    UnsupportedExportError,
+)
+
+
+@pytest.fixture
+def topology():
+    return Topology.from_molecules(
+        [
+            MoleculeWithConformer.from_smiles("CCO"),
+            MoleculeWithConformer.from_smiles("c1ccccc1O"),
+        ],
+    )
+
+
+class TestNumPyEnergies:
+    pytest.importorskip("openmm")
+
+    @pytest.mark.parametrize("detailed", [True, False])
+    def test_same_as_openmm_non_periodic(self, sage_unconstrained, topology, detailed):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        report = get_numpy_energies(interchange, detailed=detailed)
+
+        assert isinstance(report, EnergyReport)
+
+        report.compare(
+            get_openmm_energies(
+                interchange,
+                combine_nonbonded_forces=False,
+                detailed=detailed,
+            ),
+        )
+
+    def test_same_as_openmm_constrained(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        get_numpy_energies(interchange).compare(
+            get_openmm_energies(interchange, combine_nonbonded_forces=False),
+        )
+
+    def test_same_as_openmm_periodic(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+        interchange.box = Quantity(
+            [[3.0, 0.0, 0.0], [1.0, 3.0, 0.0], [0.5, 1.0, 3.0]],
+            "nanometer",
+        )
+
+        get_numpy_energies(interchange, ewald_tolerance=1e-6).compare(
+            get_openmm_energies(interchange, combine_nonbonded_forces=False),
+            tolerances={"Electrostatics": 1e-2 * kj_mol},
+        )
+
+    def test_multiple_frames(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        frames = interchange.positions + Quantity(
+            _rng.normal(scale=0.005, size=(3, *interchange.positions.shape)),
+            "nanometer",
+        )
+
+        report = get_numpy_energies(interchange, positions=frames)
+
+        assert isinstance(report, MultiFrameEnergyReport)
+        assert len(report) == 3
+
+        for index, frame in enumerate(frames):
+            expected = get_numpy_energies(interchange, positions=frame)
+
+            report.frame(index).compare(expected)
+
+    def test_missing_positions(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+        interchange.positions = None
+
+        with pytest.raises(MissingPositionsError):
+            get_numpy_energies(interchange)
+
+    def test_box_not_reduced(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+        interchange.box = Quantity(numpy.triu(numpy.full((3, 3), 3.0)), "nanometer")
+
+        with pytest.raises(UnsupportedBoxError, match="reduced form"):
+            get_numpy_energies(interchange)
+
+    def test_virtual_sites_unsupported(self, tip4p, water):
+        with pytest.raises(UnsupportedExportError, match="VirtualSites"):
+            get_numpy_energies(tip4p.create_interchange(water.to_topology()))
@@ -1,12 +1,19 @@
 from copy import deepcopy
 
+import numpy
 import pytest
-from openff.toolkit import ForceField, Quantity
+from openff.toolkit import ForceField, Quantity, Topology
 from openff.utilities.utilities import has_package
 
-from openff.interchange._tests import MoleculeWithConformer, get_test_file_path
+from openff.interchange._tests import MoleculeWithConformer, _rng, get_test_file_path
 from openff.interchange.constants import kj_mol
-from openff.interchange.drivers.openmm import _process, get_openmm_energies
+from openff.interchange.drivers.openmm import (
+    OpenMMEnergyEvaluator,
+    _process,
+    get_openmm_energies,
+)
+from openff.interchange.drivers.report import EnergyReport, MultiFrameEnergyReport
+from openff.interchange.exceptions import UnsupportedExportError
 
 if has_package("openmm"):
     import openmm
@@ -95,6 +102,217 @@ class TestProcess:
         assert processed["vdW 1-4"].m_as(kj_mol) == -2
 
 
+class TestOpenMMEnergyEvaluator:
+    pytest.importorskip("openmm")
+
+    @pytest.fixture
+    def topology(self):
+        return Topology.from_molecules(
+            [
+                MoleculeWithConformer.from_smiles("CCO"),
+                MoleculeWithConformer.from_smiles("c1ccccc1O"),
+            ],
+        )
+
+    @pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+    def test_same_energies_as_new_context(
+        self,
+        sage_unconstrained,
+        topology,
+        combine_nonbonded_forces,
+    ):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        evaluator = OpenMMEnergyEvaluator(
+            interchange,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+        )
+
+        evaluator.get_energies().compare(
+            get_openmm_energies(
+                interchange,
+                combine_nonbonded_forces=combine_nonbonded_forces,
+            ),
+        )
+
+    @pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+    def test_update_parameters(
+        self,
+        sage_unconstrained,
+        topology,
+        combine_nonbonded_forces,
+    ):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        evaluator = OpenMMEnergyEvaluator(
+            interchange,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+        )
+
+        original = evaluator.get_energies()
+
+        sage_unconstrained["Bonds"].parameters["[#6X4:1]-[#1:2]"].k *= 1.5
+        sage_unconstrained["Angles"].parameters["[*:1]~[#6X4:2]-[*:3]"].angle *= 0.9
+        propers = sage_unconstrained["ProperTorsions"]
+        propers.parameters["[*:1]-[#6X4:2]-[#6X4:3]-[*:4]"].k1 *= 2.0
+        sage_unconstrained["ImproperTorsions"].parameters[0].k1 *= 2.0
+        sage_unconstrained["vdW"].parameters["[#1:1]-[#6X4]"].epsilon *= 2.0
+
+        evaluator.update_parameters(interchange.update_parameters(sage_unconstrained))
+
+        updated = evaluator.get_energies()
+
+        updated.compare(
+            get_openmm_energies(
+                sage_unconstrained.create_interchange(topology),
+                combine_nonbonded_forces=combine_nonbonded_forces,
+            ),
+        )
+
+        for key in ["Bond", "Angle", "Torsion"]:
+            assert updated[key] != original[key]
+
+    @pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+    def test_update_charges(
+        self,
+        sage_unconstrained,
+        topology,
+        combine_nonbonded_forces,
+    ):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        evaluator = OpenMMEnergyEvaluator(
+            interchange,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+        )
+
+        molecules = [deepcopy(molecule) for molecule in topology.molecules]
+
+        for molecule in molecules:
+            molecule.assign_partial_charges("gasteiger")
+
+        other = sage_unconstrained.create_interchange(
+            topology,
+            charge_from_molecules=molecules,
+        )
+
+        interchange.collections["Electrostatics"] = other["Electrostatics"]
+
+        evaluator.update_parameters({"Electrostatics": list()})
+
+        evaluator.get_energies().compare(
+            get_openmm_energies(
+                other,
+                combine_nonbonded_forces=combine_nonbonded_forces,
+            ),
+        )
+
+    def test_update_constraints(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        evaluator = OpenMMEnergyEvaluator(interchange)
+
+        sage["Bonds"].parameters["[#6X4:1]-[#1:2]"].length = Quantity(1.2, "angstrom")
+
+        evaluator.update_parameters(interchange.update_parameters(sage))
+
+        distances = [
+            evaluator.system.getConstraintParameters(index)[2]
+            for index in range(evaluator.system.getNumConstraints())
+        ]
+
+        assert any(
+            distance.value_in_unit(openmm.unit.nanometer) == pytest.approx(0.12)
+            for distance in distances
+        )
+
+    def test_virtual_sites_unsupported(self, tip4p, water):
+        with pytest.raises(UnsupportedExportError, match="virtual sites"):
+            OpenMMEnergyEvaluator(tip4p.create_interchange(water.to_topology()))
+
+
+class TestMultipleFrames:
+    pytest.importorskip("openmm")
+
+    @pytest.fixture
+    def interchange(self, sage):
+        return sage.create_interchange(
+            Topology.from_molecules(
+                [
+                    MoleculeWithConformer.from_smiles("CCO"),
+                    MoleculeWithConformer.from_smiles("c1ccccc1O"),
+                ],
+            ),
+        )
+
+    @pytest.fixture
+    def frames(self, interchange):
+        return interchange.positions + Quantity(
+            _rng.normal(scale=0.005, size=(4, *interchange.positions.shape)),
+            "nanometer",
+        )
+
+    @pytest.mark.parametrize("combine_nonbonded_forces", [True, False])
+    @pytest.mark.parametrize("detailed", [True, False])
+    def test_same_as_single_frames(
+        self,
+        interchange,
+        frames,
+        combine_nonbonded_forces,
+        detailed,
+    ):
+        report = get_openmm_energies(
+            interchange,
+            combine_nonbonded_forces=combine_nonbonded_forces,
+            detailed=detailed,
+            positions=frames,
+        )
+
+        assert isinstance(report, MultiFrameEnergyReport)
+        assert len(report) == 4
+
+        for index, frame in enumerate(frames):
+            interchange.positions = frame
+
+            reference = get_openmm_energies(
+                interchange,
+                combine_nonbonded_forces=combine_nonbonded_forces,
+                detailed=detailed,
+            )
+
+            assert [*report.energies] == [*reference.energies]
+
+            for key, energy in reference.energies.items():
+                assert report[key][index].m_as(kj_mol) == pytest.approx(
+                    energy.m_as(kj_mol),
+                )
+
+    def test_single_frame(self, interchange, frames):
+        report = get_openmm_energies(interchange, positions=frames[0])
+
+        assert isinstance(report, EnergyReport)
+
+        interchange.positions = frames[0]
+
+        report.compare(get_openmm_energies(interchange))
+
+    def test_virtual_sites(self, tip4p, water_dimer):
+        interchange = tip4p.create_interchange(water_dimer)
+
+        positions = interchange.positions
+
+        report = get_openmm_energies(
+            interchange,
+            positions=numpy.stack([positions.m, positions.m]) * positions.u,
+        )
+
+        report.frame(1).compare(get_openmm_energies(interchange))
+
+    def test_bad_shape(self, interchange, frames):
+        with pytest.raises(ValueError, match="n_frames, n_atoms, 3"):
+            get_openmm_energies(interchange, positions=frames[:, :-1])
+
+
 class TestReportWithPlugins:
     pytest.importorskip("smirnoff_plugins")
     pytest.importorskip("openeye")
@@ -1,10 +1,15 @@
+import numpy
 import pytest
-from openff.toolkit import unit
+from openff.toolkit import Quantity, unit
 from openff.units.openmm import ensure_quantity
 from openff.utilities.testing import skip_if_missing
 
 from openff.interchange.constants import kj_mol
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers.report import (
+    EnergyReport,
+    MultiFrameEnergyReport,
+    _get_frames,
+)
 from openff.interchange.exceptions import (
     EnergyError,
     IncompatibleTolerancesError,
@@ -177,3 +182,66 @@ class TestEnergyReport:
             match="whether nonbonded",
         ):
             report.compare(report, {"Nonbonded": 0.0 * kj_mol})
+
+
+class TestMultiFrameEnergyReport:
+    @pytest.fixture
+    def report(self):
+        return MultiFrameEnergyReport(
+            energies={
+                "Bond": Quantity([1.0, 2.0, 3.0], kj_mol),
+                "Angle": Quantity([1.0, 1.0, 1.0], kj_mol),
+                "Nonbonded": Quantity([-1.0, -2.0, -4.0], kj_mol),
+            },
+        )
+
+    def test_getitem(self, report):
+        assert len(report) == report.n_frames == 3
+
+        numpy.testing.assert_allclose(report["Bond"].m_as(kj_mol), [1.0, 2.0, 3.0])
+        numpy.testing.assert_allclose(report.total_energy.m_as(kj_mol), [1.0, 1.0, 0.0])
+
+        assert report["vdW"] is None
+
+    def test_frame(self, report):
+        frame = report.frame(2)
+
+        assert isinstance(frame, EnergyReport)
+        assert frame["Bond"].m_as(kj_mol) == 3.0
+        assert frame.total_energy.m_as(kj_mol) == 0.0
+
+    def test_bad_constructor(self):
+        with pytest.raises(InvalidEnergyError, match="Foo"):
+            MultiFrameEnergyReport(energies={"Foo": Quantity([1.0], kj_mol)})
+
+        with pytest.raises(InvalidEnergyError, match="one value per frame"):
+            MultiFrameEnergyReport(
+                energies={
+                    "Bond": Quantity([1.0], kj_mol),
+                    "Angle": Quantity([1.0, 2.0], kj_mol),
+                },
+            )
+
+    def test_from_reports(self, report):
+        stacked = MultiFrameEnergyReport.from_reports(
+            [report.frame(index) for index in range(3)],
+        )
+
+        assert len(stacked) == 3
+
+        for key in report.energies:
+            numpy.testing.assert_allclose(
+                stacked[key].m_as(kj_mol),
+                report[key].m_as(kj_mol),
+            )
+
+
+def test_get_frames():
+    single = Quantity(numpy.zeros((4, 3)), unit.nanometer)
+    multiple = Quantity(numpy.zeros((2, 4, 3)), unit.nanometer)
+
+    assert _get_frames(single, n_atoms=4).shape == (1, 4, 3)
+    assert _get_frames(multiple, n_atoms=4).shape == (2, 4, 3)
+
+    with pytest.raises(ValueError, match="n_frames, n_atoms, 3"):
+        _get_frames(Quantity(numpy.zeros((2, 5, 3)), unit.nanometer), n_atoms=4)
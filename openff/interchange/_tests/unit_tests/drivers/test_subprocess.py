@@ -0,0 +1,60 @@
+import asyncio
+import sys
+
+import pytest
+
+from openff.interchange.drivers._subprocess import _run_async
+
+
+class TestRunAsync:
+    def test_output(self, tmp_path):
+        returncode, out, err = asyncio.run(
+            _run_async(
+                sys.executable,
+                "-c",
+                "import os; print(os.getcwd())",
+                cwd=tmp_path,
+            ),
+        )
+
+        assert returncode == 0
+        assert out.strip() == str(tmp_path.resolve())
+        assert err == ""
+
+    def test_failure(self, tmp_path):
+        returncode, _, err = asyncio.run(
+            _run_async(sys.executable, "-c", "raise ValueError('bad')", cwd=tmp_path),
+        )
+
+        assert returncode != 0
+        assert "ValueError: bad" in err
+
+    def test_concurrent(self, tmp_path):
+        async def run_all():
+            return await asyncio.gather(
+                *[
+                    _run_async(sys.executable, "-c", f"print({index})", cwd=tmp_path)
+                    for index in range(4)
+                ],
+            )
+
+        assert [int(out) for _, out, _ in asyncio.run(run_all())] == [0, 1, 2, 3]
+
+    def test_cancellation_kills_process(self, tmp_path):
+        async def run_and_cancel():
+            task = asyncio.create_task(
+                _run_async(
+                    sys.executable,
+                    "-c",
+                    "import time; time.sleep(60)",
+                    cwd=tmp_path,
+                ),
+            )
+
+            await asyncio.sleep(0.5)
+            task.cancel()
+
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run_and_cancel())
@@ -14,6 +14,7 @@ from openff.interchange import Interchange
 from openff.interchange._tests import get_test_file_path, requires_openeye
 from openff.interchange.drivers import get_amber_energies, get_openmm_energies
 from openff.interchange.exceptions import UnsupportedExportError
+from openff.interchange.models import TopologyKey
 
 if has_package("openmm"):
     import openmm
@@ -171,6 +172,77 @@ class TestPRMTOP:
         assert openmm_atom_names == pdb_atom_names
 
 
+class TestPRMTOPSections:
+    @pytest.mark.parametrize("n_values", [0, 1, 10, 11, 10_007])
+    def test_integer_section_format(self, n_values):
+        import io
+
+        from openff.interchange.interop.amber.export._export import (
+            _write_integer_section,
+        )
+
+        values = np.arange(n_values) * 37 - 1000
+
+        file = io.StringIO()
+        _write_integer_section(file, values)
+
+        lines = file.getvalue().splitlines()
+
+        assert len(lines) == max(1, -(-n_values // 10))
+        assert all(len(line) == 80 for line in lines[:-1])
+        assert [int(val) for line in lines for val in line.split()] == values.tolist()
+
+    def test_float_section_format(self):
+        import io
+
+        from openff.interchange.interop.amber.export._export import _write_float_section
+
+        file = io.StringIO()
+        _write_float_section(file, [1.0, -2.5e-10, 3.0e10, 0.0, 5.0, 6.0])
+
+        assert file.getvalue() == (
+            "  1.00000000E+00 -2.50000000E-10  3.00000000E+10  0.00000000E+00  5.00000000E+00\n"
+            "  6.00000000E+00\n"
+        )
+
+    def test_exclusion_arrays(self):
+        from openff.interchange.components._graph import BondGraph
+        from openff.interchange.interop.amber.export._export import (
+            _get_exclusion_arrays,
+        )
+
+        # Ethyne, with hydrogens last
+        molecule = Molecule.from_mapped_smiles("[H:3][C:1]#[C:2][H:4]")
+        pairs, _ = BondGraph.from_topology(molecule).get_pairs()
+
+        number_excluded_atoms, excluded_atoms_list = _get_exclusion_arrays(pairs, 4)
+
+        assert number_excluded_atoms.tolist() == [3, 2, 1, 1]
+        # One-indexed, with a 0 for the last atom which has no (higher-indexed) exclusions
+        assert excluded_atoms_list.tolist() == [2, 3, 4, 3, 4, 4, 0]
+
+    @skip_if_missing("openmm")
+    def test_lennard_jones_coefficients(self, sage, tmp_path):
+        topology = Molecule.from_smiles("CCO").to_topology()
+        topology.box_vectors = [4, 4, 4] * unit.nanometer
+
+        interchange = sage.create_interchange(topology)
+        interchange.to_prmtop(tmp_path / "coefficients.prmtop")
+
+        prmtop = parmed.load_file(str(tmp_path / "coefficients.prmtop"))
+
+        vdw = interchange["vdW"]
+
+        for atom in prmtop.atoms:
+            potential_key = vdw.key_map[TopologyKey(atom_indices=(atom.idx,))]
+            parameters = vdw.potentials[potential_key].parameters
+
+            assert atom.sigma == pytest.approx(parameters["sigma"].m_as(unit.angstrom))
+            assert atom.epsilon == pytest.approx(
+                parameters["epsilon"].m_as(unit.kilocalorie / unit.mole),
+            )
+
+
 class TestAmberResidues:
     @pytest.mark.parametrize("patch_residue_name", [True, False])
     def test_single_residue_system_residue_name(
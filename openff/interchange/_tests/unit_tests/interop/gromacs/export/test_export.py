@@ -72,6 +72,48 @@ class TestToGro(_NeedsGROMACS):
         assert not numpy.allclose(positions[3], positions[7])
 
 
+class TestToGroTrajectory:
+    def test_frames(self, sage, tmp_path):
+        from openff.interchange.interop.gromacs.export._export import GROMACSWriter
+        from openff.interchange.smirnoff._gromacs import _convert
+
+        interchange = sage.create_interchange(
+            MoleculeWithConformer.from_smiles("CCO").to_topology(),
+        )
+        interchange.box = Quantity([4, 4, 4], unit.nanometer)
+
+        frames = [
+            interchange.positions,
+            interchange.positions + Quantity([0.1, 0.2, 0.3], unit.nanometer),
+        ]
+
+        writer = GROMACSWriter(
+            system=_convert(interchange),
+            gro_file=tmp_path / "0.gro",
+        )
+        writer.to_gro(decimal=3)
+
+        writer.gro_file = tmp_path / "traj.gro"
+        writer.to_gro_trajectory(positions=frames, decimal=3)
+
+        lines = (tmp_path / "traj.gro").read_text().splitlines(keepends=True)
+        n_lines = interchange.topology.n_atoms + 3
+
+        assert len(lines) == 2 * n_lines
+        assert lines[:n_lines] == (tmp_path / "0.gro").read_text().splitlines(
+            keepends=True,
+        )
+
+        (tmp_path / "1.gro").write_text("".join(lines[n_lines:]))
+
+        assert numpy.allclose(
+            _read_coordinates(tmp_path / "1.gro"),
+            frames[1],
+            atol=Quantity(1e-3, unit.nanometer),
+        )
+        assert numpy.allclose(_read_box(tmp_path / "1.gro"), interchange.box)
+
+
 @skip_if_missing("mdtraj")
 @skip_if_missing("openmm")
 class TestGROMACSGROFile(_NeedsGROMACS):
@@ -3,6 +3,7 @@ from openff.toolkit import Molecule, unit
 from openff.utilities.testing import skip_if_missing
 
 from openff.interchange.exceptions import UnsupportedCutoffMethodError
+from openff.interchange.models import TopologyKey
 
 
 @skip_if_missing("openmm")
@@ -58,3 +59,55 @@ class TestEwaldSettings:
                 break
         else:
             pytest.fail("Found no `NonbondedForce`")
+
+
+@skip_if_missing("openmm")
+class TestParticleParameters:
+    def test_get_charge_arrays_mixed_units(self):
+        from openff.interchange.interop.openmm._nonbonded import _get_charge_arrays
+
+        atom_charges, virtual_site_charges = _get_charge_arrays(
+            {
+                TopologyKey(atom_indices=(1,)): unit.Quantity(0.5, unit.e),
+                TopologyKey(atom_indices=(0,)): unit.Quantity(
+                    -0.5 * 1.602176634e-19,
+                    unit.coulomb,
+                ),
+            },
+            n_atoms=3,
+        )
+
+        assert atom_charges.tolist() == pytest.approx([-0.5, 0.5, 0.0])
+        assert virtual_site_charges == dict()
+
+    def test_particle_parameters_match_collections(self, sage, basic_top):
+        import openmm
+
+        interchange = sage.create_interchange(basic_top)
+        system = interchange.to_openmm_system(combine_nonbonded_forces=False)
+
+        charges = interchange["Electrostatics"].charges
+        vdw = interchange["vdW"]
+
+        for force in system.getForces():
+            if isinstance(force, openmm.NonbondedForce):
+                for atom_index in range(interchange.topology.n_atoms):
+                    charge, _, _ = force.getParticleParameters(atom_index)
+                    expected = charges[TopologyKey(atom_indices=(atom_index,))]
+
+                    assert charge.value_in_unit(
+                        openmm.unit.elementary_charge,
+                    ) == pytest.approx(expected.m_as(unit.e))
+
+            elif isinstance(force, openmm.CustomNonbondedForce):
+                for atom_index in range(interchange.topology.n_atoms):
+                    sigma, epsilon = force.getParticleParameters(atom_index)
+                    potential_key = vdw.key_map[TopologyKey(atom_indices=(atom_index,))]
+                    parameters = vdw.potentials[potential_key].parameters
+
+                    assert sigma == pytest.approx(
+                        parameters["sigma"].m_as(unit.nanometer),
+                    )
+                    assert epsilon == pytest.approx(
+                        parameters["epsilon"].m_as(unit.kilojoule_per_mole),
+                    )
@@ -10,6 +10,7 @@ from openff.interchange.drivers import get_openmm_energies
 from openff.interchange.exceptions import (
     CutoffMismatchError,
     SwitchingFunctionMismatchError,
+    UnsupportedCombinationError,
 )
 
 
@@ -69,6 +70,47 @@ class TestCombine:
 
         # TODO: Ensure the de-duplication is maintained after exports
 
+    def test_inputs_not_modified(self, monkeypatch, sage_unconstrained):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        interchange1 = Interchange.from_smirnoff(
+            sage_unconstrained,
+            [Molecule.from_smiles("CCO")],
+        )
+        interchange2 = Interchange.from_smirnoff(
+            sage_unconstrained,
+            [Molecule.from_smiles("O")],
+        )
+
+        for interchange in (interchange1, interchange2):
+            interchange.box = [4, 4, 4] * unit.nanometer
+
+        n_keys = {
+            name: len(collection.key_map)
+            for name, collection in interchange1.collections.items()
+        }
+
+        combined = interchange1.combine(interchange2)
+
+        assert combined.topology is not interchange1.topology
+        assert not numpy.shares_memory(combined.box.m, interchange1.box.m)
+        assert interchange1.topology.n_atoms == 9
+
+        for name, collection in interchange1.collections.items():
+            assert combined[name] is not collection
+            assert len(collection.key_map) == n_keys[name]
+            n_combined_keys = n_keys[name] + len(interchange2[name].key_map)
+
+            assert len(combined[name].key_map) == n_combined_keys
+
+        potential_key = next(iter(combined["Bonds"].potentials))
+        combined["Bonds"].potentials[potential_key].parameters["k"] *= 2
+
+        combined_k = combined["Bonds"].potentials[potential_key].parameters["k"]
+        original_k = interchange1["Bonds"].potentials[potential_key].parameters["k"]
+
+        assert combined_k == 2 * original_k
+
     def test_positions_setting(self, monkeypatch, sage):
         """Test that positions exist on the result if and only if
         both input objects have positions."""
@@ -135,3 +177,103 @@ class TestCombine:
             sage.create_interchange(basic_top).combine(
                 sage_modified.create_interchange(basic_top),
             )
+
+
+class TestConcatenate:
+    @pytest.fixture
+    def interchanges(self, sage_unconstrained) -> list[Interchange]:
+        interchanges = list()
+
+        for smiles in ["C1CCOC1", "CC(=O)O", "O", "CC(=O)O"]:
+            molecule = Molecule.from_smiles(smiles)
+            molecule.generate_conformers(n_conformers=1)
+
+            interchange = Interchange.from_smirnoff(sage_unconstrained, [molecule])
+            interchange.box = [4, 4, 4] * numpy.eye(3)
+
+            interchanges.append(interchange)
+
+        return interchanges
+
+    def test_same_as_combine(self, monkeypatch, interchanges):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        concatenated = Interchange.concatenate(interchanges)
+
+        combined = interchanges[0]
+        for interchange in interchanges[1:]:
+            combined = combined.combine(interchange)
+
+        assert concatenated.topology.n_atoms == combined.topology.n_atoms
+        assert concatenated.topology.n_molecules == 4
+
+        numpy.testing.assert_allclose(concatenated.positions, combined.positions)
+
+        for name, collection in combined.collections.items():
+            assert concatenated[name].key_map == collection.key_map
+            assert concatenated[name].potentials == collection.potentials
+
+        numpy.testing.assert_equal(
+            concatenated["vdW"].get_system_parameters(),
+            combined["vdW"].get_system_parameters(),
+        )
+
+    @skip_if_missing("openmm")
+    def test_same_energies_as_combine(self, monkeypatch, interchanges):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        combined = interchanges[0]
+        for interchange in interchanges[1:]:
+            combined = combined.combine(interchange)
+
+        get_openmm_energies(
+            Interchange.concatenate(interchanges),
+            combine_nonbonded_forces=False,
+        ).compare(
+            get_openmm_energies(combined, combine_nonbonded_forces=False),
+        )
+
+    def test_inputs_not_modified(self, monkeypatch, interchanges):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        n_keys = [len(interchange["Bonds"].key_map) for interchange in interchanges]
+
+        concatenated = Interchange.concatenate(interchanges)
+
+        n_keys_after = [
+            len(interchange["Bonds"].key_map) for interchange in interchanges
+        ]
+
+        assert n_keys_after == n_keys
+        assert len(concatenated["Bonds"].key_map) == sum(n_keys)
+
+    def test_missing_positions(self, monkeypatch, interchanges):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        interchanges[1].positions = None
+
+        with pytest.warns(UserWarning, match="Setting positions to None"):
+            assert Interchange.concatenate(interchanges).positions is None
+
+    def test_error_mismatched_cutoffs(self, monkeypatch, sage, basic_top):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        sage_modified = ForceField("openff-2.1.0.offxml")
+        sage_modified["vdW"].cutoff *= 1.5
+
+        with pytest.raises(CutoffMismatchError):
+            Interchange.concatenate(
+                [
+                    sage.create_interchange(basic_top),
+                    sage.create_interchange(basic_top),
+                    sage_modified.create_interchange(basic_top),
+                ],
+            )
+
+    def test_error_mismatched_boxes(self, monkeypatch, interchanges):
+        monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
+
+        interchanges[2].box = [5, 5, 5] * numpy.eye(3)
+
+        with pytest.raises(UnsupportedCombinationError, match="unequal box vectors"):
+            Interchange.concatenate(interchanges)
@@ -0,0 +1,143 @@
+import numpy
+import pytest
+from openff.toolkit import Quantity, Topology, unit
+from openff.utilities.testing import skip_if_missing
+
+from openff.interchange._tests import MoleculeWithConformer
+from openff.interchange.drivers import get_openmm_energies
+from openff.interchange.exceptions import MissingBoxError
+
+
+@pytest.fixture
+def unit_cell(sage_unconstrained):
+    topology = Topology.from_molecules([MoleculeWithConformer.from_smiles("CCO")])
+    topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+    return sage_unconstrained.create_interchange(topology)
+
+
+@pytest.fixture
+def unit_cell_with_virtual_sites(sage_with_bond_charge):
+    topology = MoleculeWithConformer.from_mapped_smiles(
+        "[H:3][C:2]([H:4])([H:5])[Cl:1]",
+    ).to_topology()
+    topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+    return sage_with_bond_charge.create_interchange(topology)
+
+
+class TestReplicate:
+    def test_counts(self, unit_cell):
+        supercell = unit_cell.replicate((2, 1, 3))
+
+        assert supercell.topology.n_atoms == 6 * unit_cell.topology.n_atoms
+        assert supercell.topology.n_molecules == 6
+        assert supercell.positions.shape == (6 * unit_cell.topology.n_atoms, 3)
+
+        numpy.testing.assert_allclose(
+            supercell.box.m_as(unit.nanometer),
+            numpy.diag([8, 4, 12]),
+        )
+        numpy.testing.assert_allclose(supercell.topology.box_vectors, supercell.box)
+
+        for name, collection in unit_cell.collections.items():
+            assert len(supercell[name].key_map) == 6 * len(collection.key_map)
+            assert supercell[name].potentials == collection.potentials
+
+    def test_positions_translated(self, unit_cell):
+        n_atoms = unit_cell.topology.n_atoms
+
+        supercell = unit_cell.replicate((1, 1, 2))
+
+        numpy.testing.assert_allclose(
+            supercell.positions[:n_atoms],
+            unit_cell.positions,
+        )
+        numpy.testing.assert_allclose(
+            (supercell.positions[n_atoms:] - unit_cell.positions).m_as(unit.nanometer),
+            numpy.tile([0, 0, 4], (n_atoms, 1)),
+        )
+
+    def test_keys_offset(self, unit_cell):
+        n_atoms = unit_cell.topology.n_atoms
+
+        supercell = unit_cell.replicate((2, 1, 1))
+
+        for topology_key, potential_key in unit_cell["Bonds"].key_map.items():
+            shifted = type(topology_key)(
+                atom_indices=tuple(
+                    index + n_atoms for index in topology_key.atom_indices
+                ),
+                bond_order=topology_key.bond_order,
+            )
+
+            assert supercell["Bonds"].key_map[shifted] == potential_key
+
+        charges = {
+            key.atom_indices[0]: charge
+            for key, charge in unit_cell["Electrostatics"].charges.items()
+        }
+
+        for key, charge in supercell["Electrostatics"].charges.items():
+            assert charge == charges[key.atom_indices[0] % n_atoms]
+
+    def test_virtual_sites(self, unit_cell_with_virtual_sites):
+        n_atoms = unit_cell_with_virtual_sites.topology.n_atoms
+        virtual_sites = unit_cell_with_virtual_sites["VirtualSites"]
+        n_virtual_sites = len(virtual_sites.key_map)
+
+        supercell = unit_cell_with_virtual_sites.replicate((2, 1, 1))
+
+        assert len(supercell["VirtualSites"].key_map) == 2 * n_virtual_sites
+
+        for virtual_site_key, potential_key in virtual_sites.key_map.items():
+            shifted = virtual_site_key.copy(
+                update={
+                    "orientation_atom_indices": tuple(
+                        index + n_atoms
+                        for index in virtual_site_key.orientation_atom_indices
+                    ),
+                },
+            )
+
+            assert supercell["VirtualSites"].key_map[shifted] == potential_key
+
+            # Virtual sites are indexed after the atoms of both copies
+            index = virtual_sites.virtual_site_key_topology_index_map[virtual_site_key]
+            index_map = supercell["VirtualSites"].virtual_site_key_topology_index_map
+
+            assert index_map[shifted] == index + n_atoms + n_virtual_sites
+
+    @skip_if_missing("openmm")
+    def test_virtual_sites_to_openmm(self, unit_cell_with_virtual_sites):
+        system = unit_cell_with_virtual_sites.to_openmm_system()
+        supercell = unit_cell_with_virtual_sites.replicate((2, 1, 1)).to_openmm_system()
+
+        assert supercell.getNumParticles() == 2 * system.getNumParticles()
+        assert (
+            sum(map(supercell.isVirtualSite, range(supercell.getNumParticles()))) == 2
+        )
+
+    @skip_if_missing("openmm")
+    def test_valence_energies_scale(self, unit_cell):
+        original = get_openmm_energies(unit_cell, combine_nonbonded_forces=False)
+        replicated = get_openmm_energies(
+            unit_cell.replicate((2, 2, 2)),
+            combine_nonbonded_forces=False,
+        )
+
+        for key in ["Bond", "Angle", "Torsion"]:
+            assert replicated[key].m_as(unit.kilojoule_per_mole) == pytest.approx(
+                8 * original[key].m_as(unit.kilojoule_per_mole),
+            )
+
+    def test_missing_box(self, unit_cell):
+        unit_cell.box = None
+
+        with pytest.raises(MissingBoxError):
+            unit_cell.replicate((2, 2, 2))
+
+    @pytest.mark.parametrize("shape", [(2, 2), (0, 1, 1), (1.5, 1, 1)])
+    def test_invalid_shape(self, unit_cell, shape):
+        with pytest.raises(ValueError, match="three positive integers"):
+            unit_cell.replicate(shape)
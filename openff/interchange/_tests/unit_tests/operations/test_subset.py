@@ -0,0 +1,102 @@
+import numpy
+import pytest
+from openff.toolkit import Quantity, Topology, unit
+from openff.utilities.testing import skip_if_missing
+
+from openff.interchange import Interchange
+from openff.interchange._tests import MoleculeWithConformer
+from openff.interchange.drivers import get_openmm_energies
+
+
+@pytest.fixture
+def molecules():
+    return [
+        MoleculeWithConformer.from_smiles("CCO"),
+        MoleculeWithConformer.from_smiles("O"),
+        MoleculeWithConformer.from_smiles("c1ccccc1"),
+        MoleculeWithConformer.from_smiles("O"),
+    ]
+
+
+@pytest.fixture
+def interchange(sage_unconstrained, molecules):
+    topology = Topology.from_molecules(molecules)
+    topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+    return sage_unconstrained.create_interchange(topology)
+
+
+class TestSubset:
+    def test_same_as_parametrizing_subset(
+        self,
+        sage_unconstrained,
+        interchange,
+        molecules,
+    ):
+        subset = interchange.subset(molecule_indices=[2, 1])
+
+        topology = Topology.from_molecules([molecules[1], molecules[2]])
+        topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+        reference = sage_unconstrained.create_interchange(topology)
+
+        assert subset.topology.n_atoms == 15
+        numpy.testing.assert_allclose(subset.positions, interchange.positions[9:24])
+        numpy.testing.assert_allclose(subset.box, interchange.box)
+
+        for name in ["Bonds", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"]:
+            assert subset[name].key_map == reference[name].key_map
+            assert subset[name].potentials == reference[name].potentials
+
+    def test_potentials_pruned(self, interchange):
+        subset = interchange.subset(molecule_indices=[1])
+
+        assert len(subset["Bonds"].key_map) == 2
+        assert len(subset["Bonds"].potentials) == 1
+
+        assert set(subset["vdW"].key_map.values()) == set(subset["vdW"].potentials)
+
+    def test_atom_indices(self, interchange):
+        by_atoms = interchange.subset(atom_indices=range(9, 12))
+        by_molecules = interchange.subset(molecule_indices=[1])
+
+        assert by_atoms["Angles"].key_map == by_molecules["Angles"].key_map
+
+    def test_partial_molecule(self, interchange):
+        with pytest.raises(ValueError, match="every atom of each molecule"):
+            interchange.subset(atom_indices=[0, 1, 2])
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            dict(),
+            {"molecule_indices": [0], "atom_indices": [0]},
+            {"molecule_indices": [4]},
+        ],
+    )
+    def test_invalid_selection(self, interchange, arguments):
+        with pytest.raises(ValueError):
+            interchange.subset(**arguments)
+
+    def test_constraints(self, sage, molecules):
+        topology = Topology.from_molecules(molecules)
+        interchange = sage.create_interchange(topology)
+
+        subset = interchange.subset(molecule_indices=[3])
+
+        assert len(subset["Constraints"].key_map) == 3
+        assert all(max(key.atom_indices) < 3 for key in subset["Constraints"].key_map)
+
+    @skip_if_missing("openmm")
+    def test_same_energies(self, sage_unconstrained, interchange, molecules):
+        topology = Topology.from_molecules([molecules[0], molecules[2]])
+        topology.box_vectors = Quantity([4, 4, 4], unit.nanometer)
+
+        reference = Interchange.from_smirnoff(sage_unconstrained, topology)
+
+        get_openmm_energies(
+            interchange.subset(molecule_indices=[0, 2]),
+            combine_nonbonded_forces=False,
+        ).compare(
+            get_openmm_energies(reference, combine_nonbonded_forces=False),
+        )
@@ -0,0 +1,108 @@
+import pytest
+from openff.toolkit import Molecule, Topology
+
+from openff.interchange import Interchange
+from openff.interchange.smirnoff import ParametrizationCache
+
+
+class TestParametrizationCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ParametrizationCache(tmp_path / "cache.sqlite")
+
+    @pytest.fixture
+    def topology(self):
+        return Topology.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("O"),
+                Molecule.from_smiles("O"),
+            ],
+        )
+
+    def test_get_put(self, cache):
+        assert cache.get("matches", "foo", "[H:1][H:2]") is None
+
+        cache.put("matches", "foo", "[H:1][H:2]", {(0, 1): 0})
+
+        assert cache.get("matches", "foo", "[H:1][H:2]") == {(0, 1): 0}
+        assert cache.get("matches", "bar", "[H:1][H:2]") is None
+        assert len(cache) == 1
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        cache = ParametrizationCache(tmp_path / "cache.sqlite", max_size=2500)
+
+        for index in range(3):
+            cache.put("matches", "foo", str(index), b"x" * 1000)
+
+        assert len(cache) == 2
+        assert cache.size <= 2500
+        assert cache.get("matches", "foo", "0") is None
+
+        # Using an entry makes the other, older, one the next to be evicted
+        cache.get("matches", "foo", "1")
+        cache.put("matches", "foo", "3", b"x" * 1000)
+
+        assert cache.get("matches", "foo", "1") is not None
+        assert cache.get("matches", "foo", "2") is None
+
+    def test_same_collections_with_cache(self, sage, cache, topology):
+        uncached = Interchange.from_smirnoff(sage, topology)
+
+        cold = Interchange.from_smirnoff(sage, topology, cache=cache)
+        n_entries = len(cache)
+
+        warm = Interchange.from_smirnoff(sage, topology, cache=cache)
+
+        assert n_entries > 0
+        assert len(cache) == n_entries
+
+        for name, collection in uncached.collections.items():
+            for interchange in (cold, warm):
+                assert interchange[name].key_map == collection.key_map
+                assert interchange[name].potentials == collection.potentials
+
+    @pytest.mark.parametrize("smiles", ["c1ccccc1", "CC(=O)NC"])
+    def test_warm_cache_with_impropers(self, sage, cache, smiles):
+        topology = Molecule.from_smiles(smiles).to_topology()
+
+        Interchange.from_smirnoff(sage, topology, cache=cache)
+        warm = Interchange.from_smirnoff(sage, topology, cache=cache)
+
+        uncached = Interchange.from_smirnoff(sage, topology)
+
+        assert len(warm["ImproperTorsions"].key_map) > 0
+        assert warm["ImproperTorsions"].key_map == uncached["ImproperTorsions"].key_map
+
+    def test_cache_from_path(self, sage, tmp_path, topology):
+        Interchange.from_smirnoff(sage, topology, cache=tmp_path / "cache.sqlite")
+
+        assert len(ParametrizationCache(tmp_path / "cache.sqlite")) > 0
+
+    def test_invalidate(self, sage, cache, topology):
+        Interchange.from_smirnoff(sage, topology, cache=cache)
+        n_entries = len(cache)
+
+        assert cache.invalidate(molecule=Molecule.from_smiles("C")) == 0
+        assert cache.invalidate(molecule=topology.molecule(1)) > 0
+        assert 0 < len(cache) < n_entries
+
+        assert cache.invalidate(force_field=sage) > 0
+        assert len(cache) == 0
+
+    def test_invalidate_nothing(self, cache):
+        with pytest.raises(ValueError, match="clear"):
+            cache.invalidate()
+
+    def test_force_field_change_misses(self, sage, cache, topology):
+        Interchange.from_smirnoff(sage, topology, cache=cache)
+        n_entries = len(cache)
+
+        sage["Bonds"].parameters[0].k *= 2
+        modified = Interchange.from_smirnoff(sage, topology, cache=cache)
+
+        # Only the Bonds section changed, so only it gains new entries
+        assert len(cache) > n_entries
+        reference = Interchange.from_smirnoff(sage, topology)
+
+        assert modified["Bonds"].potentials == reference["Bonds"].potentials
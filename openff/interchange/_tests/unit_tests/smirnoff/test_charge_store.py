@@ -0,0 +1,108 @@
+import numpy
+import pytest
+from openff.toolkit import Molecule, unit
+
+from openff.interchange.smirnoff import (
+    FileChargeStore,
+    InMemoryChargeStore,
+    SMIRNOFFElectrostaticsCollection,
+)
+
+
+class TestChargeStores:
+    def test_in_memory_eviction(self):
+        store = InMemoryChargeStore(max_size=2)
+
+        for index in range(3):
+            store.put((str(index), "am1bcc", ""), numpy.zeros(3))
+
+        assert len(store) == 2
+        assert store.get(("0", "am1bcc", "")) is None
+
+        # Using an entry makes the other, older, one the next to be evicted
+        store.get(("1", "am1bcc", ""))
+        store.put(("3", "am1bcc", ""), numpy.zeros(3))
+
+        assert store.get(("1", "am1bcc", "")) is not None
+        assert store.get(("2", "am1bcc", "")) is None
+
+    def test_counters(self):
+        store = InMemoryChargeStore()
+
+        assert store.get(("C", "am1bcc", "")) is None
+
+        store.put(("C", "am1bcc", ""), numpy.zeros(5))
+        store.get(("C", "am1bcc", ""))
+        store.get(("C", "am1bcc", ""))
+
+        assert (store.hits, store.misses) == (2, 1)
+
+        store.reset_counters()
+
+        assert (store.hits, store.misses) == (0, 0)
+
+    def test_file_store(self, tmp_path):
+        charges = numpy.linspace(-0.5, 0.5, 5)
+
+        FileChargeStore(tmp_path / "charges.sqlite").put(("C", "am1bcc", ""), charges)
+
+        # A separate instance, as would be used by another process, sees the same charges
+        store = FileChargeStore(tmp_path / "charges.sqlite")
+
+        assert len(store) == 1
+        assert numpy.array_equal(store.get(("C", "am1bcc", "")), charges)
+        assert store.get(("C", "gasteiger", "")) is None
+
+        store.clear()
+
+        assert len(store) == 0
+
+    def test_in_memory_with_backend(self, tmp_path):
+        backend = FileChargeStore(tmp_path / "charges.sqlite")
+        backend.put(("C", "am1bcc", ""), numpy.zeros(5))
+
+        store = InMemoryChargeStore(backend=backend)
+
+        assert store.get(("C", "am1bcc", "")) is not None
+        assert len(store) == 1
+
+        store.put(("O", "am1bcc", ""), numpy.zeros(3))
+
+        assert len(backend) == 2
+
+
+class TestComputePartialCharges:
+    @pytest.fixture
+    def charge_store(self):
+        original = SMIRNOFFElectrostaticsCollection.charge_store
+        SMIRNOFFElectrostaticsCollection.charge_store = InMemoryChargeStore()
+
+        yield SMIRNOFFElectrostaticsCollection.charge_store
+
+        SMIRNOFFElectrostaticsCollection.charge_store = original
+
+    def test_charges_stored(self, charge_store):
+        molecule = Molecule.from_smiles("CCO")
+        mapped_smiles = molecule.to_smiles(mapped=True)
+
+        first = SMIRNOFFElectrostaticsCollection._compute_partial_charges(
+            molecule,
+            mapped_smiles,
+            "gasteiger",
+        )
+        second = SMIRNOFFElectrostaticsCollection._compute_partial_charges(
+            molecule,
+            mapped_smiles,
+            "gasteiger",
+        )
+
+        assert (charge_store.hits, charge_store.misses) == (1, 1)
+        assert first.m_as(unit.elementary_charge) == pytest.approx(
+            second.m_as(unit.elementary_charge),
+        )
+
+        molecule.assign_partial_charges("gasteiger")
+
+        assert first.m_as(unit.elementary_charge) == pytest.approx(
+            molecule.partial_charges.m_as(unit.elementary_charge),
+        )
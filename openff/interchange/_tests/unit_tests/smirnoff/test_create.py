@@ -142,6 +142,99 @@ class TestUnassignedParameters:
             Interchange.from_smirnoff(force_field=sage, topology=ethanol_top)
 
 
+class TestTemplateMatching:
+    @pytest.fixture
+    def mixed_topology(self) -> Topology:
+        # Same molecules with different atom orderings, interleaved with other molecules
+        return Topology.from_molecules(
+            [
+                Molecule.from_mapped_smiles("[H:3][C:1]([H:4])([H:5])[O:2][H:6]"),
+                Molecule.from_smiles("O"),
+                Molecule.from_mapped_smiles("[H:1][C:2]([H:3])([H:4])[O:5][H:6]"),
+                Molecule.from_smiles("c1ccccc1C=O"),
+                Molecule.from_smiles("O"),
+            ],
+        )
+
+    @pytest.mark.parametrize(
+        "handler_name",
+        ["Bonds", "Constraints", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"],
+    )
+    def test_same_matches_as_toolkit(self, sage, mixed_topology, handler_name):
+        from openff.interchange.smirnoff._base import _find_matches_by_template
+
+        handler = sage[handler_name]
+
+        expected = handler.find_matches(mixed_topology)
+        found = _find_matches_by_template(handler, mixed_topology)
+
+        assert type(found) is type(expected)
+        assert {*found.keys()} == {*expected.keys()}
+
+        for key in expected:
+            assert found[key].parameter_type is expected[key].parameter_type
+
+    def test_matches_ordered_by_molecule(self, sage, mixed_topology):
+        from openff.interchange.smirnoff._base import _find_matches_by_template
+
+        molecule_indices = [
+            mixed_topology.molecule_index(mixed_topology.atom(key[0]).molecule)
+            for key in _find_matches_by_template(sage["vdW"], mixed_topology)
+        ]
+
+        assert molecule_indices == sorted(molecule_indices)
+
+    def test_same_collections_with_duplicates(self, sage, mixed_topology):
+        interchange = Interchange.from_smirnoff(sage, mixed_topology)
+
+        for name in ["Bonds", "Angles", "ProperTorsions", "vdW"]:
+            expected = sage[name].find_matches(mixed_topology)
+
+            assert len({key.atom_indices for key in interchange[name].key_map}) == len(
+                expected,
+            )
+
+            for topology_key, potential_key in interchange[name].key_map.items():
+                match = expected[topology_key.atom_indices]
+
+                assert potential_key.id == match.parameter_type.smirks
+
+
+class TestParallelCreation:
+    @pytest.mark.slow
+    @pytest.mark.parametrize("force_field", ["sage", "sage_unconstrained"])
+    def test_same_as_serial(self, request, force_field):
+        force_field = request.getfixturevalue(force_field)
+        topology = Topology.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("O"),
+                Molecule.from_smiles("c1ccccc1C=O"),
+                Molecule.from_smiles("O"),
+            ],
+        )
+
+        serial = Interchange.from_smirnoff(force_field, topology)
+        parallel = Interchange.from_smirnoff(force_field, topology, n_workers=2)
+
+        assert [*parallel.collections] == [*serial.collections]
+
+        for name, collection in serial.collections.items():
+            assert parallel[name].key_map == collection.key_map
+            assert parallel[name].potentials == collection.potentials
+
+        for molecule in parallel.topology.molecules:
+            assert molecule.partial_charges is not None
+
+    def test_single_molecule(self, sage, water):
+        serial = Interchange.from_smirnoff(sage, [water])
+        parallel = Interchange.from_smirnoff(sage, [water], n_workers=2)
+
+        for name, collection in serial.collections.items():
+            assert parallel[name].key_map == collection.key_map
+            assert parallel[name].potentials == collection.potentials
+
+
 # TODO: Remove xfail after openff-toolkit 0.10.0
 @pytest.mark.xfail
 def test_library_charges_from_molecule():
@@ -0,0 +1,98 @@
+import pytest
+from openff.toolkit import Molecule, Quantity, Topology
+
+from openff.interchange.exceptions import MissingParametersError
+from openff.interchange.models import VirtualSiteKey
+
+_CH_SMIRKS = "[#6X4:1]-[#1:2]"
+
+
+class TestUpdateParameters:
+    @pytest.fixture
+    def topology(self):
+        return Topology.from_molecules(
+            [
+                Molecule.from_smiles("CCO"),
+                Molecule.from_smiles("O"),
+                Molecule.from_smiles("c1ccccc1"),
+            ],
+        )
+
+    def test_no_changes(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        assert interchange.update_parameters(sage) == dict()
+
+    def test_same_as_parametrizing_again(self, sage_unconstrained, topology):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        sage_unconstrained["Bonds"].parameters[_CH_SMIRKS].k *= 1.1
+        sage_unconstrained["vdW"].parameters["[#1:1]-[#6X4]"].epsilon *= 0.9
+
+        updated = interchange.update_parameters(sage_unconstrained)
+
+        assert [*updated] == ["Bonds", "vdW"]
+        assert [key.id for key in updated["Bonds"]] == [_CH_SMIRKS]
+        assert [key.id for key in updated["vdW"]] == ["[#1:1]-[#6X4]"]
+
+        reference = sage_unconstrained.create_interchange(topology)
+
+        for name in ["Bonds", "Angles", "ProperTorsions", "ImproperTorsions", "vdW"]:
+            assert interchange[name].potentials == reference[name].potentials
+
+    def test_unchanged_potentials_kept(self, sage_unconstrained, topology):
+        interchange = sage_unconstrained.create_interchange(topology)
+
+        angles = dict(interchange["Angles"].potentials)
+
+        sage_unconstrained["Bonds"].parameters[_CH_SMIRKS].k *= 1.1
+
+        interchange.update_parameters(sage_unconstrained)
+
+        for potential_key, potential in interchange["Angles"].potentials.items():
+            assert potential is angles[potential_key]
+
+    def test_virtual_sites(self, tip4p, water):
+        topology = Topology.from_molecules([water, water])
+        interchange = tip4p.create_interchange(topology)
+
+        key_map = interchange["vdW"].key_map
+
+        assert any(isinstance(key, VirtualSiteKey) for key in key_map)
+
+        for parameter in tip4p["vdW"].parameters:
+            parameter.sigma *= 1.1
+
+        updated = interchange.update_parameters(tip4p)
+
+        assert {key.associated_handler for key in updated["vdW"]} == {"vdW"}
+
+        reference = tip4p.create_interchange(topology)
+
+        assert interchange["vdW"].potentials == reference["vdW"].potentials
+
+    def test_constraint_distances(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        sage["Bonds"].parameters[_CH_SMIRKS].length = Quantity(1.2, "angstrom")
+
+        updated = interchange.update_parameters(sage)
+
+        assert [key.id for key in updated["Constraints"]] == [_CH_SMIRKS]
+
+        reference = sage.create_interchange(topology)
+
+        assert (
+            interchange["Constraints"].potentials == reference["Constraints"].potentials
+        )
+
+    def test_removed_parameter(self, sage, topology):
+        interchange = sage.create_interchange(topology)
+
+        sage["Angles"].parameters[0].smirks = "[#6:1]~[#6:2]~[#6:3]"
+
+        with pytest.raises(
+            MissingParametersError,
+            match="requires creating a new Interchange",
+        ):
+            interchange.update_parameters(sage)
@@ -0,0 +1,90 @@
+import pytest
+from openff.toolkit import Molecule
+from openff.utilities import skip_if_missing
+
+from openff.interchange import Interchange, profiling
+from openff.interchange.profiling import _count, _phase, get_last_report, profile
+
+
+@pytest.fixture(autouse=True)
+def _no_last_report(monkeypatch):
+    monkeypatch.delenv("INTERCHANGE_PROFILE", raising=False)
+    monkeypatch.setattr(profiling, "_last_report", None)
+
+
+def test_disabled_by_default():
+    with _phase("foo"):
+        _count(bar=1)
+
+    assert get_last_report() is None
+
+
+def test_nested_phases():
+    with profile() as report:
+        for _ in range(3):
+            with _phase("outer", things=2):
+                with _phase("inner"):
+                    _count(things=1)
+
+    assert [*report] == ["outer", "outer/inner"]
+
+    assert report["outer"].calls == 3
+    assert report["outer"].counts == {"things": 6}
+    assert report["outer/inner"].counts == {"things": 3}
+
+    assert report["outer"].wall_time >= report["outer/inner"].wall_time
+    assert report.wall_time >= report["outer"].wall_time
+
+    assert "outer/missing" not in report
+
+    with pytest.raises(KeyError, match="outer/missing"):
+        report["outer/missing"]
+
+
+def test_report_from_environment(monkeypatch, capsys):
+    monkeypatch.setenv("INTERCHANGE_PROFILE", "1")
+
+    with _phase("foo"):
+        with _phase("bar"):
+            pass
+
+    assert get_last_report()["foo/bar"].calls == 1
+    assert "bar" in capsys.readouterr().err
+
+
+class TestProfileInterchange:
+    @pytest.fixture
+    def interchange(self, sage):
+        return Interchange.from_smirnoff(sage, [Molecule.from_smiles("CCO")])
+
+    def test_from_smirnoff(self, sage):
+        with profile() as report:
+            Interchange.from_smirnoff(
+                sage,
+                [Molecule.from_smiles("CCO"), Molecule.from_smiles("O")],
+            )
+
+        assert report["from_smirnoff"].counts == {"atoms": 12, "molecules": 2}
+
+        for name in ["Bonds", "Angles", "ProperTorsions", "vdW", "Electrostatics"]:
+            assert f"from_smirnoff/{name}" in report
+
+        assert report["from_smirnoff/Bonds"].counts["keys"] == 10
+        assert report["from_smirnoff/Bonds/find_matches"].counts["molecules"] == 2
+
+        assert report.to_dict()["children"][0]["name"] == "from_smirnoff"
+
+    @skip_if_missing("openmm")
+    def test_to_openmm_system(self, interchange):
+        with profile() as report:
+            interchange.to_openmm_system()
+
+        assert report["to_openmm_system"].counts["particles"] == 9
+        assert "to_openmm_system/process_nonbonded_forces" in report
+        assert "to_openmm_system/process_bond_forces" in report
+
+    def test_to_prmtop(self, interchange, tmp_path):
+        with profile() as report:
+            interchange.to_prmtop(tmp_path / "out.prmtop")
+
+        assert report["to_prmtop/write_array_section"].calls > 1
@@ -0,0 +1,629 @@
+"""Compact, array-backed storage of the contents of a `Collection`."""
+
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
+from typing import TYPE_CHECKING, Any, Union
+
+import numpy
+from openff.toolkit import Quantity, unit
+
+from openff.interchange.exceptions import (
+    MissingParametersError,
+    UnsupportedArrayStorageError,
+)
+from openff.interchange.models import (
+    AngleKey,
+    BondKey,
+    ChargeModelTopologyKey,
+    ImproperTorsionKey,
+    LibraryChargeTopologyKey,
+    PotentialKey,
+    ProperTorsionKey,
+    SingleAtomChargeTopologyKey,
+    TopologyKey,
+)
+
+if TYPE_CHECKING:
+    from openff.interchange.components.potentials import Collection, Potential
+
+# Key classes which can be losslessly described by atom indices plus the optional columns below.
+# Virtual site keys and charge increment keys carry variable-length or string data and are not supported.
+_SUPPORTED_KEY_CLASSES: tuple[type, ...] = (
+    TopologyKey,
+    BondKey,
+    AngleKey,
+    ProperTorsionKey,
+    ImproperTorsionKey,
+    LibraryChargeTopologyKey,
+    SingleAtomChargeTopologyKey,
+    ChargeModelTopologyKey,
+)
+
+_AnyKey = Union[TopologyKey, LibraryChargeTopologyKey, ChargeModelTopologyKey]
+
+# Sentinel used in integer columns to represent `None`
+_NO_VALUE = -1
+
+
+class CollectionArrays:
+    """
+    A columnar representation of the key map and potentials of a `Collection`.
+
+    Topology keys are stored as an integer array of atom indices of shape ``(n_terms, arity)``
+    and an ``int32`` column pointing each term at a row in a dense table of parameters of shape
+    ``(n_potentials, n_parameters)``. Potential keys are stored once per unique potential, not once
+    per term, so memory scales with the size of the arrays rather than with the number of Python
+    objects.
+
+    So that potentials are reconstructed exactly, each row of the table stores magnitudes in the
+    units of that potential, which are one of a few ``unit_sets``. `get_parameter` and
+    `get_system_parameters` report each column in a single unit, listed in ``parameter_units``.
+
+    The ``key_map`` and ``potentials`` attributes are read-only, lazily-evaluated views that
+    behave like the dictionaries of the same name on a `Collection`; keys and potentials are
+    only constructed when accessed.
+
+    This is a snapshot of a `Collection`, built by `Collection.to_arrays`, not a storage backend;
+    collections still store their contents as dictionaries, and later changes to a collection are
+    not reflected in arrays built from it. It is used where array-native data pays off, such as
+    writing NPZ files and replicating collections.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+
+    def __init__(
+        self,
+        atom_indices: numpy.ndarray,
+        potential_indices: numpy.ndarray,
+        parameters: numpy.ndarray,
+        parameter_names: tuple[str, ...],
+        parameter_units: tuple[unit.Unit, ...],
+        potential_keys: list[PotentialKey],
+        key_classes: tuple[type, ...] = (TopologyKey,),
+        key_class_indices: numpy.ndarray | None = None,
+        mult: numpy.ndarray | None = None,
+        bond_order: numpy.ndarray | None = None,
+        phase: numpy.ndarray | None = None,
+        partial_charge_methods: tuple[str, ...] = tuple(),
+        partial_charge_method_indices: numpy.ndarray | None = None,
+        unit_sets: tuple[tuple[unit.Unit, ...], ...] | None = None,
+        unit_set_indices: numpy.ndarray | None = None,
+    ):
+        n_terms = len(potential_indices)
+
+        self.atom_indices = numpy.asarray(atom_indices, dtype=numpy.int32)
+
+        if self.atom_indices.ndim != 2:
+            self.atom_indices = self.atom_indices.reshape(n_terms, -1 if n_terms else 1)
+
+        self.potential_indices = numpy.asarray(potential_indices, dtype=numpy.int32)
+        self.parameters = numpy.asarray(parameters, dtype=numpy.float64).reshape(
+            len(potential_keys),
+            len(parameter_names),
+        )
+        self.parameter_names = tuple(parameter_names)
+        self.parameter_units = tuple(parameter_units)
+        self.potential_keys = list(potential_keys)
+        self.key_classes = tuple(key_classes)
+
+        def _column(values, dtype, fill):
+            if values is None:
+                return numpy.full(n_terms, fill, dtype=dtype)
+            return numpy.asarray(values, dtype=dtype)
+
+        self.key_class_indices = _column(key_class_indices, numpy.int8, 0)
+        self.mult = _column(mult, numpy.int32, _NO_VALUE)
+        self.bond_order = _column(bond_order, numpy.float64, numpy.nan)
+        self.phase = _column(phase, numpy.float64, numpy.nan)
+        self.partial_charge_methods = tuple(partial_charge_methods)
+        self.partial_charge_method_indices = _column(
+            partial_charge_method_indices,
+            numpy.int8,
+            _NO_VALUE,
+        )
+
+        if len(self.parameter_units) != len(self.parameter_names):
+            raise ValueError(
+                "Each parameter column must have exactly one unit. Found "
+                f"{len(self.parameter_names)} columns and {len(self.parameter_units)} units.",
+            )
+
+        # By default, every potential is stored in the units of the columns
+        if unit_sets is None:
+            unit_sets = (self.parameter_units,)
+
+        self.unit_sets = tuple(map(tuple, unit_sets))
+
+        if unit_set_indices is None:
+            unit_set_indices = numpy.zeros(len(self.potential_keys), dtype=numpy.int32)
+
+        self.unit_set_indices = numpy.asarray(unit_set_indices, dtype=numpy.int32)
+
+        # The factor converting each column of each set of units to the units of the column
+        self._unit_factors = numpy.array(
+            [
+                [
+                    Quantity(1.0, set_unit).m_as(parameter_unit)
+                    for set_unit, parameter_unit in zip(units, self.parameter_units)
+                ]
+                for units in self.unit_sets
+            ],
+            dtype=numpy.float64,
+        ).reshape(len(self.unit_sets), len(self.parameter_names))
+
+        self._potential_key_index: dict[PotentialKey, int] | None = None
+        self._row_index: dict | None = None
+
+    @property
+    def n_terms(self) -> int:
+        """The number of topology keys (rows in the key map)."""
+        return len(self.potential_indices)
+
+    @property
+    def n_potentials(self) -> int:
+        """The number of unique potentials."""
+        return len(self.potential_keys)
+
+    @property
+    def key_map(self) -> "_KeyMapView":
+        """A lazy, read-only view of this data mimicking `Collection.key_map`."""
+        return _KeyMapView(self)
+
+    @property
+    def potentials(self) -> "_PotentialsView":
+        """A lazy, read-only view of this data mimicking `Collection.potentials`."""
+        return _PotentialsView(self)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes consumed by the per-term and per-potential arrays."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.atom_indices,
+                self.potential_indices,
+                self.parameters,
+                self.key_class_indices,
+                self.mult,
+                self.bond_order,
+                self.phase,
+                self.partial_charge_method_indices,
+                self.unit_set_indices,
+            )
+        )
+
+    @classmethod
+    def from_collection(cls, collection: "Collection") -> "CollectionArrays":
+        """Build a columnar representation of the key map and potentials of a `Collection`."""
+        return cls.from_dicts(
+            key_map=collection.key_map,
+            potentials=collection.potentials,
+        )
+
+    @classmethod
+    def from_dicts(
+        cls,
+        key_map: Mapping,
+        potentials: Mapping,
+    ) -> "CollectionArrays":
+        """Build a columnar representation from ``key_map`` and ``potentials`` dictionaries."""
+        from openff.interchange.components.potentials import WrappedPotential
+
+        potential_keys: list[PotentialKey] = list(potentials)
+        potential_key_index = {key: index for index, key in enumerate(potential_keys)}
+
+        parameter_names: list[str] = list()
+        parameter_units: list[unit.Unit] = list()
+        dimensionalities: dict[str, Any] = dict()
+
+        for potential in potentials.values():
+            if isinstance(potential, WrappedPotential):
+                raise UnsupportedArrayStorageError(
+                    "Potentials wrapping other potentials cannot be stored as arrays.",
+                )
+
+            for name, value in potential.parameters.items():
+                # Virtual site potentials, for example, have parameters with a value of `None`
+                if not isinstance(value, Quantity):
+                    raise UnsupportedArrayStorageError(
+                        f"Parameter {name} with non-quantity value {value} cannot be stored as arrays.",
+                    )
+
+                if name not in parameter_names:
+                    if numpy.ndim(value.m) != 0:
+                        raise UnsupportedArrayStorageError(
+                            f"Array-valued parameter {name} cannot be stored as a single column.",
+                        )
+
+                    parameter_names.append(name)
+                    parameter_units.append(value.units)
+                    dimensionalities[name] = value.dimensionality
+
+                elif value.dimensionality != dimensionalities[name]:
+                    raise UnsupportedArrayStorageError(
+                        f"Parameter {name} has values of different dimensionality.",
+                    )
+
+        parameters = numpy.full(
+            (len(potential_keys), len(parameter_names)),
+            numpy.nan,
+            dtype=numpy.float64,
+        )
+
+        # Magnitudes are stored unconverted, along with the units of each potential
+        unit_sets: dict[tuple[unit.Unit, ...], int] = dict()
+        unit_set_indices: numpy.ndarray = numpy.zeros(
+            len(potential_keys),
+            dtype=numpy.int32,
+        )
+
+        for row, potential in enumerate(potentials.values()):
+            units = list(parameter_units)
+
+            for column, name in enumerate(parameter_names):
+                if name in potential.parameters:
+                    value = potential.parameters[name]
+
+                    parameters[row, column] = value.m
+                    units[column] = value.units
+
+            unit_set_indices[row] = unit_sets.setdefault(tuple(units), len(unit_sets))
+
+        n_terms = len(key_map)
+        topology_keys = list(key_map)
+
+        key_classes: list[type] = list()
+        partial_charge_methods: list[str] = list()
+
+        for topology_key in topology_keys:
+            if type(topology_key) not in _SUPPORTED_KEY_CLASSES:
+                raise UnsupportedArrayStorageError(
+                    f"Topology keys of type {type(topology_key)} cannot be stored as arrays.",
+                )
+
+            if type(topology_key) not in key_classes:
+                key_classes.append(type(topology_key))
+
+        arities = {len(topology_key.atom_indices) for topology_key in topology_keys}
+
+        if len(arities) > 1:
+            raise UnsupportedArrayStorageError(
+                f"Found topology keys with different numbers of atoms ({arities}), "
+                "which cannot be stored in a single array.",
+            )
+
+        arity = arities.pop() if arities else 1
+
+        try:
+            potential_indices = numpy.fromiter(
+                (potential_key_index[key_map[key]] for key in topology_keys),
+                dtype=numpy.int32,
+                count=n_terms,
+            )
+        except KeyError as error:
+            raise MissingParametersError(
+                f"Potential key {error} found in key map but not in potentials.",
+            ) from error
+
+        mult = numpy.fromiter(
+            (_optional(getattr(key, "mult", None), _NO_VALUE) for key in topology_keys),
+            dtype=numpy.int32,
+            count=n_terms,
+        )
+        bond_order = numpy.fromiter(
+            (
+                _optional(getattr(key, "bond_order", None), numpy.nan)
+                for key in topology_keys
+            ),
+            dtype=numpy.float64,
+            count=n_terms,
+        )
+        phase = numpy.fromiter(
+            (
+                _optional(getattr(key, "phase", None), numpy.nan)
+                for key in topology_keys
+            ),
+            dtype=numpy.float64,
+            count=n_terms,
+        )
+
+        for topology_key in topology_keys:
+            method = getattr(topology_key, "partial_charge_method", None)
+            if method is not None and method not in partial_charge_methods:
+                partial_charge_methods.append(method)
+
+        partial_charge_method_indices = numpy.fromiter(
+            (
+                (
+                    partial_charge_methods.index(key.partial_charge_method)
+                    if isinstance(key, ChargeModelTopologyKey)
+                    else _NO_VALUE
+                )
+                for key in topology_keys
+            ),
+            dtype=numpy.int8,
+            count=n_terms,
+        )
+
+        return cls(
+            atom_indices=numpy.fromiter(
+                (index for key in topology_keys for index in key.atom_indices),
+                dtype=numpy.int32,
+                count=n_terms * arity,
+            ).reshape(n_terms, arity),
+            potential_indices=potential_indices,
+            parameters=parameters,
+            parameter_names=tuple(parameter_names),
+            parameter_units=tuple(parameter_units),
+            potential_keys=potential_keys,
+            key_classes=tuple(key_classes) if key_classes else (TopologyKey,),
+            key_class_indices=numpy.fromiter(
+                (key_classes.index(type(key)) for key in topology_keys),
+                dtype=numpy.int8,
+                count=n_terms,
+            ),
+            mult=mult,
+            bond_order=bond_order,
+            phase=phase,
+            partial_charge_methods=tuple(partial_charge_methods),
+            partial_charge_method_indices=partial_charge_method_indices,
+            unit_sets=tuple(unit_sets) if unit_sets else None,
+            unit_set_indices=unit_set_indices,
+        )
+
+    def to_dicts(self) -> tuple[dict, dict]:
+        """Materialize this data as ``key_map`` and ``potentials`` dictionaries."""
+        return self._build_key_map(), dict(self.potentials.items())
+
+    def _build_key_map(self) -> dict:
+        """
+        Construct every topology key at once.
+
+        Keys are built without validation, since their contents come from typed arrays, which is
+        several times faster than constructing each with `_topology_key`.
+        """
+        potential_keys = [
+            self.potential_keys[index] for index in self.potential_indices.tolist()
+        ]
+
+        key_class_indices = self.key_class_indices.tolist()
+        mult = self.mult.tolist()
+        bond_order = self.bond_order.tolist()
+        phase = self.phase.tolist()
+        partial_charge_method_indices = self.partial_charge_method_indices.tolist()
+
+        key_map = dict()
+
+        for row, atom_indices in enumerate(self.atom_indices.tolist()):
+            key_class = self.key_classes[key_class_indices[row]]
+
+            if issubclass(key_class, LibraryChargeTopologyKey):
+                topology_key = key_class.construct(this_atom_index=atom_indices[0])
+
+            elif key_class is ChargeModelTopologyKey:
+                topology_key = key_class.construct(
+                    this_atom_index=atom_indices[0],
+                    partial_charge_method=self.partial_charge_methods[
+                        partial_charge_method_indices[row]
+                    ],
+                )
+
+            else:
+                fields = {"atom_indices": tuple(atom_indices)}
+
+                if "mult" in key_class.__fields__ and mult[row] != _NO_VALUE:
+                    fields["mult"] = mult[row]
+
+                # NaN is the only value not equal to itself
+                has_bond_order = bond_order[row] == bond_order[row]
+
+                if "bond_order" in key_class.__fields__ and has_bond_order:
+                    fields["bond_order"] = bond_order[row]
+
+                if "phase" in key_class.__fields__ and phase[row] == phase[row]:
+                    fields["phase"] = phase[row]
+
+                topology_key = key_class.construct(**fields)
+
+            key_map[topology_key] = potential_keys[row]
+
+        return key_map
+
+    def tile(self, n_copies: int, atom_offset: int) -> "CollectionArrays":
+        """
+        Repeat every term ``n_copies`` times, shifting the atom indices of each copy by ``atom_offset``.
+
+        The parameter table and potential keys are shared with this object, not repeated.
+        """
+        offsets = numpy.arange(n_copies, dtype=numpy.int32) * atom_offset
+        atom_indices = self.atom_indices[None, :, :] + offsets[:, None, None]
+
+        return CollectionArrays(
+            atom_indices=atom_indices.reshape(-1, self.atom_indices.shape[1]),
+            potential_indices=numpy.tile(self.potential_indices, n_copies),
+            parameters=self.parameters,
+            parameter_names=self.parameter_names,
+            parameter_units=self.parameter_units,
+            potential_keys=self.potential_keys,
+            key_classes=self.key_classes,
+            key_class_indices=numpy.tile(self.key_class_indices, n_copies),
+            mult=numpy.tile(self.mult, n_copies),
+            bond_order=numpy.tile(self.bond_order, n_copies),
+            phase=numpy.tile(self.phase, n_copies),
+            partial_charge_methods=self.partial_charge_methods,
+            partial_charge_method_indices=numpy.tile(
+                self.partial_charge_method_indices,
+                n_copies,
+            ),
+            unit_sets=self.unit_sets,
+            unit_set_indices=self.unit_set_indices,
+        )
+
+    def get_parameter(self, name: str) -> Quantity:
+        """Return the column of a parameter, one value per potential, as a `Quantity`."""
+        column = self.parameter_names.index(name)
+        factors = self._unit_factors[self.unit_set_indices, column]
+
+        return Quantity(
+            self.parameters[:, column] * factors,
+            self.parameter_units[column],
+        )
+
+    def get_system_parameters(self) -> numpy.ndarray:
+        """
+        Return an array of parameters as applied to each term, of shape ``(n_terms, n_parameters)``.
+
+        Values are reported in the units listed in ``parameter_units``.
+        """
+        factors = self._unit_factors[self.unit_set_indices]
+
+        return (self.parameters * factors)[self.potential_indices]
+
+    def _topology_key(self, row: int) -> _AnyKey:
+        """Construct the topology key of a single term."""
+        key_class = self.key_classes[self.key_class_indices[row]]
+        atom_indices = tuple(int(index) for index in self.atom_indices[row])
+
+        if issubclass(key_class, LibraryChargeTopologyKey):
+            return key_class(this_atom_index=atom_indices[0])
+
+        if key_class is ChargeModelTopologyKey:
+            return key_class(
+                this_atom_index=atom_indices[0],
+                partial_charge_method=self.partial_charge_methods[
+                    self.partial_charge_method_indices[row]
+                ],
+            )
+
+        fields = {"atom_indices": atom_indices}
+
+        if "mult" in key_class.__fields__ and self.mult[row] != _NO_VALUE:
+            fields["mult"] = int(self.mult[row])
+
+        if "bond_order" in key_class.__fields__ and not numpy.isnan(
+            self.bond_order[row],
+        ):
+            fields["bond_order"] = float(self.bond_order[row])
+
+        if "phase" in key_class.__fields__ and not numpy.isnan(self.phase[row]):
+            fields["phase"] = float(self.phase[row])
+
+        return key_class(**fields)
+
+    def _get_row(self, topology_key) -> int:
+        """Find the row of a topology key, raising `KeyError` if not present."""
+        if self._row_index is None:
+            self._row_index = {
+                key: row for row, key in enumerate(self._build_key_map())
+            }
+
+        return self._row_index[topology_key]
+
+    def _potential(self, index: int) -> "Potential":
+        """Construct the `Potential` stored in a single row of the parameter table."""
+        from openff.interchange.components.potentials import Potential
+
+        return Potential(
+            parameters={
+                name: Quantity(float(value), units)
+                for name, units, value in zip(
+                    self.parameter_names,
+                    self.unit_sets[self.unit_set_indices[index]],
+                    self.parameters[index],
+                )
+                if not numpy.isnan(value)
+            },
+        )
+
+    def _get_potential_index(self, potential_key: PotentialKey) -> int:
+        if self._potential_key_index is None:
+            self._potential_key_index = {
+                key: index for index, key in enumerate(self.potential_keys)
+            }
+
+        return self._potential_key_index[potential_key]
+
+    def __repr__(self) -> str:
+        return (
+            f"CollectionArrays with {self.n_terms} terms, {self.n_potentials} potentials, "
+            f"and parameters {self.parameter_names}"
+        )
+
+
+def _optional(value, default):
+    return default if value is None else value
+
+
+class _KeyMapItemsView(ItemsView):
+    _mapping: "_KeyMapView"
+
+    def __iter__(self) -> Iterator:
+        arrays = self._mapping._arrays
+
+        for row in range(arrays.n_terms):
+            yield (
+                arrays._topology_key(row),
+                arrays.potential_keys[arrays.potential_indices[row]],
+            )
+
+
+class _KeyMapValuesView(ValuesView):
+    _mapping: "_KeyMapView"
+
+    def __iter__(self) -> Iterator[PotentialKey]:
+        arrays = self._mapping._arrays
+
+        for index in arrays.potential_indices:
+            yield arrays.potential_keys[index]
+
+
+class _KeyMapView(Mapping):
+    """
+    A read-only, dict-like view of `CollectionArrays` as topology keys to potential keys.
+
+    The first lookup of a single key builds an index of every key, which later lookups reuse.
+    """
+
+    def __init__(self, arrays: CollectionArrays):
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.n_terms
+
+    def __iter__(self) -> Iterator[_AnyKey]:
+        for row in range(self._arrays.n_terms):
+            yield self._arrays._topology_key(row)
+
+    def __getitem__(self, topology_key) -> PotentialKey:
+        row = self._arrays._get_row(topology_key)
+
+        return self._arrays.potential_keys[self._arrays.potential_indices[row]]
+
+    def items(self) -> _KeyMapItemsView:
+        return _KeyMapItemsView(self)
+
+    def values(self) -> _KeyMapValuesView:
+        return _KeyMapValuesView(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self)} keys"
+
+
+class _PotentialsView(Mapping):
+    """A read-only, dict-like view of `CollectionArrays` as potential keys to potentials."""
+
+    def __init__(self, arrays: CollectionArrays):
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.n_potentials
+
+    def __iter__(self) -> Iterator[PotentialKey]:
+        return iter(self._arrays.potential_keys)
+
+    def __getitem__(self, potential_key: PotentialKey) -> "Potential":
+        return self._arrays._potential(
+            self._arrays._get_potential_index(potential_key),
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} with {len(self)} potentials"
@@ -0,0 +1,158 @@
+"""Graph distances between atoms, computed from bonds with array operations."""
+
+from typing import TYPE_CHECKING, Union
+
+import numpy
+
+if TYPE_CHECKING:
+    from openff.toolkit import Molecule, Topology
+
+
+def _get_bond_array(
+    topology_or_molecule: Union["Topology", "Molecule"],
+) -> numpy.ndarray:
+    """Return the atom indices of each bond as an array of shape (n_bonds, 2)."""
+    if hasattr(topology_or_molecule, "molecules"):
+        bonds: list[tuple[int, int]] = list()
+
+        offset = 0
+
+        for molecule in topology_or_molecule.molecules:
+            bonds.extend(
+                (offset + bond.atom1_index, offset + bond.atom2_index)
+                for bond in molecule.bonds
+            )
+
+            offset += molecule.n_atoms
+
+    else:
+        bonds = [
+            (bond.atom1_index, bond.atom2_index) for bond in topology_or_molecule.bonds
+        ]
+
+    return numpy.asarray(bonds, dtype=numpy.int64).reshape(-1, 2)
+
+
+class BondGraph:
+    """
+    A compressed sparse row (CSR) representation of the bond graph of a topology or molecule.
+
+    The neighbors of atom ``i`` are ``indices[indptr[i]:indptr[i + 1]]``. Pairs of atoms separated
+    by up to three bonds (1-2, 1-3, and 1-4 pairs) are found by expanding walks along bonds with
+    array operations, rather than by walking nested Python sets of bonded atoms.
+    """
+
+    def __init__(self, n_atoms: int, bonds: numpy.ndarray):
+        bonds = numpy.asarray(bonds, dtype=numpy.int64).reshape(-1, 2)
+
+        self.n_atoms = n_atoms
+
+        sources = numpy.concatenate([bonds[:, 0], bonds[:, 1]])
+        destinations = numpy.concatenate([bonds[:, 1], bonds[:, 0]])
+
+        order = numpy.lexsort((destinations, sources))
+
+        self.indices: numpy.ndarray = destinations[order]
+        self.indptr: numpy.ndarray = numpy.zeros(n_atoms + 1, dtype=numpy.int64)
+
+        numpy.cumsum(
+            numpy.bincount(sources, minlength=n_atoms),
+            out=self.indptr[1:],
+        )
+
+        self._pairs: numpy.ndarray | None = None
+        self._distances: numpy.ndarray | None = None
+
+    @classmethod
+    def from_topology(
+        cls,
+        topology_or_molecule: Union["Topology", "Molecule"],
+    ) -> "BondGraph":
+        """Build a graph from the bonds of a topology or molecule."""
+        return cls(
+            n_atoms=topology_or_molecule.n_atoms,
+            bonds=_get_bond_array(topology_or_molecule),
+        )
+
+    @property
+    def degrees(self) -> numpy.ndarray:
+        """The number of bonds each atom is involved in."""
+        return numpy.diff(self.indptr)
+
+    def neighbors(self, atom_index: int) -> numpy.ndarray:
+        """Return the indices of atoms bonded to this atom."""
+        return self.indices[self.indptr[atom_index] : self.indptr[atom_index + 1]]
+
+    def _extend_walks(
+        self,
+        starts: numpy.ndarray,
+        ends: numpy.ndarray,
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Extend each walk, given by its start and end atoms, by one bond in every possible way."""
+        counts = self.degrees[ends]
+
+        new_starts = numpy.repeat(starts, counts)
+
+        # For each new walk, the position of the next atom in the CSR array of neighbors
+        positions = numpy.repeat(
+            self.indptr[ends] - numpy.cumsum(counts) + counts,
+            counts,
+        )
+        positions += numpy.arange(len(positions))
+
+        return new_starts, self.indices[positions]
+
+    def _compute_pairs(self, max_distance: int):
+        starts = numpy.arange(self.n_atoms, dtype=numpy.int64)
+        ends = starts
+
+        all_pairs: list[numpy.ndarray] = list()
+        all_distances: list[numpy.ndarray] = list()
+
+        for distance in range(1, max_distance + 1):
+            starts, ends = self._extend_walks(starts, ends)
+
+            mask = starts < ends
+
+            all_pairs.append(numpy.stack([starts[mask], ends[mask]], axis=1))
+            all_distances.append(numpy.full(mask.sum(), distance, dtype=numpy.int8))
+
+        pairs = numpy.concatenate(all_pairs).reshape(-1, 2)
+        distances = numpy.concatenate(all_distances)
+
+        # Keep only the shortest distance of each pair, sorted by atom indices
+        order = numpy.lexsort((distances, pairs[:, 1], pairs[:, 0]))
+        pairs, distances = pairs[order], distances[order]
+
+        first = numpy.ones(len(pairs), dtype=bool)
+        first[1:] = numpy.any(pairs[1:] != pairs[:-1], axis=1)
+
+        self._pairs = pairs[first]
+        self._distances = distances[first]
+        self._max_distance = max_distance
+
+    def get_pairs(self, max_distance: int = 3) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Return all pairs of atoms separated by up to ``max_distance`` bonds.
+
+        Returns
+        -------
+        pairs: numpy.ndarray
+            Atom indices of each pair, shape (n_pairs, 2), with the lower index first and sorted
+            by the first then second index.
+        distances: numpy.ndarray
+            The number of bonds in the shortest path between the atoms of each pair.
+
+        """
+        if self._pairs is None or self._max_distance < max_distance:
+            self._compute_pairs(max_distance)
+
+        mask = self._distances <= max_distance
+
+        return self._pairs[mask], self._distances[mask]  # type: ignore[index]
+
+    def get_pairs_at_distance(self, distance: int) -> numpy.ndarray:
+        """Return the pairs of atoms whose shortest path is exactly ``distance`` bonds long."""
+        pairs, distances = self.get_pairs(max_distance=max(distance, 3))
+
+        return pairs[distances == distance]
@@ -0,0 +1,263 @@
+"""A handle to a saved Interchange whose fields are deserialized on first access."""
+
+import functools
+import json
+import zipfile
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openff.toolkit import Quantity, Topology
+
+    from openff.interchange import Interchange
+    from openff.interchange.components.mdconfig import MDConfig
+    from openff.interchange.components.potentials import Collection
+
+_FIELDS = ("positions", "box", "velocities", "topology", "mdconfig", "collections")
+
+
+class _LazyCollections(Mapping):
+    """A read-only mapping of collection names to collections, each of which is loaded on first access."""
+
+    def __init__(self, loaders: dict[str, Callable[[], "Collection"]]):
+        self._loaders = loaders
+        self._loaded: dict[str, Collection] = dict()
+
+    def __getitem__(self, name: str) -> "Collection":
+        if name not in self._loaded:
+            self._loaded[name] = self._loaders[name]()
+
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __repr__(self) -> str:
+        return f"_LazyCollections({[*self._loaders]}, loaded={[*self._loaded]})"
+
+
+class LazyInterchange:
+    """
+    A handle to a saved Interchange whose fields are deserialized on first access.
+
+    Create with `Interchange.load_lazy`. Positions, box vectors, velocities, the topology and the
+    MD configuration are available as attributes, as on `Interchange`, and each collection is loaded
+    the first time it is looked up in ``collections``. Fields not selected when loading raise a
+    ``LookupError``. Call `to_interchange` to load all selected fields into an `Interchange`.
+    """
+
+    def __init__(
+        self,
+        loaders: dict[str, Callable[[], Any]],
+        collection_loaders: dict[str, Callable[[], "Collection"]],
+        fields: Iterable[str] | None = None,
+        collections: Iterable[str] | None = None,
+        close: Callable[[], None] | None = None,
+    ):
+        fields = _FIELDS if fields is None else tuple(fields)
+
+        for name in fields:
+            if name not in _FIELDS:
+                raise ValueError(f"Unknown field {name}. Valid fields are {_FIELDS}.")
+
+        if collections is not None:
+            collections = set(collections)
+            collection_loaders = {
+                name: loader
+                for name, loader in collection_loaders.items()
+                if name in collections
+            }
+
+        self._fields = fields
+        self._loaders = loaders
+        self._loaded: dict[str, Any] = dict()
+        self._collections = _LazyCollections(collection_loaders)
+        self._close = close
+
+    def _get(self, name: str) -> Any:
+        if name not in self._fields:
+            raise LookupError(
+                f"Field {name} was not loaded. This handle was created with fields={self._fields}.",
+            )
+
+        if name not in self._loaded:
+            self._loaded[name] = self._loaders[name]()
+
+        return self._loaded[name]
+
+    @property
+    def positions(self) -> "Quantity | None":
+        """The positions of all particles, loaded on first access."""
+        return self._get("positions")
+
+    @property
+    def box(self) -> "Quantity | None":
+        """The periodic box vectors, loaded on first access."""
+        return self._get("box")
+
+    @property
+    def velocities(self) -> "Quantity | None":
+        """The velocities of all particles, loaded on first access."""
+        return self._get("velocities")
+
+    @property
+    def topology(self) -> "Topology | None":
+        """The topology, loaded on first access."""
+        return self._get("topology")
+
+    @property
+    def mdconfig(self) -> "MDConfig | None":
+        """The MD configuration, loaded on first access."""
+        return self._get("mdconfig")
+
+    @property
+    def collections(self) -> Mapping[str, "Collection"]:
+        """The selected collections, each loaded the first time it is looked up."""
+        if "collections" not in self._fields:
+            raise LookupError(
+                f"Field collections was not loaded. This handle was created with fields={self._fields}.",
+            )
+
+        return self._collections
+
+    def __getitem__(self, item: str):
+        """Look up collections or other components, as with `Interchange`."""
+        if item == "positions":
+            return self.positions
+        elif item in {"box", "box_vectors"}:
+            return self.box
+        elif item in self.collections:
+            return self.collections[item]
+        else:
+            raise LookupError(
+                f"Could not find component {item}. This object has the following "
+                f"collections selected:\n\t{[*self.collections.keys()]}",
+            )
+
+    def to_interchange(self) -> "Interchange":
+        """Load every selected field, returning an `Interchange` without the fields which were not selected."""
+        from openff.interchange import Interchange
+
+        fields = {
+            name: self._get(name) for name in self._fields if name != "collections"
+        }
+
+        if "collections" in self._fields:
+            fields["collections"] = dict(self.collections.items())
+
+        # Each value has been validated on the way in, and validating the topology would copy it
+        return Interchange.construct(**fields)
+
+    def close(self):
+        """Close the underlying file. Fields not yet loaded cannot be loaded afterwards."""
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "LazyInterchange":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"LazyInterchange(fields={self._fields}, loaded={[*self._loaded]})"
+
+
+def _lazy_from_npz(
+    file_path: Path | str,
+    fields: Iterable[str] | None,
+    collections: Iterable[str] | None,
+    mmap: bool,
+) -> LazyInterchange:
+    import numpy
+
+    from openff.interchange.components._npz import (
+        _decode_collection,
+        _decode_field,
+        _load_metadata,
+        _memory_map_npz,
+    )
+
+    if mmap:
+        arrays = _memory_map_npz(file_path)
+        close = None
+    else:
+        # Members of an NpzFile are only read when they are looked up
+        arrays = numpy.load(file_path, allow_pickle=False)
+        close = arrays.close
+
+    metadata = _load_metadata(arrays)
+
+    return LazyInterchange(
+        loaders={
+            name: functools.partial(_decode_field, name, metadata, arrays)
+            for name in _FIELDS
+            if name != "collections"
+        },
+        collection_loaders={
+            name: functools.partial(
+                _decode_collection,
+                name,
+                collection_metadata,
+                arrays,
+            )
+            for name, collection_metadata in metadata["collections"].items()
+        },
+        fields=fields,
+        collections=collections,
+        close=close,
+    )
+
+
+def _lazy_from_json(
+    file_path: Path | str,
+    fields: Iterable[str] | None,
+    collections: Iterable[str] | None,
+) -> LazyInterchange:
+    from openff.interchange.components.interchange import _load_collection, _load_field
+
+    # The document must be parsed in full, but building the topology and validating each collection,
+    # which take most of the time, are deferred
+    with open(file_path) as file:
+        data = json.load(file)
+
+    def _loader(name: str) -> Callable[[], Any]:
+        if data.get(name) is None:
+            return lambda: None
+
+        return functools.partial(_load_field, name, data[name])
+
+    return LazyInterchange(
+        loaders={
+            "positions": _loader("positions"),
+            "box": _loader("box"),
+            "velocities": _loader("velocities"),
+            "topology": _loader("topology"),
+            # MD configuration is not written to JSON
+            "mdconfig": lambda: None,
+        },
+        collection_loaders={
+            name: functools.partial(_load_collection, name, collection_data)
+            for name, collection_data in (data.get("collections") or dict()).items()
+        },
+        fields=fields,
+        collections=collections,
+    )
+
+
+def load_lazy(
+    file_path: Path | str,
+    fields: Iterable[str] | None = None,
+    collections: Iterable[str] | None = None,
+    mmap: bool = False,
+) -> LazyInterchange:
+    """Open an Interchange saved with `Interchange.to_npz` or as JSON, deferring deserialization."""
+    if zipfile.is_zipfile(file_path):
+        return _lazy_from_npz(file_path, fields, collections, mmap)
+
+    return _lazy_from_json(file_path, fields, collections)
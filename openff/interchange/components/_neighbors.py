@@ -0,0 +1,215 @@
+"""Pairs of particles within a cutoff of each other, found with cell lists and processed in chunks."""
+
+import itertools
+from collections.abc import Iterator
+
+import numpy
+
+from openff.interchange.exceptions import (
+    UnsupportedBoxError,
+    UnsupportedCutoffMethodError,
+)
+
+# The default number of pairs yielded, or candidate pairs considered, at once
+_CHUNK_SIZE = 2**18
+
+
+def _is_reduced_form(box: numpy.ndarray) -> bool:
+    """
+    Return whether unitless box vectors, with one vector per row, are in OpenMM's reduced form.
+
+    See http://docs.openmm.org/latest/userguide/theory/05_other_features.html#periodic-boundary-conditions
+    """
+    (ax, ay, az), (bx, by, bz), (cx, cy, cz) = box.tolist()
+
+    triangular = ay == az == bz == 0 and min(ax, by, cz) > 0
+
+    return triangular and ax >= 2 * abs(bx) and ax >= 2 * abs(cx) and by >= 2 * abs(cy)
+
+
+def _minimum_image(vectors: numpy.ndarray, box: numpy.ndarray | None) -> numpy.ndarray:
+    """
+    Return the shortest periodic images of displacement vectors, with box vectors in reduced form.
+
+    As in OpenMM, the result is only guaranteed to be the shortest image for vectors that are shorter
+    than half the width of the box.
+    """
+    if box is None:
+        return vectors
+
+    vectors = vectors - numpy.outer(numpy.round(vectors[:, 2] / box[2, 2]), box[2])
+    vectors -= numpy.outer(numpy.round(vectors[:, 1] / box[1, 1]), box[1])
+    vectors -= numpy.outer(numpy.round(vectors[:, 0] / box[0, 0]), box[0])
+
+    return vectors
+
+
+def _get_distances(
+    positions: numpy.ndarray,
+    first: numpy.ndarray,
+    second: numpy.ndarray,
+    box: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    """Return the distance, using the minimum image convention if there is a box, of each pair."""
+    vectors = _minimum_image(positions[second] - positions[first], box)
+
+    return numpy.linalg.norm(vectors, axis=1)
+
+
+def _iterate_all_pairs(
+    positions: numpy.ndarray,
+    box: numpy.ndarray | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+    """
+    Yield all pairs of particles and their distances, in chunks of up to about `chunk_size` pairs.
+
+    Each chunk is a tuple of the indices of the first particles, the indices of the second particles,
+    and the distances, with the lower index of each pair first.
+    """
+    n_particles = len(positions)
+
+    start = 0
+
+    while start < n_particles - 1:
+        # Row i holds n_particles - 1 - i pairs
+        stop = start + 1
+        row_size = n_particles - 1 - start
+
+        while stop < n_particles - 1 and (stop - start) * row_size < chunk_size:
+            stop += 1
+
+        counts = n_particles - 1 - numpy.arange(start, stop)
+
+        first = numpy.repeat(numpy.arange(start, stop), counts)
+        offsets: numpy.ndarray = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        second = numpy.arange(len(first)) - offsets + first + 1
+
+        yield first, second, _get_distances(positions, first, second, box)
+
+        start = stop
+
+
+def _iterate_neighbor_pairs(
+    positions: numpy.ndarray,
+    cutoff: float,
+    box: numpy.ndarray | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+    """
+    Yield the pairs of particles closer than a cutoff, and their distances, with a cell list.
+
+    Particles are binned into cells at least as wide as the cutoff, so candidate pairs are only drawn
+    from adjacent cells and the cost scales linearly with the number of particles. Candidates are
+    generated for one offset between cells, and for as many particles as fit in `chunk_size`
+    candidates, at a time, so memory use is bounded for any number of particles.
+
+    Each chunk is a tuple of the indices of the first particles, the indices of the second particles,
+    and the distances, with the lower index of each pair first. Chunks are never empty.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Unitless positions of shape (n_particles, 3)
+    cutoff : float
+        The distance, in the same units as `positions`, below which pairs are yielded
+    box : numpy.ndarray, optional
+        Unitless box vectors, one per row, in OpenMM's reduced form. If given, periodic boundary
+        conditions are used, and the cutoff must be less than half the width of the box.
+    chunk_size : int
+        The approximate number of candidate pairs considered at once
+
+    """
+    n_particles = len(positions)
+
+    if n_particles < 2:
+        return
+
+    if box is None:
+        origin = positions.min(axis=0)
+        widths = numpy.maximum(positions.max(axis=0) - origin, cutoff)
+
+        fractional = (positions - origin) / widths
+
+    else:
+        if not _is_reduced_form(box):
+            raise UnsupportedBoxError(
+                f"Box vectors must be in OpenMM's reduced form, found {box=}.",
+            )
+
+        inverse = numpy.linalg.inv(box)
+
+        # The distance between opposite faces of the box, along each box vector
+        widths = 1.0 / numpy.linalg.norm(inverse, axis=0)
+
+        if cutoff > 0.5 * widths.min():
+            raise UnsupportedCutoffMethodError(
+                f"The cutoff {cutoff} must be less than half the width of the box, found widths {widths}.",
+            )
+
+        fractional = positions @ inverse
+        fractional -= numpy.floor(fractional)
+
+    # Cells are at least as wide as the cutoff. Sparse particles share cells, rather than leaving most
+    # cells empty, so that the number of cells never much exceeds the number of particles.
+    n_cells = numpy.clip(
+        (widths // cutoff).astype(numpy.int64),
+        1,
+        max(1, round(n_particles ** (1 / 3))),
+    )
+
+    cells = numpy.minimum((fractional * n_cells).astype(numpy.int64), n_cells - 1)
+    cell_indices = numpy.ravel_multi_index(cells.T, n_cells)
+
+    order = numpy.argsort(cell_indices, kind="stable")
+    counts = numpy.bincount(cell_indices, minlength=n_cells.prod())
+    starts = numpy.cumsum(counts) - counts
+
+    if box is None:
+        offsets = [(-1, 0, 1)] * 3
+    else:
+        # With fewer than three cells along a vector, offsets of -1 and 1 may be the same cell
+        offsets = [
+            sorted({offset % n for offset in (-1, 0, 1)}) for n in n_cells.tolist()
+        ]
+
+    for offset in itertools.product(*offsets):
+        neighbor_cells = cells + offset
+
+        if box is None:
+            in_bounds = (neighbor_cells >= 0) & (neighbor_cells < n_cells)
+            valid = numpy.all(in_bounds, axis=1)
+            neighbor_cells = numpy.where(valid[:, None], neighbor_cells, 0)
+        else:
+            valid = numpy.ones(n_particles, dtype=bool)
+            neighbor_cells %= n_cells
+
+        neighbors = numpy.ravel_multi_index(neighbor_cells.T, n_cells)
+        n_candidates = numpy.where(valid, counts[neighbors], 0)
+
+        totals = numpy.cumsum(n_candidates)
+
+        start = 0
+
+        while start < n_particles:
+            before = totals[start - 1] if start > 0 else 0
+            end = int(numpy.searchsorted(totals, before + chunk_size, side="right"))
+            stop = max(end, start + 1)
+
+            block = n_candidates[start:stop]
+
+            first = numpy.repeat(numpy.arange(start, stop), block)
+            shifts = starts[neighbors[start:stop]] - numpy.cumsum(block) + block
+            second = order[numpy.repeat(shifts, block) + numpy.arange(len(first))]
+
+            mask = first < second
+            first, second = first[mask], second[mask]
+
+            distances = _get_distances(positions, first, second, box)
+
+            mask = distances < cutoff
+
+            if numpy.any(mask):
+                yield first[mask], second[mask], distances[mask]
+
+            start = stop
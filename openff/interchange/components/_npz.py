@@ -0,0 +1,524 @@
+"""A binary, array-native file format for `Interchange` objects, stored as uncompressed NPZ files."""
+
+import importlib
+import json
+import zipfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy
+from numpy.lib import format as npy_format
+from openff.models.models import DefaultModel
+from openff.toolkit import Molecule, Quantity, Topology, unit
+
+from openff.interchange.components._arrays import CollectionArrays
+from openff.interchange.components.potentials import Potential
+from openff.interchange.components.toolkit import _without_conformers
+from openff.interchange.exceptions import UnsupportedArrayStorageError
+from openff.interchange.models import PotentialKey
+
+if TYPE_CHECKING:
+    from openff.interchange import Interchange
+    from openff.interchange.components.potentials import Collection
+
+_FORMAT = "openff-interchange-npz"
+# Version 2 stores the units of each potential, rather than converting all potentials to the units of
+# the first, so that parameters round-trip exactly
+_FORMAT_VERSION = 2
+
+_ARRAY_NAMES = (
+    "atom_indices",
+    "potential_indices",
+    "parameters",
+    "key_class_indices",
+    "mult",
+    "bond_order",
+    "phase",
+    "partial_charge_method_indices",
+    "unit_set_indices",
+)
+
+_QUANTITIES = {
+    "positions": "nanometer",
+    "box": "nanometer",
+    "velocities": "nanometer / picosecond",
+}
+
+
+def _encode_json(data: Any) -> numpy.ndarray:
+    return numpy.frombuffer(json.dumps(data).encode(), dtype=numpy.uint8)
+
+
+def _decode_json(array: numpy.ndarray) -> Any:
+    return json.loads(numpy.asarray(array).tobytes())
+
+
+def _molecule_to_json(molecule) -> str:
+    """Serialize a molecule without its conformers, which are stored as positions instead."""
+    with _without_conformers([molecule]):
+        return molecule.to_json()
+
+
+def _molecule_from_json(serialized: str):
+    # As in `Topology.from_dict`, try `Molecule` first and fall back to `_SimpleMolecule`, which has fewer fields
+    try:
+        return Molecule.from_json(serialized)
+    except KeyError:
+        from openff.toolkit.topology._mm_molecule import _SimpleMolecule
+
+        return _SimpleMolecule.from_json(serialized)
+
+
+def _encode_topology(topology: Topology) -> tuple[dict, numpy.ndarray]:
+    """
+    Encode a topology as metadata and an array of indices into a list of unique molecules.
+
+    Molecules with identical serialized representations, i.e. copies of the same solvent molecule,
+    are stored once.
+    """
+    unique_molecules: dict[str, int] = dict()
+
+    molecule_indices = numpy.fromiter(
+        (
+            unique_molecules.setdefault(
+                _molecule_to_json(molecule),
+                len(unique_molecules),
+            )
+            for molecule in topology.molecules
+        ),
+        dtype=numpy.int32,
+        count=topology.n_molecules,
+    )
+
+    constrained_atom_pairs = [
+        [i, j, None if distance is True else distance.m_as(unit.nanometer)]
+        for (i, j), distance in topology._constrained_atom_pairs.items()
+        if i < j
+    ]
+
+    metadata = {
+        "aromaticity_model": topology.aromaticity_model,
+        "box_vectors": (
+            None
+            if topology.box_vectors is None
+            else topology.box_vectors.m_as(unit.nanometer).tolist()
+        ),
+        "constrained_atom_pairs": constrained_atom_pairs,
+        "unique_molecules": [*unique_molecules],
+    }
+
+    return metadata, molecule_indices
+
+
+def _decode_topology(metadata: dict, molecule_indices: numpy.ndarray) -> Topology:
+    templates = [
+        _molecule_from_json(serialized) for serialized in metadata["unique_molecules"]
+    ]
+
+    topology = Topology()
+    topology.aromaticity_model = metadata["aromaticity_model"]
+
+    topology.add_molecules([templates[index] for index in molecule_indices.tolist()])
+
+    if metadata["box_vectors"] is not None:
+        topology.box_vectors = Quantity(
+            numpy.asarray(metadata["box_vectors"]),
+            unit.nanometer,
+        )
+
+    for i, j, distance in metadata["constrained_atom_pairs"]:
+        topology.add_constraint(
+            i,
+            j,
+            True if distance is None else Quantity(distance, unit.nanometer),
+        )
+
+    return topology
+
+
+def _encode_parameter(value: Any) -> Any:
+    if value is None:
+        return None
+
+    return [numpy.asarray(value.m).tolist(), str(value.units)]
+
+
+def _decode_parameter(value: Any) -> Any:
+    if value is None:
+        return None
+
+    magnitude, parameter_unit = value
+
+    return Quantity(
+        numpy.asarray(magnitude) if isinstance(magnitude, list) else magnitude,
+        parameter_unit,
+    )
+
+
+def _encode_collection_json(collection: "Collection") -> dict:
+    """
+    Encode a collection as JSON, keeping the class of each key in its key maps.
+
+    ``Collection.parse_raw`` cannot tell subclasses of ``TopologyKey`` apart, and the parameters of
+    virtual site potentials may be None, which does not pass validation, so neither goes through it.
+    """
+    # The key map and, for virtual sites, the map from virtual site keys to particle indices
+    key_maps = {
+        name: value
+        for name, value in collection
+        if isinstance(value, dict) and name != "potentials"
+    }
+    key_maps = {
+        name: value
+        for name, value in key_maps.items()
+        if all(isinstance(key, DefaultModel) for key in value)
+    }
+
+    return {
+        "fields": collection.json(exclude={"potentials", *key_maps}),
+        "key_maps": {
+            name: [
+                [
+                    type(key).__name__,
+                    json.loads(key.json()),
+                    value.dict() if isinstance(value, PotentialKey) else value,
+                ]
+                for key, value in key_map.items()
+            ]
+            for name, key_map in key_maps.items()
+        },
+        "potentials": [
+            [
+                potential_key.dict(),
+                {
+                    name: _encode_parameter(value)
+                    for name, value in potential.parameters.items()
+                },
+                potential.map_key,
+            ]
+            for potential_key, potential in collection.potentials.items()
+        ],
+    }
+
+
+def _decode_collection_json(collection: "Collection", metadata: dict):
+    from openff.interchange import models
+
+    for name, key_map in metadata["key_maps"].items():
+        getattr(collection, name).update(
+            {
+                getattr(models, key_class).parse_obj(key): (
+                    PotentialKey(**value) if isinstance(value, dict) else value
+                )
+                for key_class, key, value in key_map
+            },
+        )
+
+    collection.potentials.update(
+        {
+            PotentialKey(**potential_key): Potential.construct(
+                parameters={
+                    name: _decode_parameter(value) for name, value in parameters.items()
+                },
+                map_key=map_key,
+            )
+            for potential_key, parameters, map_key in metadata["potentials"]
+        },
+    )
+
+
+def _encode_collection(
+    name: str,
+    collection: "Collection",
+) -> tuple[dict, dict[str, numpy.ndarray]]:
+    """
+    Encode a collection as metadata and arrays.
+
+    Collections whose keys or potentials cannot be stored as arrays, i.e. virtual sites, are stored
+    as JSON, with the class of each key.
+    """
+    metadata: dict[str, Any] = {
+        "class": f"{type(collection).__module__}:{type(collection).__qualname__}",
+    }
+
+    try:
+        arrays: CollectionArrays | None = CollectionArrays.from_collection(collection)
+    except UnsupportedArrayStorageError:
+        arrays = None
+
+    if arrays is None or any(
+        potential.map_key is not None for potential in collection.potentials.values()
+    ):
+        if all(
+            type(potential) is Potential for potential in collection.potentials.values()
+        ):
+            metadata.update(_encode_collection_json(collection))
+        else:
+            metadata["json"] = collection.json()
+
+        return metadata, dict()
+
+    metadata.update(
+        {
+            "fields": collection.json(exclude={"key_map", "potentials"}),
+            "parameter_names": [*arrays.parameter_names],
+            "parameter_units": [
+                str(parameter_unit) for parameter_unit in arrays.parameter_units
+            ],
+            "unit_sets": [
+                [str(set_unit) for set_unit in units] for units in arrays.unit_sets
+            ],
+            "potential_keys": [
+                potential_key.dict() for potential_key in arrays.potential_keys
+            ],
+            "key_classes": [key_class.__name__ for key_class in arrays.key_classes],
+            "partial_charge_methods": [*arrays.partial_charge_methods],
+        },
+    )
+
+    return metadata, {
+        f"collections/{name}/{array_name}": getattr(arrays, array_name)
+        for array_name in _ARRAY_NAMES
+    }
+
+
+def _decode_collection_arrays(
+    name: str,
+    metadata: dict,
+    arrays: Mapping[str, numpy.ndarray],
+) -> CollectionArrays:
+    from openff.interchange import models
+
+    # Files of version 1 store every potential in the units of the columns
+    unit_sets = metadata.get("unit_sets")
+
+    return CollectionArrays(
+        parameter_names=tuple(metadata["parameter_names"]),
+        parameter_units=tuple(
+            unit.Unit(parameter_unit) for parameter_unit in metadata["parameter_units"]
+        ),
+        unit_sets=(
+            None
+            if unit_sets is None
+            else tuple(tuple(map(unit.Unit, units)) for units in unit_sets)
+        ),
+        potential_keys=[
+            PotentialKey(**potential_key)
+            for potential_key in metadata["potential_keys"]
+        ],
+        key_classes=tuple(
+            getattr(models, key_class) for key_class in metadata["key_classes"]
+        ),
+        partial_charge_methods=tuple(metadata["partial_charge_methods"]),
+        **{
+            array_name: arrays.get(f"collections/{name}/{array_name}")
+            for array_name in _ARRAY_NAMES
+        },
+    )
+
+
+def _decode_collection(
+    name: str,
+    metadata: dict,
+    arrays: Mapping[str, numpy.ndarray],
+) -> "Collection":
+    module_name, class_name = metadata["class"].split(":")
+    collection_class = getattr(importlib.import_module(module_name), class_name)
+
+    if "json" in metadata:
+        return collection_class.parse_raw(metadata["json"])
+
+    collection = collection_class.parse_raw(metadata["fields"])
+
+    if "key_maps" in metadata:
+        _decode_collection_json(collection, metadata)
+
+        return collection
+
+    key_map, potentials = _decode_collection_arrays(name, metadata, arrays).to_dicts()
+
+    collection.key_map.update(key_map)
+    collection.potentials.update(potentials)
+
+    return collection
+
+
+def to_npz(interchange: "Interchange", file_path: Path | str):
+    """
+    Write an Interchange to an uncompressed NPZ file.
+
+    Positions, box vectors, velocities, and the key maps and parameters of each collection are stored
+    as typed arrays. The topology is stored as the serialized representation of each unique molecule
+    and an array of indices into them. Everything else is stored as JSON in the ``metadata`` array.
+    """
+    from openff.interchange import __version__
+
+    metadata: dict[str, Any] = {
+        "format": _FORMAT,
+        "format_version": _FORMAT_VERSION,
+        "interchange_version": __version__,
+        "collections": dict(),
+        "topology": None,
+        "mdconfig": (
+            None if interchange.mdconfig is None else interchange.mdconfig.json()
+        ),
+    }
+
+    arrays: dict[str, numpy.ndarray] = dict()
+
+    for name, default_unit in _QUANTITIES.items():
+        value = getattr(interchange, name)
+
+        if value is not None:
+            arrays[name] = numpy.asarray(value.m_as(default_unit), dtype=numpy.float64)
+
+    if interchange.topology is not None:
+        metadata["topology"], arrays["topology/molecule_indices"] = _encode_topology(
+            interchange.topology,
+        )
+
+    for name, collection in interchange.collections.items():
+        collection_metadata, collection_arrays = _encode_collection(name, collection)
+
+        metadata["collections"][name] = collection_metadata
+        arrays.update(collection_arrays)
+
+    arrays["metadata"] = _encode_json(metadata)
+
+    with zipfile.ZipFile(
+        file_path,
+        mode="w",
+        compression=zipfile.ZIP_STORED,
+        allowZip64=True,
+    ) as file:
+        for array_name, array in arrays.items():
+            with file.open(f"{array_name}.npy", mode="w", force_zip64=True) as member:
+                npy_format.write_array(
+                    member,
+                    numpy.ascontiguousarray(array),
+                    allow_pickle=False,
+                )
+
+
+def _memory_map_npz(file_path: Path | str) -> dict[str, numpy.ndarray]:
+    """
+    Memory-map each array in an uncompressed NPZ file.
+
+    ``numpy.load`` does not memory-map arrays in NPZ files, but uncompressed members of a ZIP file are
+    stored contiguously, so each can be mapped from its offset in the file.
+    """
+    arrays: dict[str, numpy.ndarray] = dict()
+
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Cannot memory-map compressed array {info.filename}.")
+
+            # The local file header is 30 bytes, followed by the file name and an extra field whose
+            # lengths are stored in its last four bytes
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = numpy.frombuffer(file.read(4), dtype="<u2")
+            file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+
+            version = npy_format.read_magic(file)
+
+            if version == (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+
+            array_name = info.filename.removesuffix(".npy")
+
+            if numpy.prod(shape) == 0:
+                arrays[array_name] = numpy.empty(shape, dtype=dtype)
+            else:
+                arrays[array_name] = numpy.memmap(
+                    file_path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=file.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+
+    return arrays
+
+
+def _load_arrays(file_path: Path | str, mmap: bool) -> dict[str, numpy.ndarray]:
+    if mmap:
+        return _memory_map_npz(file_path)
+
+    with numpy.load(file_path, allow_pickle=False) as data:
+        return {array_name: data[array_name] for array_name in data.files}
+
+
+def _load_metadata(arrays: Mapping[str, numpy.ndarray]) -> dict:
+    metadata = _decode_json(arrays["metadata"])
+
+    if metadata.get("format") != _FORMAT:
+        raise ValueError("File is not an Interchange NPZ file.")
+
+    if metadata["format_version"] > _FORMAT_VERSION:
+        raise ValueError(
+            f"File has format version {metadata['format_version']}, but this version of Interchange "
+            f"only reads versions up to {_FORMAT_VERSION}.",
+        )
+
+    return metadata
+
+
+def _decode_field(
+    name: str,
+    metadata: dict,
+    arrays: Mapping[str, numpy.ndarray],
+) -> Any:
+    """Decode one field, other than collections, returning None if it was not saved."""
+    if name in _QUANTITIES:
+        return Quantity(arrays[name], _QUANTITIES[name]) if name in arrays else None
+
+    elif name == "topology":
+        if metadata["topology"] is None:
+            return None
+
+        return _decode_topology(
+            metadata["topology"],
+            arrays["topology/molecule_indices"],
+        )
+
+    elif name == "mdconfig":
+        from openff.interchange.components.mdconfig import MDConfig
+
+        if metadata["mdconfig"] is None:
+            return None
+
+        return MDConfig.parse_raw(metadata["mdconfig"])
+
+    else:
+        raise KeyError(f"Cannot decode field {name}.")
+
+
+def from_npz(file_path: Path | str, mmap: bool = False) -> "Interchange":
+    """
+    Load an Interchange from an NPZ file written by `to_npz`.
+
+    If ``mmap`` is True, positions, box vectors and velocities are memory-mapped, read-only, from the
+    file instead of being read into memory.
+    """
+    from openff.interchange import Interchange
+
+    arrays = _load_arrays(file_path, mmap)
+    metadata = _load_metadata(arrays)
+
+    fields: dict[str, Any] = {
+        name: _decode_field(name, metadata, arrays)
+        for name in (*_QUANTITIES, "topology", "mdconfig")
+    }
+
+    fields["collections"] = {
+        name: _decode_collection(name, collection_metadata, arrays)
+        for name, collection_metadata in metadata["collections"].items()
+    }
+
+    # Each value has been validated on the way in, and validating the topology would copy it
+    return Interchange.construct(**fields)
@@ -1,6 +1,5 @@
 """An object for storing, manipulating, and converting molecular mechanics data."""
 
-import copy
 import json
 import warnings
 from collections.abc import Iterable
@@ -34,7 +33,9 @@ from openff.interchange.exceptions import (
 from openff.interchange.operations.minimize import (
     _DEFAULT_ENERGY_MINIMIZATION_TOLERANCE,
 )
+from openff.interchange.profiling import _profiled
 from openff.interchange.smirnoff import (
+    ParametrizationCache,
     SMIRNOFFConstraintCollection,
     SMIRNOFFVirtualSiteCollection,
 )
@@ -49,17 +50,19 @@ if TYPE_CHECKING:
     import openmm
     import openmm.app
 
+    from openff.interchange.components._lazy import LazyInterchange
+    from openff.interchange.models import PotentialKey
+
 
 class TopologyEncoder(json.JSONEncoder):
     """Custom encoder for `Topology` objects."""
 
     def default(self, obj: Topology):
         """Encode a `Topology` object to JSON."""
-        _topology = copy.deepcopy(obj)
-        for molecule in _topology.molecules:
-            molecule._conformers = None
+        from openff.interchange.components.toolkit import _without_conformers
 
-        return _topology.to_json()
+        with _without_conformers(obj.molecules):
+            return obj.to_json()
 
 
 def interchange_dumps(v, *, default):
@@ -80,6 +83,43 @@ def interchange_dumps(v, *, default):
     )
 
 
+def _load_field(key: str, val):
+    """Load a field, other than collections, of a JSON representation of an Interchange object."""
+    if key in ("positions", "velocities", "box"):
+        return Quantity(val["val"], unit.Unit(val["unit"]))
+    elif key == "topology":
+        return Topology.from_json(val)
+    else:
+        raise KeyError(f"Cannot load field {key} from JSON.")
+
+
+def _load_collection(collection_name: str, collection_data: str) -> Collection:
+    """Load a collection, by name, from its JSON representation."""
+    from openff.interchange.smirnoff import (
+        SMIRNOFFAngleCollection,
+        SMIRNOFFBondCollection,
+        SMIRNOFFConstraintCollection,
+        SMIRNOFFElectrostaticsCollection,
+        SMIRNOFFImproperTorsionCollection,
+        SMIRNOFFProperTorsionCollection,
+        SMIRNOFFvdWCollection,
+        SMIRNOFFVirtualSiteCollection,
+    )
+
+    _class_mapping = {
+        "Bonds": SMIRNOFFBondCollection,
+        "Angles": SMIRNOFFAngleCollection,
+        "Constraints": SMIRNOFFConstraintCollection,
+        "ProperTorsions": SMIRNOFFProperTorsionCollection,
+        "ImproperTorsions": SMIRNOFFImproperTorsionCollection,
+        "vdW": SMIRNOFFvdWCollection,
+        "Electrostatics": SMIRNOFFElectrostaticsCollection,
+        "VirtualSites": SMIRNOFFVirtualSiteCollection,
+    }
+
+    return _class_mapping[collection_name].parse_raw(collection_data)  # type: ignore
+
+
 def interchange_loader(data: str) -> dict:
     """Load a JSON representation of an Interchange object."""
     tmp: dict[str, int | bool | str | dict | None] = {}
@@ -87,44 +127,14 @@ def interchange_loader(data: str) -> dict:
     for key, val in json.loads(data).items():
         if val is None:
             continue
-        if key == "positions":
-            tmp["positions"] = Quantity(val["val"], unit.Unit(val["unit"]))
-        elif key == "velocities":
-            tmp["velocities"] = Quantity(val["val"], unit.Unit(val["unit"]))
-        elif key == "box":
-            tmp["box"] = Quantity(val["val"], unit.Unit(val["unit"]))
-        elif key == "topology":
-            tmp["topology"] = Topology.from_json(val)
+        if key in ("positions", "velocities", "box", "topology"):
+            tmp[key] = _load_field(key, val)
         elif key == "collections":
-            from openff.interchange.smirnoff import (
-                SMIRNOFFAngleCollection,
-                SMIRNOFFBondCollection,
-                SMIRNOFFConstraintCollection,
-                SMIRNOFFElectrostaticsCollection,
-                SMIRNOFFImproperTorsionCollection,
-                SMIRNOFFProperTorsionCollection,
-                SMIRNOFFvdWCollection,
-                SMIRNOFFVirtualSiteCollection,
-            )
-
-            tmp["collections"] = {}
-
-            _class_mapping = {
-                "Bonds": SMIRNOFFBondCollection,
-                "Angles": SMIRNOFFAngleCollection,
-                "Constraints": SMIRNOFFConstraintCollection,
-                "ProperTorsions": SMIRNOFFProperTorsionCollection,
-                "ImproperTorsions": SMIRNOFFImproperTorsionCollection,
-                "vdW": SMIRNOFFvdWCollection,
-                "Electrostatics": SMIRNOFFElectrostaticsCollection,
-                "VirtualSites": SMIRNOFFVirtualSiteCollection,
+            tmp["collections"] = {
+                collection_name: _load_collection(collection_name, collection_data)
+                for collection_name, collection_data in val.items()
             }
 
-            for collection_name, collection_data in val.items():
-                tmp["collections"][collection_name] = _class_mapping[  # type: ignore
-                    collection_name
-                ].parse_raw(collection_data)
-
     return tmp
 
 
@@ -215,6 +225,8 @@ class Interchange(DefaultModel):
         charge_from_molecules: list[Molecule] | None = None,
         partial_bond_orders_from_molecules: list[Molecule] | None = None,
         allow_nonintegral_charges: bool = False,
+        n_workers: int = 1,
+        cache: str | Path | ParametrizationCache | None = None,
     ) -> "Interchange":
         """
         Create a new object by parameterizing a topology with a SMIRNOFF force field.
@@ -240,12 +252,23 @@ class Interchange(DefaultModel):
             instead of being determined by the force field.
         allow_nonintegral_charges : bool, optional, default=False
             If True, allow molecules to have approximately non-integral charges.
+        n_workers : int, optional, default=1
+            The number of worker processes used to create the valence and non-bonded
+            collections concurrently. If 1, all collections are created serially in
+            this process.
+        cache : str, pathlib.Path, or `openff.interchange.smirnoff.ParametrizationCache`, optional
+            An on-disk cache, or the path to one, in which to look up and store the parameters
+            assigned to each unique molecule. If ``None``, no cache is used.
 
         Notes
         -----
         If the `Molecule` objects in the `topology` argument each contain conformers, the returned `Interchange` object
         will have its positions set via concatenating the 0th conformer of each `Molecule`.
 
+        With ``n_workers > 1``, each worker process receives a copy of the force field and topology.
+        Toolkit registries set up with ``toolkit_registry_manager`` in this process may not be used
+        by the workers, depending on how processes are started on the current platform.
+
         Examples
         --------
         Generate an Interchange object from a single-molecule (OpenFF) topology and
@@ -273,6 +296,8 @@ class Interchange(DefaultModel):
             charge_from_molecules=charge_from_molecules,
             partial_bond_orders_from_molecules=partial_bond_orders_from_molecules,
             allow_nonintegral_charges=allow_nonintegral_charges,
+            n_workers=n_workers,
+            cache=cache,
         )
 
     def visualize(
@@ -416,6 +441,7 @@ class Interchange(DefaultModel):
         else:
             raise NotImplementedError(f"Engine {engine} is not implemented.")
 
+    @_profiled("to_gromacs")
     def to_gromacs(
         self,
         prefix: str,
@@ -736,6 +762,81 @@ class Interchange(DefaultModel):
         else:
             raise UnsupportedExportError
 
+    def to_npz(self, file_path: Path | str):
+        """
+        Save this Interchange to a binary, uncompressed NPZ file.
+
+        Positions, box vectors, velocities, and the key maps and parameters of collections are stored as
+        typed arrays, which is much faster to write and read than JSON for large systems. Load the file
+        with `Interchange.from_npz`.
+        """
+        from openff.interchange.components._npz import to_npz
+
+        to_npz(self, file_path)
+
+    @classmethod
+    def from_npz(cls, file_path: Path | str, mmap: bool = False) -> "Interchange":
+        """
+        Load an Interchange from a file written by `Interchange.to_npz`.
+
+        Parameters
+        ----------
+        file_path : str or pathlib.Path
+            The path to the file.
+        mmap : bool, default=False
+            If True, positions, box vectors, and velocities are memory-mapped, read-only, from the file
+            instead of being read into memory.
+
+        """
+        from openff.interchange.components._npz import from_npz
+
+        return from_npz(file_path, mmap=mmap)
+
+    @classmethod
+    def load_lazy(
+        cls,
+        file_path: Path | str,
+        fields: Iterable[str] | None = None,
+        collections: Iterable[str] | None = None,
+        mmap: bool = False,
+    ) -> "LazyInterchange":
+        """
+        Open a saved Interchange, deserializing each field only when it is first accessed.
+
+        Parameters
+        ----------
+        file_path : str or pathlib.Path
+            The path to a file written by `Interchange.to_npz` or containing the output of `Interchange.json`.
+        fields : iterable of str, optional
+            The fields which can be accessed, out of "positions", "box", "velocities", "topology",
+            "mdconfig", and "collections". By default, all fields can be accessed.
+        collections : iterable of str, optional
+            The names of the collections which can be accessed, i.e. ``["Electrostatics"]``. By default,
+            all collections can be accessed.
+        mmap : bool, default=False
+            If True, arrays in NPZ files are memory-mapped, read-only, instead of being read into memory.
+
+        Returns
+        -------
+        handle : openff.interchange.components._lazy.LazyInterchange
+            A handle with the same attributes as `Interchange`. Call ``handle.to_interchange()`` to
+            load every selected field into an `Interchange`.
+
+        Examples
+        --------
+        Load only the partial charges of a saved system
+
+        .. code-block:: pycon
+
+            >>> from openff.interchange import Interchange
+            >>> with Interchange.load_lazy("out.npz", collections=["Electrostatics"]) as handle:  # doctest: +SKIP
+            ...     charges = handle["Electrostatics"].charges
+
+        """
+        from openff.interchange.components._lazy import load_lazy
+
+        return load_lazy(file_path, fields=fields, collections=collections, mmap=mmap)
+
     @classmethod
     @requires_package("foyer")
     def from_foyer(
@@ -876,9 +977,9 @@ class Interchange(DefaultModel):
         Note: This method only checks for equality of atom indices and will likely fail on complex cases
         involved layered parameters with multiple topology keys sharing identical atom indices.
         """
-        for handler in self.collections:
-            if handler == handler_name:
-                return self[handler_name]._get_parameters(atom_indices=atom_indices)
+        if handler_name in self.collections:
+            return self[handler_name]._get_parameters(atom_indices=atom_indices)
+
         raise MissingParameterHandlerError(
             f"Could not find parameter handler of name {handler_name}",
         )
@@ -976,6 +1077,108 @@ class Interchange(DefaultModel):
 
         return _combine(self, other)
 
+    @classmethod
+    @experimental
+    def concatenate(cls, interchanges: Iterable["Interchange"]) -> "Interchange":
+        """
+        Combine any number of Interchange objects. This method is unstable and not yet safe for general use.
+
+        Compatibility is checked once for each object and atom offsets are computed up front, so combining
+        many objects, i.e. a box of ligands, scales linearly with the total number of atoms, unlike repeated
+        calls to `Interchange.combine`. The box vectors, MD configuration and non-bonded settings of the
+        first object are used.
+        """
+        from openff.interchange.operations._combine import _concatenate
+
+        return _concatenate(list(interchanges))
+
+    def replicate(self, shape: tuple[int, int, int]) -> "Interchange":
+        """
+        Build a supercell by tiling this Interchange along its box vectors.
+
+        The potentials already assigned are reused, so no force field parameters are matched again. Positions
+        are translated by whole box vectors, and the topology, key maps and velocities are repeated with atom
+        offsets. Copies are ordered with the first box vector varying slowest.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            The number of copies along each of the three box vectors, i.e. ``(2, 2, 2)``.
+
+        Returns
+        -------
+        supercell : Interchange
+            A new Interchange with ``nx * ny * nz`` copies of this one and box vectors scaled to match.
+
+        """
+        from openff.interchange.operations._replicate import _replicate
+
+        return _replicate(self, shape)
+
+    def subset(
+        self,
+        molecule_indices: Iterable[int] | None = None,
+        atom_indices: Iterable[int] | None = None,
+    ) -> "Interchange":
+        """
+        Extract a smaller Interchange containing only some of the molecules in this one.
+
+        Terms are kept only if all of their atoms are selected, and potentials which are no longer used are
+        dropped. Atoms are renumbered in their original order.
+
+        Parameters
+        ----------
+        molecule_indices : iterable of int, optional
+            The indices of the molecules to keep.
+        atom_indices : iterable of int, optional
+            The indices of the atoms to keep, which must include every atom of each molecule they select from.
+
+        Returns
+        -------
+        subset : Interchange
+            A new Interchange with the selected molecules, their positions and velocities, and the same box
+            vectors.
+
+        """
+        from openff.interchange.operations._subset import _subset
+
+        return _subset(
+            self,
+            molecule_indices=molecule_indices,
+            atom_indices=atom_indices,
+        )
+
+    def update_parameters(
+        self,
+        force_field: ForceField,
+    ) -> dict[str, list["PotentialKey"]]:
+        """
+        Update, in-place, the potentials whose parameters were modified in the force field this was created from.
+
+        Each potential is recomputed once, no matter how many terms use it, and only potentials whose values
+        changed are replaced. Bonds, angles, torsions, vdW, GBSA, and constraint distances are updated; other
+        collections, such as electrostatics and virtual sites, are left unchanged.
+
+        Parameters
+        ----------
+        force_field : ForceField
+            The force field, with parameter values modified but the same SMIRKS patterns.
+
+        Returns
+        -------
+        updated : dict[str, list[PotentialKey]]
+            The keys of the potentials which were updated, by the name of their collection.
+
+        Notes
+        -----
+        Parameters are not assigned again, so this cannot account for new parameters or modified SMIRKS
+        patterns. Create a new Interchange if which parameters are assigned may have changed.
+
+        """
+        from openff.interchange.smirnoff._update import _update_parameters
+
+        return _update_parameters(self, force_field)
+
     def __repr__(self) -> str:
         periodic = self.box is not None
         n_atoms = self.topology.n_atoms
@@ -387,10 +387,26 @@ class MDConfig(DefaultModel):
 
             lmp.write("run 0\n")
 
-    def write_sander_input_file(self, input_file: str = "run.in") -> None:
-        """Write a Sander input file for running single-point energies."""
+    def write_sander_input_file(
+        self,
+        input_file: str = "run.in",
+        rerun: bool = False,
+    ) -> None:
+        """
+        Write a Sander input file for running single-point energies.
+
+        If ``rerun``, energies are evaluated for each frame of a trajectory (``imin=5``) instead of
+        for the input coordinates.
+        """
         with open(input_file, "w") as sander:
-            sander.write("single-point energy\n&cntrl\nimin=1,\nmaxcyc=0,\nntb=1,\n")
+            if rerun:
+                sander.write(
+                    "single-point energies\n&cntrl\nimin=5,\nmaxcyc=0,\nntpr=1,\nntb=1,\n",
+                )
+            else:
+                sander.write(
+                    "single-point energy\n&cntrl\nimin=1,\nmaxcyc=0,\nntb=1,\n",
+                )
 
             if self.switching_function is not None:
                 if self.switching_distance.m > 0.0:
@@ -3,8 +3,8 @@
 import ast
 import json
 import warnings
-from collections.abc import Callable
-from typing import Union
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, TypeAlias, Union
 
 import numpy
 from openff.models.models import DefaultModel
@@ -15,6 +15,8 @@ from pydantic.v1 import Field, PrivateAttr, validator
 
 from openff.interchange.exceptions import MissingParametersError
 from openff.interchange.models import (
+    ChargeIncrementTopologyKey,
+    ChargeModelTopologyKey,
     LibraryChargeTopologyKey,
     PotentialKey,
     TopologyKey,
@@ -29,6 +31,9 @@ from numpy.typing import ArrayLike
 if has_package("jax"):
     from jax import Array
 
+if TYPE_CHECKING:
+    from openff.interchange.components._arrays import CollectionArrays
+
 
 def __getattr__(name: str):
     if name == "PotentialHandler":
@@ -134,6 +139,49 @@ class WrappedPotential(DefaultModel):
         return str(self._inner_data.data)
 
 
+class _TrackedDict(dict):
+    """A dictionary which counts modifications, so that indexes built from it can be invalidated."""
+
+    _version: int = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._version += 1
+
+    def __ior__(self, other):
+        self._version += 1
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._version += 1
+
+    def setdefault(self, key, default=None):
+        self._version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self._version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._version += 1
+
+
+# Keys of charge models and charge increments must be listed before `LibraryChargeTopologyKey` in the
+# type of `Collection.key_map`, which would otherwise validate them and drop their other fields
+_ChargeKey: TypeAlias = ChargeModelTopologyKey | ChargeIncrementTopologyKey
+
+
 class Collection(DefaultModel):
     """Base class for storing parametrized force field data."""
 
@@ -146,15 +194,19 @@ class Collection(DefaultModel):
         ...,
         description="The analytical expression governing the potentials in this handler.",
     )
-    key_map: dict[TopologyKey | LibraryChargeTopologyKey, PotentialKey] = Field(
-        dict(),
-        description="A mapping between TopologyKey objects and PotentialKey objects.",
+    key_map: dict[TopologyKey | _ChargeKey | LibraryChargeTopologyKey, PotentialKey] = (
+        Field(
+            dict(),
+            description="A mapping between TopologyKey objects and PotentialKey objects.",
+        )
     )
     potentials: dict[PotentialKey, Potential | WrappedPotential] = Field(
         dict(),
         description="A mapping between PotentialKey objects and Potential objects.",
     )
 
+    _key_map_index: tuple | None = PrivateAttr(None)
+
     @property
     def independent_variables(self) -> set[str]:
         """
@@ -168,8 +220,64 @@ class Collection(DefaultModel):
         }
         return vars_in_expression - vars_in_potentials
 
+    @validator("key_map", always=True)
+    def track_key_map(cls, v: dict) -> dict:
+        # Count modifications, so that the indexes used by lookups are rebuilt only when needed
+        return _TrackedDict(v)
+
+    def _get_key_map_index(self) -> tuple[dict, dict]:
+        """
+        Return indexes of topology keys by sorted atom indices and by potential key.
+
+        The indexes are built on first use and rebuilt after ``key_map`` is modified. If ``key_map`` was
+        set without validation, i.e. by ``Collection.copy(update=...)``, they are rebuilt on every call.
+        """
+        key_map = self.key_map
+        version = getattr(key_map, "_version", None)
+        index = self._key_map_index
+
+        if index is not None and index[0] is key_map and index[1] == version:
+            return index[2], index[3]
+
+        by_atom_indices: dict[tuple[int, ...], list] = dict()
+        by_potential_key: dict[PotentialKey, list] = dict()
+
+        for topology_key, potential_key in key_map.items():
+            atom_indices = getattr(topology_key, "atom_indices", None)
+
+            if atom_indices is not None:
+                sorted_indices = tuple(sorted(atom_indices))
+                by_atom_indices.setdefault(sorted_indices, list()).append(topology_key)
+
+            by_potential_key.setdefault(potential_key, list()).append(topology_key)
+
+        if isinstance(key_map, _TrackedDict):
+            self._key_map_index = (key_map, version, by_atom_indices, by_potential_key)
+
+        return by_atom_indices, by_potential_key
+
+    def get_keys_by_atom_indices(self, atom_indices: Iterable[int]) -> list:
+        """
+        Return the topology keys involving exactly these atoms, in any order.
+
+        Lookups use an index which is built on first use and rebuilt after ``key_map`` is modified.
+        """
+        by_atom_indices, _ = self._get_key_map_index()
+
+        return list(by_atom_indices.get(tuple(sorted(atom_indices)), ()))
+
+    def get_keys_by_potential_key(self, potential_key: PotentialKey) -> list:
+        """
+        Return the topology keys associated with a potential key.
+
+        Lookups use an index which is built on first use and rebuilt after ``key_map`` is modified.
+        """
+        _, by_potential_key = self._get_key_map_index()
+
+        return list(by_potential_key.get(potential_key, ()))
+
     def _get_parameters(self, atom_indices: tuple[int]) -> dict:
-        for topology_key in self.key_map:
+        for topology_key in self.get_keys_by_atom_indices(atom_indices):
             if topology_key.atom_indices == atom_indices:
                 potential_key = self.key_map[topology_key]
                 potential = self.potentials[potential_key]
@@ -268,6 +376,18 @@ class Collection(DefaultModel):
 
         return mapping
 
+    def to_arrays(self) -> "CollectionArrays":
+        """
+        Return a compact, array-backed copy of the key map and potentials of this collection.
+
+        The returned object stores atom indices, potential indices, and parameters as NumPy
+        arrays and provides lazy, read-only ``key_map`` and ``potentials`` views. Later changes to
+        this collection are not reflected in the copy.
+        """
+        from openff.interchange.components._arrays import CollectionArrays
+
+        return CollectionArrays.from_collection(self)
+
     def parametrize(
         self,
         p=None,
@@ -1,5 +1,7 @@
 """Utilities for processing and interfacing with the OpenFF Toolkit."""
 
+import contextlib
+from collections.abc import Generator, Iterable
 from typing import TYPE_CHECKING, Union
 
 import networkx
@@ -25,6 +27,26 @@ def _get_num_h_bonds(topology: "Topology") -> int:
     return n_bonds_containing_hydrogen
 
 
+@contextlib.contextmanager
+def _without_conformers(molecules: Iterable) -> Generator[None, None, None]:
+    """
+    Temporarily remove the conformers of molecules, i.e. to serialize them without their conformers.
+
+    The conformers are restored on exit, which avoids copying the molecules.
+    """
+    molecules = list(molecules)
+    conformers = [molecule._conformers for molecule in molecules]
+
+    try:
+        for molecule in molecules:
+            molecule._conformers = None
+
+        yield
+    finally:
+        for molecule, molecule_conformers in zip(molecules, conformers):
+            molecule._conformers = molecule_conformers
+
+
 def _get_14_pairs(topology_or_molecule: Union["Topology", "Molecule"]):
     """Generate tuples of atom pairs, including symmetric duplicates."""
     # TODO: A replacement of Topology.nth_degree_neighbors in the toolkit
@@ -68,9 +90,9 @@ def _validated_list_to_array(validated_list: "ValidatedList") -> Quantity:
 
 def _combine_topologies(topology1: Topology, topology2: Topology) -> Topology:
     topology1_ = Topology(other=topology1)
-    topology2_ = Topology(other=topology2)
 
-    for molecule in topology2_.molecules:
+    # `add_molecule` copies each molecule, so topology2 does not need to be copied first
+    for molecule in topology2.molecules:
         topology1_.add_molecule(molecule)
 
     return topology1_
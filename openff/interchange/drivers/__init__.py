@@ -1,16 +1,31 @@
 """Functions for running energy evluations with molecular simulation engines."""
 
 from openff.interchange.drivers.all import get_all_energies, get_summary_data
-from openff.interchange.drivers.amber import get_amber_energies
-from openff.interchange.drivers.gromacs import get_gromacs_energies
-from openff.interchange.drivers.lammps import get_lammps_energies
-from openff.interchange.drivers.openmm import get_openmm_energies
+from openff.interchange.drivers.amber import (
+    get_amber_energies,
+    get_amber_energies_async,
+)
+from openff.interchange.drivers.gromacs import (
+    get_gromacs_energies,
+    get_gromacs_energies_async,
+)
+from openff.interchange.drivers.lammps import (
+    get_lammps_energies,
+    get_lammps_energies_async,
+)
+from openff.interchange.drivers.numpy import get_numpy_energies
+from openff.interchange.drivers.openmm import OpenMMEnergyEvaluator, get_openmm_energies
 
 __all__ = [
     "get_openmm_energies",
+    "OpenMMEnergyEvaluator",
     "get_gromacs_energies",
+    "get_gromacs_energies_async",
     "get_lammps_energies",
+    "get_lammps_energies_async",
     "get_amber_energies",
+    "get_amber_energies_async",
+    "get_numpy_energies",
     "get_all_energies",
     "get_summary_data",
 ]
@@ -0,0 +1,27 @@
+"""Helpers for running engines as subprocesses without blocking an event loop."""
+
+import asyncio
+from pathlib import Path
+
+
+async def _run_async(*args: str, cwd: Path | str) -> tuple[int, str, str]:
+    """
+    Run a command in a directory, returning its exit code, standard output, and standard error.
+
+    If the awaiting task is cancelled, the process is killed before the cancellation propagates.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+
+    return process.returncode, stdout.decode(), stderr.decode()  # type: ignore[return-value]
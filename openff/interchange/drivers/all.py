@@ -1,9 +1,14 @@
 """Functions for running energy evluations with all available engines."""
 
+import multiprocessing
+import tempfile
+import time
 import warnings
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping
+from multiprocessing.connection import Connection, wait
+from typing import NamedTuple
 
-from openff.utilities.utilities import requires_package
+from openff.utilities.utilities import requires_package, temporary_cd
 from pandas import DataFrame
 
 from openff.interchange import Interchange
@@ -20,14 +25,193 @@ from openff.interchange.exceptions import (
 )
 
 
+class EngineResult(NamedTuple):
+    """
+    The outcome of evaluating energies with one engine.
+
+    ``wall_time`` is in seconds. If the engine failed or timed out, ``energies`` is ``None`` and
+    ``error`` is the exception raised, a ``TimeoutError`` in the case of a timeout.
+    """
+
+    energies: EnergyReport | None
+    wall_time: float
+    error: Exception | None = None
+
+
+# Each engine's driver and the exception it raises if it is unavailable or cannot handle a system
+_DRIVERS: dict[str, tuple[Callable[..., EnergyReport], type[Exception]]] = {
+    "OpenMM": (get_openmm_energies, UnsupportedCutoffMethodError),
+    "Amber": (get_amber_energies, AmberError),
+    "GROMACS": (get_gromacs_energies, GMXError),
+    "LAMMPS": (get_lammps_energies, LAMMPSError),
+}
+
+
+def _run_engine(
+    engine: str,
+    interchange: "Interchange",
+    combine_nonbonded_forces: bool,
+    connection: Connection,
+):
+    """Evaluate energies with one engine, in a child process, and send back an `EngineResult`."""
+    driver, _ = _DRIVERS[engine]
+
+    kwargs: dict[str, bool] = dict()
+
+    if engine == "OpenMM":
+        kwargs["combine_nonbonded_forces"] = combine_nonbonded_forces
+
+    start = time.perf_counter()
+
+    try:
+        # Drivers write files to, and some read from, the working directory, which is only safe to
+        # change because each engine runs in its own process
+        with tempfile.TemporaryDirectory() as tmpdir, temporary_cd(tmpdir):
+            energies = driver(interchange=interchange, **kwargs)
+
+        connection.send(EngineResult(energies, time.perf_counter() - start))
+
+    except Exception as error:
+        connection.send(EngineResult(None, time.perf_counter() - start, error))
+
+    finally:
+        connection.close()
+
+
+def get_all_energies_concurrently(
+    interchange: "Interchange",
+    combine_nonbonded_forces: bool = False,
+    timeout: float | dict[str, float] | None = None,
+    _engines: Iterable[str] = ("OpenMM", "Amber", "GROMACS", "LAMMPS"),
+) -> dict[str, EngineResult]:
+    """
+    Given an Interchange object, evaluate single-point energies with all engines at the same time.
+
+    Each engine runs in its own process and temporary directory. Results are returned in the order
+    in which the engines finished, including those of engines that failed.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.Interchange
+        An OpenFF Interchange object to compute the single-point energy of
+    combine_nonbonded_forces : bool, default=False
+        Whether or not to combine all non-bonded interactions (vdW, short- and long-range
+        electrostatics, and 1-4 interactions) into a single openmm.NonbondedForce.
+    timeout : float or dict[str, float], optional
+        The time, in seconds, after which an engine is stopped and its result recorded as a
+        ``TimeoutError``. Either a single timeout for all engines or one per engine name. By default,
+        engines are not stopped.
+
+    Returns
+    -------
+    results : dict[str, EngineResult]
+        The energies, wall time, and any error of each engine, keyed by engine name.
+
+    """
+    timeouts: Mapping[str, float | None]
+
+    if isinstance(timeout, dict):
+        timeouts = timeout
+    else:
+        timeouts = {engine: timeout for engine in _DRIVERS}
+
+    start = time.perf_counter()
+
+    processes: dict[str, multiprocessing.Process] = dict()
+    connections: dict[Connection, str] = dict()
+    deadlines: dict[str, float] = dict()
+
+    for engine in _DRIVERS:
+        if engine not in _engines:
+            continue
+
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+
+        processes[engine] = multiprocessing.Process(
+            target=_run_engine,
+            args=(engine, interchange, combine_nonbonded_forces, sender),
+            name=f"get_all_energies-{engine}",
+        )
+        processes[engine].start()
+
+        # The child holds its own copy of the sending end, which is closed when it exits
+        sender.close()
+
+        connections[receiver] = engine
+
+        if timeouts.get(engine, None) is not None:
+            deadlines[engine] = time.perf_counter() + timeouts[engine]  # type: ignore[operator]
+
+    results: dict[str, EngineResult] = dict()
+
+    while connections:
+        pending = [
+            deadlines[engine] for engine in connections.values() if engine in deadlines
+        ]
+
+        for receiver in wait(
+            [*connections],
+            timeout=max(min(pending) - time.perf_counter(), 0.0) if pending else None,
+        ):
+            engine = connections.pop(receiver)  # type: ignore[call-overload]
+
+            try:
+                results[engine] = receiver.recv()  # type: ignore[union-attr]
+            except EOFError:
+                processes[engine].join()
+
+                results[engine] = EngineResult(
+                    None,
+                    time.perf_counter() - start,
+                    RuntimeError(
+                        f"{engine} process exited with code {processes[engine].exitcode}",
+                    ),
+                )
+
+            receiver.close()  # type: ignore[union-attr]
+
+        for receiver, engine in [*connections.items()]:
+            if engine in deadlines and time.perf_counter() >= deadlines[engine]:
+                processes[engine].terminate()
+
+                results[engine] = EngineResult(
+                    None,
+                    time.perf_counter() - start,
+                    TimeoutError(
+                        f"{engine} did not finish within {timeouts[engine]} seconds",
+                    ),
+                )
+
+                del connections[receiver]
+                receiver.close()
+
+    for process in processes.values():
+        process.join()
+
+    return results
+
+
 def get_all_energies(
     interchange: "Interchange",
     combine_nonbonded_forces: bool = False,
     _engines: Iterable[str] = ("OpenMM", "Amber", "GROMACS", "LAMMPS"),
+    concurrent: bool = False,
+    timeout: float | dict[str, float] | None = None,
 ) -> dict[str, EnergyReport]:
     """
     Given an Interchange object, return single-point energies as computed by all available engines.
+
+    If ``concurrent``, engines run at the same time, each in its own process, and any that do not
+    finish within ``timeout`` seconds are skipped with a warning. See `get_all_energies_concurrently`.
     """
+    if concurrent:
+        return _get_all_energies_concurrently(
+            interchange,
+            combine_nonbonded_forces,
+            timeout,
+            ["OpenMM", *_engines],
+        )
+
     # TODO: Return something nan-like if one driver fails, but still return others that succeed
     # TODO: Have each driver return the version of the engine that was used
 
@@ -60,6 +244,36 @@ def get_all_energies(
     return all_energies
 
 
+def _get_all_energies_concurrently(
+    interchange: "Interchange",
+    combine_nonbonded_forces: bool,
+    timeout: float | dict[str, float] | None,
+    engines: Iterable[str],
+) -> dict[str, EnergyReport]:
+    """Run engines concurrently, skipping those that fail the same way `get_all_energies` does."""
+    all_energies: dict[str, EnergyReport] = dict()
+
+    for engine_name, result in get_all_energies_concurrently(
+        interchange,
+        combine_nonbonded_forces=combine_nonbonded_forces,
+        timeout=timeout,
+        _engines=engines,
+    ).items():
+        if result.energies is not None:
+            all_energies[engine_name] = result.energies
+
+        elif isinstance(result.error, (TimeoutError, UnsupportedCutoffMethodError)):
+            warnings.warn(
+                f"Skipping {engine_name}, driver failed with error:\n\t{result.error}",
+                stacklevel=3,
+            )
+
+        elif not isinstance(result.error, _DRIVERS[engine_name][1]):
+            raise result.error  # type: ignore[misc]
+
+    return all_energies
+
+
 @requires_package("pandas")
 def get_summary_data(
     interchange: "Interchange",
@@ -1,16 +1,24 @@
 """Functions for running energy evluations with Amber."""
 
+import asyncio
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 from shutil import which
 
-from openff.toolkit import unit
+import numpy
+from openff.toolkit import Quantity, unit
 from openff.utilities.utilities import temporary_cd
 
 from openff.interchange import Interchange
 from openff.interchange.components.mdconfig import MDConfig
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers._subprocess import _run_async
+from openff.interchange.drivers.report import (
+    EnergyReport,
+    MultiFrameEnergyReport,
+    _get_frames,
+)
 from openff.interchange.exceptions import (
     AmberError,
     AmberExecutableNotFoundError,
@@ -23,7 +31,8 @@ def get_amber_energies(
     interchange: Interchange,
     writer: str = "internal",
     detailed: bool = False,
-) -> EnergyReport:
+    positions: Quantity | None = None,
+) -> EnergyReport | MultiFrameEnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by Amber.
 
@@ -37,13 +46,32 @@ def get_amber_energies(
         A string key identifying the backend to be used to write Amber files.
     detailed : bool, default=False
         If True, return a detailed report containing the energies of each
+    positions : openff.units.Quantity, optional
+        Positions of the atoms to use instead of `interchange.positions`, either of shape (n_atoms, 3) or
+        of shape (n_frames, n_atoms, 3). All frames are written to one ASCII trajectory, which stores
+        coordinates to 0.001 Angstrom, and evaluated with a single run of sander with `imin=5`.
 
     Returns
     -------
-    report : EnergyReport
-        An `EnergyReport` object containing the single-point energies.
+    report : EnergyReport or MultiFrameEnergyReport
+        An `EnergyReport` object containing the single-point energies, or, if `positions` has multiple
+        frames, a `MultiFrameEnergyReport` containing an array of energies of each frame.
 
     """
+    if positions is not None:
+        report = MultiFrameEnergyReport.from_reports(
+            [
+                _process(energies, detailed=False)
+                for energies in _get_amber_energies_by_frame(
+                    interchange=interchange,
+                    positions=_get_frames(positions, interchange.topology.n_atoms),
+                    writer=writer,
+                )
+            ],
+        )
+
+        return report if positions.ndim == 3 else report.frame(0)
+
     return _process(
         _get_amber_energies(
             interchange=interchange,
@@ -53,6 +81,29 @@ def get_amber_energies(
     )
 
 
+async def get_amber_energies_async(
+    interchange: Interchange,
+    writer: str = "internal",
+    detailed: bool = False,
+) -> EnergyReport:
+    """
+    Asynchronously return single-point energies of an Interchange object as computed by Amber.
+
+    Files are written to, and sander is run in, a temporary directory, so many calls can be awaited
+    at the same time. If the awaiting task is cancelled, the running sander process is killed. See
+    `get_amber_energies` for a description of the arguments.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+    return _process(
+        await _get_amber_energies_async(
+            interchange=interchange,
+            writer=writer,
+        ),
+        detailed=False,
+    )
+
+
 def _get_amber_energies(
     interchange: Interchange,
     writer: str = "internal",
@@ -79,6 +130,85 @@ def _get_amber_energies(
             )
 
 
+def _get_amber_energies_by_frame(
+    interchange: Interchange,
+    positions: Quantity,
+    writer: str = "internal",
+) -> list[dict[str, unit.Quantity]]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with temporary_cd(tmpdir):
+            if writer == "internal":
+                interchange.to_inpcrd("out.inpcrd")
+                interchange.to_prmtop("out.prmtop")
+            elif writer == "parmed":
+                struct = interchange._to_parmed()
+                struct.save("out.inpcrd")
+                struct.save("out.prmtop")
+            else:
+                raise InvalidWriterError(f"Unsupported `writer` argument {writer}")
+
+            _write_mdcrd("out.mdcrd", positions, interchange.box)
+
+            mdconfig = MDConfig.from_interchange(interchange)
+            mdconfig.write_sander_input_file("run.in", rerun=True)
+
+            return _run_sander_rerun(
+                prmtop_file="out.prmtop",
+                inpcrd_file="out.inpcrd",
+                input_file="run.in",
+                trajectory_file="out.mdcrd",
+            )
+
+
+def _write_mdcrd(file_path: Path | str, positions: Quantity, box: Quantity | None):
+    """Write frames of positions to an ASCII Amber trajectory, see https://ambermd.org/FileFormats.php#trajectory."""
+    with open(file_path, "w") as mdcrd:
+        mdcrd.write("Generated by Interchange\n")
+
+        for frame in positions.m_as(unit.angstrom):
+            values = frame.flatten()
+
+            for start in range(0, len(values), 10):
+                line = "".join(f"{value:8.3f}" for value in values[start : start + 10])
+                mdcrd.write(line + "\n")
+
+            if box is not None:
+                lengths = numpy.diagonal(box.m_as(unit.angstrom))
+                mdcrd.write("".join(f"{value:8.3f}" for value in lengths) + "\n")
+
+
+def _write_sander_inputs(interchange: Interchange, directory: str, writer: str):
+    """Write the coordinate, topology, and input files used by `_run_sander_async` to a directory."""
+    if writer == "internal":
+        interchange.to_inpcrd(os.path.join(directory, "out.inpcrd"))
+        interchange.to_prmtop(os.path.join(directory, "out.prmtop"))
+    elif writer == "parmed":
+        struct = interchange._to_parmed()
+        struct.save(os.path.join(directory, "out.inpcrd"))
+        struct.save(os.path.join(directory, "out.prmtop"))
+    else:
+        raise InvalidWriterError(f"Unsupported `writer` argument {writer}")
+
+    mdconfig = MDConfig.from_interchange(interchange)
+    mdconfig.write_sander_input_file(os.path.join(directory, "run.in"))
+
+
+async def _get_amber_energies_async(
+    interchange: Interchange,
+    writer: str = "internal",
+) -> dict[str, unit.Quantity]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Writing files of large systems is slow, so do it in a thread to not block the event loop
+        await asyncio.to_thread(_write_sander_inputs, interchange, tmpdir, writer)
+
+        return await _run_sander_async(
+            prmtop_file="out.prmtop",
+            inpcrd_file="out.inpcrd",
+            input_file="run.in",
+            cwd=tmpdir,
+        )
+
+
 def _run_sander(
     inpcrd_file: Path | str,
     prmtop_file: Path | str,
@@ -108,10 +238,35 @@ def _run_sander(
             "the Amber executables are installed and in your PATH.",
         )
 
-    sander_cmd = (
-        f"sander -i {input_file} -c {inpcrd_file} -p {prmtop_file} -o out.mdout -O"
+    _run_sander_command(
+        f"sander -i {input_file} -c {inpcrd_file} -p {prmtop_file} -o out.mdout -O",
+    )
+
+    return _parse_amber_energy("mdinfo")
+
+
+def _run_sander_rerun(
+    inpcrd_file: Path | str,
+    prmtop_file: Path | str,
+    input_file: Path | str,
+    trajectory_file: Path | str,
+) -> list[dict[str, unit.Quantity]]:
+    """Given Amber files and a trajectory, return the energies of each frame as computed by Amber."""
+    if not which("sander"):
+        raise AmberExecutableNotFoundError(
+            "Unable to find the 'sander' executable. Please ensure that "
+            "the Amber executables are installed and in your PATH.",
+        )
+
+    _run_sander_command(
+        f"sander -i {input_file} -c {inpcrd_file} -p {prmtop_file} -y {trajectory_file} -o out.mdout -O",
     )
 
+    return _parse_amber_energies("out.mdout")
+
+
+def _run_sander_command(sander_cmd: str):
+    """Run sander, raising `SanderError` if it fails."""
     sander = subprocess.Popen(
         sander_cmd,
         shell=True,
@@ -125,7 +280,38 @@ def _run_sander(
     if sander.returncode:
         raise SanderError(err)
 
-    return _parse_amber_energy("mdinfo")
+
+async def _run_sander_async(
+    inpcrd_file: Path | str,
+    prmtop_file: Path | str,
+    input_file: Path | str,
+    cwd: Path | str = ".",
+) -> dict[str, unit.Quantity]:
+    """Asynchronous version of `_run_sander`, running sander in, and with paths relative to, `cwd`."""
+    if not which("sander"):
+        raise AmberExecutableNotFoundError(
+            "Unable to find the 'sander' executable. Please ensure that "
+            "the Amber executables are installed and in your PATH.",
+        )
+
+    returncode, _, err = await _run_async(
+        "sander",
+        "-i",
+        str(input_file),
+        "-c",
+        str(inpcrd_file),
+        "-p",
+        str(prmtop_file),
+        "-o",
+        "out.mdout",
+        "-O",
+        cwd=cwd,
+    )
+
+    if returncode:
+        raise SanderError(err)
+
+    return _parse_amber_energy(os.path.join(cwd, "mdinfo"))
 
 
 def _parse_amber_energy(mdinfo: str) -> dict[str, unit.Quantity]:
@@ -136,8 +322,31 @@ def _parse_amber_energy(mdinfo: str) -> dict[str, unit.Quantity]:
     https://github.com/shirtsgroup/InterMol/tree/v0.1/intermol/amber/
     """
     with open(mdinfo) as f:
+        return _parse_amber_energy_lines(f.readlines(), mdinfo)
+
+
+def _parse_amber_energies(mdout: str) -> list[dict[str, unit.Quantity]]:
+    """Parse the energies of each frame from the output file of sander run with `imin=5`."""
+    with open(mdout) as f:
         all_lines = f.readlines()
 
+    # Each frame's output, including a summary of the final step, follows one of these lines
+    starts = [i for i, line in enumerate(all_lines) if "minimizing coord set #" in line]
+
+    if not starts:
+        raise AmberError(f"Unable to find any frames in AMBER output file: {mdout}")
+
+    return [
+        _parse_amber_energy_lines(all_lines[start:end], mdout)
+        for start, end in zip(starts, [*starts[1:], len(all_lines)])
+    ]
+
+
+def _parse_amber_energy_lines(
+    all_lines: list[str],
+    mdinfo: str,
+) -> dict[str, unit.Quantity]:
+    """Parse the first block of energies in lines of an AMBER output file."""
     # Find where the energy information starts.
     for i, line in enumerate(all_lines):
         # Seems to hit energy minimization
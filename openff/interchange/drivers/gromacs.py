@@ -1,5 +1,7 @@
 """Functions for running energy evluations with GROMACS."""
 
+import asyncio
+import os
 import subprocess
 import tempfile
 from importlib import resources
@@ -12,7 +14,12 @@ from openff.utilities.utilities import requires_package, temporary_cd
 from openff.interchange import Interchange
 from openff.interchange.components.mdconfig import MDConfig
 from openff.interchange.constants import kj_mol
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.drivers._subprocess import _run_async
+from openff.interchange.drivers.report import (
+    EnergyReport,
+    MultiFrameEnergyReport,
+    _get_frames,
+)
 from openff.interchange.exceptions import (
     GMXGromppError,
     GMXMdrunError,
@@ -52,7 +59,8 @@ def get_gromacs_energies(
     round_positions: int = 8,
     detailed: bool = False,
     _merge_atom_types: bool = False,
-) -> EnergyReport:
+    positions: Quantity | None = None,
+) -> EnergyReport | MultiFrameEnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by GROMACS.
 
@@ -70,13 +78,34 @@ def get_gromacs_energies(
         If True, return a detailed report containing the energies of each term.
     _merge_atom_types: bool, default=False
         If True, energy should be computed with merging atom types.
+    positions : openff.units.Quantity, optional
+        Positions of the atoms to use instead of `interchange.positions`, either of shape (n_atoms, 3) or
+        of shape (n_frames, n_atoms, 3). All frames are written to one trajectory and evaluated with a
+        single `gmx mdrun -rerun`, with the box vectors of `interchange`.
 
     Returns
     -------
-    report : EnergyReport
-        An `EnergyReport` object containing the single-point energies.
+    report : EnergyReport or MultiFrameEnergyReport
+        An `EnergyReport` object containing the single-point energies, or, if `positions` has multiple
+        frames, a `MultiFrameEnergyReport` containing an array of energies of each frame.
 
     """
+    if positions is not None:
+        report = MultiFrameEnergyReport.from_reports(
+            [
+                _process(energies, detailed=detailed)
+                for energies in _get_gromacs_energies_by_frame(
+                    interchange=interchange,
+                    positions=_get_frames(positions, interchange.topology.n_atoms),
+                    mdp=mdp,
+                    round_positions=round_positions,
+                    merge_atom_types=_merge_atom_types,
+                )
+            ],
+        )
+
+        return report if positions.ndim == 3 else report.frame(0)
+
     return _process(
         _get_gromacs_energies(
             interchange=interchange,
@@ -88,6 +117,33 @@ def get_gromacs_energies(
     )
 
 
+async def get_gromacs_energies_async(
+    interchange: Interchange,
+    mdp: str = "auto",
+    round_positions: int = 8,
+    detailed: bool = False,
+    _merge_atom_types: bool = False,
+) -> EnergyReport:
+    """
+    Asynchronously return single-point energies of an Interchange object as computed by GROMACS.
+
+    Files are written to, and GROMACS is run in, a temporary directory, so many calls can be awaited
+    at the same time. If the awaiting task is cancelled, the running GROMACS process is killed. See
+    `get_gromacs_energies` for a description of the arguments.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+    return _process(
+        await _get_gromacs_energies_async(
+            interchange=interchange,
+            mdp=mdp,
+            round_positions=round_positions,
+            merge_atom_types=_merge_atom_types,
+        ),
+        detailed=detailed,
+    )
+
+
 def _get_gromacs_energies(
     interchange: Interchange,
     mdp: str = "auto",
@@ -118,6 +174,120 @@ def _get_gromacs_energies(
             )
 
 
+def _get_gromacs_energies_by_frame(
+    interchange: Interchange,
+    positions: Quantity,
+    mdp: str = "auto",
+    round_positions: int = 8,
+    merge_atom_types: bool = False,
+) -> list[dict[str, unit.Quantity]]:
+    from openff.interchange.interop.gromacs.export._export import GROMACSWriter
+    from openff.interchange.smirnoff._gromacs import _convert
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with temporary_cd(tmpdir):
+            writer = GROMACSWriter(
+                system=_convert(interchange),
+                top_file="_tmp.top",
+                gro_file="_tmp.gro",
+            )
+
+            writer.to_top(_merge_atom_types=merge_atom_types)
+            writer.to_gro(decimal=round_positions)
+
+            writer.gro_file = "_tmp_traj.gro"
+            writer.to_gro_trajectory(
+                positions=_get_particle_positions(interchange, positions),
+                decimal=round_positions,
+            )
+
+            if mdp == "auto":
+                mdconfig = MDConfig.from_interchange(interchange)
+                mdp_file = "tmp.mdp"
+                mdconfig.write_mdp_file(mdp_file)
+            else:
+                mdp_file = _get_mdp_file(mdp)
+
+            return _run_gmx_rerun(
+                top_file="_tmp.top",
+                gro_file="_tmp.gro",
+                mdp_file=mdp_file,
+                trajectory_file="_tmp_traj.gro",
+                maxwarn=2,
+            )
+
+
+def _get_particle_positions(
+    interchange: Interchange,
+    positions: Quantity,
+) -> list[Quantity]:
+    """Return the positions of all particles, with virtual sites collated as in `.gro` files, of each frame."""
+    if "VirtualSites" not in interchange.collections:
+        return [*positions]
+
+    from openff.interchange.interop._virtual_sites import (
+        get_positions_with_virtual_sites,
+    )
+
+    return [
+        get_positions_with_virtual_sites(
+            interchange.copy(update={"positions": frame}),
+            collate=True,
+        )
+        for frame in positions
+    ]
+
+
+def _write_gmx_inputs(
+    interchange: Interchange,
+    directory: str,
+    mdp: str,
+    round_positions: int,
+    merge_atom_types: bool,
+) -> str:
+    """Write the files used by `_run_gmx_energy_async` to a directory, returning the path of the MDP file."""
+    interchange.to_gromacs(
+        prefix=os.path.join(directory, "_tmp"),
+        decimal=round_positions,
+        _merge_atom_types=merge_atom_types,
+    )
+
+    if mdp == "auto":
+        mdconfig = MDConfig.from_interchange(interchange)
+        mdp_file = "tmp.mdp"
+        mdconfig.write_mdp_file(os.path.join(directory, mdp_file))
+    else:
+        mdp_file = _get_mdp_file(mdp)
+
+    return mdp_file
+
+
+async def _get_gromacs_energies_async(
+    interchange: Interchange,
+    mdp: str = "auto",
+    round_positions: int = 8,
+    merge_atom_types: bool = False,
+) -> dict[str, unit.Quantity]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Writing files of large systems is slow, so do it in a thread to not block the event loop
+        mdp_file = await asyncio.to_thread(
+            _write_gmx_inputs,
+            interchange,
+            tmpdir,
+            mdp,
+            round_positions,
+            merge_atom_types,
+        )
+
+        return await _run_gmx_energy_async(
+            top_file="_tmp.top",
+            gro_file="_tmp.gro",
+            mdp_file=mdp_file,
+            maxwarn=2,
+            cwd=tmpdir,
+        )
+
+
 def _run_gmx_energy(
     top_file: Path | str,
     gro_file: Path | str,
@@ -144,6 +314,43 @@ def _run_gmx_energy(
         A dictionary of energies, keyed by the GROMACS energy term name.
 
     """
+    _run_gmx(
+        top_file=top_file,
+        gro_file=gro_file,
+        mdp_file=mdp_file,
+        maxwarn=maxwarn,
+    )
+
+    return _parse_gmx_energy("out.edr")
+
+
+def _run_gmx_rerun(
+    top_file: Path | str,
+    gro_file: Path | str,
+    mdp_file: Path | str,
+    trajectory_file: Path | str,
+    maxwarn: int = 1,
+) -> list[dict[str, unit.Quantity]]:
+    """Given GROMACS files and a trajectory, return the energies of each frame as computed by `gmx mdrun -rerun`."""
+    _run_gmx(
+        top_file=top_file,
+        gro_file=gro_file,
+        mdp_file=mdp_file,
+        maxwarn=maxwarn,
+        trajectory_file=trajectory_file,
+    )
+
+    return _parse_gmx_energies("out.edr")
+
+
+def _run_gmx(
+    top_file: Path | str,
+    gro_file: Path | str,
+    mdp_file: Path | str,
+    maxwarn: int = 1,
+    trajectory_file: Path | str | None = None,
+):
+    """Run `gmx grompp` and `gmx mdrun`, rerunning the frames of a trajectory if given, writing `out.edr`."""
     gmx = _find_gromacs_executable(raise_exception=True)
 
     grompp_cmd = f"{gmx} grompp --maxwarn {maxwarn} -o out.tpr"
@@ -165,6 +372,9 @@ def _run_gmx_energy(
     # Some GROMACS builds will want `-ntmpi` instead of `ntomp`
     mdrun_cmd = f"{gmx} mdrun -s out.tpr -e out.edr -ntomp 1"
 
+    if trajectory_file is not None:
+        mdrun_cmd += f" -rerun {trajectory_file}"
+
     mdrun = subprocess.Popen(
         mdrun_cmd,
         shell=True,
@@ -178,7 +388,52 @@ def _run_gmx_energy(
     if mdrun.returncode:
         raise GMXMdrunError(err)
 
-    return _parse_gmx_energy("out.edr")
+
+async def _run_gmx_energy_async(
+    top_file: Path | str,
+    gro_file: Path | str,
+    mdp_file: Path | str,
+    maxwarn: int = 1,
+    cwd: Path | str = ".",
+) -> dict[str, unit.Quantity]:
+    """Asynchronous version of `_run_gmx_energy`, running GROMACS in, and with paths relative to, `cwd`."""
+    gmx = _find_gromacs_executable(raise_exception=True)
+
+    returncode, _, err = await _run_async(
+        gmx,  # type: ignore[arg-type]
+        "grompp",
+        "--maxwarn",
+        str(maxwarn),
+        "-o",
+        "out.tpr",
+        "-f",
+        str(mdp_file),
+        "-c",
+        str(gro_file),
+        "-p",
+        str(top_file),
+        cwd=cwd,
+    )
+
+    if returncode:
+        raise GMXGromppError(err)
+
+    returncode, _, err = await _run_async(
+        gmx,  # type: ignore[arg-type]
+        "mdrun",
+        "-s",
+        "out.tpr",
+        "-e",
+        "out.edr",
+        "-ntomp",
+        "1",
+        cwd=cwd,
+    )
+
+    if returncode:
+        raise GMXMdrunError(err)
+
+    return _parse_gmx_energy(os.path.join(cwd, "out.edr"))
 
 
 def _get_gmx_energy_vdw(gmx_energies: dict) -> Quantity:
@@ -211,12 +466,23 @@ def _get_gmx_energy_torsion(gmx_energies: dict) -> Quantity:
     return gmx_torsion
 
 
-@requires_package("panedr")
 def _parse_gmx_energy(edr_path: str) -> dict[str, unit.Quantity]:
     """Parse an `.edr` file written by `gmx energy`."""
+    return _parse_gmx_energies(edr_path)[0]
+
+
+@requires_package("panedr")
+def _parse_gmx_energies(edr_path: str) -> list[dict[str, unit.Quantity]]:
+    """Parse the energies of each frame in an `.edr` file written by `gmx energy`."""
     import panedr
 
-    parsed_energies = panedr.edr_to_df(edr_path).to_dict("index")[0.0]
+    frames = panedr.edr_to_df(edr_path).to_dict("records")
+
+    return [_clean_gmx_energies(frame) for frame in frames]
+
+
+def _clean_gmx_energies(parsed_energies: dict[str, float]) -> dict[str, unit.Quantity]:
+    """Drop non-energy terms from the energies of one frame and attach units."""
     parsed_energies.pop("Time")
 
     #   for key in energies:
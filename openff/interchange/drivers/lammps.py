@@ -1,5 +1,9 @@
 """Functions for running energy evluations with LAMMPS."""
 
+import asyncio
+import json
+import os
+import sys
 import tempfile
 
 import numpy
@@ -8,6 +12,7 @@ from openff.utilities import MissingOptionalDependencyError, requires_package
 
 from openff.interchange import Interchange
 from openff.interchange.components.mdconfig import MDConfig
+from openff.interchange.drivers._subprocess import _run_async
 from openff.interchange.drivers.report import EnergyReport
 from openff.interchange.exceptions import LAMMPSNotFoundError, LAMMPSRunError
 
@@ -49,6 +54,44 @@ def get_lammps_energies(
         raise LAMMPSNotFoundError
 
 
+async def get_lammps_energies_async(
+    interchange: Interchange,
+    round_positions: int | None = None,
+    detailed: bool = False,
+) -> EnergyReport:
+    """
+    Asynchronously return single-point energies of an Interchange object as computed by LAMMPS.
+
+    Files are written to, and LAMMPS is run in, a temporary directory, so many calls can be awaited
+    at the same time. LAMMPS is run through its Python module in a separate Python process, which is
+    killed if the awaiting task is cancelled. See `get_lammps_energies` for a description of the
+    arguments.
+
+    .. warning :: This API is experimental and subject to change.
+    """
+    try:
+        return _process(
+            await _get_lammps_energies_async(interchange, round_positions),
+            detailed,
+        )
+    except MissingOptionalDependencyError:
+        raise LAMMPSNotFoundError
+
+
+# Run by `_get_lammps_energies_async` in a separate process, printing the last thermo output as JSON
+_LAMMPS_SCRIPT = """
+import json
+import sys
+
+import lammps
+
+runner = lammps.lammps(cmdargs=["-screen", "none", "-nocite"])
+runner.file("tmp.in")
+
+json.dump(list(runner.last_thermo().values()), sys.stdout)
+"""
+
+
 @requires_package("lammps")
 def _get_lammps_energies(
     interchange: Interchange,
@@ -78,11 +121,53 @@ def _get_lammps_energies(
     except Exception as error:
         raise LAMMPSRunError from error
 
+    return _parse_lammps_thermo([*runner.last_thermo().values()])
+
+
+def _write_lammps_inputs(interchange: Interchange, directory: str):
+    """Write the data and input files used by `_LAMMPS_SCRIPT` to a directory."""
+    interchange.to_lammps(os.path.join(directory, "out.lmp"))
+    mdconfig = MDConfig.from_interchange(interchange)
+    mdconfig.write_lammps_input(
+        interchange=interchange,
+        input_file=os.path.join(directory, "tmp.in"),
+    )
+
+
+@requires_package("lammps")
+async def _get_lammps_energies_async(
+    interchange: Interchange,
+    round_positions: int | None = None,
+) -> dict[str, unit.Quantity]:
+    if round_positions is not None:
+        # Round a copy, since other tasks may be using the same Interchange at the same time
+        interchange = interchange.copy(
+            update={
+                "positions": numpy.round(interchange.positions, round_positions),
+            },
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Writing files of large systems is slow, so do it in a thread to not block the event loop
+        await asyncio.to_thread(_write_lammps_inputs, interchange, tmpdir)
+
+        returncode, out, err = await _run_async(
+            sys.executable,
+            "-c",
+            _LAMMPS_SCRIPT,
+            cwd=tmpdir,
+        )
+
+    if returncode:
+        raise LAMMPSRunError(err)
+
+    return _parse_lammps_thermo(json.loads(out.splitlines()[-1]))
+
+
+def _parse_lammps_thermo(thermo: list[float]) -> dict[str, unit.Quantity]:
+    """Map the values of the thermo output, in kcal/mol, written by `MDConfig.write_lammps_input` to energy names."""
     # thermo_style custom ebond eangle edihed eimp epair evdwl ecoul elong etail pe
-    parsed_energies = [
-        Quantity(energy, "kilocalorie_per_mole")
-        for energy in runner.last_thermo().values()
-    ]
+    parsed_energies = [Quantity(energy, "kilocalorie_per_mole") for energy in thermo]
 
     # TODO: Sanely map LAMMPS's energy names to the ones we care about
     return {
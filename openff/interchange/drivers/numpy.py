@@ -0,0 +1,734 @@
+"""Functions for running energy evaluations with NumPy, directly from the collections of an Interchange."""
+
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy
+from openff.toolkit import Quantity, unit
+from openff.utilities.utilities import has_package
+
+from openff.interchange.components._graph import BondGraph
+from openff.interchange.components._neighbors import (
+    _get_distances,
+    _is_reduced_form,
+    _iterate_all_pairs,
+    _iterate_neighbor_pairs,
+)
+from openff.interchange.constants import _PME, kj_mol
+from openff.interchange.drivers.report import (
+    EnergyReport,
+    MultiFrameEnergyReport,
+    _get_frames,
+)
+from openff.interchange.exceptions import (
+    MissingPositionsError,
+    UnsupportedBoxError,
+    UnsupportedCutoffMethodError,
+    UnsupportedExportError,
+    UnsupportedMixingRuleError,
+)
+
+if has_package("scipy"):
+    from scipy.special import erfc as _erfc
+else:
+    _erfc = numpy.vectorize(math.erfc, otypes=[float])
+
+if TYPE_CHECKING:
+    from openff.interchange import Interchange
+
+_SUPPORTED_COLLECTIONS: frozenset[str] = frozenset(
+    {
+        "Bonds",
+        "Constraints",
+        "Angles",
+        "ProperTorsions",
+        "ImproperTorsions",
+        "vdW",
+        "Electrostatics",
+    },
+)
+
+_COULOMB_CONSTANT = 138.935456  # kJ/nm
+
+# The number of wave vectors times particles processed at once in Ewald sums
+_CHUNK_SIZE = 2**18
+
+
+class _ValenceData(NamedTuple):
+    """Atom indices and unitless parameters, in OpenMM's units, of each valence term."""
+
+    bonds: numpy.ndarray | None
+    bond_parameters: numpy.ndarray  # length, k
+    angles: numpy.ndarray | None
+    angle_parameters: numpy.ndarray  # angle, k
+    torsions: numpy.ndarray | None
+    torsion_parameters: numpy.ndarray  # periodicity, phase, k divided by idivf
+
+
+class _NonbondedData(NamedTuple):
+    """Unitless per-atom parameters, in OpenMM's units, and settings of the non-bonded interactions."""
+
+    charges: numpy.ndarray | None
+    sigmas: numpy.ndarray | None
+    epsilons: numpy.ndarray | None
+    mixing_rule: str
+    vdw_cutoff: bool
+    electrostatics_ewald: bool
+    cutoff: float
+    switch_distance: float | None
+    vdw_14: float
+    coul_14: float
+    exclusions: numpy.ndarray
+    pairs_14: numpy.ndarray
+
+
+def get_numpy_energies(
+    interchange: "Interchange",
+    detailed: bool = False,
+    positions: Quantity | None = None,
+    ewald_tolerance: float = 1e-4,
+) -> EnergyReport | MultiFrameEnergyReport:
+    """
+    Given an OpenFF Interchange object, return single-point energies computed with NumPy.
+
+    Energies are evaluated directly from the collections, without exporting to an engine, for
+    sanity checks of small systems. Terms follow OpenMM's conventions, including skipping bonds and
+    angles whose geometry is fully constrained and adding a long-range dispersion correction to
+    periodic vdW interactions. Periodic electrostatics are evaluated with an Ewald sum, so they
+    agree with OpenMM's PME to within `ewald_tolerance`.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.Interchange
+        An OpenFF Interchange object to compute the single-point energy of
+    detailed : bool, default=False
+        If True, return a detailed report containing the energies of 1-4 interactions separately.
+    positions : openff.units.Quantity, optional
+        Positions of the atoms to use instead of `interchange.positions`, either of shape (n_atoms, 3) or
+        of shape (n_frames, n_atoms, 3). Each frame is evaluated with the same box vectors.
+    ewald_tolerance : float, default=1e-4
+        The relative error tolerance of the Ewald sum, used in the same way as OpenMM does.
+
+    Returns
+    -------
+    report : EnergyReport or MultiFrameEnergyReport
+        An `EnergyReport` object containing the single-point energies, or, if `positions` has multiple
+        frames, a `MultiFrameEnergyReport` containing an array of energies of each frame.
+
+    """
+    if unsupported := sorted(set(interchange.collections) - _SUPPORTED_COLLECTIONS):
+        raise UnsupportedExportError(
+            f"Energies of collections {unsupported} cannot be evaluated with NumPy.",
+        )
+
+    if positions is None:
+        if interchange.positions is None:
+            raise MissingPositionsError(
+                f"Positions are required to evaluate energies, found {interchange.positions=}.",
+            )
+
+        positions = interchange.positions
+
+    frames = _get_frames(positions, interchange.topology.n_atoms).m_as(unit.nanometer)
+
+    box = None if interchange.box is None else interchange.box.m_as(unit.nanometer)
+
+    if box is not None and not _is_reduced_form(box):
+        raise UnsupportedBoxError(
+            f"Box vectors must be in OpenMM's reduced form, found {box=}.",
+        )
+
+    valence = _get_valence_data(interchange)
+    nonbonded = _get_nonbonded_data(interchange)
+
+    reports = [
+        _process(
+            {
+                **_get_valence_energies(valence, frame),
+                **_get_nonbonded_energies(nonbonded, frame, box, ewald_tolerance),
+            },
+            detailed=detailed,
+        )
+        for frame in frames
+    ]
+
+    if positions.ndim == 2:
+        return reports[0]
+
+    return MultiFrameEnergyReport.from_reports(reports)
+
+
+def _get_parameter_array(
+    collection,
+    names: tuple[str, ...],
+    units: tuple[str, ...],
+) -> numpy.ndarray:
+    """Return an array of the unitless parameters of each term in the key map of a collection."""
+    indices = {
+        potential_key: index
+        for index, potential_key in enumerate(collection.potentials)
+    }
+
+    parameters = numpy.array(
+        [
+            [
+                potential.parameters[name].m_as(parameter_unit)
+                for name, parameter_unit in zip(names, units)
+            ]
+            for potential in collection.potentials.values()
+        ],
+    ).reshape(-1, len(names))
+
+    return parameters[
+        numpy.fromiter(
+            (indices[potential_key] for potential_key in collection.key_map.values()),
+            dtype=numpy.int64,
+            count=len(collection.key_map),
+        )
+    ]
+
+
+def _get_atom_indices(collection, n_atoms: int) -> numpy.ndarray:
+    """Return the atom indices of each term in the key map of a collection."""
+    return numpy.array(
+        [topology_key.atom_indices for topology_key in collection.key_map],
+        dtype=numpy.int64,
+    ).reshape(-1, n_atoms)
+
+
+def _get_valence_data(interchange: "Interchange") -> _ValenceData:
+    collections = interchange.collections
+
+    if "Constraints" in collections:
+        constrained = {
+            tuple(sorted(key.atom_indices))
+            for key in collections["Constraints"].key_map
+        }
+    else:
+        constrained = set()
+
+    def _is_constrained(atom1: int, atom2: int) -> bool:
+        return (min(atom1, atom2), max(atom1, atom2)) in constrained
+
+    bonds = None
+    bond_parameters = numpy.empty((0, 2))
+
+    if "Bonds" in collections:
+        collection = collections["Bonds"]
+
+        if collection.expression != "k/2*(r-length)**2":
+            raise UnsupportedExportError(
+                f"Unsupported bond expression {collection.expression}.",
+            )
+
+        bonds = _get_atom_indices(collection, 2)
+        bond_parameters = _get_parameter_array(
+            collection,
+            ("length", "k"),
+            ("nanometer", "kilojoule / nanometer ** 2 / mol"),
+        )
+
+        # Following OpenMM, bonds whose lengths are constrained do not contribute energy
+        mask = numpy.array(
+            [not _is_constrained(*bond) for bond in bonds.tolist()],
+            dtype=bool,
+        )
+        bonds, bond_parameters = bonds[mask], bond_parameters[mask]
+
+    angles = None
+    angle_parameters = numpy.empty((0, 2))
+
+    if "Angles" in collections:
+        collection = collections["Angles"]
+
+        if collection.expression != "k/2*(theta-angle)**2":
+            raise UnsupportedExportError(
+                f"Unsupported angle expression {collection.expression}.",
+            )
+
+        angles = _get_atom_indices(collection, 3)
+        angle_parameters = _get_parameter_array(
+            collection,
+            ("angle", "k"),
+            ("radian", "kilojoule / radian ** 2 / mol"),
+        )
+
+        mask = numpy.array(
+            [
+                not all(_is_constrained(*pair) for pair in [(a, b), (b, c), (a, c)])
+                for a, b, c in angles.tolist()
+            ],
+            dtype=bool,
+        )
+        angles, angle_parameters = angles[mask], angle_parameters[mask]
+
+    torsions: list[numpy.ndarray] = list()
+    torsion_parameters: list[numpy.ndarray] = list()
+
+    for name in ("ProperTorsions", "ImproperTorsions"):
+        if name not in collections:
+            continue
+
+        collection = collections[name]
+
+        if collection.expression != "k*(1+cos(periodicity*theta-phase))":
+            raise UnsupportedExportError(
+                f"Unsupported torsion expression {collection.expression}.",
+            )
+
+        parameters = _get_parameter_array(
+            collection,
+            ("periodicity", "phase", "k", "idivf"),
+            ("dimensionless", "radian", "kilojoule / mol", "dimensionless"),
+        )
+
+        torsions.append(_get_atom_indices(collection, 4))
+        periodicities, phases, ks, idivfs = parameters.T
+
+        torsion_parameters.append(
+            numpy.stack([numpy.round(periodicities), phases, ks / idivfs], axis=1),
+        )
+
+    return _ValenceData(
+        bonds=bonds,
+        bond_parameters=bond_parameters,
+        angles=angles,
+        angle_parameters=angle_parameters,
+        torsions=numpy.concatenate(torsions) if torsions else None,
+        torsion_parameters=(
+            numpy.concatenate(torsion_parameters)
+            if torsion_parameters
+            else numpy.empty((0, 3))
+        ),
+    )
+
+
+def _get_nonbonded_data(interchange: "Interchange") -> _NonbondedData | None:
+    vdw = interchange.collections.get("vdW", None)
+    electrostatics = interchange.collections.get("Electrostatics", None)
+
+    if vdw is None and electrostatics is None:
+        return None
+
+    n_atoms = interchange.topology.n_atoms
+    periodic = interchange.box is not None
+
+    charges = sigmas = epsilons = None
+    vdw_cutoff = electrostatics_ewald = False
+    switch_distance = None
+
+    if electrostatics is not None:
+        method = (
+            electrostatics.periodic_potential
+            if periodic
+            else electrostatics.nonperiodic_potential
+        )
+
+        if method not in ((_PME,) if periodic else ("Coulomb", "no-cutoff")):
+            raise UnsupportedCutoffMethodError(
+                f"Electrostatics method {method} is not supported with {periodic=}.",
+            )
+
+        electrostatics_ewald = periodic
+        cutoff = electrostatics.cutoff.m_as(unit.nanometer)
+
+        charges = numpy.zeros(n_atoms)
+
+        for topology_key, charge in electrostatics.charges.items():
+            charges[topology_key.atom_indices[0]] = charge.m_as(unit.elementary_charge)
+
+    if vdw is not None:
+        method = vdw.periodic_method if periodic else vdw.nonperiodic_method
+
+        if method not in (("cutoff",) if periodic else ("cutoff", "no-cutoff")):
+            raise UnsupportedCutoffMethodError(
+                f"vdW method {method} is not supported with {periodic=}.",
+            )
+
+        if vdw.mixing_rule not in ("lorentz-berthelot", "geometric"):
+            raise UnsupportedMixingRuleError(
+                f"Unsupported mixing rule {vdw.mixing_rule}.",
+            )
+
+        vdw_cutoff = method == "cutoff"
+        cutoff = vdw.cutoff.m_as(unit.nanometer)
+
+        if vdw_cutoff and vdw.switch_width.m != 0.0:
+            switch_distance = (vdw.cutoff - vdw.switch_width).m_as(unit.nanometer)
+
+        parameters = _get_parameter_array(
+            vdw,
+            ("sigma", "epsilon"),
+            ("nanometer", "kilojoule / mol"),
+        )
+
+        sigmas, epsilons = numpy.ones(n_atoms), numpy.zeros(n_atoms)
+
+        atom_indices = _get_atom_indices(vdw, 1)[:, 0]
+        sigmas[atom_indices] = parameters[:, 0]
+        epsilons[atom_indices] = parameters[:, 1]
+
+    graph = BondGraph.from_topology(interchange.topology)
+    pairs, distances = graph.get_pairs(max_distance=3)
+
+    return _NonbondedData(
+        charges=charges,
+        sigmas=sigmas,
+        epsilons=epsilons,
+        mixing_rule=getattr(vdw, "mixing_rule", "lorentz-berthelot"),
+        vdw_cutoff=vdw_cutoff,
+        electrostatics_ewald=electrostatics_ewald,
+        cutoff=cutoff,
+        switch_distance=switch_distance,
+        vdw_14=getattr(vdw, "scale_14", 1.0),
+        coul_14=getattr(electrostatics, "scale_14", 1.0),
+        exclusions=pairs[distances < 3],
+        pairs_14=pairs[distances == 3],
+    )
+
+
+def _get_dihedrals(positions: numpy.ndarray, torsions: numpy.ndarray) -> numpy.ndarray:
+    """Return the dihedral angle, in radians, of each set of four atoms."""
+    b0 = positions[torsions[:, 0]] - positions[torsions[:, 1]]
+    b1 = positions[torsions[:, 2]] - positions[torsions[:, 1]]
+    b2 = positions[torsions[:, 2]] - positions[torsions[:, 3]]
+
+    normal1 = numpy.cross(b0, b1)
+    normal2 = numpy.cross(b1, b2)
+
+    angles = numpy.arctan2(
+        numpy.linalg.norm(numpy.cross(normal1, normal2), axis=1),
+        numpy.einsum("ij,ij->i", normal1, normal2),
+    )
+
+    return numpy.where(numpy.einsum("ij,ij->i", b0, normal2) < 0, -angles, angles)
+
+
+def _get_valence_energies(
+    data: _ValenceData,
+    positions: numpy.ndarray,
+) -> dict[str, float]:
+    energies: dict[str, float] = dict()
+
+    if data.bonds is not None:
+        vectors = positions[data.bonds[:, 1]] - positions[data.bonds[:, 0]]
+        lengths = numpy.linalg.norm(vectors, axis=1)
+
+        equilibrium_lengths, ks = data.bond_parameters.T
+
+        energies["Bond"] = float(
+            numpy.sum(0.5 * ks * (lengths - equilibrium_lengths) ** 2),
+        )
+
+    if data.angles is not None:
+        vectors1 = positions[data.angles[:, 0]] - positions[data.angles[:, 1]]
+        vectors2 = positions[data.angles[:, 2]] - positions[data.angles[:, 1]]
+
+        angles = numpy.arctan2(
+            numpy.linalg.norm(numpy.cross(vectors1, vectors2), axis=1),
+            numpy.einsum("ij,ij->i", vectors1, vectors2),
+        )
+
+        equilibrium_angles, ks = data.angle_parameters.T
+
+        energies["Angle"] = float(
+            numpy.sum(0.5 * ks * (angles - equilibrium_angles) ** 2),
+        )
+
+    if data.torsions is not None:
+        periodicities, phases, ks = data.torsion_parameters.T
+
+        dihedrals = _get_dihedrals(positions, data.torsions)
+
+        energies["Torsion"] = float(
+            numpy.sum(ks * (1 + numpy.cos(periodicities * dihedrals - phases))),
+        )
+
+    return energies
+
+
+def _is_in(
+    first: numpy.ndarray,
+    second: numpy.ndarray,
+    pairs: numpy.ndarray,
+    n_atoms: int,
+) -> numpy.ndarray:
+    """Return whether each pair of atoms, with the lower index first, is in an array of such pairs."""
+    codes = numpy.sort(pairs[:, 0] * n_atoms + pairs[:, 1])
+
+    if len(codes) == 0:
+        return numpy.zeros(len(first), dtype=bool)
+
+    query = first * n_atoms + second
+
+    indices = numpy.minimum(numpy.searchsorted(codes, query), len(codes) - 1)
+
+    return codes[indices] == query
+
+
+def _mix(
+    data: _NonbondedData,
+    first: numpy.ndarray,
+    second: numpy.ndarray,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the sigma and epsilon of each pair of atoms."""
+    if data.mixing_rule == "lorentz-berthelot":
+        sigmas = 0.5 * (data.sigmas[first] + data.sigmas[second])  # type: ignore[index]
+    else:
+        sigmas = numpy.sqrt(data.sigmas[first] * data.sigmas[second])  # type: ignore[index]
+
+    return sigmas, numpy.sqrt(data.epsilons[first] * data.epsilons[second])  # type: ignore[index]
+
+
+def _lennard_jones(
+    distances: numpy.ndarray,
+    sigmas: numpy.ndarray,
+    epsilons: numpy.ndarray,
+) -> numpy.ndarray:
+    x6 = (sigmas / distances) ** 6
+
+    return 4 * epsilons * (x6 * x6 - x6)
+
+
+def _switch(
+    distances: numpy.ndarray,
+    switch_distance: float,
+    cutoff: float,
+) -> numpy.ndarray:
+    """OpenMM's switching function, going smoothly from one at the switching distance to zero at the cutoff."""
+    x = numpy.clip((distances - switch_distance) / (cutoff - switch_distance), 0.0, 1.0)
+
+    return 1 - x**3 * (10 - 15 * x + 6 * x**2)
+
+
+def _get_nonbonded_energies(
+    data: _NonbondedData | None,
+    positions: numpy.ndarray,
+    box: numpy.ndarray | None,
+    ewald_tolerance: float,
+) -> dict[str, float]:
+    if data is None:
+        return dict()
+
+    n_atoms = len(positions)
+
+    has_vdw = data.sigmas is not None
+    has_electrostatics = data.charges is not None
+
+    alpha = math.sqrt(-math.log(2 * ewald_tolerance)) / data.cutoff
+
+    vdw = coulomb = 0.0
+
+    if box is None:
+        chunks = _iterate_all_pairs(positions)
+    else:
+        chunks = _iterate_neighbor_pairs(positions, data.cutoff, box)
+
+    for first, second, distances in chunks:
+        # 1-2, 1-3, and 1-4 interactions are handled separately
+        is_excluded = _is_in(first, second, data.exclusions, n_atoms)
+        is_14 = _is_in(first, second, data.pairs_14, n_atoms)
+
+        mask = ~(is_excluded | is_14)
+
+        first, second, distances = first[mask], second[mask], distances[mask]
+
+        if has_vdw:
+            within = distances < data.cutoff if data.vdw_cutoff else slice(None)
+
+            distances_within = distances[within]
+
+            pair_energies = _lennard_jones(
+                distances_within,
+                *_mix(data, first[within], second[within]),
+            )
+
+            if data.switch_distance is not None:
+                pair_energies *= _switch(
+                    distances_within,
+                    data.switch_distance,
+                    data.cutoff,
+                )
+
+            vdw += float(numpy.sum(pair_energies))
+
+        if has_electrostatics:
+            products = data.charges[first] * data.charges[second]  # type: ignore[index]
+
+            if data.electrostatics_ewald:
+                screened = products * _erfc(alpha * distances) / distances
+
+                coulomb += _COULOMB_CONSTANT * float(numpy.sum(screened))
+            else:
+                coulomb += _COULOMB_CONSTANT * float(numpy.sum(products / distances))
+
+    energies: dict[str, float] = dict()
+
+    first_14, second_14 = data.pairs_14[:, 0], data.pairs_14[:, 1]
+    distances_14 = _get_distances(positions, first_14, second_14, box)
+
+    if has_vdw:
+        if box is not None:
+            vdw += _get_dispersion_correction(data, abs(numpy.linalg.det(box)))
+
+        sigmas_14, epsilons_14 = _mix(data, first_14, second_14)
+
+        energies_14 = _lennard_jones(distances_14, sigmas_14, data.vdw_14 * epsilons_14)
+
+        energies["vdW"] = vdw
+        energies["vdW 1-4"] = float(numpy.sum(energies_14))
+
+    if has_electrostatics:
+        charges: numpy.ndarray = data.charges  # type: ignore[assignment]
+
+        if data.electrostatics_ewald:
+            coulomb += _get_ewald_energy(positions, charges, box, alpha, ewald_tolerance)  # type: ignore[arg-type]
+
+            # Interactions between excluded pairs, and 1-4 pairs, are subtracted from the reciprocal space sum
+            excluded = numpy.concatenate([data.exclusions, data.pairs_14])
+
+            distances = _get_distances(positions, excluded[:, 0], excluded[:, 1], box)
+
+            products = charges[excluded[:, 0]] * charges[excluded[:, 1]]
+            corrections = products * (1 - _erfc(alpha * distances)) / distances
+
+            coulomb -= _COULOMB_CONSTANT * float(numpy.sum(corrections))
+
+        energies["Electrostatics"] = coulomb
+        products_14 = charges[first_14] * charges[second_14]
+        coulomb_14 = data.coul_14 * products_14 / distances_14
+
+        energies["Electrostatics 1-4"] = _COULOMB_CONSTANT * float(
+            numpy.sum(coulomb_14),
+        )
+
+    return energies
+
+
+def _get_ewald_energy(
+    positions: numpy.ndarray,
+    charges: numpy.ndarray,
+    box: numpy.ndarray,
+    alpha: float,
+    ewald_tolerance: float,
+) -> float:
+    """Return the reciprocal space, self, and neutralizing background energies of an Ewald sum."""
+    volume = abs(numpy.linalg.det(box))
+
+    # Rows are the reciprocal vectors, without a factor of 2 pi
+    reciprocal = numpy.linalg.inv(box).T
+
+    # Wave vectors are summed until exp(-k^2 / (4 alpha^2)), which decays much faster than the
+    # direct space terms, is below the square of the tolerance
+    k_max = 2 * alpha * math.sqrt(-2 * math.log(ewald_tolerance))
+
+    # The component of a wave vector along each reciprocal vector is at most |k| |a| / (2 pi)
+    lengths = numpy.linalg.norm(box, axis=1)
+    n_max = numpy.ceil(k_max * lengths / (2 * math.pi)).astype(numpy.int64)
+
+    grid = numpy.stack(
+        numpy.meshgrid(
+            *[numpy.arange(-n, n + 1) for n in n_max.tolist()],
+            indexing="ij",
+        ),
+        axis=-1,
+    ).reshape(-1, 3)
+
+    # The wave vectors k and -k contribute equally, so only the one whose first nonzero component is positive is summed
+    leading = grid[numpy.arange(len(grid)), numpy.argmax(grid != 0, axis=1)]
+    grid = grid[leading > 0]
+
+    wave_vectors = 2 * math.pi * grid @ reciprocal
+    squared = numpy.einsum("ij,ij->i", wave_vectors, wave_vectors)
+
+    mask = squared < k_max**2
+    wave_vectors, squared = wave_vectors[mask], squared[mask]
+
+    factors = numpy.exp(-squared / (4 * alpha**2)) / squared
+
+    reciprocal_sum = 0.0
+    chunk_size = max(1, _CHUNK_SIZE // len(positions))
+
+    for start in range(0, len(wave_vectors), chunk_size):
+        phases = wave_vectors[start : start + chunk_size] @ positions.T
+
+        cosines, sines = numpy.cos(phases) @ charges, numpy.sin(phases) @ charges
+        structure_factors = cosines**2 + sines**2
+
+        reciprocal_sum += float(factors[start : start + chunk_size] @ structure_factors)
+
+    reciprocal_energy = 4 * math.pi / volume * reciprocal_sum
+    self_energy = alpha / math.sqrt(math.pi) * float(charges @ charges)
+    net_charge = float(numpy.sum(charges))
+    net_charge_energy = math.pi * net_charge**2 / (2 * volume * alpha**2)
+
+    return _COULOMB_CONSTANT * (reciprocal_energy - self_energy - net_charge_energy)
+
+
+def _get_dispersion_correction(data: _NonbondedData, volume: float) -> float:
+    """
+    Return OpenMM's long-range dispersion correction to vdW interactions truncated at the cutoff.
+
+    Each pair of atoms is assumed to interact with the average of the interactions of all pairs,
+    grouped into pairs of classes of atoms with the same parameters.
+    """
+    n_atoms = len(data.sigmas)  # type: ignore[arg-type]
+
+    classes, counts = numpy.unique(
+        numpy.stack([data.sigmas, data.epsilons], axis=1),
+        axis=0,
+        return_counts=True,
+    )
+
+    first, second = numpy.triu_indices(len(classes))
+
+    n_pairs = numpy.where(
+        first == second,
+        counts[first] * (counts[first] + 1) / 2,
+        counts[first] * counts[second],
+    )
+
+    sigmas, epsilons = _mix(
+        data._replace(sigmas=classes[:, 0], epsilons=classes[:, 1]),
+        first,
+        second,
+    )
+
+    cutoff = data.cutoff
+
+    # The integral of r^2 times the interaction energy from the cutoff to infinity ...
+    integrals = (
+        4 * epsilons * (sigmas**12 / (9 * cutoff**9) - sigmas**6 / (3 * cutoff**3))
+    )
+
+    # ... plus that of the part removed by the switching function
+    if data.switch_distance is not None:
+        distances = numpy.linspace(data.switch_distance, cutoff, 1001)
+
+        energies = _lennard_jones(distances, sigmas[:, None], epsilons[:, None])
+        switched = _switch(distances, data.switch_distance, cutoff)
+
+        values = distances**2 * energies * (1 - switched)
+
+        integrals += numpy.sum(
+            0.5 * (values[:, 1:] + values[:, :-1]) * numpy.diff(distances),
+            axis=1,
+        )
+
+    average = float(numpy.sum(n_pairs * integrals)) / (n_atoms * (n_atoms + 1) / 2)
+
+    return 2 * math.pi * n_atoms**2 * average / volume
+
+
+def _process(energies: dict[str, float], detailed: bool = False) -> EnergyReport:
+    """Attach units to energies, and combine 1-4 interactions with the rest unless `detailed`."""
+    if not detailed:
+        for key in ("vdW", "Electrostatics"):
+            if key in energies:
+                energies[key] += energies.pop(f"{key} 1-4")
+
+    return EnergyReport(
+        energies={key: Quantity(value, kj_mol) for key, value in energies.items()},
+    )
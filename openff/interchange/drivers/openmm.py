@@ -1,17 +1,25 @@
 """Functions for running energy evluations with OpenMM."""
 
 import warnings
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional
 
 import numpy
-from openff.toolkit import unit
+from openff.toolkit import Quantity, unit
 from openff.units.openmm import ensure_quantity
 from openff.utilities.utilities import has_package, requires_package
 
 from openff.interchange import Interchange
-from openff.interchange.drivers.report import EnergyReport
+from openff.interchange.constants import kj_mol
+from openff.interchange.drivers.report import (
+    EnergyReport,
+    MultiFrameEnergyReport,
+    _get_frames,
+)
 from openff.interchange.exceptions import CannotInferNonbondedEnergyError
 from openff.interchange.interop.openmm._positions import to_openmm_positions
+from openff.interchange.models import PotentialKey
 
 if has_package("openmm") or TYPE_CHECKING:
     import openmm
@@ -25,7 +33,8 @@ def get_openmm_energies(
     combine_nonbonded_forces: bool = True,
     detailed: bool = False,
     platform: str = "Reference",
-) -> EnergyReport:
+    positions: Quantity | None = None,
+) -> EnergyReport | MultiFrameEnergyReport:
     """
     Given an OpenFF Interchange object, return single-point energies as computed by OpenMM.
 
@@ -46,11 +55,16 @@ def get_openmm_energies(
     detailed : bool, default=False
         Attempt to report energies with more granularity. Not guaranteed to be compatible with all values
         of other arguments. Useful for debugging.
+    positions : openff.units.Quantity, optional
+        Positions of the atoms to use instead of `interchange.positions`, either of shape (n_atoms, 3) or
+        of shape (n_frames, n_atoms, 3). Each frame is evaluated with the same system and context, and
+        the same box vectors. Positions of virtual sites, if any, are computed from those of the atoms.
 
     Returns
     -------
-    report : EnergyReport
-        An `EnergyReport` object containing the single-point energies.
+    report : EnergyReport or MultiFrameEnergyReport
+        An `EnergyReport` object containing the single-point energies, or, if `positions` has multiple
+        frames, a `MultiFrameEnergyReport` containing an array of energies of each frame.
 
     """
     if "VirtualSites" in interchange.collections:
@@ -76,16 +90,32 @@ def get_openmm_energies(
         None if interchange.box is None else interchange.box.to_openmm()
     )
 
-    positions: openmm.unit.Quantity = to_openmm_positions(
-        interchange,
-        include_virtual_sites=has_virtual_sites,
-    )
+    if positions is not None:
+        frames = _get_frames(positions, interchange.topology.n_atoms)
+
+        report = _process_frames(
+            _get_openmm_energies_by_frame(
+                system=system,
+                box_vectors=box_vectors,
+                positions=frames.m_as(unit.nanometer),
+                round_positions=round_positions,
+                platform=platform,
+            ),
+            combine_nonbonded_forces=combine_nonbonded_forces,
+            detailed=detailed,
+            system=system,
+        )
+
+        return report if positions.ndim == 3 else report.frame(0)
 
     return _process(
         _get_openmm_energies(
             system=system,
             box_vectors=box_vectors,
-            positions=positions,
+            positions=to_openmm_positions(
+                interchange,
+                include_virtual_sites=has_virtual_sites,
+            ),
             round_positions=round_positions,
             platform=platform,
         ),
@@ -95,6 +125,181 @@ def get_openmm_energies(
     )
 
 
+class OpenMMEnergyEvaluator:
+    """
+    Evaluate energies of an Interchange with OpenMM, keeping one context alive between evaluations.
+
+    Updated parameters are set on the existing forces, and pushed into the context with
+    `updateParametersInContext`, instead of creating a new system and context. Bonds, angles, torsions,
+    constraints, vdW parameters and partial charges, including 1-4 interactions, can be updated.
+
+    .. warning :: This API is experimental and subject to change.
+
+    Parameters
+    ----------
+    interchange : openff.interchange.Interchange
+        An OpenFF Interchange object, which is kept and read from when parameters are updated.
+    combine_nonbonded_forces : bool, default=True
+        Whether or not to combine all non-bonded interactions into a single openmm.NonbondedForce.
+    platform : str, default="Reference"
+        The name of the platform (`openmm.Platform`) used by OpenMM.
+
+    Examples
+    --------
+    Re-evaluate energies after modifying a force field:
+
+    >>> evaluator = OpenMMEnergyEvaluator(interchange)  # doctest: +SKIP
+    >>> force_field["Bonds"].parameters["[#6X4:1]-[#1:2]"].k *= 1.1  # doctest: +SKIP
+    >>> evaluator.update_parameters(interchange.update_parameters(force_field))  # doctest: +SKIP
+    >>> evaluator.get_energies()  # doctest: +SKIP
+
+    """
+
+    @requires_package("openmm")
+    def __init__(
+        self,
+        interchange: Interchange,
+        combine_nonbonded_forces: bool = True,
+        platform: str = "Reference",
+    ):
+        from openff.interchange.interop.common import _build_particle_map
+        from openff.interchange.interop.openmm._parameters import (
+            _check_supported,
+            _get_constraint_terms,
+            _get_nonbonded_terms,
+            _get_valence_terms,
+        )
+
+        _check_supported(interchange)
+
+        self.interchange = interchange
+        self.combine_nonbonded_forces = combine_nonbonded_forces
+
+        self.system: openmm.System = interchange.to_openmm(
+            combine_nonbonded_forces=combine_nonbonded_forces,
+        )
+        self.particle_map = _build_particle_map(interchange, defaultdict(list))
+
+        self._valence_terms = _get_valence_terms(
+            interchange,
+            self.system,
+            self.particle_map,
+        )
+        self._constraint_terms = _get_constraint_terms(
+            interchange,
+            self.system,
+            self.particle_map,
+        )
+        self._nonbonded_terms = _get_nonbonded_terms(
+            interchange,
+            self.system,
+            self.particle_map,
+            combine_nonbonded_forces,
+        )
+
+        self.context: openmm.Context = _create_context(self.system, platform)
+
+        if interchange.box is not None:
+            self.context.setPeriodicBoxVectors(*interchange.box.to_openmm())
+
+        self.context.setPositions(
+            to_openmm_positions(interchange, include_virtual_sites=False),
+        )
+
+    def set_positions(self, positions: Quantity):
+        """Set the positions, of atoms in the same order as the topology, in the context."""
+        self.context.setPositions(ensure_quantity(positions, "openmm"))
+
+    def update_parameters(
+        self,
+        updated: dict[str, Iterable[PotentialKey]] | None = None,
+    ):
+        """
+        Set parameters from the Interchange on the forces in the context.
+
+        Parameters
+        ----------
+        updated : dict[str, Iterable[PotentialKey]], optional
+            The keys of the potentials to update, by the name of their collection, as returned by
+            `Interchange.update_parameters`. If the key "Electrostatics" is present, all partial charges are
+            updated. If None, every parameter is updated.
+
+        """
+        from openff.interchange.interop.openmm._parameters import (
+            _set_nonbonded_parameters,
+            _set_valence_parameters,
+        )
+
+        if updated is None:
+            updated = {
+                name: collection.potentials
+                for name, collection in self.interchange.collections.items()
+            }
+
+        modified: set[openmm.Force] = set()
+
+        for name, valence_terms in self._valence_terms.items():
+            if name in updated:
+                _set_valence_parameters(
+                    self.interchange,
+                    name,
+                    valence_terms,
+                    updated[name],
+                )
+                modified.add(valence_terms.force)
+
+        modified |= _set_nonbonded_parameters(
+            self.interchange,
+            self._nonbonded_terms,
+            self.particle_map,
+            vdw_potential_keys=updated.get("vdW", ()),
+            update_charges="Electrostatics" in updated,
+            combine_nonbonded_forces=self.combine_nonbonded_forces,
+        )
+
+        for force in modified:
+            force.updateParametersInContext(self.context)
+
+        if "Constraints" in updated:
+            constraints = self.interchange["Constraints"]
+
+            for potential_key in updated["Constraints"]:
+                parameters = constraints.potentials[potential_key].parameters
+                distance = parameters["distance"].m_as(unit.nanometer)
+
+                for term in self._constraint_terms.get(potential_key, ()):
+                    self.system.setConstraintParameters(
+                        term.index,
+                        *term.particles,
+                        distance,
+                    )
+
+            # Constraints are not forces, so the context must be reinitialized to use them
+            self.context.reinitialize(preserveState=True)
+
+    def get_energies(self, detailed: bool = False) -> EnergyReport:
+        """
+        Return the energies of the current positions and parameters in the context.
+
+        Parameters
+        ----------
+        detailed : bool, default=False
+            Attempt to report energies with more granularity.
+
+        Returns
+        -------
+        report : EnergyReport
+            An `EnergyReport` object containing the single-point energies.
+
+        """
+        return _process(
+            _get_raw_energies(self.context, self.system),
+            combine_nonbonded_forces=self.combine_nonbonded_forces,
+            detailed=detailed,
+            system=self.system,
+        )
+
+
 def _get_openmm_energies(
     system: "openmm.System",
     box_vectors: Optional["openmm.unit.Quantity"],
@@ -103,15 +308,7 @@ def _get_openmm_energies(
     platform: str,
 ) -> dict[int, "openmm.unit.Quantity"]:
     """Given prepared `openmm` objects, run a single-point energy calculation."""
-    for index, force in enumerate(system.getForces()):
-        force.setForceGroup(index)
-
-    integrator = openmm.VerletIntegrator(1.0 * openmm.unit.femtoseconds)
-    context = openmm.Context(
-        system,
-        integrator,
-        openmm.Platform.getPlatformByName(platform),
-    )
+    context = _create_context(system, platform)
 
     if box_vectors is not None:
         context.setPeriodicBoxVectors(*box_vectors)
@@ -124,6 +321,81 @@ def _get_openmm_energies(
         ),
     )
 
+    raw_energies = _get_raw_energies(context, system)
+
+    del context
+
+    return raw_energies
+
+
+def _get_openmm_energies_by_frame(
+    system: "openmm.System",
+    box_vectors: Optional["openmm.unit.Quantity"],
+    positions: numpy.ndarray,
+    round_positions: int | None,
+    platform: str,
+) -> dict[int, Quantity]:
+    """
+    Run single-point energy calculations of many frames of atom positions, in nanometers, with one context.
+
+    Returns an array of the energies of each force group, with one value per frame.
+    """
+    context = _create_context(system, platform)
+
+    if box_vectors is not None:
+        context.setPeriodicBoxVectors(*box_vectors)
+
+    if round_positions is not None:
+        positions = numpy.round(positions, round_positions)
+
+    n_frames, n_atoms, _ = positions.shape
+
+    # Virtual sites are after all atoms, and their positions are computed from the atoms in each frame
+    particle_positions = numpy.zeros((system.getNumParticles(), 3))
+    has_virtual_sites = system.getNumParticles() > n_atoms
+
+    energies = numpy.empty((n_frames, system.getNumForces()))
+
+    for frame, frame_positions in enumerate(positions):
+        particle_positions[:n_atoms] = frame_positions
+
+        context.setPositions(particle_positions)
+
+        if has_virtual_sites:
+            context.computeVirtualSites()
+
+        for index in range(system.getNumForces()):
+            energies[frame, index] = (
+                context.getState(getEnergy=True, groups={index})
+                .getPotentialEnergy()
+                .value_in_unit(openmm.unit.kilojoule_per_mole)
+            )
+
+    del context
+
+    return {
+        index: Quantity(energies[:, index], kj_mol)
+        for index in range(system.getNumForces())
+    }
+
+
+def _create_context(system: "openmm.System", platform: str) -> "openmm.Context":
+    """Put each force of a system in its own force group and create a context for it."""
+    for index, force in enumerate(system.getForces()):
+        force.setForceGroup(index)
+
+    return openmm.Context(
+        system,
+        openmm.VerletIntegrator(1.0 * openmm.unit.femtoseconds),
+        openmm.Platform.getPlatformByName(platform),
+    )
+
+
+def _get_raw_energies(
+    context: "openmm.Context",
+    system: "openmm.System",
+) -> dict[int, "openmm.unit.Quantity"]:
+    """Return the energy of each force group, as set by `_create_context`, of the current state of a context."""
     raw_energies: dict[int, openmm.unit.Quantity] = dict()
 
     for index in range(system.getNumForces()):
@@ -131,19 +403,16 @@ def _get_openmm_energies(
         raw_energies[index] = state.getPotentialEnergy()
         del state
 
-    del context
-    del integrator
-
     return raw_energies
 
 
-def _process(
-    raw_energies: dict[int, "openmm.unit.Quantity"],
+def _stage(
+    raw_energies: dict,
     system: "openmm.System",
     combine_nonbonded_forces: bool,
-    detailed: bool,
-) -> EnergyReport:
-    staged: dict[str, unit.Quantity] = dict()
+) -> dict:
+    """Label the energy of each force group by the type of interaction of its force."""
+    staged: dict = dict()
 
     valence_map = {
         openmm.HarmonicBondForce: "Bond",
@@ -187,6 +456,21 @@ def _process(
                 else:
                     raise CannotInferNonbondedEnergyError()
 
+    return staged
+
+
+def _process(
+    raw_energies: dict[int, "openmm.unit.Quantity"],
+    system: "openmm.System",
+    combine_nonbonded_forces: bool,
+    detailed: bool,
+) -> EnergyReport:
+    staged: dict[str, unit.Quantity] = _stage(
+        raw_energies,
+        system,
+        combine_nonbonded_forces,
+    )
+
     if detailed:
         processed = staged
 
@@ -234,3 +518,43 @@ def _process(
             )
 
     return EnergyReport(energies=processed)
+
+
+def _process_frames(
+    raw_energies: dict[int, Quantity],
+    system: "openmm.System",
+    combine_nonbonded_forces: bool,
+    detailed: bool,
+) -> MultiFrameEnergyReport:
+    """Process arrays of energies of each force group, with one value per frame, like `_process`."""
+    staged: dict[str, Quantity] = _stage(raw_energies, system, combine_nonbonded_forces)
+
+    if detailed:
+        return MultiFrameEnergyReport(energies=staged)
+
+    processed = {
+        key: staged[key]
+        for key in ["Bond", "Angle", "Torsion", "RBTorsion"]
+        if key in staged
+    }
+
+    if combine_nonbonded_forces:
+        processed["Nonbonded"] = staged["Nonbonded"]
+
+    else:
+        zero = Quantity(numpy.zeros(len(next(iter(raw_energies.values())))), kj_mol)
+
+        processed["Electrostatics"] = sum(
+            (
+                staged[key]
+                for key in ["Electrostatics", "Electrostatics 1-4"]
+                if key in staged
+            ),
+            zero,
+        )
+        processed["vdW"] = sum(
+            (staged[key] for key in ["vdW", "vdW 1-4"] if key in staged),
+            zero,
+        )
+
+    return MultiFrameEnergyReport(energies=processed)
@@ -1,10 +1,12 @@
 """Storing and processing results of energy evaluations."""
 
 import warnings
+from collections.abc import Sequence
 
+import numpy
 from openff.models.models import DefaultModel
-from openff.models.types import FloatQuantity
-from openff.toolkit import unit
+from openff.models.types import ArrayQuantity, FloatQuantity
+from openff.toolkit import Quantity, unit
 from pydantic.v1 import validator
 
 from openff.interchange.constants import kj_mol
@@ -204,3 +206,78 @@ class EnergyReport(DefaultModel):
                 nonbonded_energy += self.energies[key]
 
         return nonbonded_energy
+
+
+class MultiFrameEnergyReport(DefaultModel):
+    """Energies of many frames, evaluated with the same parameters, stored as one array per energy term."""
+
+    energies: dict[str, ArrayQuantity] = dict()
+
+    @validator("energies")
+    def validate_energies(cls, v: dict) -> dict:
+        """Validate the structure of a dict mapping keys to arrays of energies, one per frame."""
+        for key, val in v.items():
+            if key not in _KNOWN_ENERGY_TERMS:
+                raise InvalidEnergyError(f"Energy type {key} not understood.")
+            v[key] = ArrayQuantity.validate_type(val)
+
+        if len({len(val) for val in v.values()}) > 1:
+            raise InvalidEnergyError("All energy terms must have one value per frame.")
+
+        return v
+
+    @classmethod
+    def from_reports(cls, reports: Sequence[EnergyReport]) -> "MultiFrameEnergyReport":
+        """Stack reports of single frames, each with the same energy terms, into one report."""
+        return cls(
+            energies={
+                key: Quantity(
+                    numpy.array([report[key].m_as(kj_mol) for report in reports]),  # type: ignore[union-attr]
+                    kj_mol,
+                )
+                for key in reports[0].energies
+            },
+        )
+
+    @property
+    def n_frames(self) -> int:
+        """Return the number of frames."""
+        return len(next(iter(self.energies.values()), ()))
+
+    @property
+    def total_energy(self):
+        """Return the total energy of each frame."""
+        return self["total"]
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    def __getitem__(self, item: str) -> ArrayQuantity | None:
+        if type(item) is not str:
+            raise LookupError(
+                "Only str arguments can be currently be used for lookups.\n"
+                f"Found item {item} of type {type(item)}",
+            )
+        if item in self.energies.keys():
+            return self.energies[item]
+        if item.lower() == "total":
+            return sum(self.energies.values())  # type: ignore
+        else:
+            return None
+
+    def frame(self, index: int) -> EnergyReport:
+        """Return the energies of a single frame."""
+        return EnergyReport(
+            energies={key: val[index] for key, val in self.energies.items()},
+        )
+
+
+def _get_frames(positions: Quantity, n_atoms: int) -> Quantity:
+    """Check that positions are of shape (n_atoms, 3) or (n_frames, n_atoms, 3), returning them as the latter."""
+    if positions.shape[-2:] != (n_atoms, 3) or positions.ndim not in (2, 3):
+        raise ValueError(
+            f"Positions must be of shape (n_atoms, 3) or (n_frames, n_atoms, 3) with {n_atoms} atoms, "
+            f"found shape {positions.shape}.",
+        )
+
+    return positions.reshape(-1, n_atoms, 3)
@@ -98,6 +98,12 @@ class UnsupportedExportError(InterchangeException):
     """
 
 
+class UnsupportedArrayStorageError(InterchangeException):
+    """
+    Exception for attempting to store the contents of a collection that cannot be stored as arrays.
+    """
+
+
 class UnsupportedCombinationError(InterchangeException):
     """General exception for something going wrong in Interchange object combination."""
 
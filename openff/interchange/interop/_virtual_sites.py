@@ -172,8 +172,9 @@ def _get_separation_by_atom_indices(
 
     A constraint distance is first searched for, then an equilibrium bond length.
 
-    This is slow, but often necessary for converting virtual site "distances" to weighted
-    averages (unitless) of orientation atom positions.
+    This is often necessary for converting virtual site "distances" to weighted averages (unitless)
+    of orientation atom positions. Constraints and bonds are looked up by atom indices in O(1) time,
+    but angles are still searched for linearly.
     """
     if prioritize_geometry:
         p1 = interchange.positions[atom_indices[1]]
@@ -184,7 +185,7 @@ def _get_separation_by_atom_indices(
     if "Constraints" in interchange.collections:
         collection = interchange["Constraints"]
 
-        for key in collection.key_map:
+        for key in collection.get_keys_by_atom_indices(atom_indices):
             if (key.atom_indices == atom_indices) or (
                 key.atom_indices[::-1] == atom_indices
             ):
@@ -195,7 +196,7 @@ def _get_separation_by_atom_indices(
     if "Bonds" in interchange.collections:
         collection = interchange["Bonds"]
 
-        for key in collection.key_map:
+        for key in collection.get_keys_by_atom_indices(atom_indices):
             if (key.atom_indices == atom_indices) or (
                 key.atom_indices[::-1] == atom_indices
             ):
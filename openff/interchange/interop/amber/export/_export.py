@@ -1,15 +1,13 @@
 """Interfaces with Amber."""
 
 import textwrap
-from collections import defaultdict
-from collections.abc import Iterable
-from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
-from openff.toolkit import Topology, unit
+from openff.toolkit import unit
 
 from openff.interchange import Interchange
+from openff.interchange.components._graph import BondGraph
 from openff.interchange.components.toolkit import _get_num_h_bonds
 from openff.interchange.constants import (
     _PME,
@@ -23,6 +21,7 @@ from openff.interchange.exceptions import (
     UnsupportedMixingRuleError,
 )
 from openff.interchange.models import PotentialKey
+from openff.interchange.profiling import _count, _profiled
 
 
 def _write_text_blob(file, blob):
@@ -36,273 +35,253 @@ def _write_text_blob(file, blob):
             file.write(line + "\n")
 
 
-def _flatten(list_of_lists: Iterable[list[int]]) -> list[int]:
-    return [item for sublist in list_of_lists for item in sublist]
+# Number of lines formatted at once when writing numerical sections, bounding the size of the
+# strings held in memory while still formatting many values per call
+_LINES_PER_CHUNK = 1000
 
 
-def _get_per_atom_exclusion_lists(
-    topology: "Topology",
-) -> dict[int, defaultdict[int, list[int]]]:
-    """
-    Get the excluded atoms of each atom in this topology.
+@_profiled("write_array_section")
+def _write_array_section(file, values, value_format: str, values_per_line: int):
+    """Write values as fixed-width lines, formatting many lines at a time."""
+    values = np.asarray(values).ravel()
 
-    Parameters
-    ----------
-    topology: Topology
-        OpenFF Topology
+    _count(values=len(values))
 
-    Returns
-    -------
-    per_atom_exclusions: dict[int, list[int]]
-        keys: atom indices (OpenFF atoms, zero-indexed)
-        values: defaultdict[int, list[int]]
-            list of atom indices (OpenFF atoms, zero-indexed) that are excluded from this atom,
-            keyed by their separation distance in the graph (1 for bonded, 2 for in an angle, 3
-            for in a dihedral)
+    if len(values) == 0:
+        file.write("\n")
+        return
 
-    """
-    per_atom_exclusions: dict[int, defaultdict[int, list[int]]] = dict()
+    line_format = value_format * values_per_line + "\n"
+    chunk_size = values_per_line * _LINES_PER_CHUNK
 
-    for atom1 in topology.atoms:
-        # Excluded atoms _on this atom_
-        this_atom_exclusions = defaultdict(list)
-        index1 = topology.atom_index(atom1)
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size].tolist()
 
-        for atom2 in atom1.bonded_atoms:
-            index2 = topology.atom_index(atom2)
+        n_lines, remainder = divmod(len(chunk), values_per_line)
 
-            if index2 > index1:
-                # These atoms are bonded
-                this_atom_exclusions[1].append(index2)
+        chunk_format = line_format * n_lines
 
-            for atom3 in atom2.bonded_atoms:
-                atom3_index = topology.atom_index(atom3)
+        if remainder:
+            chunk_format += value_format * remainder + "\n"
 
-                if atom3_index > index1:
-                    # These atoms are included in an angle
-                    this_atom_exclusions[2].append(atom3_index)
+        file.write(chunk_format % tuple(chunk))
 
-                for atom4 in atom3.bonded_atoms:
-                    atom4_index = topology.atom_index(atom4)
-                    if atom4_index > index1 and atom4_index:
-                        # These atoms are included in a torsion
-                        this_atom_exclusions[3].append(atom4_index)
 
-        per_atom_exclusions[index1] = this_atom_exclusions
+def _write_integer_section(file, values):
+    """Write a section with FORMAT(10I8)."""
+    _write_array_section(file, np.asarray(values, dtype=np.int64), "%8d", 10)
 
-    return per_atom_exclusions
 
+def _write_float_section(file, values):
+    """Write a section with FORMAT(5E16.8)."""
+    _write_array_section(file, np.asarray(values, dtype=np.float64), "%16.8E", 5)
 
-def _get_exclusion_lists(
-    per_atom_exclusions: dict[int, defaultdict[int, list[int]]],
-) -> tuple[list[int], list[int]]:
+
+@_profiled("get_exclusion_arrays")
+def _get_exclusion_arrays(
+    pairs: np.ndarray,
+    n_atoms: int,
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Convert a per-atom exclusion dict to Amer structures.
+    Convert pairs of excluded atoms to Amber structures.
 
     Parameters
     ----------
-    per_atom_exclusions: dict[int, list[int]]
-        keys: atom indices (OpenFF atoms, zero-indexed)
-        values: list of atom indices (OpenFF atoms, zero-indexed) that are excluded from this atom
-
-        See _getper_atom_exclusion_lists
+    pairs: np.ndarray
+        Atom indices (OpenFF atoms, zero-indexed) of pairs of atoms separated by three or fewer
+        bonds, shape (n_pairs, 2), with the lower index first and sorted by the first then second
+        index. See `BondGraph.get_pairs`.
+    n_atoms: int
+        The number of atoms in the topology.
 
     Returns
     -------
-    number_excluded_atoms: list[int]
+    number_excluded_atoms: np.ndarray
         Number of excluded atoms for each atom (OpenFF atoms, zero-indexed)
-    excluded_atoms_list: list[int]
+    excluded_atoms_list: np.ndarray
         Flattened list of per-atom exclusions (Amber atoms, one-indexed).
         See EXCLUDED_ATOMS_LIST in https://ambermd.org/prmtop.pdf
 
     """
-    excluded_atoms_list: list[int] = list()
-    number_excluded_atoms: list[int] = list()
-
-    for this_atom, this_atom_exclusions in per_atom_exclusions.items():
-        if len(this_atom_exclusions) == 0:
-            # Amber expects this list to have a 1 in it, pointing to a non-existent
-            # atom with index 0, when an atom has no exclusions
-            tmp = {0}
+    counts = np.bincount(pairs[:, 0], minlength=n_atoms)
 
-        else:
-            tmp = set()
-            for other_atom in _flatten(this_atom_exclusions.values()):
-                if other_atom > this_atom:
-                    tmp.add(other_atom + 1)
+    # Amber expects this list to have a 1 in it, pointing to a non-existent
+    # atom with index 0, when an atom has no exclusions
+    number_excluded_atoms = np.where(counts == 0, 1, counts)
 
-        for val in sorted(tmp):
-            excluded_atoms_list.append(val)
+    offsets = np.cumsum(number_excluded_atoms) - number_excluded_atoms
+    first_pair_of_atom = np.cumsum(counts) - counts
 
-        number_excluded_atoms.append(len(tmp))
+    excluded_atoms_list = np.zeros(number_excluded_atoms.sum(), dtype=np.int64)
+    excluded_atoms_list[
+        offsets[pairs[:, 0]] + np.arange(len(pairs)) - first_pair_of_atom[pairs[:, 0]]
+    ] = (pairs[:, 1] + 1)
 
     return number_excluded_atoms, excluded_atoms_list
 
 
+def _split_by_hydrogen(
+    rows: np.ndarray,
+    atom_indices: np.ndarray,
+    atomic_numbers: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split rows of a bond, angle, or dihedral list by whether or not they contain a hydrogen."""
+    if len(rows) == 0:
+        return rows.ravel(), rows.ravel()
+
+    contains_hydrogen = np.any(atomic_numbers[atom_indices] == 1, axis=1)
+
+    return rows[contains_hydrogen].ravel(), rows[~contains_hydrogen].ravel()
+
+
+@_profiled("get_bond_lists")
 def _get_bond_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    atomic_numbers: np.ndarray,
     potential_key_to_bond_type_mapping: dict[PotentialKey, int],
-) -> tuple[list[int], list[int]]:
-    bonds_inc_hydrogen: list[int] = list()
-    bonds_without_hydrogen: list[int] = list()
-
+) -> tuple[np.ndarray, np.ndarray]:
     # TODO: Should probably build bond lists and exclusions without assuming bond physics
-    for bond, key_ in interchange["Bonds"].key_map.items():
-        bond_type_index = potential_key_to_bond_type_mapping[key_]
-
-        these_atomic_numbers = tuple(
-            atomic_numbers[index] for index in bond.atom_indices
-        )
-
-        bond_indices = tuple(sorted(bond.atom_indices))
+    key_map = interchange["Bonds"].key_map
 
-        bonds_list = (
-            bonds_inc_hydrogen if 1 in these_atomic_numbers else bonds_without_hydrogen
-        )
+    atom_indices = np.sort(
+        np.asarray([key.atom_indices for key in key_map], dtype=np.int64).reshape(
+            -1,
+            2,
+        ),
+        axis=1,
+    )
+    type_indices = np.asarray(
+        [potential_key_to_bond_type_mapping[key] for key in key_map.values()],
+        dtype=np.int64,
+    )
 
-        bonds_list.append(bond_indices[0] * 3)
-        bonds_list.append(bond_indices[1] * 3)
-        bonds_list.append(bond_type_index + 1)
+    rows = np.column_stack([atom_indices * 3, type_indices + 1])
 
-    return bonds_inc_hydrogen, bonds_without_hydrogen
+    return _split_by_hydrogen(rows, atom_indices, atomic_numbers)
 
 
+@_profiled("get_angle_lists")
 def _get_angle_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    atomic_numbers: np.ndarray,
     potential_key_to_angle_type_mapping: dict[PotentialKey, int],
-) -> tuple[list[int], list[int]]:
-    angles_inc_hydrogen: list[int] = list()
-    angles_without_hydrogen: list[int] = list()
+) -> tuple[np.ndarray, np.ndarray]:
+    key_map = interchange["Angles"].key_map
 
-    for angle, key_ in interchange["Angles"].key_map.items():
-        angle_type_index = potential_key_to_angle_type_mapping[key_]
+    atom_indices = np.asarray(
+        [key.atom_indices for key in key_map],
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    type_indices = np.asarray(
+        [potential_key_to_angle_type_mapping[key] for key in key_map.values()],
+        dtype=np.int64,
+    )
 
-        these_atomic_numbers = tuple(
-            atomic_numbers[index] for index in angle.atom_indices
-        )
-
-        angle_indices = list(angle.atom_indices)
-        angle_indices = (
-            angle_indices
-            if angle_indices[0] < angle_indices[-1]
-            else list(reversed(angle_indices))
-        )
+    # Order each angle such that the first atom has the lower index
+    to_reverse = atom_indices[:, 0] > atom_indices[:, -1]
+    atom_indices[to_reverse] = atom_indices[to_reverse, ::-1]
 
-        angles_list = (
-            angles_inc_hydrogen
-            if 1 in these_atomic_numbers
-            else angles_without_hydrogen
-        )
-
-        angles_list.append(angle_indices[0] * 3)
-        angles_list.append(angle_indices[1] * 3)
-        angles_list.append(angle_indices[2] * 3)
-        angles_list.append(angle_type_index + 1)
+    rows = np.column_stack([atom_indices * 3, type_indices + 1])
 
-    return angles_inc_hydrogen, angles_without_hydrogen
+    return _split_by_hydrogen(rows, atom_indices, atomic_numbers)
 
 
+@_profiled("get_dihedral_lists")
 def _get_dihedral_lists(
     interchange: "Interchange",
-    atomic_numbers: tuple,
+    atomic_numbers: np.ndarray,
     potential_key_to_dihedral_type_mapping: dict[PotentialKey, int],
-    already_counted: set[tuple[int, ...]],
-    exclusions: dict[int, defaultdict[int, list[int]]],  # per-atom exclusions
-) -> tuple[list[int], list[int]]:
-    dihedrals_inc_hydrogen: list[int] = list()
-    dihedrals_without_hydrogen: list[int] = list()
-
-    if "ProperTorsions" in interchange.collections:
-        for dihedral, proper_key in interchange["ProperTorsions"].key_map.items():
-            dihedral_type_index = potential_key_to_dihedral_type_mapping[proper_key]
-
-            atom1_index, atom2_index, atom3_index, atom4_index = dihedral.atom_indices
-
-            # Since 0 can't be negative, attempt to re-arrange this torsion
-            # such that the third atom listed is negative.
-            # This should only be strictly necessary when _14_tag is -1, but
-            # ParmEd likes to always flip it, and always flipping should be harmless.
-            # Could put this in an if block if desired.
-            if atom3_index == 0:
-                atom1_index, atom2_index, atom3_index, atom4_index = reversed(
-                    (
-                        atom1_index,
-                        atom2_index,
-                        atom3_index,
-                        atom4_index,
-                    ),
-                )
-
-            these_atomic_numbers = tuple(
-                atomic_numbers[index] for index in dihedral.atom_indices
-            )
-
-            # See if the non-bonded interactions of the first and fourth atoms need to be exluded
-
-            atom1_neighbors = exclusions[atom1_index][1] + exclusions[atom1_index][2]
-            atom4_neighbors = exclusions[atom4_index][1] + exclusions[atom4_index][2]
-
-            _sorted = tuple(sorted([atom1_index, atom4_index]))
+    close_pairs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    n_atoms = len(atomic_numbers)
 
-            if atom4_index in atom1_neighbors:
-                # Exclude because these atoms are separated by only one or two bonds
-                exclude_nonbonded = -1
-
-            elif atom1_index in atom4_neighbors:
-                # Exclude because these atoms are separated by only one or two bonds
-                exclude_nonbonded = -1
-
-            elif _sorted in already_counted:
-                # Exclude because these were already counted once in another torsion
-                exclude_nonbonded = -1
-
-            else:
-                exclude_nonbonded = 1
-
-            dihedrals_list = (
-                dihedrals_inc_hydrogen
-                if 1 in these_atomic_numbers
-                else dihedrals_without_hydrogen
-            )
+    # Atom indices, signs applied to (scaled) atom indices, and type indices of each dihedral
+    atom_indices = [np.empty((0, 4), dtype=np.int64)]
+    signs = [np.empty((0, 4), dtype=np.int64)]
+    type_indices = [np.empty(0, dtype=np.int64)]
 
-            dihedrals_list.append(atom1_index * 3)
-            dihedrals_list.append(atom2_index * 3)
-            dihedrals_list.append(atom3_index * 3 * exclude_nonbonded)
-            dihedrals_list.append(atom4_index * 3)
-            dihedrals_list.append(dihedral_type_index + 1)
+    if "ProperTorsions" in interchange.collections:
+        key_map = interchange["ProperTorsions"].key_map
+
+        proper_indices = np.asarray(
+            [key.atom_indices for key in key_map],
+            dtype=np.int64,
+        ).reshape(-1, 4)
+
+        # Since 0 can't be negative, attempt to re-arrange each torsion
+        # such that the third atom listed is negative.
+        # This should only be strictly necessary when the 1-4 pair is excluded,
+        # but ParmEd likes to always flip it, and always flipping should be harmless.
+        to_reverse = proper_indices[:, 2] == 0
+        proper_indices[to_reverse] = proper_indices[to_reverse, ::-1]
+
+        # Encode each 1-4 pair, lower index first, as a single integer
+        pairs = np.sort(proper_indices[:, [0, 3]], axis=1)
+        pair_ids = pairs[:, 0] * n_atoms + pairs[:, 1]
+
+        first_occurrence = np.zeros(len(pair_ids), dtype=bool)
+        first_occurrence[np.unique(pair_ids, return_index=True)[1]] = True
+
+        # Exclude the non-bonded interactions of the first and fourth atoms if they are
+        # separated by only one or two bonds or were already counted once in an earlier torsion
+        exclude_nonbonded = ~first_occurrence | np.isin(
+            pair_ids,
+            close_pairs[:, 0] * n_atoms + close_pairs[:, 1],
+        )
 
-            already_counted.add(_sorted)
+        proper_signs = np.ones_like(proper_indices)
+        proper_signs[exclude_nonbonded, 2] = -1
+
+        atom_indices.append(proper_indices)
+        signs.append(proper_signs)
+        type_indices.append(
+            np.asarray(
+                [
+                    potential_key_to_dihedral_type_mapping[key]
+                    for key in key_map.values()
+                ],
+                dtype=np.int64,
+            ),
+        )
 
     if "ImproperTorsions" in interchange.collections:
-        for improper, improper_key in interchange["ImproperTorsions"].key_map.items():
-            dihedral_type_index = potential_key_to_dihedral_type_mapping[improper_key]
-
-            atom1_index, atom2_index, atom3_index, atom4_index = improper.atom_indices
-
-            # Assume that no improper torsions include 1-4 pairs, so don't check nor track them
-
-            these_atomic_numbers = tuple(
-                atomic_numbers[index] for index in improper.atom_indices
-            )
+        key_map = interchange["ImproperTorsions"].key_map
+
+        # Assume that no improper torsions include 1-4 pairs, so don't check nor track them
+        improper_indices = np.asarray(
+            [key.atom_indices for key in key_map],
+            dtype=np.int64,
+        ).reshape(-1, 4)
+
+        improper_signs = np.ones_like(improper_indices)
+        improper_signs[:, 2:] = -1
+
+        atom_indices.append(improper_indices)
+        signs.append(improper_signs)
+        type_indices.append(
+            np.asarray(
+                [
+                    potential_key_to_dihedral_type_mapping[key]
+                    for key in key_map.values()
+                ],
+                dtype=np.int64,
+            ),
+        )
 
-            dihedrals_list = (
-                dihedrals_inc_hydrogen
-                if 1 in these_atomic_numbers
-                else dihedrals_without_hydrogen
-            )
+    all_atom_indices = np.concatenate(atom_indices)
 
-            dihedrals_list.append(atom1_index * 3)
-            dihedrals_list.append(atom2_index * 3)
-            dihedrals_list.append(atom3_index * 3 * -1)
-            dihedrals_list.append(atom4_index * 3 * -1)
-            dihedrals_list.append(dihedral_type_index + 1)
+    rows = np.column_stack(
+        [
+            all_atom_indices * 3 * np.concatenate(signs),
+            np.concatenate(type_indices) + 1,
+        ],
+    )
 
-    return dihedrals_inc_hydrogen, dihedrals_without_hydrogen
+    return _split_by_hydrogen(rows, all_atom_indices, atomic_numbers)
 
 
 # TODO: Split this mono-function into smaller functions
+@_profiled("to_prmtop")
 def to_prmtop(interchange: "Interchange", file_path: Path | str):
     """
     Write a .prmtop file. See http://ambermd.org/prmtop.pdf for details.
@@ -349,10 +328,13 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
         potential_key_to_atom_type_mapping: dict[PotentialKey, int] = {
             key: i for i, key in enumerate(interchange["vdW"].potentials)
         }
-        atom_type_indices = [
-            potential_key_to_atom_type_mapping[potential_key]
-            for potential_key in interchange["vdW"].key_map.values()
-        ]
+        atom_type_indices = np.fromiter(
+            (
+                potential_key_to_atom_type_mapping[potential_key]
+                for potential_key in interchange["vdW"].key_map.values()
+            ),
+            dtype=np.int64,
+        )
 
         potential_key_to_bond_type_mapping: dict[PotentialKey, int] = {
             key: i for i, key in enumerate(interchange["Bonds"].potentials)
@@ -362,28 +344,33 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             key: i for i, key in enumerate(interchange["Angles"].potentials)
         }
 
-        dihedral_potentials = dict()
+        # Only the keys are needed here; parameters are looked up in each collection later
+        dihedral_potential_keys: dict[PotentialKey, None] = dict()
         for key in ["ProperTorsions", "ImproperTorsions"]:
             if key in interchange.collections:
-                dihedral_potentials.update(deepcopy(interchange[key].potentials))
-                dihedral_potentials.update(deepcopy(interchange[key].potentials))
+                dihedral_potential_keys.update(
+                    dict.fromkeys(interchange[key].potentials),
+                )
 
         potential_key_to_dihedral_type_mapping: dict[PotentialKey, int] = {
-            key: i for i, key in enumerate(dihedral_potentials)
+            key: i for i, key in enumerate(dihedral_potential_keys)
         }
 
-        # This is only used to track 1-4 pairs that are already counted. Since we
-        # only care about membership and never indexing and the membership check
-        # will happen roughly once per dihedral, use a set for speed.
-        already_counted: set[tuple[int, ...]] = set()
+        excluded_pairs, excluded_pair_distances = BondGraph.from_topology(
+            interchange.topology,
+        ).get_pairs(max_distance=3)
 
-        per_atom_exclusion_lists = _get_per_atom_exclusion_lists(interchange.topology)
-
-        number_excluded_atoms, excluded_atoms_list = _get_exclusion_lists(
-            per_atom_exclusion_lists,
+        number_excluded_atoms, excluded_atoms_list = _get_exclusion_arrays(
+            excluded_pairs,
+            interchange.topology.n_atoms,
         )
-        atomic_numbers = tuple(
-            atom.atomic_number for atom in interchange.topology.atoms
+
+        # Pairs separated by one or two bonds, whose 1-4 interactions are excluded
+        close_pairs = excluded_pairs[excluded_pair_distances <= 2]
+
+        atomic_numbers = np.fromiter(
+            (atom.atomic_number for atom in interchange.topology.atoms),
+            dtype=np.int64,
         )
 
         bonds_inc_hydrogen, bonds_without_hydrogen = _get_bond_lists(
@@ -402,8 +389,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             interchange,
             atomic_numbers,
             potential_key_to_dihedral_type_mapping,
-            already_counted,
-            per_atom_exclusion_lists,
+            close_pairs,
         )
 
         # total number of atoms
@@ -494,8 +480,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
         ]
 
         prmtop.write("%FLAG POINTERS\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in pointers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, pointers)
 
         prmtop.write("%FLAG ATOM_NAME\n" "%FORMAT(20a4)\n")
 
@@ -514,83 +499,70 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
         _write_text_blob(prmtop, text_blob)
 
         prmtop.write("%FLAG CHARGE\n" "%FORMAT(5E16.8)\n")
-        charges = [
-            charge.m_as(unit.e) * AMBER_COULOMBS_CONSTANT
-            for charge in interchange["Electrostatics"].charges.values()
-        ]
-        text_blob = "".join([f"{val:16.8E}" for val in charges])
-        _write_text_blob(prmtop, text_blob)
+        charges = np.fromiter(
+            (
+                charge.m_as(unit.e)
+                for charge in interchange["Electrostatics"].charges.values()
+            ),
+            dtype=np.float64,
+        )
+        _write_float_section(prmtop, charges * AMBER_COULOMBS_CONSTANT)
 
         prmtop.write("%FLAG ATOMIC_NUMBER\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in atomic_numbers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, atomic_numbers)
 
         prmtop.write("%FLAG MASS\n" "%FORMAT(5E16.8)\n")
-        masses = [a.mass.m for a in interchange.topology.atoms]
-        text_blob = "".join([f"{val:16.8E}" for val in masses])
-        _write_text_blob(prmtop, text_blob)
+        masses = np.fromiter(
+            (a.mass.m for a in interchange.topology.atoms),
+            dtype=np.float64,
+        )
+        _write_float_section(prmtop, masses)
 
         prmtop.write("%FLAG ATOM_TYPE_INDEX\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val + 1).rjust(8) for val in atom_type_indices])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, atom_type_indices + 1)
 
         prmtop.write("%FLAG NUMBER_EXCLUDED_ATOMS\n" "%FORMAT(10I8)\n")
         # https://ambermd.org/prmtop.pdf says this section is ignored (!?)
-        text_blob = "".join([str(val).rjust(8) for val in number_excluded_atoms])
-        _write_text_blob(prmtop, text_blob)
-
-        acoefs = [None] * int((NTYPES + 1) * NTYPES / 2)
-        bcoefs = [None] * int((NTYPES + 1) * NTYPES / 2)
+        _write_integer_section(prmtop, number_excluded_atoms)
 
-        nonbonded_parm_indices: list[int | None] = [None] * (NTYPES * NTYPES)
-
-        for key_i, i in potential_key_to_atom_type_mapping.items():
-            for key_j, j in potential_key_to_atom_type_mapping.items():
-                if j < i:
-                    # Only need to handle the lower triangle as everything symmetric.
-                    continue
-
-                atom_type_index_i = i + 1
-                atom_type_index_j = j + 1
-
-                coeff_index = int(i + (j + 1) * j / 2) + 1  # FORTRAN IDX
-
-                # index = NONBONDED PARM INDEX [NTYPES × (ATOM TYPE INDEX(i) − 1) + ATOM TYPE INDEX(j)]
-                parm_index_fwd = (
-                    NTYPES * (atom_type_index_i - 1) + atom_type_index_j  # FORTRAN IDX
-                )
-                parm_index_rev = (
-                    NTYPES * (atom_type_index_j - 1) + atom_type_index_i  # FORTRAN IDX
-                )
-
-                # TODO: Figure out the right way to map cross-interactions, using the
-                #       key_i and key_j objects as lookups to parameters
-                sigma_i = interchange["vdW"].potentials[key_i].parameters["sigma"]
-                sigma_j = interchange["vdW"].potentials[key_j].parameters["sigma"]
-                epsilon_i = interchange["vdW"].potentials[key_i].parameters["epsilon"]
-                epsilon_j = interchange["vdW"].potentials[key_j].parameters["epsilon"]
+        # TODO: Figure out the right way to map cross-interactions, using the
+        #       potential keys as lookups to parameters
+        vdw_potentials = [
+            interchange["vdW"].potentials[key]
+            for key in potential_key_to_atom_type_mapping
+        ]
+        sigmas = np.asarray(
+            [
+                potential.parameters["sigma"].m_as(unit.angstrom)
+                for potential in vdw_potentials
+            ],
+        )
+        epsilons = np.asarray(
+            [
+                potential.parameters["epsilon"].m_as(kcal_mol)
+                for potential in vdw_potentials
+            ],
+        )
 
-                sigma = (sigma_i + sigma_j) * 0.5
-                epsilon = (epsilon_i * epsilon_j) ** 0.5
+        # Only the upper triangle (i <= j) is stored, ordered by j then i
+        j_indices, i_indices = np.tril_indices(NTYPES)
 
-                acoef = (4 * epsilon * sigma**12).m_as(kcal_mol * unit.angstrom**12)
-                bcoef = (4 * epsilon * sigma**6).m_as(kcal_mol * unit.angstrom**6)
+        sigma = (sigmas[i_indices] + sigmas[j_indices]) * 0.5
+        epsilon = (epsilons[i_indices] * epsilons[j_indices]) ** 0.5
 
-                acoefs[coeff_index - 1] = acoef
-                bcoefs[coeff_index - 1] = bcoef
+        acoefs = 4 * epsilon * sigma**12
+        bcoefs = 4 * epsilon * sigma**6
 
-                nonbonded_parm_indices[parm_index_fwd - 1] = coeff_index
-                nonbonded_parm_indices[parm_index_rev - 1] = coeff_index
+        # index = NONBONDED PARM INDEX [NTYPES × (ATOM TYPE INDEX(i) − 1) + ATOM TYPE INDEX(j)]
+        low = np.minimum.outer(np.arange(NTYPES), np.arange(NTYPES))
+        high = np.maximum.outer(np.arange(NTYPES), np.arange(NTYPES))
 
-        assert all(
-            value is not None
-            for values in [acoefs, bcoefs, nonbonded_parm_indices]
-            for value in values  # type: ignore
-        ), "an internal error occurred"
+        nonbonded_parm_indices = (
+            low + (high + 1) * high // 2 + 1
+        ).ravel()  # FORTRAN IDX
 
         prmtop.write("%FLAG NONBONDED_PARM_INDEX\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in nonbonded_parm_indices])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, nonbonded_parm_indices)
 
         residue_names = [
             getattr(residue, "residue_name", "RES")
@@ -614,8 +586,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             else [0]
         )
         prmtop.write("%FLAG RESIDUE_POINTER\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val + 1).rjust(8) for val in residue_pointers])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, np.asarray(residue_pointers) + 1)
 
         # TODO: Exclude (?) bonds containing hydrogens
         prmtop.write("%FLAG BOND_FORCE_CONSTANT\n" "%FORMAT(5E16.8)\n")
@@ -623,8 +594,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             interchange["Bonds"].potentials[key].parameters["k"].m_as(kcal_mol_a2) / 2
             for key in potential_key_to_bond_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in bond_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, bond_k)
 
         prmtop.write("%FLAG BOND_EQUIL_VALUE\n" "%FORMAT(5E16.8)\n")
         bond_length = [
@@ -634,8 +604,7 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             .m_as(unit.angstrom)
             for key in potential_key_to_bond_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in bond_length])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, bond_length)
 
         prmtop.write("%FLAG ANGLE_FORCE_CONSTANT\n" "%FORMAT(5E16.8)\n")
         angle_k = [
@@ -643,20 +612,18 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             / 2  # noqa
             for key in potential_key_to_angle_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in angle_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, angle_k)
 
         prmtop.write("%FLAG ANGLE_EQUIL_VALUE\n" "%FORMAT(5E16.8)\n")
         angle_theta = [
             interchange["Angles"].potentials[key].parameters["angle"].m_as(unit.radian)
             for key in potential_key_to_angle_type_mapping
         ]
-        text_blob = "".join([f"{val:16.8E}" for val in angle_theta])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, angle_theta)
 
-        dihedral_k: list[int] = list()
-        dihedral_periodicity: list[int] = list()
-        dihedral_phase: list[int] = list()
+        dihedral_k: list[float] = list()
+        dihedral_periodicity: list[float] = list()
+        dihedral_phase: list[float] = list()
 
         for key_ in potential_key_to_dihedral_type_mapping:
             params = interchange[key_.associated_handler].potentials[key_].parameters  # type: ignore
@@ -666,65 +633,49 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             dihedral_phase.append(params["phase"].m_as(unit.radian))
 
         prmtop.write("%FLAG DIHEDRAL_FORCE_CONSTANT\n" "%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_k])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, dihedral_k)
 
         prmtop.write("%FLAG DIHEDRAL_PERIODICITY\n" "%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_periodicity])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, dihedral_periodicity)
 
         prmtop.write("%FLAG DIHEDRAL_PHASE\n" "%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in dihedral_phase])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, dihedral_phase)
 
         prmtop.write("%FLAG SCEE_SCALE_FACTOR\n" "%FORMAT(5E16.8)\n")
-        scee = NPTRA * [1.2]
-        text_blob = "".join([f"{val:16.8E}" for val in scee])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, np.full(NPTRA, 1.2))
 
         prmtop.write("%FLAG SCNB_SCALE_FACTOR\n" "%FORMAT(5E16.8)\n")
-        scnb = NPTRA * [2.0]
-        text_blob = "".join([f"{val:16.8E}" for val in scnb])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, np.full(NPTRA, 2.0))
 
         prmtop.write("%FLAG SOLTY\n" "%FORMAT(5E16.8)\n")
         prmtop.write(f"{0:16.8E}\n")
 
         prmtop.write("%FLAG LENNARD_JONES_ACOEF\n" "%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in acoefs])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, acoefs)
 
         prmtop.write("%FLAG LENNARD_JONES_BCOEF\n" "%FORMAT(5E16.8)\n")
-        text_blob = "".join([f"{val:16.8E}" for val in bcoefs])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, bcoefs)
 
         prmtop.write("%FLAG BONDS_INC_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in bonds_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, bonds_inc_hydrogen)
 
         prmtop.write("%FLAG BONDS_WITHOUT_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in bonds_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, bonds_without_hydrogen)
 
         prmtop.write("%FLAG ANGLES_INC_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in angles_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, angles_inc_hydrogen)
 
         prmtop.write("%FLAG ANGLES_WITHOUT_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in angles_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, angles_without_hydrogen)
 
         prmtop.write("%FLAG DIHEDRALS_INC_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in dihedrals_inc_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, dihedrals_inc_hydrogen)
 
         prmtop.write("%FLAG DIHEDRALS_WITHOUT_HYDROGEN\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in dihedrals_without_hydrogen])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, dihedrals_without_hydrogen)
 
         prmtop.write("%FLAG EXCLUDED_ATOMS_LIST\n" "%FORMAT(10I8)\n")
-        text_blob = "".join([str(val).rjust(8) for val in excluded_atoms_list])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, excluded_atoms_list)
 
         prmtop.write("%FLAG HBOND_ACOEF\n" "%FORMAT(5E16.8)\n")
         _write_text_blob(prmtop, "")
@@ -745,14 +696,10 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
         _write_text_blob(prmtop, text_blob)
 
         prmtop.write("%FLAG JOIN_ARRAY\n" "%FORMAT(10I8)\n")
-        _ = NATOM * [0]
-        text_blob = "".join([str(val).rjust(8) for val in _])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, np.zeros(NATOM, dtype=np.int64))
 
         prmtop.write("%FLAG IROTAT\n" "%FORMAT(10I8)\n")
-        _ = NATOM * [0]
-        text_blob = "".join([str(val).rjust(8) for val in _])
-        _write_text_blob(prmtop, text_blob)
+        _write_integer_section(prmtop, np.zeros(NATOM, dtype=np.int64))
 
         if IFBOX == 1:
             if (interchange.box.m != np.diag(np.diagonal(interchange.box.m))).any():
@@ -773,26 +720,22 @@ def to_prmtop(interchange: "Interchange", file_path: Path | str):
             box = [90.0]
             for i in range(3):
                 box.append(interchange.box[i, i].m_as(unit.angstrom))  # type: ignore
-            text_blob = "".join([f"{val:16.8E}" for val in box])
-            _write_text_blob(prmtop, text_blob)
+            _write_float_section(prmtop, box)
 
         prmtop.write("%FLAG RADIUS_SET\n" "%FORMAT(1a80)\n")
         prmtop.write("0\n")
 
         prmtop.write("%FLAG RADII\n" "%FORMAT(5E16.8)\n")
-        radii = NATOM * [0]
-        text_blob = "".join([f"{val:16.8E}" for val in radii])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, np.zeros(NATOM))
 
         prmtop.write("%FLAG SCREEN\n" "%FORMAT(5E16.8)\n")
-        screen = NATOM * [0]
-        text_blob = "".join([f"{val:16.8E}" for val in screen])
-        _write_text_blob(prmtop, text_blob)
+        _write_float_section(prmtop, np.zeros(NATOM))
 
         prmtop.write("%FLAG IPOL\n" "%FORMAT(1I8)\n")
         prmtop.write("       0\n")
 
 
+@_profiled("to_inpcrd")
 def to_inpcrd(interchange: "Interchange", file_path: Path | str):
     """
     Write a .prmtop file. See https://ambermd.org/FileFormats.php#restart for details.
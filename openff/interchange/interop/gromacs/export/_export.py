@@ -3,7 +3,7 @@ import warnings
 
 import numpy
 from openff.models.models import DefaultModel
-from openff.toolkit import unit
+from openff.toolkit import Quantity, unit
 
 from openff.interchange.exceptions import MissingPositionsError
 from openff.interchange.interop.gromacs.models.models import (
@@ -16,6 +16,7 @@ from openff.interchange.interop.gromacs.models.models import (
     PeriodicProperDihedral,
     RyckaertBellemansDihedral,
 )
+from openff.interchange.profiling import _profiled
 
 
 class GROMACSWriter(DefaultModel):
@@ -25,6 +26,7 @@ class GROMACSWriter(DefaultModel):
     top_file: pathlib.Path | str | None = None
     gro_file: pathlib.Path | str | None = None
 
+    @_profiled("to_top")
     def to_top(self, _merge_atom_types: bool = False):
         """Write a GROMACS topology file."""
         if self.top_file is None:
@@ -46,6 +48,7 @@ class GROMACSWriter(DefaultModel):
             self._write_system(top)
             self._write_molecules(top)
 
+    @_profiled("to_gro")
     def to_gro(self, decimal: int = 3):
         """Write a GROMACS coordinate file."""
         if self.gro_file is None:
@@ -54,6 +57,22 @@ class GROMACSWriter(DefaultModel):
         with open(self.gro_file, "w") as gro:
             self._write_gro(gro, decimal)
 
+    @_profiled("to_gro_trajectory")
+    def to_gro_trajectory(self, positions: list[Quantity], decimal: int = 3):
+        """
+        Write a GROMACS coordinate file with one frame for each set of positions.
+
+        Each set of positions must include virtual sites, collated as in `.gro` files. The file can be
+        read as a trajectory, i.e. by ``gmx mdrun -rerun``.
+        """
+        if self.gro_file is None:
+            raise ValueError("No GRO file specified.")
+
+        with open(self.gro_file, "w") as gro:
+            for frame in positions:
+                self._write_gro_frame(gro, frame, decimal)
+
+    @_profiled("write_defaults")
     def _write_defaults(self, top):
         top.write("[ defaults ]\n")
         top.write("; nbfunc\tcomb-rule\tgen-pairs\tfudgeLJ\tfudgeQQ\n")
@@ -67,6 +86,7 @@ class GROMACSWriter(DefaultModel):
             f"{self.system.coul_14:8.6f}\n\n",
         )
 
+    @_profiled("write_atomtypes")
     def _write_atomtypes(self, top, merge_atom_types: bool) -> dict[str, str]:
         top.write("[ atomtypes ]\n")
         top.write(
@@ -155,6 +175,7 @@ class GROMACSWriter(DefaultModel):
         top.write("\n")
         return mapping_to_reduced_atom_types
 
+    @_profiled("write_moleculetypes")
     def _write_moleculetypes(
         self,
         top,
@@ -185,6 +206,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_atoms")
     def _write_atoms(
         self,
         top,
@@ -221,6 +243,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_pairs")
     def _write_pairs(self, top, molecule_type):
         top.write("[ pairs ]\n")
         top.write(";ai    aj   funct\n")
@@ -234,6 +257,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_bonds")
     def _write_bonds(self, top, molecule_type):
         top.write("[ bonds ]\n")
         top.write(";ai    aj   funct r k\n")
@@ -253,6 +277,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_angles")
     def _write_angles(self, top, molecule_type):
         top.write("[ angles ]\n")
         top.write(";ai    aj   ak   funct theta  k\n")
@@ -273,6 +298,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_dihedrals")
     def _write_dihedrals(self, top, molecule_type):
         top.write("[ dihedrals ]\n")
         top.write(";ai    aj   ak   al   funct phi  k\n")
@@ -318,6 +344,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_virtual_sites")
     def _write_virtual_sites(self, top, molecule_type):
         # TODO: Collect by type so only one header is used for each per molecule
         for gromacs_virtual_site in molecule_type.virtual_sites:
@@ -366,6 +393,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_exclusions")
     def _write_exclusions(self, top, molecule_type):
         top.write("[ exclusions ]\n")
         top.write(";ai    aj\n")
@@ -383,6 +411,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_settles")
     def _write_settles(self, top, molecule_type):
         top.write("[ settles ]\n")
         top.write(";i  funct   dOH  dHH\n")
@@ -399,6 +428,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_system")
     def _write_system(self, top):
         top.write("[ system ]\n")
         top.write(";name\n")
@@ -407,6 +437,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_molecules")
     def _write_molecules(self, top):
         top.write("[ molecules ]\n")
         top.write(";name\tnumber\n")
@@ -416,6 +447,7 @@ class GROMACSWriter(DefaultModel):
 
         top.write("\n")
 
+    @_profiled("write_gro")
     def _write_gro(self, gro, decimal: int):
         if self.system.positions is None:
             raise MissingPositionsError(
@@ -428,18 +460,21 @@ class GROMACSWriter(DefaultModel):
                 stacklevel=2,
             )
 
+        self._write_gro_frame(gro, self.system.positions, decimal)
+
+    def _write_gro_frame(self, gro, positions: Quantity, decimal: int):
         n_particles = sum(
             len(molecule_type.atoms) * self.system.molecules[molecule_name]
             for molecule_name, molecule_type in self.system.molecule_types.items()
         )
 
-        assert n_particles == self.system.positions.shape[0], (
+        assert n_particles == positions.shape[0], (
             n_particles,
-            self.system.positions.shape[0],
+            positions.shape[0],
         )
 
         # Explicitly round here to avoid ambiguous things in string formatting
-        positions = numpy.round(self.system.positions, decimal).m_as(unit.nanometer)
+        coordinates = numpy.round(positions, decimal).m_as(unit.nanometer)
 
         gro.write("Generated by Interchange\n")
         gro.write(f"{n_particles}\n")
@@ -460,9 +495,9 @@ class GROMACSWriter(DefaultModel):
                             atom.residue_name[:5],
                             atom.name[:5],
                             (count + 1) % 100000,
-                            positions[count, 0],
-                            positions[count, 1],
-                            positions[count, 2],
+                            coordinates[count, 0],
+                            coordinates[count, 1],
+                            coordinates[count, 2],
                         ),
                     )
 
@@ -9,8 +9,10 @@ from openff.toolkit.topology.molecule import Atom, unit
 from openff.interchange import Interchange
 from openff.interchange.exceptions import UnsupportedExportError
 from openff.interchange.models import PotentialKey
+from openff.interchange.profiling import _profiled
 
 
+@_profiled("to_lammps")
 def to_lammps(interchange: Interchange, file_path: Path | str):
     """Write an Interchange object to a LAMMPS data file."""
     if isinstance(file_path, str):
@@ -137,6 +139,7 @@ def to_lammps(interchange: Interchange, file_path: Path | str):
             _write_impropers(lmp_file=lmp_file, interchange=interchange)
 
 
+@_profiled("write_pair_coeffs")
 def _write_pair_coeffs(lmp_file: IO, interchange: Interchange, atom_type_map: dict):
     """Write the Pair Coeffs section of a LAMMPS data file."""
     lmp_file.write("Pair Coeffs\n\n")
@@ -154,6 +157,7 @@ def _write_pair_coeffs(lmp_file: IO, interchange: Interchange, atom_type_map: di
     lmp_file.write("\n")
 
 
+@_profiled("write_bond_coeffs")
 def _write_bond_coeffs(lmp_file: IO, interchange: Interchange):
     """Write the Bond Coeffs section of a LAMMPS data file."""
     lmp_file.write("Bond Coeffs\n\n")
@@ -173,6 +177,7 @@ def _write_bond_coeffs(lmp_file: IO, interchange: Interchange):
     lmp_file.write("\n")
 
 
+@_profiled("write_angle_coeffs")
 def _write_angle_coeffs(lmp_file: IO, interchange: Interchange):
     """Write the Angle Coeffs section of a LAMMPS data file."""
     lmp_file.write("\nAngle Coeffs\n\n")
@@ -192,6 +197,7 @@ def _write_angle_coeffs(lmp_file: IO, interchange: Interchange):
     lmp_file.write("\n")
 
 
+@_profiled("write_proper_coeffs")
 def _write_proper_coeffs(lmp_file: IO, interchange: Interchange):
     """Write the Dihedral Coeffs section of a LAMMPS data file."""
     lmp_file.write("\nDihedral Coeffs\n\n")
@@ -215,6 +221,7 @@ def _write_proper_coeffs(lmp_file: IO, interchange: Interchange):
     lmp_file.write("\n")
 
 
+@_profiled("write_improper_coeffs")
 def _write_improper_coeffs(lmp_file: IO, interchange: Interchange):
     """Write the Improper Coeffs section of a LAMMPS data file."""
     lmp_file.write("\nImproper Coeffs\n\n")
@@ -265,6 +272,7 @@ def _write_improper_coeffs(lmp_file: IO, interchange: Interchange):
     lmp_file.write("\n")
 
 
+@_profiled("write_atoms")
 def _write_atoms(lmp_file: IO, interchange: Interchange, atom_type_map: dict):
     """Write the Atoms section of a LAMMPS data file."""
     lmp_file.write("\nAtoms\n\n")
@@ -338,6 +346,7 @@ def _write_atoms(lmp_file: IO, interchange: Interchange, atom_type_map: dict):
 # appears to be spent looking up the LAMMPS "type" index from the potential key.
 # (bond_map[pot_key]). Not sure why - I thought dictionary lookups were always
 # fast - but it might be worth looking into.
+@_profiled("write_bonds")
 def _write_bonds(lmp_file: IO, interchange: Interchange):
     """Write the Bonds section of a LAMMPS data file."""
     lmp_file.write("\nBonds\n\n")
@@ -361,6 +370,7 @@ def _write_bonds(lmp_file: IO, interchange: Interchange):
         )
 
 
+@_profiled("write_angles")
 def _write_angles(lmp_file: IO, interchange: Interchange):
     """Write the Angles section of a LAMMPS data file."""
     lmp_file.write("\nAngles\n\n")
@@ -385,6 +395,7 @@ def _write_angles(lmp_file: IO, interchange: Interchange):
         )
 
 
+@_profiled("write_propers")
 def _write_propers(lmp_file: IO, interchange: Interchange):
     """Write the Dihedrals section of a LAMMPS data file."""
     lmp_file.write("\nDihedrals\n\n")
@@ -410,6 +421,7 @@ def _write_propers(lmp_file: IO, interchange: Interchange):
         )
 
 
+@_profiled("write_impropers")
 def _write_impropers(lmp_file: IO, interchange: Interchange):
     """Write the Impropers section of a LAMMPS data file."""
     lmp_file.write("\nImpropers\n\n")
@@ -13,6 +13,7 @@ from openff.interchange.exceptions import (
 from openff.interchange.interop.openmm._import._import import from_openmm
 from openff.interchange.interop.openmm._positions import to_openmm_positions
 from openff.interchange.interop.openmm._topology import to_openmm_topology
+from openff.interchange.profiling import _count, _profiled
 
 if has_package("openmm"):
     import openmm
@@ -30,6 +31,7 @@ __all__ = [
 
 
 @requires_package("openmm")
+@_profiled("to_openmm_system")
 def to_openmm_system(
     interchange: "Interchange",
     combine_nonbonded_forces: bool = False,
@@ -140,6 +142,8 @@ def to_openmm_system(
             except NotImplementedError:
                 continue
 
+    _count(particles=system.getNumParticles(), forces=system.getNumForces())
+
     return system
 
 
@@ -170,6 +174,7 @@ def _to_pdb(
 
 
 @requires_package("openmm")
+@_profiled("apply_hmr")
 def _apply_hmr(
     system: "openmm.System",
     interchange: "Interchange",
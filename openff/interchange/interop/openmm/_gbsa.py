@@ -2,11 +2,13 @@ from openff.utilities.utilities import has_package
 
 from openff.interchange import Interchange
 from openff.interchange.exceptions import UnsupportedExportError
+from openff.interchange.profiling import _profiled
 
 if has_package("openmm"):
     import openmm
 
 
+@_profiled("process_gbsa")
 def _process_gbsa(
     interchange: "Interchange",
     system: "openmm.System",
@@ -6,12 +6,14 @@ import itertools
 from collections import defaultdict
 from typing import DefaultDict, NamedTuple, Optional
 
+import numpy
 from openff.toolkit import Molecule, unit
 from openff.units.openmm import to_openmm as to_openmm_quantity
 from openff.utilities.utilities import has_package
 
 from openff.interchange import Interchange
 from openff.interchange.common._nonbonded import ElectrostaticsCollection, vdWCollection
+from openff.interchange.components._graph import BondGraph, _get_bond_array
 from openff.interchange.constants import _PME
 from openff.interchange.exceptions import (
     CannotSetSwitchingFunctionError,
@@ -25,6 +27,7 @@ from openff.interchange.models import (
     TopologyKey,
     VirtualSiteKey,
 )
+from openff.interchange.profiling import _profiled
 
 if has_package("openmm"):
     import openmm
@@ -49,6 +52,7 @@ class _NonbondedData(NamedTuple):
     periodic: bool
 
 
+@_profiled("process_nonbonded_forces")
 def _process_nonbonded_forces(
     interchange: "Interchange",
     system: openmm.System,
@@ -159,6 +163,7 @@ def _process_nonbonded_forces(
     return openff_openmm_particle_map
 
 
+@_profiled("add_particles_to_system")
 def _add_particles_to_system(
     interchange: "Interchange",
     system: openmm.System,
@@ -218,6 +223,7 @@ def _add_particles_to_system(
     return particle_map
 
 
+@_profiled("prepare_input_data")
 def _prepare_input_data(interchange: "Interchange") -> _NonbondedData:
     try:
         vdw: "vdWCollection" = interchange["vdW"]
@@ -276,6 +282,7 @@ def _prepare_input_data(interchange: "Interchange") -> _NonbondedData:
     )
 
 
+@_profiled("create_single_nonbonded_force")
 def _create_single_nonbonded_force(
     data: _NonbondedData,
     interchange: "Interchange",
@@ -479,6 +486,7 @@ def _create_single_nonbonded_force(
     _apply_switching_function(data.vdw_collection, non_bonded_force)
 
 
+@_profiled("create_exceptions")
 def _create_exceptions(
     data: _NonbondedData,
     non_bonded_force: openmm.NonbondedForce,
@@ -487,13 +495,12 @@ def _create_exceptions(
     parent_virtual_particle_mapping: DefaultDict[int, list[int]],
 ):
     # The topology indices reported by toolkit methods must be converted to openmm indices
-    bonds = [
-        sorted(
-            openff_openmm_particle_map[interchange.topology.atom_index(a)]
-            for a in bond.atoms
-        )
-        for bond in interchange.topology.bonds
-    ]
+    bonds = numpy.sort(
+        _get_atom_particle_indices(interchange, openff_openmm_particle_map)[
+            _get_bond_array(interchange.topology)
+        ],
+        axis=1,
+    ).tolist()
 
     coul_14 = getattr(data.electrostatics_collection, "scale_14", 1.0)
     vdw_14 = getattr(data.vdw_collection, "scale_14", 1.0)
@@ -570,6 +577,7 @@ def _create_exceptions(
                     _add_zeroed_exception(non_bonded_force, v1, v2)
 
 
+@_profiled("create_multiple_nonbonded_forces")
 def _create_multiple_nonbonded_forces(
     data: _NonbondedData,
     interchange: "Interchange",
@@ -578,7 +586,6 @@ def _create_multiple_nonbonded_forces(
     molecule_virtual_site_map: dict,
     openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
 ):
-    from openff.interchange.components.toolkit import _get_14_pairs
 
     if molecule_virtual_site_map in (None, dict()):
         has_virtual_sites = False
@@ -665,26 +672,19 @@ def _create_multiple_nonbonded_forces(
 
     coul_14, vdw_14 = _get_14_scaling_factors(data)
 
-    openmm_pairs = list()
-
-    for atom1, atom2 in _get_14_pairs(interchange.topology):
-        openff_indices = (
-            interchange.topology.atom_index(atom1),
-            interchange.topology.atom_index(atom2),
-        )
-
-        openmm_indices = (
-            openff_openmm_particle_map[openff_indices[0]],
-            openff_openmm_particle_map[openff_indices[1]],
-        )
-
-        openmm_pairs.append(openmm_indices)
+    openmm_pairs: set[tuple[int, int]] = {
+        (p1, p2)
+        for pair in _get_atom_particle_indices(interchange, openff_openmm_particle_map)[
+            BondGraph.from_topology(interchange.topology).get_pairs_at_distance(3)
+        ].tolist()
+        for p1, p2 in (pair, pair[::-1])
+    }
 
     if electrostatics_force is not None:
         for i in range(electrostatics_force.getNumExceptions()):
             (p1, p2, _, _, _) = electrostatics_force.getExceptionParameters(i)
 
-            if (p1, p2) in openmm_pairs or (p2, p1) in openmm_pairs:
+            if (p1, p2) in openmm_pairs:
                 if vdw_force is not None:
                     if data.vdw_collection.is_plugin:
                         # Since we fed in in r_min1, epsilon1, ..., r_min2, epsilon2, ...
@@ -746,6 +746,7 @@ def _create_multiple_nonbonded_forces(
             )
 
 
+@_profiled("create_vdw_force")
 def _create_vdw_force(
     data: _NonbondedData,
     interchange: "Interchange",
@@ -836,6 +837,7 @@ def _create_vdw_force(
     return vdw_force
 
 
+@_profiled("create_electrostatics_force")
 def _create_electrostatics_force(
     data: _NonbondedData,
     interchange: "Interchange",
@@ -915,145 +917,154 @@ def _create_electrostatics_force(
     return electrostatics_force
 
 
-def _set_particle_parameters(
-    data: _NonbondedData,
-    vdw_force: openmm.CustomNonbondedForce,
-    electrostatics_force: openmm.NonbondedForce,
+def _get_atom_particle_indices(
     interchange: "Interchange",
-    has_virtual_sites: bool,
-    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]],
     openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
-):
-    if electrostatics_force is not None:
-        electrostatics: ElectrostaticsCollection = data.electrostatics_collection
+) -> numpy.ndarray:
+    """Return the OpenMM particle index of each atom, indexed by topology atom index."""
+    return numpy.fromiter(
+        (
+            openff_openmm_particle_map[atom_index]
+            for atom_index in range(interchange.topology.n_atoms)
+        ),
+        dtype=numpy.int64,
+        count=interchange.topology.n_atoms,
+    )
 
-        partial_charges = electrostatics.charges
 
-    else:
-        partial_charges = None
+def _get_charge_arrays(
+    partial_charges: dict[TopologyKey | VirtualSiteKey, unit.Quantity],
+    n_atoms: int,
+) -> tuple[numpy.ndarray, dict[VirtualSiteKey, float]]:
+    """
+    Return the partial charges, in units of the elementary charge, of each atom and virtual site.
 
-    vdw: "vdWCollection" = data.vdw_collection
+    Charges usually share one unit, so the conversion factor is computed once per distinct unit
+    instead of converting each charge individually.
+    """
+    atom_charges = numpy.zeros(n_atoms)
+    virtual_site_charges: dict[VirtualSiteKey, float] = dict()
 
-    for molecule in interchange.topology.molecules:
-        for atom in molecule.atoms:
-            atom_index = interchange.topology.atom_index(atom)
-            particle_index = openff_openmm_particle_map[atom_index]
-            # TODO: Actually process virtual site vdW parameters here
+    conversion_factors: dict = dict()
 
-            top_key = TopologyKey(atom_indices=(atom_index,))
+    for key, charge in partial_charges.items():
+        charge_units = charge.units
 
-            if partial_charges is not None:
-                partial_charge = partial_charges[top_key].m_as(unit.e)
-            else:
-                partial_charge = 0.0
+        if charge_units not in conversion_factors:
+            conversion_factors[charge_units] = unit.Quantity(1.0, charge_units).m_as(
+                unit.elementary_charge,
+            )
 
-            if vdw is not None:
-                pot_key = vdw.key_map[top_key]
+        value = charge.m * conversion_factors[charge_units]
 
-                if vdw.is_plugin:
-                    parameters = vdw.potentials[pot_key].parameters
+        if type(key) is VirtualSiteKey:
+            virtual_site_charges[key] = value
+        else:
+            atom_charges[key.atom_indices[0]] = value
+
+    return atom_charges, virtual_site_charges
 
-                    if hasattr(vdw, "modify_parameters"):
-                        # This method stripsopenmm.units ..
-                        parameters = vdw.modify_parameters(parameters)
-                    else:
-                        # so manually strip them if the method is not present
-                        parameters = {key: val.m for key, val in parameters.items()}
 
-                else:
-                    sigma = vdw.potentials[pot_key].parameters["sigma"]
-                    epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+def _get_vdw_parameters_by_potential(vdw: "vdWCollection") -> dict:
+    """Return the (unitless) parameters of each vdW potential, as passed to `setParticleParameters`."""
+    parameters_by_potential = dict()
 
-                    sigma = sigma.m_as(unit.nanometer)
-                    epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
+    for potential_key, potential in vdw.potentials.items():
+        if vdw.is_plugin:
+            if hasattr(vdw, "modify_parameters"):
+                # This method strips openmm.units ..
+                parameters = vdw.modify_parameters(potential.parameters)
             else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
+                # so manually strip them if the method is not present
+                parameters = {key: val.m for key, val in potential.parameters.items()}
 
-            if vdw_force is not None:
-                if vdw.is_plugin:
-                    vdw_force.setParticleParameters(
-                        particle_index,
-                        [*parameters.values()],
-                    )
-                    del parameters
-                else:
-                    vdw_force.setParticleParameters(particle_index, [sigma, epsilon])
+            parameters_by_potential[potential_key] = [*parameters.values()]
 
-            if electrostatics_force is not None:
-                electrostatics_force.setParticleParameters(
-                    particle_index,
-                    partial_charge,
-                    0.0,
-                    0.0,
-                )
+        else:
+            parameters_by_potential[potential_key] = [
+                potential.parameters["sigma"].m_as(unit.nanometer),
+                potential.parameters["epsilon"].m_as(unit.kilojoule / unit.mol),
+            ]
 
-        for virtual_site_key in molecule_virtual_site_map[
-            interchange.topology.molecule_index(molecule)
-        ]:
-            particle_index = openff_openmm_particle_map[virtual_site_key]
+    return parameters_by_potential
 
-            if vdw is not None:
-                pot_key = vdw.key_map[virtual_site_key]
 
-                if vdw.is_plugin:
-                    parameters = vdw.potentials[pot_key].parameters
+def _set_particle_parameters(
+    data: _NonbondedData,
+    vdw_force: openmm.CustomNonbondedForce,
+    electrostatics_force: openmm.NonbondedForce,
+    interchange: "Interchange",
+    has_virtual_sites: bool,
+    molecule_virtual_site_map: dict[int, list[VirtualSiteKey]],
+    openff_openmm_particle_map: dict[int | VirtualSiteKey, int],
+):
+    n_atoms = interchange.topology.n_atoms
 
-                    if hasattr(vdw, "modify_parameters"):
-                        # This method strips openmm.units ..
+    atom_particle_indices: list[int] = _get_atom_particle_indices(
+        interchange,
+        openff_openmm_particle_map,
+    ).tolist()
 
-                        parameters = vdw.modify_parameters(parameters)
+    if electrostatics_force is not None:
+        electrostatics: ElectrostaticsCollection = data.electrostatics_collection
 
-                    else:
-                        # so manually strip them if the method is not present
-                        parameters = {key: val.m for key, val in parameters.items()}
-
-                    # a non-LJ vdW interaction might be mixed with virtual site parameters that have
-                    # zeroed-out sigma and epsilon; in this case
-                    if {tuple(vdw.potentials[pot_key].parameters.keys())} != {
-                        vdw.potential_parameters(),
-                    }:
-                        parameters = {
-                            key: val
-                            for key, val in zip(
-                                vdw.potential_parameters(),
-                                vdw.default_parameter_values(),
-                            )
-                        }
+        atom_charges, virtual_site_charges = _get_charge_arrays(
+            electrostatics.charges,
+            n_atoms,
+        )
 
-                else:
-                    sigma = vdw.potentials[pot_key].parameters["sigma"]
-                    epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+        for particle_index, partial_charge in zip(
+            atom_particle_indices,
+            atom_charges.tolist(),
+        ):
+            electrostatics_force.setParticleParameters(
+                particle_index,
+                partial_charge,
+                0.0,
+                0.0,
+            )
 
-                    sigma = sigma.m_as(unit.nanometer)
-                    epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
-            else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
+        for virtual_site_key, partial_charge in virtual_site_charges.items():
+            electrostatics_force.setParticleParameters(
+                openff_openmm_particle_map[virtual_site_key],
+                partial_charge,
+                0.0,
+                0.0,
+            )
 
-            if vdw_force is not None:
+    vdw: "vdWCollection" = data.vdw_collection
 
-                # TODO: Refactor getting the "vdW" parameters by particle index into
-                #       a common function
+    if vdw_force is None or vdw is None:
+        return
 
-                if vdw.is_plugin:
-                    vdw_force.setParticleParameters(
-                        particle_index,
-                        [*parameters.values()],
-                    )
-                else:
-                    vdw_force.setParticleParameters(particle_index, [sigma, epsilon])
+    # Convert the parameters of each potential once, then look them up for each particle
+    parameters_by_potential = _get_vdw_parameters_by_potential(vdw)
 
-            partial_charge = partial_charges[virtual_site_key].m_as(unit.e)
+    # TODO: Actually process virtual site vdW parameters here
+    for topology_key, potential_key in vdw.key_map.items():
+        if type(topology_key) is VirtualSiteKey:
+            particle_index = openff_openmm_particle_map[topology_key]
 
-            if electrostatics_force is not None:
-                electrostatics_force.setParticleParameters(
+            # a non-LJ vdW interaction might be mixed with virtual site parameters that have
+            # zeroed-out sigma and epsilon; in this case
+            if vdw.is_plugin and {
+                tuple(vdw.potentials[potential_key].parameters.keys()),
+            } != {vdw.potential_parameters()}:
+                vdw_force.setParticleParameters(
                     particle_index,
-                    partial_charges[virtual_site_key].m_as(unit.e),
-                    0.0,
-                    0.0,
+                    [*vdw.default_parameter_values()],
                 )
 
+                continue
+
+        else:
+            particle_index = atom_particle_indices[topology_key.atom_indices[0]]
+
+        vdw_force.setParticleParameters(
+            particle_index,
+            parameters_by_potential[potential_key],
+        )
+
 
 def _get_14_scaling_factors(data: _NonbondedData) -> tuple[float, float]:
     if data.electrostatics_collection is None:
@@ -0,0 +1,479 @@
+"""
+Helper functions for updating the parameters of `openmm.Force` objects created from an Interchange.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy
+from openff.units.openmm import to_openmm as to_openmm_quantity
+from openff.utilities.utilities import has_package
+
+from openff.interchange.components._graph import BondGraph
+from openff.interchange.exceptions import (
+    InternalInconsistencyError,
+    UnsupportedExportError,
+)
+from openff.interchange.interop.openmm._nonbonded import (
+    _get_atom_particle_indices,
+    _get_charge_arrays,
+    _get_vdw_parameters_by_potential,
+)
+from openff.interchange.interop.openmm._valence import (
+    _get_angle_parameters,
+    _get_bond_parameters,
+    _get_improper_torsion_parameters,
+    _get_proper_torsion_parameters,
+    _get_rb_torsion_parameters,
+)
+from openff.interchange.models import PotentialKey, TopologyKey
+
+if has_package("openmm"):
+    import openmm
+
+if TYPE_CHECKING:
+    from openff.interchange import Interchange
+
+
+class _Term(NamedTuple):
+    """A term of a force, by its index in the force and the particles it acts on."""
+
+    term_index: int
+    particles: tuple[int, ...]
+
+
+class _ValenceTerms(NamedTuple):
+    """The terms of a force created from a valence collection, grouped by potential key."""
+
+    force: "openmm.Force"
+    terms: dict[PotentialKey, list[_Term]]
+
+
+class _NonbondedTerms(NamedTuple):
+    """The forces created from the vdW and Electrostatics collections, and their 1-4 terms."""
+
+    vdw_force: "openmm.Force | None"
+    electrostatics_force: "openmm.Force | None"
+    vdw_14_force: "openmm.Force | None"
+    electrostatics_14_force: "openmm.Force | None"
+    pairs_14: list[_Term]
+    pairs_by_particle: dict[int, list[int]]
+    charges: numpy.ndarray
+    sigmas: numpy.ndarray
+    epsilons: numpy.ndarray
+
+
+# The methods to count and read the terms of each valence force, and the number of particles in each term
+_GETTERS: dict[str, tuple[str, str, int]] = {
+    "Bonds": ("getNumBonds", "getBondParameters", 2),
+    "Angles": ("getNumAngles", "getAngleParameters", 3),
+    "ProperTorsions": ("getNumTorsions", "getTorsionParameters", 4),
+    "ImproperTorsions": ("getNumTorsions", "getTorsionParameters", 4),
+    "RBTorsions": ("getNumTorsions", "getTorsionParameters", 4),
+}
+
+_SETTERS: dict[str, str] = {
+    "Bonds": "setBondParameters",
+    "Angles": "setAngleParameters",
+    "ProperTorsions": "setTorsionParameters",
+    "ImproperTorsions": "setTorsionParameters",
+    "RBTorsions": "setTorsionParameters",
+}
+
+
+def _check_supported(interchange: "Interchange"):
+    virtual_sites = interchange.collections.get("VirtualSites", None)
+
+    if virtual_sites is not None and len(virtual_sites.key_map) > 0:
+        raise UnsupportedExportError(
+            "Updating parameters in an OpenMM context with virtual sites is not supported.",
+        )
+
+    for collection in interchange.collections.values():
+        if collection.is_plugin:
+            raise UnsupportedExportError(
+                f"Updating parameters in an OpenMM context is not supported with plugins, found {collection.type}.",
+            )
+
+
+def _get_valence_force(
+    system: "openmm.System",
+    name: str,
+    expression: str,
+) -> "openmm.Force | None":
+    """Return the force created from a valence collection, which is the first force of its type."""
+    if name == "Bonds":
+        force_type = openmm.HarmonicBondForce
+    elif name == "Angles":
+        force_type = (
+            openmm.HarmonicAngleForce
+            if expression == "k/2*(theta-angle)**2"
+            else openmm.CustomAngleForce
+        )
+    elif name == "RBTorsions":
+        force_type = openmm.RBTorsionForce
+    else:
+        force_type = openmm.PeriodicTorsionForce
+
+    for force in system.getForces():
+        if type(force) is force_type:
+            return force
+
+    return None
+
+
+def _match_terms(
+    keys: Iterator[tuple[str, TopologyKey, PotentialKey]],
+    force: "openmm.Force",
+    n_particles: int,
+    getter: str,
+    n_terms: int,
+    particle_map: dict,
+) -> Iterator[tuple[str, PotentialKey, _Term]]:
+    """
+    Match each term of a force to the key it was created from.
+
+    Terms are added in the order of the key map, possibly skipping some keys (i.e. of constrained bonds),
+    so the terms and keys are each walked through only once.
+    """
+    for index in range(n_terms):
+        particles = tuple(getattr(force, getter)(index)[:n_particles])
+
+        for name, topology_key, potential_key in keys:
+            if tuple(particle_map[i] for i in topology_key.atom_indices) == particles:
+                yield name, potential_key, _Term(index, particles)
+                break
+        else:
+            raise InternalInconsistencyError(
+                f"Could not match term {index} of {force.__class__.__name__}, acting on particles {particles}, "
+                "to a topology key.",
+            )
+
+
+def _get_valence_terms(
+    interchange: "Interchange",
+    system: "openmm.System",
+    particle_map: dict,
+) -> dict[str, _ValenceTerms]:
+    """Return the terms of the valence forces in a system, grouped by collection name and potential key."""
+    valence_terms: dict[str, _ValenceTerms] = dict()
+
+    # Propers and impropers are added to the same force, propers first
+    for group in (
+        ("Bonds",),
+        ("Angles",),
+        ("ProperTorsions", "ImproperTorsions"),
+        ("RBTorsions",),
+    ):
+        names = [name for name in group if name in interchange.collections]
+
+        if not names:
+            continue
+
+        force = _get_valence_force(system, names[0], interchange[names[0]].expression)
+
+        if force is None:
+            continue
+
+        counter, getter, n_particles = _GETTERS[names[0]]
+
+        keys = (
+            (name, topology_key, potential_key)
+            for name in names
+            for topology_key, potential_key in interchange[name].key_map.items()
+        )
+
+        for name in names:
+            valence_terms[name] = _ValenceTerms(force, defaultdict(list))
+
+        for name, potential_key, term in _match_terms(
+            keys,
+            force,
+            n_particles,
+            getter,
+            getattr(force, counter)(),
+            particle_map,
+        ):
+            valence_terms[name].terms[potential_key].append(term)
+
+    return valence_terms
+
+
+def _set_valence_parameters(
+    interchange: "Interchange",
+    name: str,
+    valence_terms: _ValenceTerms,
+    potential_keys: Iterable[PotentialKey],
+):
+    """Set the parameters of the terms of a valence force which use the given potentials."""
+    collection = interchange[name]
+    setter = getattr(valence_terms.force, _SETTERS[name])
+
+    for potential_key in potential_keys:
+        parameters = collection.potentials[potential_key].parameters
+
+        if name == "Bonds":
+            values: tuple = _get_bond_parameters(parameters)
+        elif name == "Angles":
+            if isinstance(valence_terms.force, openmm.CustomAngleForce):
+                keys = collection.potential_parameters()
+                values = ([to_openmm_quantity(parameters[key]) for key in keys],)
+            else:
+                values = _get_angle_parameters(parameters)
+        elif name == "ProperTorsions":
+            values = _get_proper_torsion_parameters(parameters)
+        elif name == "ImproperTorsions":
+            values = _get_improper_torsion_parameters(parameters)
+        else:
+            values = _get_rb_torsion_parameters(parameters)
+
+        for term in valence_terms.terms.get(potential_key, ()):
+            setter(term.term_index, *term.particles, *values)
+
+
+def _get_constraint_terms(
+    interchange: "Interchange",
+    system: "openmm.System",
+    particle_map: dict,
+) -> dict[PotentialKey, list[_Term]]:
+    """Return the constraints in a system, grouped by potential key."""
+    terms: dict[PotentialKey, list[_Term]] = defaultdict(list)
+
+    if "Constraints" not in interchange.collections:
+        return terms
+
+    key_map = interchange["Constraints"].key_map
+    keys = (("Constraints", *item) for item in key_map.items())
+
+    for _, potential_key, term in _match_terms(
+        keys,
+        system,
+        2,
+        "getConstraintParameters",
+        system.getNumConstraints(),
+        particle_map,
+    ):
+        terms[potential_key].append(term)
+
+    return terms
+
+
+def _get_nonbonded_terms(
+    interchange: "Interchange",
+    system: "openmm.System",
+    particle_map: dict,
+    combine_nonbonded_forces: bool,
+) -> _NonbondedTerms:
+    """Return the non-bonded forces of a system, their 1-4 terms, and the parameters of each particle."""
+    n_atoms = interchange.topology.n_atoms
+
+    forces = {force.getName(): force for force in system.getForces()}
+
+    if combine_nonbonded_forces:
+        vdw_force = electrostatics_force = forces.get("Nonbonded force", None)
+        vdw_14_force = electrostatics_14_force = None
+    else:
+        vdw_force = forces.get("vdW force", None)
+        electrostatics_force = forces.get("Electrostatics force", None)
+        vdw_14_force = forces.get("vdW 1-4 force", None)
+        electrostatics_14_force = forces.get("Electrostatics 1-4 force", None)
+
+    atom_particle_indices = _get_atom_particle_indices(interchange, particle_map)
+
+    pairs_14: list[_Term] = list()
+
+    if combine_nonbonded_forces:
+        if vdw_force is not None:
+            graph = BondGraph.from_topology(interchange.topology)
+            atom_pairs = graph.get_pairs_at_distance(3)
+
+            pairs = {
+                (p1, p2)
+                for pair in atom_particle_indices[atom_pairs].tolist()
+                for p1, p2 in (pair, pair[::-1])
+            }
+
+            for index in range(vdw_force.getNumExceptions()):
+                p1, p2, *_ = vdw_force.getExceptionParameters(index)
+
+                if (p1, p2) in pairs:
+                    pairs_14.append(_Term(index, (p1, p2)))
+
+    else:
+        # Both 1-4 forces, if present, have a bond for each 1-4 pair in the same order
+        force_14 = electrostatics_14_force
+
+        if force_14 is None:
+            force_14 = vdw_14_force
+
+        if force_14 is not None:
+            for index in range(force_14.getNumBonds()):
+                p1, p2, _ = force_14.getBondParameters(index)
+                pairs_14.append(_Term(index, (p1, p2)))
+
+    pairs_by_particle: dict[int, list[int]] = defaultdict(list)
+
+    for position, term in enumerate(pairs_14):
+        for particle in term.particles:
+            pairs_by_particle[particle].append(position)
+
+    charges = numpy.zeros(n_atoms)
+    sigmas = numpy.zeros(n_atoms)
+    epsilons = numpy.zeros(n_atoms)
+
+    if "Electrostatics" in interchange.collections:
+        electrostatics = interchange["Electrostatics"]
+        atom_charges, _ = _get_charge_arrays(electrostatics.charges, n_atoms)
+
+        charges[atom_particle_indices] = atom_charges
+
+    if "vdW" in interchange.collections:
+        vdw = interchange["vdW"]
+        parameters_by_potential = _get_vdw_parameters_by_potential(vdw)
+
+        for topology_key, potential_key in vdw.key_map.items():
+            particle = atom_particle_indices[topology_key.atom_indices[0]]
+            sigma, epsilon = parameters_by_potential[potential_key]
+            sigmas[particle], epsilons[particle] = sigma, epsilon
+
+    return _NonbondedTerms(
+        vdw_force=vdw_force,
+        electrostatics_force=electrostatics_force,
+        vdw_14_force=vdw_14_force,
+        electrostatics_14_force=electrostatics_14_force,
+        pairs_14=pairs_14,
+        pairs_by_particle=pairs_by_particle,
+        charges=charges,
+        sigmas=sigmas,
+        epsilons=epsilons,
+    )
+
+
+def _set_nonbonded_parameters(
+    interchange: "Interchange",
+    nonbonded_terms: _NonbondedTerms,
+    particle_map: dict,
+    vdw_potential_keys: Iterable[PotentialKey],
+    update_charges: bool,
+    combine_nonbonded_forces: bool,
+) -> set["openmm.Force"]:
+    """
+    Set the parameters of particles whose vdW potentials or charges changed, and of their 1-4 terms.
+
+    Returns the forces which were modified.
+    """
+    charges = nonbonded_terms.charges
+    sigmas = nonbonded_terms.sigmas
+    epsilons = nonbonded_terms.epsilons
+
+    changed: set[int] = set()
+
+    if update_charges and "Electrostatics" in interchange.collections:
+        electrostatics = interchange["Electrostatics"]
+        electrostatics._charges_cached = False
+
+        n_atoms = interchange.topology.n_atoms
+        atom_charges, _ = _get_charge_arrays(electrostatics.charges, n_atoms)
+
+        atom_particle_indices = _get_atom_particle_indices(interchange, particle_map)
+
+        new_charges = numpy.zeros_like(charges)
+        new_charges[atom_particle_indices] = atom_charges
+
+        changed.update(numpy.flatnonzero(new_charges != charges).tolist())
+        charges[:] = new_charges
+
+    vdw_potential_keys = list(vdw_potential_keys)
+
+    if vdw_potential_keys:
+        vdw = interchange["vdW"]
+        parameters_by_potential = _get_vdw_parameters_by_potential(vdw)
+
+        for potential_key in vdw_potential_keys:
+            for topology_key in vdw.get_keys_by_potential_key(potential_key):
+                particle = particle_map[topology_key.atom_indices[0]]
+                sigma, epsilon = parameters_by_potential[potential_key]
+                sigmas[particle], epsilons[particle] = sigma, epsilon
+                changed.add(particle)
+
+    if not changed:
+        return set()
+
+    vdw_force = nonbonded_terms.vdw_force
+    electrostatics_force = nonbonded_terms.electrostatics_force
+    vdw_14_force = nonbonded_terms.vdw_14_force
+    electrostatics_14_force = nonbonded_terms.electrostatics_14_force
+
+    # When combined, a single NonbondedForce stores both vdW and electrostatics
+    nonbonded_force = vdw_force if combine_nonbonded_forces else None
+
+    modified: set[openmm.Force] = set()
+
+    for particle in sorted(changed):
+        if nonbonded_force is not None:
+            nonbonded_force.setParticleParameters(
+                particle,
+                charges[particle],
+                sigmas[particle],
+                epsilons[particle],
+            )
+            modified.add(nonbonded_force)
+        else:
+            if electrostatics_force is not None:
+                electrostatics_force.setParticleParameters(
+                    particle,
+                    charges[particle],
+                    0.0,
+                    0.0,
+                )
+                modified.add(electrostatics_force)
+            if vdw_force is not None:
+                vdw_force.setParticleParameters(
+                    particle,
+                    [sigmas[particle], epsilons[particle]],
+                )
+                modified.add(vdw_force)
+
+    coul_14 = getattr(
+        interchange.collections.get("Electrostatics", None),
+        "scale_14",
+        1.0,
+    )
+    vdw_14 = getattr(interchange.collections.get("vdW", None), "scale_14", 1.0)
+    mixing_rule = getattr(
+        interchange.collections.get("vdW", None),
+        "mixing_rule",
+        "lorentz-berthelot",
+    )
+
+    positions = {
+        position
+        for particle in changed
+        for position in nonbonded_terms.pairs_by_particle[particle]
+    }
+
+    for position in sorted(positions):
+        index, (p1, p2) = nonbonded_terms.pairs_14[position]
+
+        qq = charges[p1] * charges[p2] * coul_14
+        eps_14 = (epsilons[p1] * epsilons[p2]) ** 0.5 * vdw_14
+
+        if mixing_rule == "geometric":
+            sig_14 = (sigmas[p1] * sigmas[p2]) ** 0.5
+        else:
+            sig_14 = (sigmas[p1] + sigmas[p2]) * 0.5
+
+        if nonbonded_force is not None:
+            nonbonded_force.setExceptionParameters(index, p1, p2, qq, sig_14, eps_14)
+            continue
+
+        if electrostatics_14_force is not None:
+            electrostatics_14_force.setBondParameters(index, p1, p2, [qq])
+            modified.add(electrostatics_14_force)
+
+        if vdw_14_force is not None:
+            vdw_14_force.setBondParameters(index, p1, p2, [sig_14, eps_14])
+            modified.add(vdw_14_force)
+
+    return modified
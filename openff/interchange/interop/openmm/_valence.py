@@ -10,11 +10,74 @@ from openff.utilities.utilities import has_package
 
 from openff.interchange.exceptions import UnsupportedExportError
 from openff.interchange.models import VirtualSiteKey
+from openff.interchange.profiling import _profiled
 
 if has_package("openmm"):
     import openmm
 
 
+def _get_bond_parameters(parameters: dict) -> tuple[float, float]:
+    """Return the (unitless) length and force constant of a bond, as passed to `addBond`."""
+    return (
+        parameters["length"].m_as(off_unit.nanometer),
+        parameters["k"].m_as(off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol),
+    )
+
+
+def _get_angle_parameters(parameters: dict) -> tuple[float, float]:
+    """Return the (unitless) angle and force constant of a harmonic angle, as passed to `addAngle`."""
+    return (
+        parameters["angle"].m_as(off_unit.radian),
+        parameters["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol),
+    )
+
+
+def _get_proper_torsion_parameters(parameters: dict) -> tuple[int, float, float]:
+    """Return the periodicity, phase, and (divided) force constant of a proper torsion, as passed to `addTorsion`."""
+    k = parameters["k"].m_as(off_unit.kilojoule / off_unit.mol)
+    periodicity = int(parameters["periodicity"])
+    phase = parameters["phase"].m_as(off_unit.radian)
+    # Work around a pint gotcha:
+    # >>> import pint
+    # >>> u = pint.UnitRegistry()
+    # >>> val
+    # <Quantity(1.0, 'dimensionless')>
+    # >>> val.m
+    # 0.9999999999
+    # >>> int(val)
+    # 0
+    # >>> int(round(val, 0))
+    # 1
+    # >>> round(val.m_as(u.dimensionless), 0)
+    # 1.0
+    # >>> round(val, 0).m
+    # 1.0
+    idivf = parameters["idivf"].m_as(off_unit.dimensionless)
+    if idivf == 0:
+        raise RuntimeError("Found an idivf of 0.")
+
+    return periodicity, phase, k / idivf
+
+
+def _get_improper_torsion_parameters(parameters: dict) -> tuple[int, float, float]:
+    """Return the periodicity, phase, and (divided) force constant of an improper torsion."""
+    k = parameters["k"].m_as(off_unit.kilojoule / off_unit.mol)
+    periodicity = int(parameters["periodicity"])
+    phase = parameters["phase"].m_as(off_unit.radian)
+    idivf = int(parameters["idivf"])
+
+    return periodicity, phase, k / idivf
+
+
+def _get_rb_torsion_parameters(parameters: dict) -> tuple[float, ...]:
+    """Return the (unitless) coefficients of a Ryckaert-Bellemans torsion, as passed to `addTorsion`."""
+    return tuple(
+        parameters[f"c{index}"].m_as(off_unit.kilojoule / off_unit.mol)
+        for index in range(6)
+    )
+
+
+@_profiled("process_constraints")
 def _process_constraints(
     interchange,
     openmm_sys,
@@ -48,6 +111,7 @@ def _process_constraints(
     return constrained_pairs
 
 
+@_profiled("process_bond_forces")
 def _process_bond_forces(
     interchange,
     openmm_sys,
@@ -87,11 +151,7 @@ def _process_bond_forces(
                 # This bond's length is constrained, dpo so not add a bond force
                 continue
 
-        params = bond_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(
-            off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol,
-        )
-        length = params["length"].m_as(off_unit.nanometer)
+        length, k = _get_bond_parameters(bond_handler.potentials[pot_key].parameters)
 
         harmonic_bond_force.addBond(
             particle1=openmm_indices[0],
@@ -101,6 +161,7 @@ def _process_bond_forces(
         )
 
 
+@_profiled("process_angle_forces")
 def _process_angle_forces(
     interchange,
     openmm_sys,
@@ -172,9 +233,9 @@ def _process_angle_forces(
             )
 
         else:
-            params = angle_handler.potentials[pot_key].parameters
-            k = params["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol)
-            angle = params["angle"].m_as(off_unit.radian)
+            angle, k = _get_angle_parameters(
+                angle_handler.potentials[pot_key].parameters,
+            )
 
             harmonic_angle_force.addAngle(
                 particle1=openmm_indices[0],
@@ -185,6 +246,7 @@ def _process_angle_forces(
             )
 
 
+@_profiled("process_torsion_forces")
 def _process_torsion_forces(interchange, openmm_sys, particle_map):
     if "ProperTorsions" in interchange.collections:
         _process_proper_torsion_forces(interchange, openmm_sys, particle_map)
@@ -192,6 +254,7 @@ def _process_torsion_forces(interchange, openmm_sys, particle_map):
         _process_rb_torsion_forces(interchange, openmm_sys, particle_map)
 
 
+@_profiled("process_proper_torsion_forces")
 def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
     """
     Process the Propers section of an Interchange object.
@@ -205,40 +268,15 @@ def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
         openff_indices = top_key.atom_indices
         openmm_indices = tuple(particle_map[index] for index in openff_indices)
 
-        params = proper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        # Work around a pint gotcha:
-        # >>> import pint
-        # >>> u = pint.UnitRegistry()
-        # >>> val
-        # <Quantity(1.0, 'dimensionless')>
-        # >>> val.m
-        # 0.9999999999
-        # >>> int(val)
-        # 0
-        # >>> int(round(val, 0))
-        # 1
-        # >>> round(val.m_as(u.dimensionless), 0)
-        # 1.0
-        # >>> round(val, 0).m
-        # 1.0
-        idivf = params["idivf"].m_as(off_unit.dimensionless)
-        if idivf == 0:
-            raise RuntimeError("Found an idivf of 0.")
         torsion_force.addTorsion(
-            openmm_indices[0],
-            openmm_indices[1],
-            openmm_indices[2],
-            openmm_indices[3],
-            periodicity,
-            phase,
-            k / idivf,
+            *openmm_indices,
+            *_get_proper_torsion_parameters(
+                proper_torsion_handler.potentials[pot_key].parameters,
+            ),
         )
 
 
+@_profiled("process_rb_torsion_forces")
 def _process_rb_torsion_forces(interchange, openmm_sys, particle_map):
     """
     Process Ryckaert-Bellemans torsions.
@@ -252,29 +290,15 @@ def _process_rb_torsion_forces(interchange, openmm_sys, particle_map):
         openff_indices = top_key.atom_indices
         openmm_indices = tuple(particle_map[index] for index in openff_indices)
 
-        params = rb_torsion_handler.potentials[pot_key].parameters
-
-        c0 = params["c0"].m_as(off_unit.kilojoule / off_unit.mol)
-        c1 = params["c1"].m_as(off_unit.kilojoule / off_unit.mol)
-        c2 = params["c2"].m_as(off_unit.kilojoule / off_unit.mol)
-        c3 = params["c3"].m_as(off_unit.kilojoule / off_unit.mol)
-        c4 = params["c4"].m_as(off_unit.kilojoule / off_unit.mol)
-        c5 = params["c5"].m_as(off_unit.kilojoule / off_unit.mol)
-
         rb_force.addTorsion(
-            openmm_indices[0],
-            openmm_indices[1],
-            openmm_indices[2],
-            openmm_indices[3],
-            c0,
-            c1,
-            c2,
-            c3,
-            c4,
-            c5,
+            *openmm_indices,
+            *_get_rb_torsion_parameters(
+                rb_torsion_handler.potentials[pot_key].parameters,
+            ),
         )
 
 
+@_profiled("process_improper_torsion_forces")
 def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
     """
     Process the Impropers section of an Interchange object.
@@ -295,21 +319,11 @@ def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
         openff_indices = top_key.atom_indices
         openmm_indices = tuple(particle_map[index] for index in openff_indices)
 
-        params = improper_torsion_handler.potentials[pot_key].parameters
-
-        k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
-        periodicity = int(params["periodicity"])
-        phase = params["phase"].m_as(off_unit.radian)
-        idivf = int(params["idivf"])
-
         torsion_force.addTorsion(
-            openmm_indices[0],
-            openmm_indices[1],
-            openmm_indices[2],
-            openmm_indices[3],
-            periodicity,
-            phase,
-            k / idivf,
+            *openmm_indices,
+            *_get_improper_torsion_parameters(
+                improper_torsion_handler.potentials[pot_key].parameters,
+            ),
         )
 
 
@@ -2,9 +2,11 @@
 
 import copy
 import warnings
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
 import numpy
+from openff.toolkit import Quantity
 
 from openff.interchange.components.toolkit import _combine_topologies
 from openff.interchange.exceptions import (
@@ -12,9 +14,83 @@ from openff.interchange.exceptions import (
     SwitchingFunctionMismatchError,
     UnsupportedCombinationError,
 )
+from openff.interchange.models import (
+    ChargeIncrementTopologyKey,
+    PotentialKey,
+    VirtualSiteKey,
+)
+from openff.interchange.profiling import _profiled
 
 if TYPE_CHECKING:
+    from openff.toolkit import Topology
+
     from openff.interchange.components.interchange import Interchange
+    from openff.interchange.components.potentials import Collection
+
+
+def _copy_collection(collection: "Collection") -> "Collection":
+    """
+    Copy a collection without deep-copying its contents.
+
+    The key map and potentials get new dictionaries, and each potential new parameters, so that they
+    can be extended or modified without affecting the original. Topology and potential keys are hashed
+    by these dictionaries and so are never modified in place; they are shared with the original.
+    """
+    return collection.copy(
+        update={
+            "key_map": dict(collection.key_map),
+            "potentials": {
+                potential_key: _copy_potential(potential)
+                for potential_key, potential in collection.potentials.items()
+            },
+        },
+    )
+
+
+def _copy_potential(potential):
+    """Copy a potential with its own parameters dictionary."""
+    from openff.interchange.components.potentials import Potential
+
+    if isinstance(potential, Potential):
+        return potential.copy(update={"parameters": dict(potential.parameters)})
+
+    return potential.copy()
+
+
+def _offset_topology_key(topology_key, atom_offset: int):
+    """Return a copy of a topology key with its atom indices shifted by ``atom_offset``."""
+    return _map_topology_key(topology_key, lambda index: index + atom_offset)
+
+
+def _map_topology_key(topology_key, atom_map: Callable[[int], int]):
+    """Return a copy of a topology key with each atom index replaced by ``atom_map(index)``."""
+    # Keys are built from validated keys, so skip validating them again
+    if isinstance(topology_key, VirtualSiteKey):
+        return topology_key.copy(
+            update={
+                "orientation_atom_indices": tuple(
+                    atom_map(idx) for idx in topology_key.orientation_atom_indices
+                ),
+            },
+        )
+
+    if isinstance(topology_key, ChargeIncrementTopologyKey):
+        return topology_key.copy(
+            update={
+                "this_atom_index": atom_map(topology_key.this_atom_index),
+                "other_atom_indices": tuple(
+                    atom_map(idx) for idx in topology_key.other_atom_indices
+                ),
+            },
+        )
+
+    new_atom_indices = tuple(atom_map(idx) for idx in topology_key.atom_indices)
+
+    if "atom_indices" in topology_key.__fields__:
+        return topology_key.copy(update={"atom_indices": new_atom_indices})
+
+    assert len(new_atom_indices) == 1
+    return topology_key.copy(update={"this_atom_index": new_atom_indices[0]})
 
 
 def _check_nonbonded_compatibility(
@@ -45,6 +121,7 @@ def _check_nonbonded_compatibility(
         )
 
 
+@_profiled("combine")
 def _combine(
     input1: "Interchange",
     input2: "Interchange",
@@ -58,9 +135,21 @@ def _combine(
         stacklevel=2,
     )
 
-    result = copy.deepcopy(input1)
+    # Copying only the containers which are modified below, instead of deep-copying input1, avoids
+    # doubling the memory used by large systems; the combined topology is already a new object and
+    # positions are replaced by a new array below
+    result = input1.copy(
+        update={
+            "collections": {
+                name: _copy_collection(collection)
+                for name, collection in input1.collections.items()
+            },
+            "topology": _combine_topologies(input1.topology, input2.topology),
+            "mdconfig": None if input1.mdconfig is None else input1.mdconfig.copy(),
+            "box": copy.deepcopy(input1.box),
+        },
+    )
 
-    result.topology = _combine_topologies(input1.topology, input2.topology)
     atom_offset = input1.topology.n_atoms
 
     _check_nonbonded_compatibility(input1, input2)
@@ -88,16 +177,11 @@ def _combine(
             continue
 
         for top_key, pot_key in handler.key_map.items():
-            _tmp_pot_key = copy.deepcopy(pot_key)
-            new_atom_indices = tuple(idx + atom_offset for idx in top_key.atom_indices)
-            new_top_key = top_key.__class__(**top_key.dict())
-            try:
-                new_top_key.atom_indices = new_atom_indices
-            except ValueError:
-                assert len(new_atom_indices) == 1
-                new_top_key.this_atom_index = new_atom_indices[0]
+            _tmp_pot_key = pot_key
+            new_top_key = _offset_topology_key(top_key, atom_offset)
             # If interchange was not created with SMIRNOFF, we need avoid merging potentials with same key
             if pot_key.associated_handler == "ExternalSource":
+                _tmp_pot_key = pot_key.copy()
                 _mult = 0
                 while _tmp_pot_key in self_handler.potentials:
                     _tmp_pot_key.mult = _mult
@@ -134,3 +218,178 @@ def _combine(
         )
 
     return result
+
+
+def _check_concatenation_compatibility(interchanges: Sequence["Interchange"]):
+    if len(interchanges) == 0:
+        raise UnsupportedCombinationError("At least one Interchange object is needed.")
+
+    first = interchanges[0]
+
+    for interchange in interchanges:
+        if interchange.topology is None:
+            raise UnsupportedCombinationError(
+                "Cannot concatenate Interchange objects without topologies.",
+            )
+
+        if interchange.topology.aromaticity_model != first.topology.aromaticity_model:
+            raise UnsupportedCombinationError(
+                "Aromaticity models do not match. Found "
+                f"{first.topology.aromaticity_model} and {interchange.topology.aromaticity_model}.",
+            )
+
+        if interchange is not first:
+            _check_nonbonded_compatibility(first, interchange)
+
+    boxes = [
+        interchange.box for interchange in interchanges if interchange.box is not None
+    ]
+
+    for box in boxes[1:]:
+        if not numpy.allclose(box, boxes[0]):
+            raise UnsupportedCombinationError(
+                "Combination with unequal box vectors is not currently supported",
+            )
+
+
+def _concatenate_topologies(
+    interchanges: Sequence["Interchange"],
+    atom_offsets: list[int],
+) -> "Topology":
+    from openff.toolkit import Topology
+
+    first = interchanges[0].topology
+
+    topology = Topology()
+    topology.aromaticity_model = first.aromaticity_model
+
+    # Adding all molecules at once invalidates the atom index cache once, rather than per molecule
+    topology.add_molecules(
+        [
+            molecule
+            for interchange in interchanges
+            for molecule in interchange.topology.molecules
+        ],
+    )
+
+    topology.box_vectors = first.box_vectors
+
+    for interchange, atom_offset in zip(interchanges, atom_offsets):
+        for (i, j), distance in interchange.topology._constrained_atom_pairs.items():
+            pair = (i + atom_offset, j + atom_offset)
+            topology._constrained_atom_pairs[pair] = distance
+
+    return topology
+
+
+def _concatenate_quantities(interchanges: Sequence["Interchange"], name: str):
+    values = [getattr(interchange, name) for interchange in interchanges]
+
+    if any(value is None for value in values):
+        return None
+
+    units = values[0].units
+
+    return Quantity(numpy.concatenate([value.m_as(units) for value in values]), units)
+
+
+@_profiled("concatenate")
+def _concatenate(interchanges: Sequence["Interchange"]) -> "Interchange":
+    """
+    Concatenate any number of Interchange objects in one pass.
+
+    Unlike folding with `_combine`, compatibility is checked once per input, atom offsets are computed
+    up front, and each topology key is copied once, so the cost is linear in the total number of keys.
+    """
+    warnings.warn(
+        "Interchange object combination is experimental and likely to produce "
+        "strange results. Any workflow using this method is not guaranteed to "
+        "be suitable for production. Use with extreme caution and thoroughly "
+        "validate results!",
+        stacklevel=2,
+    )
+
+    _check_concatenation_compatibility(interchanges)
+
+    first = interchanges[0]
+
+    atom_offsets = numpy.cumsum(
+        [0, *(interchange.topology.n_atoms for interchange in interchanges[:-1])],
+    ).tolist()
+
+    collections: dict[str, "Collection"] = dict()
+
+    for interchange, atom_offset in zip(interchanges, atom_offsets):
+        for name, collection in interchange.collections.items():
+            if name not in collections:
+                collections[name] = collection.copy(
+                    update={"key_map": dict(), "potentials": dict()},
+                )
+
+            target = collections[name]
+
+            # If interchange was not created with SMIRNOFF, we need avoid merging potentials with same key,
+            # so each potential key of each input is renamed, once, if it is already used
+            renamed: dict[PotentialKey, PotentialKey] = dict()
+
+            for top_key, pot_key in collection.key_map.items():
+                if pot_key.associated_handler == "ExternalSource":
+                    if pot_key not in renamed:
+                        new_pot_key = pot_key
+
+                        if pot_key in target.potentials:
+                            new_pot_key = pot_key.copy()
+                            _mult = 0
+                            while new_pot_key in target.potentials:
+                                new_pot_key.mult = _mult
+                                _mult += 1
+
+                        renamed[pot_key] = new_pot_key
+
+                    new_pot_key = renamed[pot_key]
+                else:
+                    new_pot_key = pot_key
+
+                # Keys are not modified in place, so those of the first input can be shared
+                if atom_offset != 0:
+                    top_key = _offset_topology_key(top_key, atom_offset)
+
+                target.key_map[top_key] = new_pot_key
+                target.potentials[new_pot_key] = collection.potentials[pot_key]
+
+    for collection in collections.values():
+        collection.potentials.update(
+            {
+                potential_key: _copy_potential(potential)
+                for potential_key, potential in collection.potentials.items()
+            },
+        )
+
+    if "Electrostatics" in collections:
+        collections["Electrostatics"]._charges = dict()
+        collections["Electrostatics"]._charges_cached = False
+
+    positions = _concatenate_quantities(interchanges, "positions")
+
+    if positions is None:
+        warnings.warn(
+            "Setting positions to None because one or more objects concatenated were missing positions.",
+        )
+
+    return first.copy(
+        update={
+            "collections": collections,
+            "topology": _concatenate_topologies(interchanges, atom_offsets),
+            "mdconfig": None if first.mdconfig is None else first.mdconfig.copy(),
+            "box": next(
+                (
+                    interchange.box
+                    for interchange in interchanges
+                    if interchange.box is not None
+                ),
+                None,
+            ),
+            "positions": positions,
+            "velocities": _concatenate_quantities(interchanges, "velocities"),
+        },
+    )
@@ -0,0 +1,177 @@
+"""The logic behind `Interchange.replicate`."""
+
+from typing import TYPE_CHECKING
+
+import numpy
+from openff.toolkit import Quantity, Topology, unit
+
+from openff.interchange.components._arrays import CollectionArrays
+from openff.interchange.exceptions import (
+    MissingBoxError,
+    MissingPositionsError,
+    UnsupportedArrayStorageError,
+)
+from openff.interchange.operations._combine import _copy_potential, _offset_topology_key
+from openff.interchange.profiling import _count, _phase, _profiled
+
+if TYPE_CHECKING:
+    from openff.interchange.components.interchange import Interchange
+    from openff.interchange.components.potentials import Collection
+
+
+def _replicate_key_map(collection: "Collection", n_copies: int, n_atoms: int) -> dict:
+    """Build the key map of ``n_copies`` copies of a collection, each shifted by ``n_atoms`` atoms."""
+    try:
+        arrays = CollectionArrays.from_collection(collection)
+    except UnsupportedArrayStorageError:
+        # Virtual sites and charge increments cannot be stored as arrays, so offset each key
+        return {
+            _offset_topology_key(topology_key, copy * n_atoms): potential_key
+            for copy in range(n_copies)
+            for topology_key, potential_key in collection.key_map.items()
+        }
+
+    return arrays.tile(n_copies, n_atoms)._build_key_map()
+
+
+def _replicate_virtual_site_indices(
+    index_map: dict,
+    n_copies: int,
+    n_atoms: int,
+) -> dict:
+    """Map the virtual sites of each copy to particle indices, which begin after the atoms of all copies."""
+    n_virtual_sites = len(index_map)
+
+    replicated = dict()
+
+    for copy in range(n_copies):
+        index_offset = (n_copies - 1) * n_atoms + copy * n_virtual_sites
+
+        for virtual_site_key, index in index_map.items():
+            shifted = _offset_topology_key(virtual_site_key, copy * n_atoms)
+            replicated[shifted] = index + index_offset
+
+    return replicated
+
+
+def _replicate_topology(topology: Topology, n_copies: int, box: Quantity) -> Topology:
+    replicated = Topology()
+    replicated.aromaticity_model = topology.aromaticity_model
+
+    # Adding all molecules at once invalidates the atom index cache once, rather than per molecule
+    replicated.add_molecules(
+        [molecule for _ in range(n_copies) for molecule in topology.molecules],
+    )
+
+    replicated.box_vectors = box
+
+    for copy in range(n_copies):
+        atom_offset = copy * topology.n_atoms
+
+        for (i, j), distance in topology._constrained_atom_pairs.items():
+            pair = (i + atom_offset, j + atom_offset)
+            replicated._constrained_atom_pairs[pair] = distance
+
+    return replicated
+
+
+@_profiled("replicate")
+def _replicate(
+    interchange: "Interchange",
+    shape: tuple[int, int, int],
+) -> "Interchange":
+    """
+    Tile an Interchange into a supercell of ``shape`` copies along each box vector.
+
+    Copies are ordered with the first box vector varying slowest. The potentials of the original are
+    reused and only topology keys, positions and velocities are repeated, so no force field matching is
+    done.
+    """
+    shape = tuple(shape)
+
+    if len(shape) != 3 or not all(
+        isinstance(n, (int, numpy.integer)) and n > 0 for n in shape
+    ):
+        raise ValueError(f"Shape must be three positive integers, found {shape}.")
+
+    if interchange.box is None:
+        raise MissingBoxError("Cannot replicate an Interchange without box vectors.")
+
+    if interchange.positions is None:
+        raise MissingPositionsError(
+            "Cannot replicate an Interchange without positions.",
+        )
+
+    n_copies = int(numpy.prod(shape))
+    n_atoms = interchange.topology.n_atoms
+
+    box = interchange.box.m_as(unit.nanometer)
+
+    # Translation of each copy, in copies of the box vectors
+    cells = numpy.stack(
+        numpy.meshgrid(*(numpy.arange(n) for n in shape), indexing="ij"),
+        axis=-1,
+    ).reshape(-1, 3)
+    translations = cells @ box
+
+    positions = interchange.positions.m_as(unit.nanometer)
+    replicated_positions = positions[None, :, :] + translations[:, None, :]
+
+    replicated_velocities = (
+        None
+        if interchange.velocities is None
+        else Quantity(
+            numpy.tile(
+                interchange.velocities.m_as(unit.nanometer / unit.picosecond),
+                (n_copies, 1),
+            ),
+            unit.nanometer / unit.picosecond,
+        )
+    )
+
+    replicated_box = Quantity(box * numpy.asarray(shape)[:, None], unit.nanometer)
+
+    collections = dict()
+
+    for name, collection in interchange.collections.items():
+        with _phase(name, keys=len(collection.key_map) * n_copies):
+            collections[name] = collection.copy(
+                update={
+                    "key_map": _replicate_key_map(collection, n_copies, n_atoms),
+                    "potentials": {
+                        potential_key: _copy_potential(potential)
+                        for potential_key, potential in collection.potentials.items()
+                    },
+                },
+            )
+
+    if "Electrostatics" in collections:
+        collections["Electrostatics"]._charges = dict()
+        collections["Electrostatics"]._charges_cached = False
+
+    if "VirtualSites" in collections:
+        collections["VirtualSites"].virtual_site_key_topology_index_map = (
+            _replicate_virtual_site_indices(
+                interchange["VirtualSites"].virtual_site_key_topology_index_map,
+                n_copies,
+                n_atoms,
+            )
+        )
+
+    with _phase("topology"):
+        topology = _replicate_topology(interchange.topology, n_copies, replicated_box)
+
+    _count(atoms=n_atoms * n_copies)
+
+    return interchange.copy(
+        update={
+            "collections": collections,
+            "topology": topology,
+            "mdconfig": (
+                None if interchange.mdconfig is None else interchange.mdconfig.copy()
+            ),
+            "box": replicated_box,
+            "positions": Quantity(replicated_positions.reshape(-1, 3), unit.nanometer),
+            "velocities": replicated_velocities,
+        },
+    )
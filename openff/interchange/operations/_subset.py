@@ -0,0 +1,190 @@
+"""The logic behind `Interchange.subset`."""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy
+from openff.toolkit import Topology
+
+from openff.interchange.models import ChargeIncrementTopologyKey, VirtualSiteKey
+from openff.interchange.operations._combine import _copy_potential, _map_topology_key
+from openff.interchange.profiling import _count, _phase, _profiled
+
+if TYPE_CHECKING:
+    from openff.interchange.components.interchange import Interchange
+    from openff.interchange.components.potentials import Collection
+
+
+def _key_atom_indices(topology_key) -> tuple[int, ...]:
+    """Return every atom a topology key depends on."""
+    if isinstance(topology_key, VirtualSiteKey):
+        return topology_key.orientation_atom_indices
+
+    if isinstance(topology_key, ChargeIncrementTopologyKey):
+        return (topology_key.this_atom_index, *topology_key.other_atom_indices)
+
+    return topology_key.atom_indices
+
+
+def _get_molecule_atom_starts(topology: Topology) -> numpy.ndarray:
+    """Return the index of the first atom of each molecule, with the total number of atoms appended."""
+    return numpy.cumsum([0, *(molecule.n_atoms for molecule in topology.molecules)])
+
+
+def _select_molecules(
+    topology: Topology,
+    molecule_indices: Iterable[int] | None,
+    atom_indices: Iterable[int] | None,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the sorted indices of the selected molecules and of their atoms."""
+    if (molecule_indices is None) == (atom_indices is None):
+        raise ValueError(
+            "Exactly one of `molecule_indices` and `atom_indices` must be specified.",
+        )
+
+    atom_starts = _get_molecule_atom_starts(topology)
+
+    if molecule_indices is not None:
+        selected_molecules = numpy.unique(
+            numpy.asarray(list(molecule_indices), dtype=numpy.int64),
+        )
+
+        if len(selected_molecules) and (
+            selected_molecules[0] < 0 or selected_molecules[-1] >= topology.n_molecules
+        ):
+            raise ValueError(
+                f"Molecule indices must be between 0 and {topology.n_molecules - 1}.",
+            )
+
+    else:
+        selected_atoms = numpy.unique(numpy.asarray(list(atom_indices), dtype=numpy.int64))  # type: ignore[arg-type]
+
+        if len(selected_atoms) and (
+            selected_atoms[0] < 0 or selected_atoms[-1] >= atom_starts[-1]
+        ):
+            raise ValueError(
+                f"Atom indices must be between 0 and {atom_starts[-1] - 1}.",
+            )
+
+        selected_molecules = numpy.unique(
+            numpy.searchsorted(atom_starts, selected_atoms, side="right") - 1,
+        )
+
+        n_atoms_selected = (
+            atom_starts[selected_molecules + 1] - atom_starts[selected_molecules]
+        ).sum()
+
+        # A `Topology` can only contain whole molecules
+        if n_atoms_selected != len(selected_atoms):
+            raise ValueError(
+                "Atom indices must include every atom of each molecule they select from. Use "
+                "`molecule_indices` to select whole molecules.",
+            )
+
+    if len(selected_molecules) == 0:
+        return selected_molecules, numpy.empty(0, dtype=numpy.int64)
+
+    selected_atoms = numpy.concatenate(
+        [
+            numpy.arange(start, stop)
+            for start, stop in zip(
+                atom_starts[selected_molecules].tolist(),
+                atom_starts[selected_molecules + 1].tolist(),
+            )
+        ],
+    )
+
+    return selected_molecules, selected_atoms
+
+
+def _subset_collection(collection: "Collection", atom_map: list[int]) -> "Collection":
+    """
+    Keep only the terms of a collection whose atoms are all selected, renumbered with ``atom_map``.
+
+    ``atom_map`` maps each old atom index to its new index, or -1 if it is not selected. Only the keys
+    and potentials which are kept are copied, but every key is visited, so the cost scales with the
+    size of the collection rather than of the selection.
+    """
+    key_map = {
+        _map_topology_key(topology_key, atom_map.__getitem__): potential_key
+        for topology_key, potential_key in collection.key_map.items()
+        if all(atom_map[index] >= 0 for index in _key_atom_indices(topology_key))
+    }
+
+    potentials = {
+        potential_key: _copy_potential(collection.potentials[potential_key])
+        for potential_key in dict.fromkeys(key_map.values())
+    }
+
+    return collection.copy(update={"key_map": key_map, "potentials": potentials})
+
+
+@_profiled("subset")
+def _subset(
+    interchange: "Interchange",
+    molecule_indices: Iterable[int] | None = None,
+    atom_indices: Iterable[int] | None = None,
+) -> "Interchange":
+    """
+    Extract the selected molecules of an Interchange, renumbering atoms in their original order.
+
+    Terms are kept if all of their atoms are selected, and potentials no longer used by any term are
+    dropped. Atom selections must contain whole molecules.
+    """
+    topology = interchange.topology
+
+    selected_molecules, selected_atoms = _select_molecules(
+        topology,
+        molecule_indices,
+        atom_indices,
+    )
+
+    _count(molecules=len(selected_molecules), atoms=len(selected_atoms))
+
+    # A lookup table from old to new atom indices, as a list since it is indexed one atom at a time
+    atom_map_array = numpy.full(topology.n_atoms, -1, dtype=numpy.int64)
+    atom_map_array[selected_atoms] = numpy.arange(len(selected_atoms))
+    atom_map: list[int] = atom_map_array.tolist()
+
+    collections = dict()
+
+    for name, collection in interchange.collections.items():
+        with _phase(name):
+            collections[name] = _subset_collection(collection, atom_map)
+
+    if "Electrostatics" in collections:
+        collections["Electrostatics"]._charges = dict()
+        collections["Electrostatics"]._charges_cached = False
+
+    with _phase("topology"):
+        subset_topology = Topology()
+        subset_topology.aromaticity_model = topology.aromaticity_model
+        subset_topology.add_molecules(
+            [topology.molecule(index) for index in selected_molecules.tolist()],
+        )
+        subset_topology.box_vectors = topology.box_vectors
+
+        for (i, j), distance in topology._constrained_atom_pairs.items():
+            if atom_map[i] >= 0 and atom_map[j] >= 0:
+                pair = (atom_map[i], atom_map[j])
+                subset_topology._constrained_atom_pairs[pair] = distance
+
+    return interchange.copy(
+        update={
+            "collections": collections,
+            "topology": subset_topology,
+            "mdconfig": (
+                None if interchange.mdconfig is None else interchange.mdconfig.copy()
+            ),
+            "positions": (
+                None
+                if interchange.positions is None
+                else interchange.positions[selected_atoms]
+            ),
+            "velocities": (
+                None
+                if interchange.velocities is None
+                else interchange.velocities[selected_atoms]
+            ),
+        },
+    )
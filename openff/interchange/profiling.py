@@ -0,0 +1,286 @@
+"""
+Opt-in timing of the phases of creating and exporting Interchange objects.
+
+Profiling is enabled within the :func:`profile` context manager, or for every top-level operation
+by setting the environment variable ``INTERCHANGE_PROFILE=1``, in which case a report is printed to
+standard error after each operation. When disabled, the cost of each instrumented phase is a single
+context variable lookup.
+
+If ``opentelemetry`` is installed, each phase is also emitted as a span from the tracer
+``"openff.interchange"``. Spans are only exported if a tracer provider, i.e. one sending spans to a
+local collector, has been configured.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextvars import ContextVar
+from typing import Any
+
+from openff.utilities.utilities import has_package
+
+
+class PhaseRecord:
+    """
+    The time spent in, and objects processed by, one phase, summed over all calls to it.
+
+    Phases are nested; a phase called from within another is stored in ``children`` of the outer
+    phase, keyed by name. ``counts`` holds the number of objects, i.e. topology keys or forces,
+    recorded by the phase.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_time: float = 0.0
+        self.calls: int = 0
+        self.counts: dict[str, int] = dict()
+        self.children: dict[str, PhaseRecord] = dict()
+
+    @property
+    def self_time(self) -> float:
+        """The wall time spent in this phase but not in any of its children."""
+        return self.wall_time - sum(child.wall_time for child in self.children.values())
+
+    def child(self, name: str) -> "PhaseRecord":
+        """Return the record of the phase with this name called within this phase, creating it if needed."""
+        if name not in self.children:
+            self.children[name] = PhaseRecord(name)
+
+        return self.children[name]
+
+    def count(self, **counts: int):
+        """Add to the number of objects processed by this phase."""
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a nested dictionary representation of this record."""
+        return {
+            "name": self.name,
+            "wall_time": self.wall_time,
+            "self_time": self.self_time,
+            "calls": self.calls,
+            "counts": dict(self.counts),
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+    def __repr__(self) -> str:
+        return f"PhaseRecord({self.name}, {self.calls} calls, {self.wall_time:.4f} s)"
+
+
+class ProfileReport:
+    """
+    A report of the time spent in each instrumented phase while profiling was enabled.
+
+    Phases are accessed by their path, i.e. ``report["from_smirnoff/Bonds/store_matches"]``.
+    """
+
+    def __init__(self):
+        self.root = PhaseRecord("total")
+
+    @property
+    def wall_time(self) -> float:
+        """The wall time spent while profiling was enabled."""
+        return self.root.wall_time
+
+    def __getitem__(self, path: str) -> PhaseRecord:
+        record = self.root
+
+        for name in path.split("/"):
+            try:
+                record = record.children[name]
+            except KeyError as error:
+                raise KeyError(f"No phase {path} in report") from error
+
+        return record
+
+    def __contains__(self, path: str) -> bool:
+        try:
+            self[path]
+        except KeyError:
+            return False
+
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.flatten())
+
+    def flatten(self) -> dict[str, PhaseRecord]:
+        """Return the records of all phases, keyed by path, in the order they were first called."""
+        flat: dict[str, PhaseRecord] = dict()
+
+        def _visit(record: PhaseRecord, prefix: str):
+            for name, child in record.children.items():
+                path = f"{prefix}{name}"
+                flat[path] = child
+                _visit(child, f"{path}/")
+
+        _visit(self.root, "")
+
+        return flat
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a nested dictionary representation of this report."""
+        return self.root.to_dict()
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'phase':<56} {'calls':>7} {'total (s)':>10} {'self (s)':>10}  counts",
+        ]
+
+        def _visit(record: PhaseRecord, depth: int):
+            for child in record.children.values():
+                counts = ", ".join(
+                    f"{key}={value}" for key, value in child.counts.items()
+                )
+
+                lines.append(
+                    f"{'  ' * depth + child.name:<56} {child.calls:>7} "
+                    f"{child.wall_time:>10.4f} {child.self_time:>10.4f}  {counts}",
+                )
+
+                _visit(child, depth + 1)
+
+        _visit(self.root, 0)
+
+        lines.append(f"{'total':<56} {'':>7} {self.wall_time:>10.4f}")
+
+        return "\n".join(lines)
+
+
+_CURRENT_PHASE: ContextVar[PhaseRecord | None] = ContextVar(
+    "_CURRENT_PHASE",
+    default=None,
+)
+
+_HAS_OPENTELEMETRY = has_package("opentelemetry")
+
+_last_report: ProfileReport | None = None
+
+
+def get_last_report() -> ProfileReport | None:
+    """Return the report of the last operation profiled because ``INTERCHANGE_PROFILE=1`` is set."""
+    return _last_report
+
+
+def _count(**counts: int):
+    """Add to the number of objects processed by the current phase. Does nothing if profiling is disabled."""
+    record = _CURRENT_PHASE.get()
+
+    if record is None:
+        return
+
+    record.count(**counts)
+
+    if _HAS_OPENTELEMETRY:
+        from opentelemetry import trace
+
+        trace.get_current_span().set_attributes(
+            {f"interchange.{key}": value for key, value in counts.items()},
+        )
+
+
+def _start_span(name: str):
+    if not _HAS_OPENTELEMETRY:
+        return contextlib.nullcontext()
+
+    from opentelemetry import trace
+
+    return trace.get_tracer("openff.interchange").start_as_current_span(name)
+
+
+@contextlib.contextmanager
+def profile() -> Generator[ProfileReport, None, None]:
+    """
+    Record the time spent in each phase of the operations run within this context.
+
+    Examples
+    --------
+    Find out which sections of a force field take the longest to apply
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange import Interchange
+        >>> from openff.interchange.profiling import profile
+        >>> from openff.toolkit import ForceField, Molecule
+        >>> with profile() as report:
+        ...     interchange = Interchange.from_smirnoff(
+        ...         ForceField("openff-2.1.0.offxml"),
+        ...         [Molecule.from_smiles("CCO")],
+        ...     )
+        >>> print(report)  # doctest: +SKIP
+        >>> report["from_smirnoff/Electrostatics"].wall_time  # doctest: +SKIP
+
+    """
+    report = ProfileReport()
+
+    token = _CURRENT_PHASE.set(report.root)
+    start = time.perf_counter()
+
+    try:
+        yield report
+    finally:
+        report.root.wall_time += time.perf_counter() - start
+        report.root.calls += 1
+
+        _CURRENT_PHASE.reset(token)
+
+
+@contextlib.contextmanager
+def _phase(name: str, **counts: int) -> Generator[None, None, None]:
+    """
+    Record the time spent in, and optionally the number of objects processed by, a phase.
+
+    Does nothing unless profiling is enabled. Counts can also be added from within the phase with
+    ``_count``.
+    """
+    global _last_report
+
+    parent = _CURRENT_PHASE.get()
+
+    if parent is None:
+        if os.environ.get("INTERCHANGE_PROFILE", "0") != "1":
+            yield
+            return
+
+        with profile() as report:
+            with _phase(name, **counts):
+                yield
+
+        _last_report = report
+
+        print(report, file=sys.stderr)
+        return
+
+    record = parent.child(name)
+    record.calls += 1
+
+    token = _CURRENT_PHASE.set(record)
+    start = time.perf_counter()
+
+    try:
+        with _start_span(name):
+            _count(**counts)
+
+            yield
+    finally:
+        record.wall_time += time.perf_counter() - start
+
+        _CURRENT_PHASE.reset(token)
+
+
+def _profiled(name: str) -> Callable[[Callable], Callable]:
+    """Decorate a function so that each call to it is recorded as a phase."""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _phase(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,12 @@
 """The interface between Interchange and SMIRNOFF objects."""
 
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
+from openff.interchange.smirnoff._cache import ParametrizationCache
+from openff.interchange.smirnoff._charge_store import (
+    ChargeStore,
+    FileChargeStore,
+    InMemoryChargeStore,
+)
 from openff.interchange.smirnoff._gbsa import SMIRNOFFGBSACollection
 from openff.interchange.smirnoff._nonbonded import (
     SMIRNOFFElectrostaticsCollection,
@@ -1,5 +1,6 @@
 import abc
 import json
+from collections.abc import Callable
 from typing import TypeVar
 
 from openff.models.models import DefaultModel
@@ -10,6 +11,7 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
     BondHandler,
     ImproperTorsionHandler,
     ParameterHandler,
+    ParameterType,
     ProperTorsionHandler,
 )
 
@@ -22,9 +24,20 @@ from openff.interchange.exceptions import (
     UnassignedTorsionError,
 )
 from openff.interchange.models import (
+    BondKey,
+    ChargeIncrementTopologyKey,
+    ChargeModelTopologyKey,
     LibraryChargeTopologyKey,
     PotentialKey,
+    ProperTorsionKey,
     TopologyKey,
+    VirtualSiteKey,
+)
+from openff.interchange.profiling import _count, _phase
+from openff.interchange.smirnoff._cache import (
+    _get_active_cache,
+    _hash_handlers,
+    _mapped_smiles,
 )
 
 T = TypeVar("T", bound="SMIRNOFFCollection")
@@ -48,6 +61,28 @@ def dump_collection(v, *, default):
     return json.dumps(_sanitize(v), default=default)
 
 
+# Keys are stored without their class, so pick the class from the fields that were stored. Subclasses
+# that add no fields, like `AngleKey` and `ImproperTorsionKey`, cannot be told apart, but compare equal.
+_KEY_CLASSES: dict[frozenset[str], type[DefaultModel]] = {
+    frozenset(key_class.__fields__): key_class
+    for key_class in (
+        TopologyKey,
+        BondKey,
+        ProperTorsionKey,
+        VirtualSiteKey,
+        LibraryChargeTopologyKey,
+        ChargeModelTopologyKey,
+        ChargeIncrementTopologyKey,
+    )
+}
+
+
+def _parse_topology_key(data: str) -> DefaultModel:
+    fields = json.loads(data)
+
+    return _KEY_CLASSES[frozenset(fields)].parse_obj(fields)
+
+
 def collection_loader(data: str) -> dict:
     """Load a JSON blob dumped from a `Collection`."""
     tmp: dict[str, int | float | bool | str | dict | None] = {}
@@ -68,13 +103,7 @@ def collection_loader(data: str) -> dict:
                 key_map = {}
 
                 for key_, val_ in val.items():
-                    if "atom_indices" in key_:
-                        topology_key: TopologyKey | LibraryChargeTopologyKey = (
-                            TopologyKey.parse_raw(key_)
-                        )
-
-                    else:
-                        topology_key = LibraryChargeTopologyKey.parse_raw(key_)
+                    topology_key = _parse_topology_key(key_)
 
                     # TODO: Not obvious if cosmetic attributes survive here
                     potential_key = PotentialKey(**val_)
@@ -183,6 +212,134 @@ def _check_all_valence_terms_assigned(
         raise exception
 
 
+def _find_matches_by_template(
+    parameter_handler: ParameterHandler,
+    topology: Topology,
+    valence_terms: Callable[[Topology], list] | None = None,
+):
+    """
+    Find the matches of a parameter handler in a topology, matching each unique molecule only once.
+
+    Matches of each unique molecule (the "template") are copied onto every duplicate of it by
+    mapping atom indices, so each chemical species is only subject to SMARTS matching once. The
+    result contains the same keys as ``parameter_handler.find_matches(topology)``, ordered by
+    molecule in the topology.
+
+    If ``valence_terms`` is passed, each template is checked for unassigned valence terms. If any
+    are found, the (slower) check is repeated on the whole topology in order to raise the error.
+
+    If a ``ParametrizationCache`` is active, the matches of each template are looked up in, or stored
+    in, the cache. The environment match of each cached match is rebuilt from the stored atom
+    indices of the reference molecule, so connectivity checks behave as on a cache miss.
+    """
+    groups = topology.identical_molecule_groups
+
+    instances: dict[int, tuple[int, dict[int, int]]] = {
+        molecule_index: (unique_molecule_index, atom_map)
+        for unique_molecule_index, group in groups.items()
+        for molecule_index, atom_map in group
+    }
+
+    templates = dict()
+
+    cache = _get_active_cache()
+
+    if cache is not None:
+        handler_hash = _hash_handlers(parameter_handler)
+        parameters = [*parameter_handler.parameters]
+
+    for unique_molecule_index in groups:
+        if cache is not None:
+            smiles = _mapped_smiles(topology.molecule(unique_molecule_index))
+            cached = cache.get("matches", handler_hash, smiles)
+
+            if cached is not None:
+                _count(cached_molecules=1)
+
+                template_matches = cached[0]()
+                template = topology.molecule(unique_molecule_index)
+
+                for key, parameter_index, reference_atom_indices in cached[1]:
+                    template_matches[key] = parameter_handler._Match(
+                        parameters[parameter_index],
+                        Topology._ChemicalEnvironmentMatch(
+                            reference_atom_indices=reference_atom_indices,
+                            reference_molecule=template,
+                            topology_atom_indices=reference_atom_indices,
+                        ),
+                    )
+
+                templates[unique_molecule_index] = template_matches
+
+                continue
+
+        template_topology = topology.molecule(unique_molecule_index).to_topology()
+
+        with _phase("find_matches", molecules=1):
+            template_matches = parameter_handler.find_matches(template_topology)
+
+        if valence_terms is not None:
+            if len(template_matches) != len(valence_terms(template_topology)):
+                _check_all_valence_terms_assigned(
+                    handler=parameter_handler,
+                    assigned_terms=parameter_handler.find_matches(topology),
+                    topology=topology,
+                    valence_terms=valence_terms(topology),
+                )
+
+        if cache is not None:
+            parameter_indices = {
+                id(parameter): index for index, parameter in enumerate(parameters)
+            }
+
+            cache.put(
+                "matches",
+                handler_hash,
+                smiles,
+                (
+                    template_matches.__class__,
+                    [
+                        (
+                            key,
+                            parameter_indices[id(val.parameter_type)],
+                            val.environment_match.reference_atom_indices,
+                        )
+                        for key, val in template_matches.items()
+                    ],
+                ),
+            )
+
+        templates[unique_molecule_index] = template_matches
+
+    if len(templates) == 0:
+        return parameter_handler.find_matches(topology)
+
+    # Use the same (possibly key-transforming) dictionary type as the toolkit
+    matches = [*templates.values()][0].__class__()
+
+    offset = 0
+
+    for molecule_index, molecule in enumerate(topology.molecules):
+        unique_molecule_index, atom_map = instances[molecule_index]
+
+        for key, val in templates[unique_molecule_index].items():
+            matches[tuple(offset + atom_map[index] for index in key)] = val
+
+        offset += molecule.n_atoms
+
+    return matches
+
+
+def _get_cosmetic_attributes(parameter: ParameterType) -> dict:
+    return {
+        cosmetic_attribute: getattr(
+            parameter,
+            f"_{cosmetic_attribute}",
+        )
+        for cosmetic_attribute in parameter._cosmetic_attribs
+    }
+
+
 class SMIRNOFFCollection(Collection, abc.ABC):
     """Base class for handlers storing potentials produced by SMIRNOFF force fields."""
 
@@ -247,41 +404,36 @@ class SMIRNOFFCollection(Collection, abc.ABC):
                 PotentialKey,
             ] = dict()
 
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_by_template(
+            parameter_handler,
+            topology,
+            valence_terms=(
+                self.valence_terms
+                if self.__class__.__name__
+                in [
+                    "SMIRNOFFBondCollection",
+                    "SMIRNOFFAngleCollection",
+                ]
+                else None
+            ),
+        )
+
+        # Potential keys depend only on the parameter, so share them between all matches
+        potential_keys: dict[str, PotentialKey] = dict()
 
         for key, val in matches.items():
             parameter: ParameterHandler.ParameterType = val.parameter_type
 
-            cosmetic_attributes = {
-                cosmetic_attribute: getattr(
-                    parameter,
-                    f"_{cosmetic_attribute}",
+            if parameter.smirks not in potential_keys:
+                potential_keys[parameter.smirks] = PotentialKey(
+                    id=parameter.smirks,
+                    associated_handler=parameter_handler.TAGNAME,
+                    cosmetic_attributes=_get_cosmetic_attributes(parameter),
                 )
-                for cosmetic_attribute in parameter._cosmetic_attribs
-            }
-
-            topology_key = TopologyKey(atom_indices=key)
 
-            potential_key = PotentialKey(
-                id=parameter.smirks,
-                associated_handler=parameter_handler.TAGNAME,
-                cosmetic_attributes=cosmetic_attributes,
-            )
-
-            self.key_map[topology_key] = potential_key
-
-        if self.__class__.__name__ in [
-            "SMIRNOFFBondCollection",
-            "SMIRNOFFAngleCollection",
-        ]:
-            valence_terms = self.valence_terms(topology)
-
-            _check_all_valence_terms_assigned(
-                handler=parameter_handler,
-                assigned_terms=matches,
-                topology=topology,
-                valence_terms=valence_terms,
-            )
+            self.key_map[TopologyKey(atom_indices=key)] = potential_keys[
+                parameter.smirks
+            ]
 
     def store_potentials(self, parameter_handler: TP):
         """
@@ -0,0 +1,265 @@
+"""An on-disk cache of parameters assigned to unique molecules."""
+
+import contextlib
+import hashlib
+import json
+import pickle
+import sqlite3
+from collections.abc import Generator
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from openff.toolkit import ForceField, Molecule
+from openff.toolkit.typing.engines.smirnoff import ParameterHandler
+
+_ACTIVE_CACHE: ContextVar["ParametrizationCache | None"] = ContextVar(
+    "_ACTIVE_CACHE",
+    default=None,
+)
+
+_ELECTROSTATICS_HANDLERS = (
+    "Electrostatics",
+    "ChargeIncrementModel",
+    "ToolkitAM1BCC",
+    "LibraryCharges",
+)
+
+
+def _hash_handlers(*parameter_handlers: ParameterHandler) -> str:
+    """Hash the contents of one or more parameter handlers."""
+    return hashlib.sha256(
+        json.dumps(
+            [
+                [handler.__class__.__name__, handler.to_dict()]
+                for handler in parameter_handlers
+            ],
+            sort_keys=True,
+            default=str,
+        ).encode(),
+    ).hexdigest()
+
+
+def _hash_electrostatics_handlers(
+    parameter_handlers: dict[str, ParameterHandler],
+) -> str:
+    """Hash the contents of the handlers which, together, assign partial charges."""
+    return _hash_handlers(
+        *[
+            parameter_handlers[name]
+            for name in _ELECTROSTATICS_HANDLERS
+            if name in parameter_handlers
+        ],
+    )
+
+
+def _mapped_smiles(molecule: Molecule) -> str:
+    return molecule.to_smiles(isomeric=True, explicit_hydrogens=True, mapped=True)
+
+
+class ParametrizationCache:
+    """
+    A size-bounded, on-disk cache of parameters assigned to unique molecules.
+
+    Entries are keyed by a content hash of the force field section(s) used and the mapped SMILES of
+    the molecule, so changing either the force field or the atom ordering of a molecule results in a
+    cache miss. Entries are stored in a SQLite database, which can be shared between processes, and
+    the least recently used entries are evicted once the total size of stored entries exceeds
+    ``max_size`` bytes.
+
+    Examples
+    --------
+    Re-use the parameters of molecules found in a previous call to ``Interchange.from_smirnoff``
+
+    .. code-block:: pycon
+
+        >>> from openff.interchange import Interchange
+        >>> from openff.interchange.smirnoff import ParametrizationCache
+        >>> from openff.toolkit import ForceField, Molecule
+        >>> cache = ParametrizationCache("parameters.sqlite")
+        >>> sage = ForceField("openff-2.0.0.offxml")
+        >>> for smiles in ["CCO", "CCO"]:
+        ...     interchange = Interchange.from_smirnoff(
+        ...         sage,
+        ...         [Molecule.from_smiles(smiles)],
+        ...         cache=cache,
+        ...     )
+
+    """
+
+    # Entries are ordered by a counter, rather than a timestamp, so that the order of use is unambiguous
+    _NEXT_USE = "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM entries)"
+
+    def __init__(self, path: str | Path, max_size: int = 2**30):
+        self.path = Path(path)
+        self.max_size = max_size
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "handler_hash TEXT NOT NULL, "
+                "smiles TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "last_used INTEGER NOT NULL)",
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS last_used_index ON entries (last_used)",
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"ParametrizationCache(path={str(self.path)!r}, max_size={self.max_size})"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=60.0)
+
+    @staticmethod
+    def _key(kind: str, handler_hash: str, smiles: str) -> str:
+        return hashlib.sha256(f"{kind}\n{handler_hash}\n{smiles}".encode()).hexdigest()
+
+    def get(self, kind: str, handler_hash: str, smiles: str) -> Any | None:
+        """Return the entry stored for this kind of data, handler(s), and molecule, or ``None``."""
+        key = self._key(kind, handler_hash, smiles)
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT value FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                f"UPDATE entries SET last_used = {self._NEXT_USE} WHERE key = ?",
+                (key,),
+            )
+
+        return pickle.loads(row[0])
+
+    def put(self, kind: str, handler_hash: str, smiles: str, value: Any):
+        """Store an entry, evicting the least recently used entries if the cache is full."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(blob) > self.max_size:
+            return
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, {self._NEXT_USE})",
+                (
+                    self._key(kind, handler_hash, smiles),
+                    handler_hash,
+                    smiles,
+                    blob,
+                    len(blob),
+                ),
+            )
+
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection):
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries",
+        ).fetchone()
+
+        if total_size <= self.max_size:
+            return
+
+        to_delete = list()
+
+        for key, size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_used ASC",
+        ):
+            if total_size <= self.max_size:
+                break
+
+            to_delete.append((key,))
+            total_size -= size
+
+        connection.executemany("DELETE FROM entries WHERE key = ?", to_delete)
+
+    def invalidate(
+        self,
+        force_field: ForceField | None = None,
+        molecule: Molecule | None = None,
+    ) -> int:
+        """
+        Remove entries associated with a force field and/or molecule, returning the number removed.
+
+        If a force field is passed, entries created from any of its parameter handlers are removed.
+        If a molecule is passed, entries for it (with the same atom ordering) are removed. If both are
+        passed, only entries matching both are removed.
+        """
+        if force_field is None and molecule is None:
+            raise ValueError(
+                "Must pass a force field and/or molecule. Use `clear` to remove all entries.",
+            )
+
+        conditions, arguments = list(), list()
+
+        if force_field is not None:
+            handler_hashes = {
+                _hash_handlers(handler)
+                for handler in force_field._parameter_handlers.values()
+            }
+
+            # Electrostatics entries are keyed by several handlers at once
+            handler_hashes.add(
+                _hash_electrostatics_handlers(force_field._parameter_handlers),
+            )
+
+            conditions.append(
+                f"handler_hash IN ({', '.join('?' * len(handler_hashes))})",
+            )
+            arguments.extend(handler_hashes)
+
+        if molecule is not None:
+            conditions.append("smiles = ?")
+            arguments.append(_mapped_smiles(molecule))
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            return connection.execute(
+                f"DELETE FROM entries WHERE {' AND '.join(conditions)}",
+                arguments,
+            ).rowcount
+
+    def clear(self):
+        """Remove all entries."""
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with contextlib.closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """The total size, in bytes, of all stored entries."""
+        with contextlib.closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries",
+            ).fetchone()[0]
+
+
+@contextlib.contextmanager
+def _use_cache(
+    cache: "str | Path | ParametrizationCache | None",
+) -> Generator["ParametrizationCache | None", None, None]:
+    """Make a cache available to collections created within this context."""
+    if cache is not None and not isinstance(cache, ParametrizationCache):
+        cache = ParametrizationCache(cache)
+
+    token = _ACTIVE_CACHE.set(cache)
+
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE.reset(token)
+
+
+def _get_active_cache() -> ParametrizationCache | None:
+    return _ACTIVE_CACHE.get()
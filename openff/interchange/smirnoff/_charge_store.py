@@ -0,0 +1,170 @@
+"""Stores of partial charges computed by toolkit wrappers."""
+
+import abc
+import contextlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy
+
+ChargeKey = tuple[str, str, str]
+
+
+class ChargeStore(abc.ABC):
+    """
+    Base class for stores of partial charges, in units of the elementary charge.
+
+    Charges are keyed by a tuple of the mapped SMILES of the molecule, the partial charge method,
+    and a string describing the versions of the toolkits used to compute them. Each store counts the
+    number of lookups which did and did not find stored charges.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: ChargeKey) -> numpy.ndarray | None:
+        """Return the charges stored with this key, or ``None``, and count the lookup."""
+        charges = self._get(key)
+
+        if charges is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return charges
+
+    @abc.abstractmethod
+    def _get(self, key: ChargeKey) -> numpy.ndarray | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, key: ChargeKey, charges: numpy.ndarray):
+        """Store charges with this key."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove all stored charges."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def reset_counters(self):
+        """Reset the hit and miss counters to zero."""
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__} with {len(self)} entries, "
+            f"{self.hits} hits and {self.misses} misses"
+        )
+
+
+class InMemoryChargeStore(ChargeStore):
+    """
+    A store of partial charges held in memory, evicting the least recently used charges when full.
+
+    If ``backend`` is passed, lookups which miss this store fall back to it, and new charges are
+    also stored in it. This allows, for example, a file-backed store to be shared between processes
+    while each process keeps recently used charges in memory.
+    """
+
+    def __init__(self, max_size: int = 1024, backend: ChargeStore | None = None):
+        super().__init__()
+
+        self.max_size = max_size
+        self.backend = backend
+        self._data: OrderedDict[ChargeKey, numpy.ndarray] = OrderedDict()
+
+    def _get(self, key: ChargeKey) -> numpy.ndarray | None:
+        if key in self._data:
+            self._data.move_to_end(key)
+
+            return self._data[key]
+
+        if self.backend is not None:
+            charges = self.backend.get(key)
+
+            if charges is not None:
+                self._put(key, charges)
+
+            return charges
+
+        return None
+
+    def put(self, key: ChargeKey, charges: numpy.ndarray):
+        """Store charges with this key, and in the backend store, if any."""
+        self._put(key, charges)
+
+        if self.backend is not None:
+            self.backend.put(key, charges)
+
+    def _put(self, key: ChargeKey, charges: numpy.ndarray):
+        self._data[key] = numpy.asarray(charges, dtype=numpy.float64)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all charges stored in memory. Charges in the backend store are not removed."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileChargeStore(ChargeStore):
+    """A store of partial charges in a SQLite database, which can be shared between processes."""
+
+    def __init__(self, path: str | Path):
+        super().__init__()
+
+        self.path = Path(path)
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS charges ("
+                "smiles TEXT NOT NULL, "
+                "method TEXT NOT NULL, "
+                "toolkits TEXT NOT NULL, "
+                "charges BLOB NOT NULL, "
+                "PRIMARY KEY (smiles, method, toolkits))",
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=60.0)
+
+    def _get(self, key: ChargeKey) -> numpy.ndarray | None:
+        with contextlib.closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT charges FROM charges WHERE smiles = ? AND method = ? AND toolkits = ?",
+                key,
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return numpy.frombuffer(row[0], dtype=numpy.float64).copy()
+
+    def put(self, key: ChargeKey, charges: numpy.ndarray):
+        """Store charges with this key."""
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO charges VALUES (?, ?, ?, ?)",
+                (*key, numpy.asarray(charges, dtype=numpy.float64).tobytes()),
+            )
+
+    def clear(self):
+        """Remove all stored charges."""
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM charges")
+
+    def __len__(self) -> int:
+        with contextlib.closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM charges").fetchone()[0]
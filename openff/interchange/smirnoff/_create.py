@@ -1,3 +1,7 @@
+import functools
+from collections.abc import Callable
+from pathlib import Path
+
 from openff.toolkit import ForceField, Molecule, Quantity, Topology
 from openff.toolkit.typing.engines.smirnoff import ParameterHandler
 from openff.toolkit.typing.engines.smirnoff.plugins import load_handler_plugins
@@ -11,7 +15,9 @@ from openff.interchange.exceptions import (
     SMIRNOFFHandlersNotImplementedError,
 )
 from openff.interchange.plugins import load_smirnoff_plugins
+from openff.interchange.profiling import _count, _phase, _profiled
 from openff.interchange.smirnoff._base import SMIRNOFFCollection
+from openff.interchange.smirnoff._cache import ParametrizationCache, _use_cache
 from openff.interchange.smirnoff._gbsa import SMIRNOFFGBSACollection
 from openff.interchange.smirnoff._nonbonded import (
     SMIRNOFFElectrostaticsCollection,
@@ -63,6 +69,26 @@ for collection_plugin in load_smirnoff_plugins():
             )
 
 
+def _step(name: str) -> Callable[[Callable], Callable]:
+    """Profile a step as a phase, counting the keys and potentials of the collection it creates."""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(interchange: Interchange, *args, **kwargs):
+            with _phase(name):
+                function(interchange, *args, **kwargs)
+
+                if name in interchange.collections:
+                    _count(
+                        keys=len(interchange.collections[name].key_map),
+                        potentials=len(interchange.collections[name].potentials),
+                    )
+
+        return wrapper
+
+    return decorator
+
+
 def _check_supported_handlers(force_field: ForceField):
     unsupported = list()
 
@@ -78,6 +104,7 @@ def _check_supported_handlers(force_field: ForceField):
         )
 
 
+@_profiled("from_smirnoff")
 def _create_interchange(
     force_field: ForceField,
     topology: Topology | list[Molecule],
@@ -86,47 +113,228 @@ def _create_interchange(
     charge_from_molecules: list[Molecule] | None = None,
     partial_bond_orders_from_molecules: list[Molecule] | None = None,
     allow_nonintegral_charges: bool = False,
+    n_workers: int = 1,
+    cache: str | Path | ParametrizationCache | None = None,
 ) -> Interchange:
     _check_supported_handlers(force_field)
 
     interchange = Interchange()
 
-    _topology = Interchange.validate_topology(topology)
+    with _phase("validate_topology"):
+        _topology = Interchange.validate_topology(topology)
+
+    _count(atoms=_topology.n_atoms, molecules=_topology.n_molecules)
 
     interchange.positions = _infer_positions(_topology, positions)
 
     interchange.box = _topology.box_vectors if box is None else box
 
-    _bonds(interchange, force_field, _topology, partial_bond_orders_from_molecules)
-    _constraints(
-        interchange,
-        force_field,
-        _topology,
-        bonds=interchange.collections.get("Bonds", None),  # type: ignore[arg-type]
-    )
-    _angles(interchange, force_field, _topology)
-    _propers(interchange, force_field, _topology, partial_bond_orders_from_molecules)
-    _impropers(interchange, force_field, _topology)
-
-    _vdw(interchange, force_field, _topology)
-    _electrostatics(
-        interchange,
-        force_field,
-        _topology,
-        charge_from_molecules,
-        allow_nonintegral_charges,
-    )
-    _plugins(interchange, force_field, _topology)
+    with _use_cache(cache) as _cache:
+        if n_workers > 1:
+            _parallel(
+                interchange,
+                force_field,
+                _topology,
+                charge_from_molecules,
+                partial_bond_orders_from_molecules,
+                allow_nonintegral_charges,
+                n_workers,
+                _cache,
+            )
 
-    _virtual_sites(interchange, force_field, _topology)
+        else:
+            _bonds(
+                interchange,
+                force_field,
+                _topology,
+                partial_bond_orders_from_molecules,
+            )
+            _constraints(
+                interchange,
+                force_field,
+                _topology,
+                bonds=interchange.collections.get("Bonds", None),  # type: ignore[arg-type]
+            )
+            _angles(interchange, force_field, _topology)
+            _propers(
+                interchange,
+                force_field,
+                _topology,
+                partial_bond_orders_from_molecules,
+            )
+            _impropers(interchange, force_field, _topology)
+
+            _vdw(interchange, force_field, _topology)
+            _electrostatics(
+                interchange,
+                force_field,
+                _topology,
+                charge_from_molecules,
+                allow_nonintegral_charges,
+            )
+
+        _plugins(interchange, force_field, _topology)
+
+        _virtual_sites(interchange, force_field, _topology)
 
-    _gbsa(interchange, force_field, _topology)
+        _gbsa(interchange, force_field, _topology)
 
-    interchange.topology = _topology
+    with _phase("set_topology"):
+        interchange.topology = _topology
 
     return interchange
 
 
+def _uses_fractional_bond_orders(force_field: ForceField) -> bool:
+    """Return whether or not any valence parameters are interpolated by fractional bond order."""
+    for handler_name, attributes in (
+        ("Bonds", ("k_bondorder", "length_bondorder")),
+        ("ProperTorsions", ("k_bondorder",)),
+    ):
+        if handler_name not in force_field.registered_parameter_handlers:
+            continue
+
+        for parameter in force_field[handler_name].parameters:
+            if any(getattr(parameter, attribute, None) for attribute in attributes):
+                return True
+
+    return False
+
+
+def _create_collection(
+    name: str,
+    force_field: ForceField,
+    topology: Topology,
+    kwargs: dict,
+    cache: ParametrizationCache | None = None,
+) -> SMIRNOFFCollection | None:
+    """Create a single collection on a scratch Interchange. Runs in a worker process."""
+    interchange = Interchange()
+
+    with _use_cache(cache):
+        {
+            "Bonds": _bonds,
+            "Angles": _angles,
+            "ProperTorsions": _propers,
+            "ImproperTorsions": _impropers,
+            "vdW": _vdw,
+            "Electrostatics": _electrostatics,
+        }[name](interchange, force_field, topology, **kwargs)
+
+    return interchange.collections.get(name, None)  # type: ignore[return-value]
+
+
+@_profiled("parallel")
+def _parallel(
+    interchange: Interchange,
+    force_field: ForceField,
+    topology: Topology,
+    charge_from_molecules: list[Molecule] | None,
+    partial_bond_orders_from_molecules: list[Molecule] | None,
+    allow_nonintegral_charges: bool,
+    n_workers: int,
+    cache: ParametrizationCache | None = None,
+):
+    """
+    Create the valence and non-bonded collections concurrently in a pool of worker processes.
+
+    Each collection is created from its own copy of the force field and topology, and the results
+    are stored in the same order as when they are created serially. Steps which modify their inputs
+    in-place are run in this process, before or after the workers, so that those side effects are
+    not lost:
+
+    * up-converting old versions of the Bonds and vdW sections,
+    * assigning fractional bond orders to molecules in the topology,
+    * creating constraints, which depend on bond parameters, and
+    * setting the partial charges of molecules in the topology.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from openff.interchange.smirnoff._nonbonded import _upconvert_vdw_handler
+
+    if "Bonds" in force_field.registered_parameter_handlers:
+        if force_field["Bonds"].version == Version("0.3"):
+            from openff.interchange.smirnoff._valence import _upconvert_bondhandler
+
+            _upconvert_bondhandler(force_field["Bonds"])
+
+    if "vdW" in force_field.registered_parameter_handlers:
+        _upconvert_vdw_handler(force_field["vdW"])
+
+    in_process: dict[str, SMIRNOFFCollection | None] = dict()
+
+    # Assigning fractional bond orders modifies molecules in the topology, which must happen
+    # here and before the topology is copied into the workers
+    if _uses_fractional_bond_orders(force_field):
+        for name, function in (("Bonds", _bonds), ("ProperTorsions", _propers)):
+            function(
+                interchange,
+                force_field,
+                topology,
+                partial_bond_orders_from_molecules,
+            )
+            in_process[name] = interchange.collections.pop(name, None)  # type: ignore[assignment]
+
+    step_kwargs: dict[str, dict] = {
+        "Bonds": {
+            "partial_bond_orders_from_molecules": partial_bond_orders_from_molecules,
+        },
+        "Angles": dict(),
+        "ProperTorsions": {
+            "partial_bond_orders_from_molecules": partial_bond_orders_from_molecules,
+        },
+        "ImproperTorsions": dict(),
+        "vdW": dict(),
+        "Electrostatics": {
+            "charge_from_molecules": charge_from_molecules,
+            "allow_nonintegral_charges": allow_nonintegral_charges,
+        },
+    }
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        # Submit the most expensive steps first
+        futures = {
+            name: executor.submit(
+                _create_collection,
+                name,
+                force_field,
+                topology,
+                kwargs,
+                cache,
+            )
+            for name, kwargs in sorted(
+                step_kwargs.items(),
+                key=lambda item: item[0] != "Electrostatics",
+            )
+            if name not in in_process
+        }
+
+        collections: dict[str, SMIRNOFFCollection | None] = {
+            name: in_process[name] if name in in_process else futures[name].result()
+            for name in step_kwargs
+        }
+
+    for name, collection in collections.items():
+        if collection is not None:
+            interchange.collections.update({name: collection})
+
+        if name == "Bonds":
+            _constraints(
+                interchange,
+                force_field,
+                topology,
+                bonds=collection,  # type: ignore[arg-type]
+            )
+
+    if collections["Electrostatics"] is not None:
+        collections["Electrostatics"]._assign_charges_to_topology(  # type: ignore[union-attr]
+            topology,
+            allow_nonintegral_charges=True,
+        )
+
+
+@_step("Bonds")
 def _bonds(
     interchange: Interchange,
     force_field: ForceField,
@@ -152,6 +360,7 @@ def _bonds(
     )
 
 
+@_step("Constraints")
 def _constraints(
     interchange: Interchange,
     force_field: ForceField,
@@ -176,6 +385,7 @@ def _constraints(
     )
 
 
+@_step("Angles")
 def _angles(interchange, force_field, _topology):
     if "Angles" not in force_field.registered_parameter_handlers:
         return
@@ -190,6 +400,7 @@ def _angles(interchange, force_field, _topology):
     )
 
 
+@_step("ProperTorsions")
 def _propers(
     interchange,
     force_field,
@@ -210,6 +421,7 @@ def _propers(
     )
 
 
+@_step("ImproperTorsions")
 def _impropers(interchange, force_field, _topology):
     if "ImproperTorsions" not in force_field.registered_parameter_handlers:
         return
@@ -224,6 +436,7 @@ def _impropers(interchange, force_field, _topology):
     )
 
 
+@_step("vdW")
 def _vdw(interchange: Interchange, force_field: ForceField, topology: Topology):
     from openff.interchange.smirnoff._nonbonded import _upconvert_vdw_handler
 
@@ -245,6 +458,7 @@ def _vdw(interchange: Interchange, force_field: ForceField, topology: Topology):
     )
 
 
+@_step("Electrostatics")
 def _electrostatics(
     interchange: Interchange,
     force_field: ForceField,
@@ -286,6 +500,7 @@ def _electrostatics(
     )
 
 
+@_step("GBSA")
 def _gbsa(
     interchange: Interchange,
     force_field: ForceField,
@@ -304,6 +519,7 @@ def _gbsa(
     )
 
 
+@_step("VirtualSites")
 def _virtual_sites(
     interchange: Interchange,
     force_field: ForceField,
@@ -345,6 +561,7 @@ def _virtual_sites(
     interchange.collections.update({"VirtualSites": virtual_site_handler})
 
 
+@_step("plugins")
 def _plugins(
     interchange: Interchange,
     force_field: ForceField,
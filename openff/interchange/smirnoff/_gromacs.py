@@ -8,9 +8,9 @@ from openff.toolkit.topology._mm_molecule import _SimpleMolecule
 from openff.toolkit.topology.molecule import Atom
 from openff.units.elements import MASSES, SYMBOLS
 
+from openff.interchange.components._graph import BondGraph
 from openff.interchange.components.interchange import Interchange
 from openff.interchange.components.potentials import Collection
-from openff.interchange.components.toolkit import _get_14_pairs
 from openff.interchange.exceptions import UnsupportedExportError
 from openff.interchange.interop._virtual_sites import (
     _virtual_site_parent_molecule_mapping,
@@ -35,6 +35,7 @@ from openff.interchange.interop.gromacs.models.models import (
     RyckaertBellemansDihedral,
 )
 from openff.interchange.models import BondKey, TopologyKey, VirtualSiteKey
+from openff.interchange.profiling import _profiled
 
 MoleculeLike: TypeAlias = Union[Molecule, _SimpleMolecule]
 
@@ -42,6 +43,7 @@ _WATER = Molecule.from_mapped_smiles("[H:2][O:1][H:3]")
 _SIMPLE_WATER = _SimpleMolecule.from_molecule(_WATER)
 
 
+@_profiled("convert")
 def _convert(
     interchange: Interchange,
     hydrogen_mass: float = 1.007947,
@@ -247,12 +249,9 @@ def _convert(
             for atom_type_name in this_molecule_atom_type_names
         }
 
-        # Use a set to de-duplicate
-        pairs: set[tuple] = {*_get_14_pairs(unique_molecule)}
-
-        for pair in pairs:
-            molecule_indices = sorted(unique_molecule.atom_index(atom) for atom in pair)
-
+        for molecule_indices in (
+            BondGraph.from_topology(unique_molecule).get_pairs_at_distance(3).tolist()
+        ):
             if system.gen_pairs:
                 molecule.pairs.append(
                     GROMACSPair(
@@ -307,6 +306,7 @@ def _convert(
     return system
 
 
+@_profiled("convert_bonds")
 def _convert_bonds(
     molecule: GROMACSMolecule,
     unique_molecule: MoleculeLike,
@@ -356,6 +356,7 @@ def _create_single_bond(
     )
 
 
+@_profiled("convert_angles")
 def _convert_angles(
     molecule: GROMACSMolecule,
     unique_molecule: MoleculeLike,
@@ -405,6 +406,7 @@ def _create_single_angle(
     )
 
 
+@_profiled("convert_dihedrals")
 def _convert_dihedrals(
     molecule: GROMACSMolecule,
     unique_molecule: MoleculeLike,
@@ -555,6 +557,7 @@ def _create_single_rb_torsion(
     )
 
 
+@_profiled("convert_virtual_sites")
 def _convert_virtual_sites(
     molecule: GROMACSMolecule,
     unique_molecule: MoleculeLike,
@@ -631,6 +634,7 @@ def _convert_virtual_sites(
             )
 
 
+@_profiled("convert_settles")
 def _convert_settles(
     molecule: GROMACSMolecule,
     unique_molecule: MoleculeLike,
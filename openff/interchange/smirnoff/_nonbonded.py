@@ -1,8 +1,7 @@
 import copy
-import functools
 import warnings
 from collections.abc import Iterable
-from typing import Any, Literal, Optional, Union
+from typing import Any, ClassVar, Literal, Optional, Union
 
 import numpy
 from openff.toolkit import Molecule, Quantity, Topology, unit
@@ -37,7 +36,9 @@ from openff.interchange.models import (
     TopologyKey,
     VirtualSiteKey,
 )
+from openff.interchange.profiling import _phase
 from openff.interchange.smirnoff._base import SMIRNOFFCollection, T
+from openff.interchange.smirnoff._charge_store import ChargeStore, InMemoryChargeStore
 
 ElectrostaticsHandlerType = Union[
     ElectrostaticsHandler,
@@ -270,6 +271,8 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
     ] = Field("Coulomb")
     exception_potential: Literal["Coulomb"] = Field("Coulomb")
 
+    charge_store: ClassVar[ChargeStore] = InMemoryChargeStore()
+
     @classmethod
     def allowed_parameter_handlers(cls):
         """Return a list of allowed types of ParameterHandler classes."""
@@ -460,18 +463,44 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
         return handler
 
     @classmethod
-    @functools.lru_cache(None)
     def _compute_partial_charges(
         cls,
         molecule: Molecule,
         mapped_smiles: str,
         method: str,
     ) -> Quantity:
-        """Call out to the toolkit's toolkit wrappers to generate partial charges."""
-        molecule = copy.deepcopy(molecule)
-        molecule.assign_partial_charges(method)
+        """
+        Call out to the toolkit's toolkit wrappers to generate partial charges.
+
+        Charges are looked up in, and stored in, ``cls.charge_store``, keyed by the mapped SMILES,
+        the method, and the versions of the registered toolkits.
+        """
+        from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+
+        key = (
+            mapped_smiles,
+            method,
+            ",".join(
+                f"{name}={version}"
+                for name, version in sorted(
+                    GLOBAL_TOOLKIT_REGISTRY.registered_toolkit_versions.items(),
+                )
+            ),
+        )
+
+        charges = cls.charge_store.get(key)
+
+        if charges is None:
+            molecule = copy.deepcopy(molecule)
+
+            with _phase("assign_partial_charges", molecules=1, atoms=molecule.n_atoms):
+                molecule.assign_partial_charges(method)
+
+            charges = molecule.partial_charges.m_as(unit.elementary_charge)
 
-        return molecule.partial_charges
+            cls.charge_store.put(key, charges)
+
+        return Quantity(numpy.array(charges), unit.elementary_charge)
 
     @classmethod
     def _library_charge_to_potentials(
@@ -775,6 +804,47 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
 
         return matches, potentials
 
+    @classmethod
+    def _find_cached_reference_matches(
+        cls,
+        parameter_handlers: dict[str, ElectrostaticsHandlerType],
+        unique_molecule: Molecule,
+    ) -> tuple[dict[TopologyKey, PotentialKey], dict[PotentialKey, Potential]]:
+        """
+        Call `_find_reference_matches`, first looking up the result in the active cache, if any.
+        """
+        from openff.toolkit.utils.toolkits import GLOBAL_TOOLKIT_REGISTRY
+
+        from openff.interchange.smirnoff._cache import (
+            _get_active_cache,
+            _hash_electrostatics_handlers,
+            _mapped_smiles,
+        )
+
+        cache = _get_active_cache()
+
+        if cache is None:
+            return cls._find_reference_matches(parameter_handlers, unique_molecule)
+
+        # The charge method used by ToolkitAM1BCC depends on which toolkits are available
+        kind = f"charges\n{GLOBAL_TOOLKIT_REGISTRY!r}"
+        handler_hash = _hash_electrostatics_handlers(parameter_handlers)
+        smiles = _mapped_smiles(unique_molecule)
+
+        cached = cache.get(kind, handler_hash, smiles)
+
+        if cached is not None:
+            return cached
+
+        matches, potentials = cls._find_reference_matches(
+            parameter_handlers,
+            unique_molecule,
+        )
+
+        cache.put(kind, handler_hash, smiles, (matches, potentials))
+
+        return matches, potentials
+
     @classmethod
     def _assign_charges_from_molecules(
         cls,
@@ -860,7 +930,7 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
 
             if not flag:
                 # TODO: Rename this method to something like `_find_matches`
-                matches, potentials = self._find_reference_matches(
+                matches, potentials = self._find_cached_reference_matches(
                     parameter_handlers,
                     unique_molecule,
                 )
@@ -890,6 +960,17 @@ class SMIRNOFFElectrostaticsCollection(ElectrostaticsCollection, SMIRNOFFCollect
                             # as the old key (on a unique/reference molecule)
                             self.key_map[new_key] = matches[key]
 
+        self._assign_charges_to_topology(
+            topology,
+            allow_nonintegral_charges=allow_nonintegral_charges,
+        )
+
+    def _assign_charges_to_topology(
+        self,
+        topology: Topology,
+        allow_nonintegral_charges: bool = False,
+    ) -> None:
+        """Check the net charge of each molecule and set the partial charges of each molecule in the topology."""
         topology_charges = [0.0] * topology.n_atoms
         for key, val in self.charges.items():
             topology_charges[key.atom_indices[0]] = val.m
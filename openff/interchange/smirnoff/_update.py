@@ -0,0 +1,183 @@
+"""The logic behind `Interchange.update_parameters`."""
+
+from typing import TYPE_CHECKING
+
+from openff.interchange.components.potentials import Potential, WrappedPotential
+from openff.interchange.exceptions import (
+    MissingParameterHandlerError,
+    MissingParametersError,
+)
+from openff.interchange.models import PotentialKey
+from openff.interchange.profiling import _count, _phase, _profiled
+from openff.interchange.smirnoff._base import SMIRNOFFCollection
+
+if TYPE_CHECKING:
+    from openff.toolkit import ForceField
+
+    from openff.interchange.components.interchange import Interchange
+
+# Collections whose potentials each depend only on the parameter their potential key points to
+_UPDATABLE_COLLECTIONS: tuple[str, ...] = (
+    "Bonds",
+    "Angles",
+    "ProperTorsions",
+    "ImproperTorsions",
+    "vdW",
+    "GBSA",
+)
+
+
+def _potentials_equal(
+    potential1: Potential | WrappedPotential,
+    potential2: Potential | WrappedPotential,
+) -> bool:
+    potentials = (potential1, potential2)
+
+    if any(isinstance(potential, WrappedPotential) for potential in potentials):
+        # The wrapped potentials are stored in a private attribute, which pydantic does not compare
+        return type(potential1) is type(potential2) and (
+            potential1._inner_data.data == potential2._inner_data.data  # type: ignore[union-attr]
+        )
+
+    return potential1 == potential2
+
+
+def _recompute_potentials(
+    collection: SMIRNOFFCollection,
+    force_field: "ForceField",
+) -> dict[PotentialKey, Potential | WrappedPotential]:
+    """
+    Compute the potentials of a collection from a force field, without modifying the collection.
+
+    The collection's own ``store_potentials`` is run on a copy whose key map holds one topology key
+    per potential key, so the cost scales with the number of potentials rather than of terms. Every
+    potential is recomputed, since which parameters changed is not known. Only potentials whose key
+    is associated with the collection's own section are returned.
+    """
+    if collection.type not in force_field.registered_parameter_handlers:
+        raise MissingParameterHandlerError(
+            f"Force field has no {collection.type} section. Create a new Interchange to remove a collection.",
+        )
+
+    parameter_handler = force_field[collection.type]
+
+    _, by_potential_key = collection._get_key_map_index()
+
+    # Potentials set by other sections, i.e. those of virtual sites in the vdW collection, are not updated
+    by_potential_key = {
+        potential_key: topology_keys
+        for potential_key, topology_keys in by_potential_key.items()
+        if potential_key.associated_handler == collection.type
+    }
+
+    smirks = {parameter.smirks for parameter in parameter_handler.parameters}
+
+    ids = {potential_key.id for potential_key in by_potential_key}
+
+    if missing := sorted(ids - smirks):
+        raise MissingParametersError(
+            f"Parameters in {collection.type} with SMIRKS {missing} are not in the force field. Parameters can "
+            "be changed in-place, but changing which parameters are assigned requires creating a new Interchange.",
+        )
+
+    scratch = collection.copy(
+        update={
+            "key_map": {
+                topology_keys[0]: potential_key
+                for potential_key, topology_keys in by_potential_key.items()
+            },
+            "potentials": dict(),
+        },
+    )
+    scratch.store_potentials(parameter_handler=parameter_handler)
+
+    return scratch.potentials
+
+
+def _update_constraints(
+    constraints: SMIRNOFFCollection,
+    force_field: "ForceField",
+    changed_bonds: dict[PotentialKey, Potential | WrappedPotential],
+) -> list[PotentialKey]:
+    """Update constraint distances set by Constraints parameters, or taken from updated bond lengths."""
+    _, by_potential_key = constraints._get_key_map_index()
+
+    potentials: dict[PotentialKey, Potential | WrappedPotential] = dict()
+
+    for potential_key in by_potential_key:
+        if potential_key.associated_handler == "Bonds":
+            if potential_key in changed_bonds:
+                distance = changed_bonds[potential_key].parameters["length"]
+            else:
+                continue
+
+        elif "Constraints" in force_field.registered_parameter_handlers:
+            distance = force_field["Constraints"].parameters[potential_key.id].distance
+
+        else:
+            continue
+
+        potentials[potential_key] = Potential(parameters={"distance": distance})
+
+    changed = {
+        potential_key: potential
+        for potential_key, potential in potentials.items()
+        if not _potentials_equal(constraints.potentials[potential_key], potential)
+    }
+
+    constraints.potentials.update(changed)
+
+    return [*changed]
+
+
+@_profiled("update_parameters")
+def _update_parameters(
+    interchange: "Interchange",
+    force_field: "ForceField",
+) -> dict[str, list[PotentialKey]]:
+    """
+    Update, in-place, the potentials of an Interchange whose source parameters changed in a force field.
+
+    Only potentials are updated; the key maps are not. Collections other than valence, vdW, and GBSA
+    collections created from SMIRNOFF force fields are left unchanged.
+    """
+    updated: dict[str, list[PotentialKey]] = dict()
+    changed_bonds: dict[PotentialKey, Potential | WrappedPotential] = dict()
+
+    for name in _UPDATABLE_COLLECTIONS:
+        collection = interchange.collections.get(name, None)
+
+        if not isinstance(collection, SMIRNOFFCollection):
+            continue
+
+        with _phase(name):
+            recomputed = _recompute_potentials(collection, force_field)
+            potentials = collection.potentials
+
+            changed = {
+                potential_key: potential
+                for potential_key, potential in recomputed.items()
+                if not _potentials_equal(potentials[potential_key], potential)
+            }
+
+            collection.potentials.update(changed)
+
+        if changed:
+            updated[name] = [*changed]
+
+        if name == "Bonds":
+            changed_bonds = changed
+
+    # Constraint distances can be taken from bond lengths, so they are updated after bonds
+    constraints = interchange.collections.get("Constraints", None)
+
+    if isinstance(constraints, SMIRNOFFCollection):
+        with _phase("Constraints"):
+            changed_keys = _update_constraints(constraints, force_field, changed_bonds)
+
+        if changed_keys:
+            updated["Constraints"] = changed_keys
+
+    _count(potentials=sum(len(potential_keys) for potential_keys in updated.values()))
+
+    return updated
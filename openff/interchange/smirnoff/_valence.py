@@ -33,7 +33,8 @@ from openff.interchange.models import (
 from openff.interchange.smirnoff._base import (
     SMIRNOFFCollection,
     T,
-    _check_all_valence_terms_assigned,
+    _find_matches_by_template,
+    _get_cosmetic_attributes,
 )
 
 _CollectionAlias = type[T]
@@ -138,18 +139,18 @@ class SMIRNOFFBondCollection(SMIRNOFFCollection, BondCollection):
             # TODO: Should the key_map always be reset, or should we be able to partially
             # update it? Also Note the duplicated code in the child classes
             self.key_map: dict[BondKey, PotentialKey] = dict()  # type: ignore[assignment]
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_by_template(
+            parameter_handler,
+            topology,
+            valence_terms=self.valence_terms,
+        )
+
+        # Potential keys depend only on the parameter and bond order, so share them between matches
+        potential_keys: dict[tuple[str, float | None], PotentialKey] = dict()
+
         for key, val in matches.items():
             parameter: BondHandler.BondType = val.parameter_type
 
-            cosmetic_attributes = {
-                cosmetic_attribute: getattr(
-                    parameter,
-                    f"_{cosmetic_attribute}",
-                )
-                for cosmetic_attribute in parameter._cosmetic_attribs
-            }
-
             if parameter.k_bondorder or parameter.length_bondorder:
                 bond = topology.get_bond_between(*key)
                 fractional_bond_order = bond.fractional_bond_order
@@ -165,23 +166,17 @@ class SMIRNOFFBondCollection(SMIRNOFFCollection, BondCollection):
                 bond_order=fractional_bond_order,
             )
 
-            potential_key = PotentialKey(
-                id=parameter.smirks,
-                associated_handler=parameter_handler.TAGNAME,
-                bond_order=fractional_bond_order,
-                cosmetic_attributes=cosmetic_attributes,
-            )
+            cache_key = (parameter.smirks, fractional_bond_order)
 
-            self.key_map[topology_key] = potential_key
+            if cache_key not in potential_keys:
+                potential_keys[cache_key] = PotentialKey(
+                    id=parameter.smirks,
+                    associated_handler=parameter_handler.TAGNAME,
+                    bond_order=fractional_bond_order,
+                    cosmetic_attributes=_get_cosmetic_attributes(parameter),
+                )
 
-        valence_terms = self.valence_terms(topology)
-
-        _check_all_valence_terms_assigned(
-            handler=parameter_handler,
-            topology=topology,
-            assigned_terms=matches,
-            valence_terms=valence_terms,
-        )
+            self.key_map[topology_key] = potential_keys[cache_key]
 
     def store_potentials(self, parameter_handler: BondHandler) -> None:
         """
@@ -357,7 +352,7 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
         except IndexError:
             return
 
-        constraint_matches = constraint_handler.find_matches(topology)
+        constraint_matches = _find_matches_by_template(constraint_handler, topology)
 
         if any([type(p) is BondHandler for p in parameter_handlers]):
             bond_handler = [p for p in parameter_handlers if type(p) is BondHandler][0]
@@ -374,13 +369,7 @@ class SMIRNOFFConstraintCollection(SMIRNOFFCollection):
 
             smirks = parameter.smirks
             distance = parameter.distance
-            cosmetic_attributes = {
-                cosmetic_attribute: getattr(
-                    parameter,
-                    f"_{cosmetic_attribute}",
-                )
-                for cosmetic_attribute in parameter._cosmetic_attribs
-            }
+            cosmetic_attributes = _get_cosmetic_attributes(parameter)
 
             if distance is not None:
                 # This constraint parameter is fully specified
@@ -498,19 +487,17 @@ class SMIRNOFFProperTorsionCollection(SMIRNOFFCollection, ProperTorsionCollectio
         """
         if self.key_map:
             self.key_map: dict[ProperTorsionKey, PotentialKey] = dict()  # type: ignore[assignment]
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_by_template(
+            parameter_handler,
+            topology,
+            valence_terms=lambda topology: list(topology.propers),
+        )
         for key, val in matches.items():
             parameter: ProperTorsionHandler.ProperTorsionType = val.parameter_type
 
             n_terms = len(parameter.phase)
 
-            cosmetic_attributes = {
-                cosmetic_attribute: getattr(
-                    parameter,
-                    f"_{cosmetic_attribute}",
-                )
-                for cosmetic_attribute in parameter._cosmetic_attribs
-            }
+            cosmetic_attributes = _get_cosmetic_attributes(parameter)
 
             for n in range(n_terms):
                 smirks = parameter.smirks
@@ -542,13 +529,6 @@ class SMIRNOFFProperTorsionCollection(SMIRNOFFCollection, ProperTorsionCollectio
 
                 self.key_map[topology_key] = potential_key
 
-        _check_all_valence_terms_assigned(
-            handler=parameter_handler,
-            topology=topology,
-            assigned_terms=matches,
-            valence_terms=list(topology.propers),
-        )
-
     def store_potentials(self, parameter_handler: ProperTorsionHandler) -> None:
         """
         Populate self.potentials with key-val pairs of [PotentialKey, Potential].
@@ -669,7 +649,7 @@ class SMIRNOFFImproperTorsionCollection(SMIRNOFFCollection, ImproperTorsionColle
         """
         if self.key_map:
             self.key_map = dict()
-        matches = parameter_handler.find_matches(topology)
+        matches = _find_matches_by_template(parameter_handler, topology)
         for key, val in matches.items():
             parameter_handler._assert_correct_connectivity(
                 val,
@@ -684,13 +664,7 @@ class SMIRNOFFImproperTorsionCollection(SMIRNOFFCollection, ImproperTorsionColle
 
             n_terms = len(parameter.phase)
 
-            cosmetic_attributes = {
-                cosmetic_attribute: getattr(
-                    parameter,
-                    f"_{cosmetic_attribute}",
-                )
-                for cosmetic_attribute in parameter._cosmetic_attribs
-            }
+            cosmetic_attributes = _get_cosmetic_attributes(parameter)
 
             for n in range(n_terms):
                 smirks = parameter.smirks